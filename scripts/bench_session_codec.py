@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark dos codecs de sessão por tamanho de histórico.
+
+Uso:
+    python scripts/bench_session_codec.py --history 10 50 200 --iterations 2000
+
+Mostra, por codec e tamanho de histórico, o tempo médio de encode/decode
+(incluindo `Session.to_dict`/`Session.from_dict`) e o tamanho em bytes.
+Com orjson/zstandard instalados (extra `perf`) o codec binary usa-os.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.domain.contact_card import ContactCard
+from app.infra.stores.session_codec import (
+    BinarySessionCodec,
+    JsonSessionCodec,
+    SessionCodec,
+)
+from app.sessions.models import HistoryRole, Session, SessionContext
+
+
+def build_session(history_len: int) -> Session:
+    session = Session(
+        session_id="bench",
+        sender_id="bench-sender",
+        context=SessionContext(tenant_id="bench", vertente="saas"),
+        contact_card=ContactCard(
+            wa_id="5511999999999",
+            phone="5511999999999",
+            whatsapp_name="Bench",
+        ),
+    )
+    for idx in range(history_len):
+        role = HistoryRole.USER if idx % 2 == 0 else HistoryRole.ASSISTANT
+        session.add_to_history(
+            f"Mensagem {idx}: quero saber mais sobre o sistema de agendamento.",
+            role=role,
+            max_history=None,
+        )
+    return session
+
+
+def bench(codec: SessionCodec, session: Session, iterations: int) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encoded = codec.encode(session.to_dict())
+    encode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Session.from_dict(codec.decode(encoded))
+    decode_us = (time.perf_counter() - start) / iterations * 1e6
+
+    size = len(encoded.encode() if isinstance(encoded, str) else encoded)
+    return encode_us, decode_us, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 10, 50, 200])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--threshold", type=int, default=4096)
+    args = parser.parse_args()
+
+    codecs: list[SessionCodec] = [
+        JsonSessionCodec(),
+        BinarySessionCodec(compress_threshold_bytes=args.threshold),
+    ]
+    print(f"{'codec':<8}{'history':>8}{'encode_us':>12}{'decode_us':>12}{'bytes':>10}")
+    for history_len in args.history:
+        session = build_session(history_len)
+        for codec in codecs:
+            encode_us, decode_us, size = bench(codec, session, args.iterations)
+            print(
+                f"{codec.name:<8}{history_len:>8}{encode_us:>12.1f}"
+                f"{decode_us:>12.1f}{size:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -31,12 +31,17 @@ class OttoRequest(BaseModel):
     session_state: str
     correlation_id: str | None = None
     history: list[str] = Field(default_factory=list)
+    history_summary: str = ""
     contact_card_summary: str = ""
     contact_card_signals: dict[str, str] = Field(default_factory=dict)
     tenant_intent: str | None = None
     intent_confidence: float = 0.0
     loaded_contexts: list[str] = Field(default_factory=list)
     valid_transitions: list[str] = Field(default_factory=list)
+    # Sinais para roteamento de modelo: campo que o Otto perguntou no turno
+    # anterior e quantos campos do ContactCard ainda faltam (None = sem card)
+    pending_question: str | None = None
+    contact_missing_fields: int | None = None
 
 
 class OttoDecision(BaseModel):
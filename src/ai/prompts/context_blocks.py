@@ -0,0 +1,66 @@
+"""Blocos de contexto pré-processados para montagem de prompt.
+
+Contextos são textos estáticos (YAML versionado) separados em blocos por linha
+em branco. Cada texto é dividido e normalizado uma única vez; a união entre
+contextos vira um conjunto de hashes de blocos já calculados.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_BLOCK_SEPARATOR = re.compile(r"\n\s*\n")
+
+
+@dataclass(frozen=True, slots=True)
+class ContextBlocks:
+    """Blocos de um texto e o hash normalizado (minúsculas, espaços colapsados)."""
+
+    blocks: tuple[str, ...]
+    keys: tuple[bytes, ...]
+
+
+@lru_cache(maxsize=512)
+def split_context(text: str) -> ContextBlocks:
+    """Divide o texto em blocos com hash normalizado (memoizado por conteúdo)."""
+    blocks: list[str] = []
+    keys: list[bytes] = []
+    for chunk in _BLOCK_SEPARATOR.split(text.strip()):
+        block = chunk.strip()
+        if not block:
+            continue
+        normalized = " ".join(block.lower().split())
+        blocks.append(block)
+        keys.append(hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest())
+    return ContextBlocks(tuple(blocks), tuple(keys))
+
+
+def merge_context_texts(texts: Iterable[str], exclude: Iterable[str] = ()) -> str:
+    """Une textos removendo blocos duplicados, preservando a primeira ocorrência.
+
+    Blocos presentes em `exclude` (ex.: já enviados no prefixo) são omitidos.
+    """
+    merged: list[str] = []
+    seen: set[bytes] = {key for text in exclude if text for key in split_context(text).keys}
+    for text in texts:
+        if not text:
+            continue
+        parsed = split_context(text)
+        for key, block in zip(parsed.keys, parsed.blocks, strict=True):
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(block)
+    return "\n\n".join(merged)
+
+
+def clear_context_blocks_cache() -> None:
+    """Descarta blocos memoizados (testes/hot reload)."""
+    split_context.cache_clear()
@@ -9,9 +9,10 @@ Padronização:
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
 
 from ai.config.prompt_assets_loader import load_context_for_prompt
+from ai.prompts.context_blocks import clear_context_blocks_cache, merge_context_texts
 
 _ALWAYS_SYSTEM = (
     "core/system_role.yaml",
@@ -51,56 +52,40 @@ def normalize_tenant_intent(intent: str | None) -> str | None:
 def build_contexts(tenant_intent: str | None = None) -> dict[str, str]:
     """Carrega e junta contextos padronizados.
 
+    A montagem é memoizada pelo conteúdo dos assets: por intent, chamadas
+    repetidas custam só as consultas ao cache do loader.
+
     Args:
         tenant_intent: ID curto/canônico da vertente (opcional).
     """
-    system_parts = [load_context_for_prompt(path) for path in _ALWAYS_SYSTEM]
-    system_context = _merge_unique_blocks(system_parts)
-
-    institutional_parts = [load_context_for_prompt(path) for path in _ALWAYS_USER]
-    institutional_context = _merge_unique_blocks(institutional_parts)
-
-    tenant_context = ""
     folder = normalize_tenant_intent(tenant_intent)
-    if folder:
-        tenant_context = _merge_unique_blocks(
-            [load_context_for_prompt(f"vertentes/{folder}/core.yaml")]
+    tenant_text = load_context_for_prompt(f"vertentes/{folder}/core.yaml") if folder else ""
+    return dict(
+        _assemble_contexts(
+            tuple(load_context_for_prompt(path) for path in _ALWAYS_SYSTEM),
+            tuple(load_context_for_prompt(path) for path in _ALWAYS_USER),
+            tenant_text,
         )
+    )
 
-    user_parts = [institutional_context]
-    if tenant_context:
-        user_parts.append(tenant_context)
-    user_context = _merge_unique_blocks(user_parts)
 
+def clear_context_builder_cache() -> None:
+    """Descarta montagens memoizadas (testes/hot reload)."""
+    _assemble_contexts.cache_clear()
+    clear_context_blocks_cache()
+
+
+@lru_cache(maxsize=32)
+def _assemble_contexts(
+    system_parts: tuple[str, ...],
+    institutional_parts: tuple[str, ...],
+    tenant_text: str,
+) -> dict[str, str]:
+    institutional_context = merge_context_texts(institutional_parts)
+    tenant_context = merge_context_texts([tenant_text])
     return {
-        "system_context": system_context,
+        "system_context": merge_context_texts(system_parts),
         "institutional_context": institutional_context,
         "tenant_context": tenant_context,
-        "user_context": user_context,
+        "user_context": merge_context_texts([institutional_context, tenant_context]),
     }
-
-
-def _merge_unique_blocks(parts: list[str]) -> str:
-    """Une partes removendo blocos textuais duplicados (economia de tokens)."""
-    merged: list[str] = []
-    seen: set[str] = set()
-    for part in parts:
-        text = (part or "").strip()
-        if not text:
-            continue
-        for block in _split_blocks(text):
-            normalized = _normalize_block(block)
-            if not normalized or normalized in seen:
-                continue
-            seen.add(normalized)
-            merged.append(block)
-    return "\n\n".join(merged).strip()
-
-
-def _split_blocks(text: str) -> list[str]:
-    chunks = re.split(r"\n\s*\n", text.strip())
-    return [chunk.strip() for chunk in chunks if chunk and chunk.strip()]
-
-
-def _normalize_block(block: str) -> str:
-    return " ".join(block.lower().split())
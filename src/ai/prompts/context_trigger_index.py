@@ -0,0 +1,169 @@
+"""Índice compilado de triggers dos contextos dinâmicos por vertente.
+
+Os YAMLs de `contexts/vertentes/<vertente>/` são lidos uma única vez: keywords
+já normalizadas, flags `persist`/`min_confidence` e um único regex com todas
+as keywords da vertente. Por mensagem resta uma varredura do texto.
+
+Invalidação por mtime (diretório + arquivos), verificada no máximo a cada
+`REVALIDATE_SECONDS` para não trocar YAML por `stat` no caminho quente.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+REVALIDATE_SECONDS = 5.0
+
+_Signature = tuple[int, tuple[tuple[str, int], ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class TriggerEntry:
+    """Contexto injetável por keywords (manual_injection fica fora do índice)."""
+
+    file_name: str
+    persist: bool
+    min_confidence: float
+    any_keywords: frozenset[str]
+    all_keywords: frozenset[str]
+
+    def matches(self, found: frozenset[str] | set[str], intent_confidence: float) -> bool:
+        if self.min_confidence and intent_confidence < self.min_confidence:
+            return False
+        if self.any_keywords:
+            return not self.any_keywords.isdisjoint(found)
+        return bool(self.all_keywords) and self.all_keywords <= found
+
+
+class VertenteTriggerIndex:
+    """Entradas ordenadas por arquivo + regex único com todas as keywords."""
+
+    __slots__ = ("_implied", "_pattern", "entries", "signature")
+
+    def __init__(self, entries: tuple[TriggerEntry, ...], signature: _Signature) -> None:
+        self.entries = entries
+        self.signature = signature
+        keywords = {kw for e in entries for kw in (*e.any_keywords, *e.all_keywords)}
+        # Lookahead casa em toda posição (sobreposições); a alternativa mais
+        # longa vence, e `_implied` devolve as keywords contidas nela.
+        ordered = sorted(keywords, key=lambda kw: (-len(kw), kw))
+        self._pattern = (
+            re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))") if ordered else None
+        )
+        self._implied = {kw: frozenset(k for k in keywords if k in kw) for kw in keywords}
+
+    def keywords_in(self, normalized_message: str) -> set[str]:
+        """Keywords presentes como substring da mensagem normalizada."""
+        if self._pattern is None or not normalized_message:
+            return set()
+        found: set[str] = set()
+        for kw in set(self._pattern.findall(normalized_message)):
+            found |= self._implied[kw]
+        return found
+
+    def match(self, normalized_message: str, intent_confidence: float) -> list[TriggerEntry]:
+        """Entradas disparadas pela mensagem, na ordem dos arquivos."""
+        found = self.keywords_in(normalized_message)
+        if not found:
+            return []
+        return [e for e in self.entries if e.matches(found, intent_confidence)]
+
+
+_cache: dict[Path, tuple[float, VertenteTriggerIndex | None]] = {}
+
+
+def get_trigger_index(vert_dir: Path) -> VertenteTriggerIndex | None:
+    """Índice da vertente (None se o diretório não existe)."""
+    now = time.monotonic()
+    cached = _cache.get(vert_dir)
+    if cached is not None and now - cached[0] < REVALIDATE_SECONDS:
+        return cached[1]
+    signature = _signature(vert_dir)
+    if signature is None:
+        index = None
+    elif cached is not None and cached[1] is not None and cached[1].signature == signature:
+        index = cached[1]
+    else:
+        index = _build_index(vert_dir, signature)
+    _cache[vert_dir] = (now, index)
+    return index
+
+
+def clear_trigger_index_cache() -> None:
+    """Descarta índices compilados (testes/hot reload)."""
+    _cache.clear()
+
+
+def normalize_text(text: str) -> str:
+    """Minúsculas, sem acentos e com espaços colapsados."""
+    lowered = (text or "").strip().lower()
+    if not lowered:
+        return ""
+    no_accents = "".join(
+        ch for ch in unicodedata.normalize("NFKD", lowered) if not unicodedata.combining(ch)
+    )
+    return " ".join(no_accents.split())
+
+
+def _signature(vert_dir: Path) -> _Signature | None:
+    try:
+        dir_mtime = vert_dir.stat().st_mtime_ns
+        files = tuple(
+            (path.name, path.stat().st_mtime_ns) for path in sorted(vert_dir.glob("*.yaml"))
+        )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return dir_mtime, files
+
+
+def _build_index(vert_dir: Path, signature: _Signature) -> VertenteTriggerIndex:
+    entries: list[TriggerEntry] = []
+    for name, _ in signature[1]:
+        if name == "core.yaml":
+            continue
+        entry = _load_entry(vert_dir / name)
+        if entry is not None:
+            entries.append(entry)
+    return VertenteTriggerIndex(tuple(entries), signature)
+
+
+def _load_entry(path: Path) -> TriggerEntry | None:
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    except (OSError, yaml.YAMLError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    metadata = data.get("metadata", {}) if isinstance(data.get("metadata"), dict) else {}
+    if bool(metadata.get("manual_injection", False)):
+        return None
+    trigger = metadata.get("injection_trigger") or data.get("injection_trigger")
+    if not isinstance(trigger, dict):
+        return None
+    any_keywords = _keywords(trigger.get("any_keywords") or trigger.get("keywords"))
+    all_keywords = frozenset() if any_keywords else _keywords(trigger.get("all_keywords"))
+    if not any_keywords and not all_keywords:
+        return None
+    return TriggerEntry(
+        file_name=path.name,
+        persist=bool(metadata.get("persist", False)),
+        min_confidence=float(metadata.get("min_confidence", 0.0)),
+        any_keywords=any_keywords,
+        all_keywords=all_keywords,
+    )
+
+
+def _keywords(raw: Any) -> frozenset[str]:
+    if not isinstance(raw, list):
+        return frozenset()
+    normalized = (normalize_text(str(word)) for word in raw if word)
+    return frozenset(word for word in normalized if word)
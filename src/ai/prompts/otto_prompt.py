@@ -10,12 +10,15 @@ from __future__ import annotations
 
 import hashlib
 import logging
-import re
 from typing import NamedTuple
 
 from ai.config.prompt_assets_loader import load_context_for_prompt, load_prompt_template
+from ai.prompts.context_blocks import merge_context_texts
 from ai.prompts.context_builder import build_contexts
 from ai.prompts.dynamic_context_loader import resolve_dynamic_contexts
+from ai.prompts.otto_prompt_layout import PROMPT_LAYOUT_CACHE_PREFIX as _CACHE_PREFIX
+from ai.prompts.otto_prompt_layout import PROMPT_LAYOUT_LEGACY as _LEGACY
+from ai.prompts.otto_prompt_layout import build_static_prefix, format_otto_turn_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +60,8 @@ def format_otto_prompt(
         institutional_context=(institutional_context or "(vazio)")[:2000],
         tenant_context=(tenant_context or "(vazio)")[:1200],
         contact_card_summary=(contact_card_summary or "(vazio)")[:1200],
-        conversation_history=(conversation_history or "(sem historico)")[:1200],
+        # Histórico mantém o final: turnos recentes valem mais que o resumo antigo
+        conversation_history=(conversation_history or "(sem historico)")[-1200:],
     )
 
 
@@ -75,11 +79,13 @@ def build_full_prompt(
     extra_context_chunks: list[str] | None = None,
     extra_loaded_contexts: list[str] | None = None,
     correlation_id: str | None = None,
+    prompt_layout: str = _LEGACY,
 ) -> PromptComponents:
     """Monta prompt final e lista de contextos carregados para persistência.
 
     Args:
         correlation_id: ID de correlação para rastreabilidade de logs.
+        prompt_layout: `legacy` ou `cache_prefix` (ver `otto_prompt_layout.py`).
     """
     contexts = build_contexts(tenant_intent)
     dynamic_result = resolve_dynamic_contexts(
@@ -89,30 +95,46 @@ def build_full_prompt(
         loaded_contexts=loaded_contexts,
         session_state=session_state,
     )
+    cache_prefix = prompt_layout == _CACHE_PREFIX
     tenant_context = _build_tenant_context(
         base_context=contexts["tenant_context"],
         dynamic_chunks=dynamic_result.contexts_for_prompt,
         extra_context_paths=extra_context_paths,
         extra_context_chunks=extra_context_chunks,
+        include_base=not cache_prefix,
         correlation_id=correlation_id,
     )
-
-    user_prompt = format_otto_prompt(
-        user_message=user_message,
-        session_state=session_state,
-        valid_transitions=valid_transitions,
-        institutional_context=contexts["institutional_context"],
-        tenant_context=tenant_context,
-        contact_card_summary=contact_card_summary,
-        conversation_history=conversation_history,
-    )
+    if cache_prefix:
+        system_prompt = build_static_prefix(
+            contexts["system_context"],
+            contexts["institutional_context"],
+            contexts["tenant_context"],
+        )
+        user_prompt = format_otto_turn_prompt(
+            turn_context=tenant_context,
+            user_message=user_message,
+            session_state=session_state,
+            valid_transitions=valid_transitions,
+            contact_card_summary=contact_card_summary,
+            conversation_history=conversation_history,
+        )
+    else:
+        system_prompt = contexts["system_context"]
+        user_prompt = format_otto_prompt(
+            institutional_context=contexts["institutional_context"],
+            tenant_context=tenant_context,
+            user_message=user_message,
+            session_state=session_state,
+            valid_transitions=valid_transitions,
+            contact_card_summary=contact_card_summary,
+            conversation_history=conversation_history,
+        )
 
     merged_loaded = sorted(
         set((dynamic_result.loaded_contexts or []) + (extra_loaded_contexts or []))
     )
 
     # P0-1: Fingerprint de prompts para rastreabilidade
-    system_prompt = contexts["system_context"]
     fingerprint = _compute_prompt_fingerprint(system_prompt, user_prompt)
     logger.info(
         "otto_prompt_built",
@@ -122,6 +144,7 @@ def build_full_prompt(
             "result": "ok",
             "correlation_id": correlation_id,
             "prompt_fingerprint": fingerprint,
+            "prompt_layout": prompt_layout,
             "loaded_contexts": merged_loaded,
             "system_chars": len(system_prompt),
             "user_chars": len(user_prompt),
@@ -131,42 +154,26 @@ def build_full_prompt(
     return PromptComponents(system_prompt, user_prompt, merged_loaded)
 
 
-def _merge_context_chunks(*chunks: list[str]) -> str:
-    merged: list[str] = []
-    seen: set[str] = set()
-    for chunk in chunks:
-        for item in chunk or []:
-            text = (item or "").strip()
-            if not text:
-                continue
-            for block in _split_blocks(text):
-                normalized = _normalize_block(block)
-                if not normalized or normalized in seen:
-                    continue
-                seen.add(normalized)
-                merged.append(block)
-    return "\n\n".join(merged).strip()
-
-
 def _build_tenant_context(
     *,
     base_context: str,
     dynamic_chunks: list[str],
     extra_context_paths: list[str] | None,
     extra_context_chunks: list[str] | None,
+    include_base: bool = True,
     correlation_id: str | None = None,
 ) -> str:
     """Constrói tenant_context com budget de tokens.
 
     P0-3: Aplica limite de ~2500 tokens (10k chars) para evitar explosão de custo.
+    `include_base=False` (cache_prefix): o core da vertente já está no SYSTEM.
     """
     loaded_paths = [load_context_for_prompt(path) for path in (extra_context_paths or [])]
-    merged = _merge_context_chunks(
-        [base_context] if base_context else [],
-        dynamic_chunks,
-        loaded_paths,
-        extra_context_chunks or [],
-    )
+    turn_chunks = [*dynamic_chunks, *loaded_paths, *(extra_context_chunks or [])]
+    if include_base:
+        merged = merge_context_texts([base_context, *turn_chunks])
+    else:
+        merged = merge_context_texts(turn_chunks, exclude=[base_context])
 
     # P0-3: Budget de tokens - truncar se necessário
     if len(merged) > _MAX_TENANT_CONTEXT_CHARS:
@@ -194,11 +201,3 @@ def _compute_prompt_fingerprint(system_prompt: str, user_prompt: str) -> str:
     combined = f"{system_prompt}\n---\n{user_prompt}"
     return hashlib.sha256(combined.encode("utf-8")).hexdigest()
 
-
-def _split_blocks(text: str) -> list[str]:
-    chunks = re.split(r"\n\s*\n", text.strip())
-    return [chunk.strip() for chunk in chunks if chunk and chunk.strip()]
-
-
-def _normalize_block(block: str) -> str:
-    return " ".join(block.lower().split())
@@ -0,0 +1,55 @@
+"""Layout do prompt do Otto amigável ao cache de prefixo do provedor.
+
+No layout `legacy` os contextos estáticos (institucional e vertente) vão no USER
+intercalados com dados do turno, então o prefixo enviado muda a cada mensagem.
+No layout `cache_prefix` o SYSTEM concentra tudo que é estático (system role,
+guardrails, sobre_pyloto, core da vertente) em um texto byte-idêntico por
+vertente, e o USER leva só dados do turno — o provedor reaproveita o prefixo.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ai.config.prompt_assets_loader import load_prompt_template
+
+PROMPT_LAYOUT_LEGACY = "legacy"
+PROMPT_LAYOUT_CACHE_PREFIX = "cache_prefix"
+PROMPT_LAYOUTS = (PROMPT_LAYOUT_LEGACY, PROMPT_LAYOUT_CACHE_PREFIX)
+
+_STATIC_PREFIX_TEMPLATE = load_prompt_template("otto_static_prefix_template.yaml")
+_TURN_TEMPLATE = load_prompt_template("otto_turn_template.yaml")
+
+
+@lru_cache(maxsize=32)
+def build_static_prefix(
+    system_context: str,
+    institutional_context: str,
+    tenant_context: str,
+) -> str:
+    """Monta o SYSTEM estável (mesmos limites de tamanho do layout legacy)."""
+    return _STATIC_PREFIX_TEMPLATE.format(
+        system_context=system_context,
+        institutional_context=(institutional_context or "(vazio)")[:2000],
+        tenant_context=(tenant_context or "(vazio)")[:1200],
+    ).strip()
+
+
+def format_otto_turn_prompt(
+    *,
+    user_message: str,
+    session_state: str,
+    valid_transitions: list[str],
+    turn_context: str,
+    contact_card_summary: str,
+    conversation_history: str,
+) -> str:
+    """Formata USER com dados do turno (sempre após o prefixo estático)."""
+    return _TURN_TEMPLATE.format(
+        user_message=(user_message or "")[:800],
+        session_state=session_state or "",
+        valid_transitions=", ".join(valid_transitions) if valid_transitions else "Nenhuma",
+        turn_context=(turn_context or "(vazio)")[:1200],
+        contact_card_summary=(contact_card_summary or "(vazio)")[:1200],
+        conversation_history=(conversation_history or "(sem historico)")[-1200:],
+    )
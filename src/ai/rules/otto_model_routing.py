@@ -0,0 +1,66 @@
+"""Regras determinísticas de roteamento de modelo do Otto.
+
+Escolhe o tier (`fast` ou `full`) a partir de sinais baratos do turno:
+estado da sessão, tamanho da mensagem, gates dos micro agentes, pergunta
+pendente do Otto e campos faltantes do ContactCard. Na dúvida, `full`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from ai.models.otto import OttoDecision
+
+ModelTier = Literal["fast", "full"]
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRoutingPolicy:
+    """Limiares do roteamento (montados a partir das settings no bootstrap)."""
+
+    fast_states: frozenset[str] = frozenset({"INITIAL", "TRIAGE", "COLLECTING_INFO"})
+    max_fast_chars: int = 60
+    escalation_confidence: float = 0.7
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingFeatures:
+    """Sinais determinísticos do turno usados no roteamento."""
+
+    session_state: str
+    message_chars: int
+    user_asked_question: bool
+    micro_agents_fired: bool
+    pending_question: str | None
+    contact_missing_fields: int | None
+
+
+def route_model_tier(
+    features: RoutingFeatures,
+    policy: ModelRoutingPolicy,
+) -> tuple[ModelTier, str]:
+    """Retorna (tier, motivo). Motivo vai para log/métrica."""
+    if features.session_state not in policy.fast_states:
+        return "full", "state"
+    if features.micro_agents_fired:
+        # Objeção/caso/ROI injetados: turno exige raciocínio sobre contexto extra
+        return "full", "micro_agents"
+    if features.message_chars > policy.max_fast_chars:
+        return "full", "long_message"
+    if features.user_asked_question:
+        return "full", "user_question"
+    if features.contact_missing_fields == 0:
+        # Card completo: conversa em fechamento/agendamento, onde erro custa caro
+        return "full", "card_complete"
+    if features.pending_question:
+        return "fast", "answer_to_pending_question"
+    return "fast", "short_turn"
+
+
+def needs_escalation(decision: OttoDecision | None, policy: ModelRoutingPolicy) -> bool:
+    """Resposta do modelo rápido deve ser refeita no principal?"""
+    if decision is None or decision.requires_human:
+        return True
+    return decision.confidence < policy.escalation_confidence
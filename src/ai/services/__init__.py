@@ -6,9 +6,11 @@ Exporta agentes e utilitários ativos na arquitetura Otto.
 from ai.services.contact_card_extractor import ContactCardExtractorService
 from ai.services.decision_validator import DecisionValidatorService
 from ai.services.otto_agent import OttoAgentService
+from ai.services.otto_model_router import OttoModelRouter
 
 __all__ = [
     "ContactCardExtractorService",
     "DecisionValidatorService",
     "OttoAgentService",
+    "OttoModelRouter",
 ]
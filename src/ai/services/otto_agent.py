@@ -8,12 +8,14 @@ from typing import TYPE_CHECKING
 
 from ai.models.otto import OttoDecision, OttoRequest
 from ai.prompts.otto_prompt import build_full_prompt
+from ai.prompts.otto_prompt_layout import PROMPT_LAYOUT_LEGACY
 from ai.services.prompt_micro_agents import MicroAgentResult, run_prompt_micro_agents
-from ai.utils.sanitizer import mask_history
+from ai.utils.sanitizer import mask_history, normalize_history_labels
 from app.observability import record_confidence, record_handoff, record_latency
 
 if TYPE_CHECKING:
     from ai.core.otto_client import OttoClientProtocol
+    from ai.services.otto_model_router import OttoModelRouter
 
 logger = logging.getLogger(__name__)
 
@@ -28,22 +30,35 @@ _HANDOFF_TEXT = (
 class OttoAgentService:
     """Servico de decisao do OttoAgent."""
 
-    def __init__(self, client: OttoClientProtocol) -> None:
+    def __init__(
+        self,
+        client: OttoClientProtocol,
+        prompt_layout: str = PROMPT_LAYOUT_LEGACY,
+        router: OttoModelRouter | None = None,
+    ) -> None:
         self._client = client
+        self._prompt_layout = prompt_layout
+        self._router = router
 
     async def decide(self, request: OttoRequest) -> OttoDecision:
         """Executa OttoAgent e retorna decisão bruta (gates externos)."""
         start_time = time.perf_counter()
         correlation_id = request.correlation_id
-        conversation_history = _conversation_history_text(request.history)
+        conversation_history = _conversation_history_text(
+            request.history,
+            summary=request.history_summary,
+        )
         micro_result = await _safe_run_micro_agents(request, correlation_id)
         system_prompt, user_prompt, loaded_contexts = _build_prompts(
             request=request,
             conversation_history=conversation_history,
             micro_result=micro_result,
+            prompt_layout=self._prompt_layout,
         )
         request.loaded_contexts = loaded_contexts
+        client = self._client if self._router is None else self._router.bind(request, micro_result)
         decision = await self._safe_client_decision(
+            client,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             correlation_id=correlation_id,
@@ -67,13 +82,14 @@ class OttoAgentService:
 
     async def _safe_client_decision(
         self,
+        client: OttoClientProtocol,
         *,
         system_prompt: str,
         user_prompt: str,
         correlation_id: str | None,
     ) -> OttoDecision | None:
         try:
-            return await self._client.decide(system_prompt=system_prompt, user_prompt=user_prompt)
+            return await client.decide(system_prompt=system_prompt, user_prompt=user_prompt)
         except Exception as exc:
             logger.warning(
                 "otto_client_error",
@@ -120,6 +136,7 @@ def _build_prompts(
     request: OttoRequest,
     conversation_history: str,
     micro_result: MicroAgentResult,
+    prompt_layout: str = PROMPT_LAYOUT_LEGACY,
 ) -> tuple[str, str, list[str]]:
     return build_full_prompt(
         contact_card_summary=request.contact_card_summary,
@@ -134,13 +151,17 @@ def _build_prompts(
         extra_context_chunks=micro_result.context_chunks,
         extra_loaded_contexts=micro_result.loaded_contexts,
         correlation_id=request.correlation_id,
+        prompt_layout=prompt_layout,
     )
 
 
-def _conversation_history_text(history: list[str]) -> str:
-    normalized = _normalize_history_labels(
+def _conversation_history_text(history: list[str], summary: str = "") -> str:
+    normalized = normalize_history_labels(
         mask_history(history, max_messages=_MAX_HISTORY_MESSAGES)
     )
+    if summary.strip():
+        # Turnos compactados da sessão entram como resumo antes da janela recente
+        normalized.insert(0, f"Resumo anterior: {mask_history([summary.strip()])[0]}")
     return "\n".join(normalized) if normalized else "(sem historico)"
 
 
@@ -166,17 +187,3 @@ def _handoff_decision(reason: str, *, correlation_id: str | None) -> OttoDecisio
         reasoning_debug=reason,
     )
 
-
-def _normalize_history_labels(history: list[str]) -> list[str]:
-    normalized: list[str] = []
-    for entry in history:
-        text = (entry or "").strip()
-        if not text:
-            continue
-        lowered = text.lower()
-        if lowered.startswith(("usu\u00e1rio:", "usuario:")):
-            text = f"Usuario: {text.split(':', 1)[1].strip()}"
-        elif lowered.startswith(("otto:", "assistente:", "assistant:")):
-            text = f"Otto: {text.split(':', 1)[1].strip()}"
-        normalized.append(text)
-    return normalized
@@ -0,0 +1,150 @@
+"""Roteador de modelo do OttoAgent (rápido vs principal, com escalonamento)."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ai.rules.otto_model_routing import (
+    ModelRoutingPolicy,
+    RoutingFeatures,
+    needs_escalation,
+    route_model_tier,
+)
+from app.observability import record_counter
+
+if TYPE_CHECKING:
+    from ai.core.otto_client import OttoClientProtocol
+    from ai.models.otto import OttoDecision, OttoRequest
+    from ai.services.prompt_micro_agents import MicroAgentResult
+
+logger = logging.getLogger(__name__)
+
+
+def routing_features(request: OttoRequest, micro_result: MicroAgentResult) -> RoutingFeatures:
+    """Extrai os sinais de roteamento do request já montado."""
+    message = (request.user_message or "").strip()
+    return RoutingFeatures(
+        session_state=request.session_state,
+        message_chars=len(message),
+        user_asked_question="?" in message,
+        micro_agents_fired=bool(micro_result.context_paths or micro_result.context_chunks),
+        pending_question=request.pending_question,
+        contact_missing_fields=request.contact_missing_fields,
+    )
+
+
+class OttoModelRouter:
+    """Escolhe o cliente por turno; escala ao principal em baixa confiança.
+
+    Erro do cliente rápido também escala (não vira handoff); erro do
+    principal propaga para o tratamento do OttoAgentService.
+    """
+
+    def __init__(
+        self,
+        *,
+        full_client: OttoClientProtocol,
+        fast_client: OttoClientProtocol,
+        policy: ModelRoutingPolicy | None = None,
+    ) -> None:
+        self._full_client = full_client
+        self._fast_client = fast_client
+        self._policy = policy or ModelRoutingPolicy()
+
+    def bind(self, request: OttoRequest, micro_result: MicroAgentResult) -> OttoClientProtocol:
+        """Cliente do turno: mesma interface do OttoClient, já roteado."""
+        return _RoutedTurn(self, request, micro_result)
+
+    async def decide(
+        self,
+        *,
+        request: OttoRequest,
+        micro_result: MicroAgentResult,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> OttoDecision | None:
+        tier, reason = route_model_tier(routing_features(request, micro_result), self._policy)
+        if tier == "fast":
+            decision = await self._fast_decision(system_prompt, user_prompt, request)
+            escalated = needs_escalation(decision, self._policy)
+            _log_route(request, tier, reason, escalated=escalated, decision=decision)
+            if not escalated:
+                return decision
+        else:
+            _log_route(request, tier, reason, escalated=False, decision=None)
+        return await self._full_client.decide(system_prompt=system_prompt, user_prompt=user_prompt)
+
+    async def _fast_decision(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        request: OttoRequest,
+    ) -> OttoDecision | None:
+        try:
+            return await self._fast_client.decide(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+            )
+        except Exception as exc:
+            logger.warning(
+                "otto_fast_model_error",
+                extra={
+                    "component": "otto_model_router",
+                    "action": "decide_fast",
+                    "result": "error",
+                    "correlation_id": request.correlation_id,
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return None
+
+
+class _RoutedTurn:
+    __slots__ = ("_micro_result", "_request", "_router")
+
+    def __init__(
+        self,
+        router: OttoModelRouter,
+        request: OttoRequest,
+        micro_result: MicroAgentResult,
+    ) -> None:
+        self._router = router
+        self._request = request
+        self._micro_result = micro_result
+
+    async def decide(self, *, system_prompt: str, user_prompt: str) -> OttoDecision | None:
+        return await self._router.decide(
+            request=self._request,
+            micro_result=self._micro_result,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+
+def _log_route(
+    request: OttoRequest,
+    tier: str,
+    reason: str,
+    *,
+    escalated: bool,
+    decision: OttoDecision | None,
+) -> None:
+    record_counter(
+        "otto_model_router",
+        "escalated" if escalated else f"route_{tier}",
+        metadata={"reason": reason},
+    )
+    logger.info(
+        "otto_model_routed",
+        extra={
+            "component": "otto_model_router",
+            "action": "route",
+            "result": "escalated" if escalated else tier,
+            "correlation_id": request.correlation_id,
+            "tier": tier,
+            "reason": reason,
+            "session_state": request.session_state,
+            "fast_confidence": decision.confidence if decision is not None else None,
+        },
+    )
@@ -1,11 +1,17 @@
 """Utilitários de IA (sanitização e parsing genérico)."""
 
 from ai.utils._json_extractor import extract_json_from_response
-from ai.utils.sanitizer import contains_pii, mask_history, sanitize_pii
+from ai.utils.sanitizer import (
+    contains_pii,
+    mask_history,
+    normalize_history_labels,
+    sanitize_pii,
+)
 
 __all__ = [
     "contains_pii",
     "extract_json_from_response",
     "mask_history",
+    "normalize_history_labels",
     "sanitize_pii",
 ]
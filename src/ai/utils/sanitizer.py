@@ -113,3 +113,19 @@ def contains_pii(text: str) -> bool:
         return False
 
     return any(pattern.search(text) for pattern in _PATTERNS.values())
+
+
+def normalize_history_labels(history: list[str]) -> list[str]:
+    """Padroniza rótulos do histórico para `Usuario:`/`Otto:` e remove vazios."""
+    normalized: list[str] = []
+    for entry in history:
+        text = (entry or "").strip()
+        if not text:
+            continue
+        lowered = text.lower()
+        if lowered.startswith(("usu\u00e1rio:", "usuario:")):
+            text = f"Usuario: {text.split(':', 1)[1].strip()}"
+        elif lowered.startswith(("otto:", "assistente:", "assistant:")):
+            text = f"Otto: {text.split(':', 1)[1].strip()}"
+        normalized.append(text)
+    return normalized
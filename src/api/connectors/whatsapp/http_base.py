@@ -5,10 +5,15 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from api.connectors.whatsapp.http_pool import get_shared_http_client
+
+if TYPE_CHECKING:
+    from api.connectors.whatsapp.resilience import Bulkhead, CircuitBreaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,35 +44,61 @@ class HttpError(Exception):
 
 
 class HttpClient:
-    """Cliente HTTP simples para chamadas externas."""
+    """Cliente HTTP simples para chamadas externas.
+
+    Reutiliza o pool compartilhado do processo (keep-alive) em vez de abrir
+    um AsyncClient por tentativa; `client` permite injetar outro pool.
+    Com `circuit_breaker`, cada tentativa consulta o circuito antes da chamada
+    (falha rápida, inclusive entre backoffs) e reporta falhas transitórias;
+    com `bulkhead`, o envio inteiro (tentativas + backoff) ocupa uma vaga.
+    """
 
-    def __init__(self, config: HttpClientConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: HttpClientConfig | None = None,
+        client: httpx.AsyncClient | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        bulkhead: Bulkhead | None = None,
+    ) -> None:
         self._config = config or HttpClientConfig()
+        self._client = client
+        self._breaker = circuit_breaker
+        self._bulkhead = bulkhead
 
     async def post(
         self,
         url: str,
         json: dict[str, Any],
         headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        if self._bulkhead is None:
+            return await self._post_with_retries(url, json, headers)
+        async with self._bulkhead.slot():
+            return await self._post_with_retries(url, json, headers)
+
+    async def _post_with_retries(
+        self,
+        url: str,
+        json: dict[str, Any],
+        headers: dict[str, str] | None,
     ) -> httpx.Response:
         merged_headers = {**self._config.default_headers, **(headers or {})}
         for attempt in range(self._config.max_retries + 1):
+            if self._breaker is not None:
+                self._breaker.before_call()
             try:
-                async with httpx.AsyncClient(verify=self._config.verify_ssl) as client:
-                    response = await client.post(
-                        url,
-                        json=json,
-                        headers=merged_headers,
-                        timeout=self._config.timeout_seconds,
-                    )
+                response = await self._post_once(url, json, merged_headers)
                 if response.status_code in (429,) or response.status_code >= 500:
                     raise HttpError(
                         "http_retryable_status",
                         status_code=response.status_code,
                         is_retryable=True,
                     )
+                if self._breaker is not None:
+                    self._breaker.record_success()
                 return response
             except HttpError as exc:
+                self._report_http_error(exc)
                 if not exc.is_retryable or attempt >= self._config.max_retries:
                     raise
                 await _backoff_sleep(
@@ -76,6 +107,8 @@ class HttpClient:
                     self._config.backoff_max_seconds,
                 )
             except (httpx.TimeoutException, httpx.ConnectError) as exc:
+                if self._breaker is not None:
+                    self._breaker.record_failure()
                 if attempt >= self._config.max_retries:
                     raise HttpError("http_connection_error", is_retryable=True) from exc
                 await _backoff_sleep(
@@ -83,8 +116,43 @@ class HttpClient:
                     self._config.backoff_base_seconds,
                     self._config.backoff_max_seconds,
                 )
+            except httpx.TransportError:
+                # ReadError/RemoteProtocolError: falha de transporte, sem retry do POST
+                if self._breaker is not None:
+                    self._breaker.record_failure()
+                raise
+            except BaseException:
+                # Cancelamento ou erro inesperado: sem desfecho, libera o teste half-open
+                if self._breaker is not None:
+                    self._breaker.release_probe()
+                raise
         raise HttpError("http_retry_exhausted", is_retryable=True)
 
+    def _report_http_error(self, exc: HttpError) -> None:
+        if self._breaker is None:
+            return
+        if exc.is_retryable:
+            self._breaker.record_failure()
+        elif exc.status_code is not None and 400 <= exc.status_code < 500:
+            # A Graph API respondeu: o destino está alcançável
+            self._breaker.record_success()
+        else:
+            self._breaker.release_probe()
+
+    async def _post_once(
+        self,
+        url: str,
+        json: dict[str, Any],
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        timeout = self._config.timeout_seconds
+        if not self._config.verify_ssl:
+            # Pool compartilhado sempre verifica TLS; exceção fica isolada
+            async with httpx.AsyncClient(verify=False) as client:  # noqa: S501
+                return await client.post(url, json=json, headers=headers, timeout=timeout)
+        client = self._client or get_shared_http_client()
+        return await client.post(url, json=json, headers=headers, timeout=timeout)
+
 
 async def _backoff_sleep(attempt: int, base: float, max_seconds: float) -> None:
     backoff = min((2**attempt) * base, max_seconds)
@@ -24,17 +24,17 @@ from typing import TYPE_CHECKING, Any
 from api.connectors.whatsapp.http_base import HttpClient, HttpClientConfig, HttpError
 from api.connectors.whatsapp.meta_errors import WhatsAppApiError, parse_meta_error
 from api.connectors.whatsapp.meta_logging import log_meta_error, log_success
+from api.connectors.whatsapp.resilience import get_shared_graph_api_guards
 
 if TYPE_CHECKING:
     import httpx
 
+    from api.connectors.whatsapp.resilience import Bulkhead, CircuitBreaker
     from config.settings import WhatsAppSettings
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-
-
 class WhatsAppHttpClient(HttpClient):
     """Cliente HTTP especializado para Meta/WhatsApp API.
 
@@ -50,14 +50,19 @@ class WhatsAppHttpClient(HttpClient):
         self,
         config: HttpClientConfig | None = None,
         phone_number_id: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        bulkhead: Bulkhead | None = None,
     ) -> None:
         """Inicializa cliente WhatsApp.
 
         Args:
             config: Configuração HTTP base
             phone_number_id: ID do número (para logging/dedup)
+            client: AsyncClient injetado (default: pool compartilhado)
+            circuit_breaker, bulkhead: Resiliência compartilhada entre envios
         """
-        super().__init__(config)
+        super().__init__(config, client=client, circuit_breaker=circuit_breaker, bulkhead=bulkhead)
         self.phone_number_id = phone_number_id
 
     async def send_message(
@@ -78,7 +83,7 @@ class WhatsAppHttpClient(HttpClient):
 
         Raises:
             ValueError: Se access_token está vazio ou inválido
-            HttpError: Se erro HTTP ou Meta
+            HttpError: Se erro HTTP/Meta ou envio rejeitado (circuito/bulkhead)
         """
         # Validar access_token antes de usar (CRÍTICO)
         if not access_token or not access_token.strip():
@@ -127,11 +132,8 @@ class WhatsAppHttpClient(HttpClient):
         headers: dict[str, str],
         endpoint: str,
     ) -> httpx.Response:
-        """Executa POST com tratamento de erros previsível."""
-        try:
-            return await self.post(url, json=payload, headers=headers)
-        except HttpError:
-            raise
+        """Executa POST (circuito e bulkhead aplicados em `HttpClient.post`)."""
+        return await self.post(url, json=payload, headers=headers)
 
     def _process_whatsapp_response(
         self,
@@ -173,23 +175,24 @@ class WhatsAppHttpClient(HttpClient):
 def create_whatsapp_http_client(
     settings: WhatsAppSettings | None = None,
 ) -> WhatsAppHttpClient:
-    """Factory para criar cliente WhatsApp com config padrão.
+    """Factory do cliente WhatsApp com config e o breaker/bulkhead do processo.
 
     Args:
         settings: WhatsAppSettings opcional. Se None, carrega do ambiente.
-
-    Returns:
-        Cliente HTTP configurado para WhatsApp.
     """
     # Import local para evitar dependência circular
-    from config.settings import get_whatsapp_settings
+    from config.settings import get_whatsapp_outbound_settings, get_whatsapp_settings
 
     whatsapp = settings or get_whatsapp_settings()
+    outbound = get_whatsapp_outbound_settings()
     config = HttpClientConfig(
         timeout_seconds=whatsapp.request_timeout_seconds,
         max_retries=whatsapp.max_retries,
     )
+    breaker, bulkhead = get_shared_graph_api_guards(whatsapp, outbound)
     return WhatsAppHttpClient(
         config=config,
         phone_number_id=whatsapp.phone_number_id,
+        circuit_breaker=breaker,
+        bulkhead=bulkhead,
     )
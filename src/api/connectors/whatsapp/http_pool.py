@@ -0,0 +1,120 @@
+"""Pool HTTP compartilhado (process-wide) para a Graph API.
+
+Responsabilidades:
+- Manter um único httpx.AsyncClient por processo, com keep-alive e limites
+- Habilitar HTTP/2 quando o pacote `h2` estiver disponível
+- Expor init/get/close para o lifespan da aplicação
+
+Motivo: abrir um AsyncClient por requisição paga TCP+TLS a cada envio
+(100-300 ms sob rajada) e esgota portas efêmeras.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from config.settings import WhatsAppOutboundSettings, WhatsAppSettings
+
+logger = logging.getLogger(__name__)
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class HttpPoolConfig:
+    """Configuração do pool de conexões."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = True
+    timeout_seconds: float = 30.0
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: WhatsAppSettings,
+        outbound: WhatsAppOutboundSettings,
+    ) -> HttpPoolConfig:
+        """Monta config a partir das settings do canal e de tráfego outbound."""
+        return cls(
+            max_connections=outbound.http_max_connections,
+            max_keepalive_connections=outbound.http_max_keepalive_connections,
+            keepalive_expiry_seconds=outbound.http_keepalive_expiry_seconds,
+            http2=outbound.http2_enabled,
+            timeout_seconds=settings.request_timeout_seconds,
+        )
+
+
+def http2_available() -> bool:
+    """Indica se o extra HTTP/2 do httpx (pacote h2) está instalado."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_async_client(config: HttpPoolConfig | None = None) -> httpx.AsyncClient:
+    """Cria AsyncClient com limites e keep-alive configurados."""
+    cfg = config or HttpPoolConfig()
+    use_http2 = cfg.http2 and http2_available()
+    if cfg.http2 and not use_http2:
+        # Fallback explícito: sem h2 o httpx levanta ImportError com http2=True
+        logger.warning(
+            "http_pool_http2_unavailable",
+            extra={"component": "http_pool", "action": "build", "result": "http1_fallback"},
+        )
+    limits = httpx.Limits(
+        max_connections=cfg.max_connections,
+        max_keepalive_connections=cfg.max_keepalive_connections,
+        keepalive_expiry=cfg.keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        http2=use_http2,
+        limits=limits,
+        timeout=cfg.timeout_seconds,
+    )
+
+
+def init_shared_http_client(config: HttpPoolConfig | None = None) -> httpx.AsyncClient:
+    """Cria (ou reaproveita) o cliente compartilhado do processo."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        return _shared_client
+    _shared_client = build_async_client(config)
+    logger.info(
+        "http_pool_created",
+        extra={"component": "http_pool", "action": "init", "result": "ok"},
+    )
+    return _shared_client
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """Retorna o cliente compartilhado, criando sob demanda fora do lifespan.
+
+    Scripts e testes que não passam pelo lifespan continuam funcionando;
+    em produção o lifespan já criou o cliente com os limites das settings.
+    """
+    if _shared_client is not None and not _shared_client.is_closed:
+        return _shared_client
+    from config.settings import get_whatsapp_outbound_settings, get_whatsapp_settings
+
+    return init_shared_http_client(
+        HttpPoolConfig.from_settings(get_whatsapp_settings(), get_whatsapp_outbound_settings())
+    )
+
+
+async def close_shared_http_client() -> None:
+    """Fecha o cliente compartilhado (shutdown)."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is None or client.is_closed:
+        return
+    await client.aclose()
+    logger.info(
+        "http_pool_closed",
+        extra={"component": "http_pool", "action": "close", "result": "ok"},
+    )
@@ -64,7 +64,8 @@ class MediaUploader:
             gcs_client: Cliente Google Cloud Storage
             bucket_name: Nome do bucket GCS
             metadata_store: Store para metadados
-            whatsapp_client: Cliente WhatsApp API (opcional)
+            whatsapp_client: Cliente WhatsApp API (opcional; reutiliza o pool
+                HTTP compartilhado do processo)
         """
         self._gcs = gcs_client
         self._bucket_name = bucket_name
@@ -0,0 +1,178 @@
+"""Circuit breaker e bulkhead para chamadas à Graph API.
+
+Com a Graph API degradada, cada envio gastaria todas as tentativas com
+backoff (2s, 4s, 8s) segurando a task de processamento. O circuit breaker
+abre após `failure_threshold` falhas transitórias seguidas e passa a falhar
+rápido até `reset_seconds`; então libera uma chamada de teste (half-open)
+que fecha ou reabre o circuito. O bulkhead limita envios simultâneos e
+rejeita quem não consegue vaga dentro de `acquire_timeout_seconds`.
+
+Falhas rápidas levantam `HttpError` retryable: o chamador registra o envio
+como falho e o caminho de retry decide quando tentar de novo.
+
+Breaker e bulkhead da Graph API são únicos por processo (como o pool HTTP
+compartilhado): senders inline e de retry veem o mesmo estado e limite.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from api.connectors.whatsapp.http_base import HttpError
+from app.observability import record_counter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    from config.settings import WhatsAppOutboundSettings, WhatsAppSettings
+
+logger = logging.getLogger(__name__)
+
+_shared_guards: tuple[CircuitBreaker, Bulkhead] | None = None
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(HttpError):
+    """Circuito aberto: envio rejeitado sem chamar a Graph API."""
+
+    def __init__(self, retry_after_seconds: float) -> None:
+        super().__init__("graph_api_circuit_open", is_retryable=True)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class BulkheadFullError(HttpError):
+    """Sem vaga para envio simultâneo dentro do tempo de espera."""
+
+    def __init__(self) -> None:
+        super().__init__("graph_api_bulkhead_full", is_retryable=True)
+
+
+class CircuitBreaker:
+    """Circuit breaker closed/open/half-open por contagem de falhas seguidas."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        name: str = "graph_api",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._threshold = max(1, failure_threshold)
+        self._reset_seconds = max(0.0, reset_seconds)
+        self._name = name
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_call(self) -> None:
+        """Autoriza a chamada ou falha rápido.
+
+        Raises:
+            CircuitOpenError: Circuito aberto ou teste half-open em andamento.
+        """
+        if self._state is CircuitState.OPEN:
+            remaining = self._opened_at + self._reset_seconds - self._clock()
+            if remaining > 0:
+                raise CircuitOpenError(remaining)
+            self._transition(CircuitState.HALF_OPEN)
+        if self._state is CircuitState.HALF_OPEN:
+            now = self._clock()
+            # Teste sem desfecho (cancelado) expira após reset_seconds
+            if self._probe_in_flight and now - self._probe_started_at < self._reset_seconds:
+                raise CircuitOpenError(self._reset_seconds)
+            self._probe_in_flight = True
+            self._probe_started_at = now
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self._state is not CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def release_probe(self) -> None:
+        """Libera o teste half-open sem desfecho (cancelado/erro inesperado)."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self._threshold:
+            self._opened_at = self._clock()
+            if self._state is not CircuitState.OPEN:
+                self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous, self._state = self._state, state
+        logger.warning(
+            "circuit_breaker_transition",
+            extra={
+                "circuit": self._name,
+                "from_state": previous.value,
+                "to_state": state.value,
+                "consecutive_failures": self._failures,
+            },
+        )
+        record_counter("circuit_breaker", f"{self._name}_{state.value}")
+
+
+class Bulkhead:
+    """Limita chamadas simultâneas com espera máxima por vaga."""
+
+    def __init__(
+        self,
+        max_concurrent: int = 20,
+        acquire_timeout_seconds: float = 0.5,
+        name: str = "graph_api",
+    ) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        self._timeout = max(0.0, acquire_timeout_seconds)
+        self._name = name
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Ocupa uma vaga durante o bloco.
+
+        Raises:
+            BulkheadFullError: Se nenhuma vaga liberar dentro do timeout.
+        """
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self._timeout)
+        except TimeoutError:
+            record_counter("bulkhead", f"{self._name}_rejected")
+            raise BulkheadFullError from None
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+
+def get_shared_graph_api_guards(
+    whatsapp: WhatsAppSettings,
+    outbound: WhatsAppOutboundSettings,
+) -> tuple[CircuitBreaker, Bulkhead]:
+    """Circuit breaker e bulkhead do processo (config da primeira chamada)."""
+    global _shared_guards
+    if _shared_guards is None:
+        breaker = CircuitBreaker(
+            whatsapp.circuit_breaker_threshold, whatsapp.circuit_breaker_reset_seconds
+        )
+        bulkhead = Bulkhead(outbound.max_concurrent_sends, outbound.bulkhead_timeout_seconds)
+        _shared_guards = (breaker, bulkhead)
+    return _shared_guards
@@ -1,6 +1,7 @@
 """Webhook WhatsApp: verificação, assinatura e parsing seguro."""
 
 from ..signature import SignatureResult, verify_meta_signature
+from .classify import WebhookPayloadSummary, classify_webhook_payload
 from .receive import (
     InvalidJsonError,
     InvalidSignatureError,
@@ -14,7 +15,9 @@ __all__ = [
     "InvalidSignatureError",
     "SignatureResult",
     "WebhookChallengeError",
+    "WebhookPayloadSummary",
     "WebhookRequestError",
+    "classify_webhook_payload",
     "parse_webhook_request",
     "verify_meta_signature",
     "verify_webhook_challenge",
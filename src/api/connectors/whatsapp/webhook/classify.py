@@ -0,0 +1,56 @@
+"""Classificação barata do payload do webhook (antes de qualquer pipeline).
+
+A maior parte do tráfego da Meta são callbacks de `statuses`
+(sent/delivered/read), sem `messages`. O classificador percorre só a
+estrutura `entry[].changes[].value` para decidir se há mensagem a processar.
+Estruturas inesperadas seguem para o pipeline (que registra o erro).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@dataclass(frozen=True, slots=True)
+class WebhookPayloadSummary:
+    """Resumo do payload: mensagens processáveis e contagem de status."""
+
+    message_count: int = 0
+    status_counts: dict[str, int] = field(default_factory=dict)
+    malformed: bool = False
+
+    @property
+    def requires_processing(self) -> bool:
+        """False para payloads só de status ou vazios (ack imediato)."""
+        return self.malformed or self.message_count > 0
+
+
+def classify_webhook_payload(payload: Mapping[str, Any]) -> WebhookPayloadSummary:
+    """Conta mensagens com `id` e status por tipo sem normalizar o payload."""
+    message_count = 0
+    status_counts: dict[str, int] = {}
+    entries = payload.get("entry") or []
+    if not isinstance(entries, list):
+        return WebhookPayloadSummary(malformed=True)
+    for entry in entries:
+        changes = (entry.get("changes") or []) if isinstance(entry, dict) else None
+        if not isinstance(changes, list):
+            return WebhookPayloadSummary(malformed=True)
+        for change in changes:
+            value = (change.get("value") or {}) if isinstance(change, dict) else None
+            if not isinstance(value, dict):
+                return WebhookPayloadSummary(malformed=True)
+            messages = value.get("messages") or []
+            statuses = value.get("statuses") or []
+            if not isinstance(messages, list) or not isinstance(statuses, list):
+                return WebhookPayloadSummary(malformed=True)
+            message_count += sum(1 for msg in messages if isinstance(msg, dict) and msg.get("id"))
+            for item in statuses:
+                status = item.get("status") if isinstance(item, dict) else None
+                key = status if isinstance(status, str) and status else "unknown"
+                status_counts[key] = status_counts.get(key, 0) + 1
+    return WebhookPayloadSummary(message_count=message_count, status_counts=status_counts)
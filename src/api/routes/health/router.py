@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
 import time
 from dataclasses import dataclass
@@ -13,6 +14,8 @@ from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from app.infra.ai.openai_transport import get_openai_connection_stats
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -73,6 +76,7 @@ async def readiness_check(request: Request) -> JSONResponse:
             "firestore": firestore_check.as_dict(),
             "openai": openai_check.as_dict(),
         },
+        "openai_connections": get_openai_connection_stats().as_dict(),
         "timestamp": datetime.now(UTC).isoformat(),
     }
     return JSONResponse(content=payload, status_code=200 if ready else 503)
@@ -97,10 +101,7 @@ async def _check_firestore(firestore_client: Any | None) -> DependencyCheck:
         return DependencyCheck(status="failed", error="not_configured")
     started_at = time.perf_counter()
     try:
-        exists = await asyncio.wait_for(
-            asyncio.to_thread(_read_firestore_health_doc, firestore_client),
-            timeout=3.0,
-        )
+        exists = await asyncio.wait_for(_read_firestore_health_doc(firestore_client), timeout=3.0)
     except TimeoutError:
         return DependencyCheck(status="failed", error="timeout")
     except Exception as exc:
@@ -110,8 +111,12 @@ async def _check_firestore(firestore_client: Any | None) -> DependencyCheck:
     return DependencyCheck(status=status, latency_ms=round(latency_ms, 2))
 
 
-def _read_firestore_health_doc(firestore_client: Any) -> bool:
-    doc = firestore_client.collection("_health").document("check").get()
+async def _read_firestore_health_doc(firestore_client: Any) -> bool:
+    doc_ref = firestore_client.collection("_health").document("check")
+    if inspect.iscoroutinefunction(doc_ref.get):
+        doc = await doc_ref.get()
+    else:
+        doc = await asyncio.to_thread(doc_ref.get)
     return bool(getattr(doc, "exists", False))
 
 
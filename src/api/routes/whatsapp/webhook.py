@@ -8,6 +8,10 @@ from typing import Any
 from fastapi import APIRouter, Request, Response, status
 from fastapi.responses import JSONResponse
 
+from api.connectors.whatsapp.webhook.classify import (
+    WebhookPayloadSummary,
+    classify_webhook_payload,
+)
 from api.connectors.whatsapp.webhook.receive import (
     InvalidJsonError,
     InvalidSignatureError,
@@ -18,6 +22,7 @@ from api.connectors.whatsapp.webhook.verify import (
     verify_webhook_challenge,
 )
 from api.routes.whatsapp.webhook_runtime import dispatch_inbound_processing
+from api.routes.whatsapp.webhook_status_metrics import record_status_only_payload
 from app.observability import get_correlation_id, reset_correlation_id, set_correlation_id
 from config.settings import get_whatsapp_settings
 
@@ -65,7 +70,11 @@ async def receive_webhook(request: Request) -> Response | dict[str, Any]:
     try:
         settings = get_whatsapp_settings()
         try:
-            payload, correlation_id = await _parse_and_log_request(request, settings)
+            payload, correlation_id, summary = await _parse_and_log_request(request, settings)
+            if not summary.requires_processing:
+                # Fast-path: só status/vazio — ack sem use case, task ou log por request
+                record_status_only_payload(summary.status_counts)
+                return {"status": "received", "correlation_id": correlation_id}
             await dispatch_inbound_processing(
                 payload=payload,
                 correlation_id=correlation_id,
@@ -98,7 +107,10 @@ async def receive_webhook(request: Request) -> Response | dict[str, Any]:
         reset_correlation_id(token)
 
 
-async def _parse_and_log_request(request: Request, settings: Any) -> tuple[dict[str, Any], str]:
+async def _parse_and_log_request(
+    request: Request,
+    settings: Any,
+) -> tuple[dict[str, Any], str, WebhookPayloadSummary]:
     raw_body = await request.body()
     payload, signature_result = parse_webhook_request(
         raw_body=raw_body,
@@ -106,6 +118,9 @@ async def _parse_and_log_request(request: Request, settings: Any) -> tuple[dict[
         secret=settings.webhook_secret or None,
     )
     correlation_id = get_correlation_id()
+    summary = classify_webhook_payload(payload)
+    if not summary.requires_processing:
+        return payload, correlation_id, summary
     logger.info(
         "webhook_received",
         extra={
@@ -114,9 +129,10 @@ async def _parse_and_log_request(request: Request, settings: Any) -> tuple[dict[
             "signature_valid": signature_result.valid,
             "signature_skipped": signature_result.skipped,
             "payload_size": len(raw_body),
+            "message_count": summary.message_count,
         },
     )
-    return payload, correlation_id
+    return payload, correlation_id, summary
 
 
 def _error_response(
@@ -5,15 +5,22 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from pydantic import ValidationError as PydanticValidationError
-
+from api.routes.whatsapp.webhook_runtime_errors import (
+    is_infrastructure_error,
+    is_validation_error,
+)
+from api.routes.whatsapp.webhook_runtime_lane_retry import run_with_lane_retry
+from api.routes.whatsapp.webhook_runtime_queue import (
+    enqueue_processing_item,
+    stop_queue_consumers,
+)
 from api.routes.whatsapp.webhook_runtime_tasks import (
     drain_processing_tasks,
     schedule_processing_task,
 )
+from api.routes.whatsapp.webhook_status_metrics import flush_status_metrics
 from app.coordinators.whatsapp.inbound.handler import process_inbound_payload
-from app.protocols.validator import ValidationError as OutboundValidationError
-from utils.errors import FirestoreUnavailableError, RedisConnectionError
+from app.services.conversation_lanes import ConversationLaneFullError
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +36,8 @@ def get_inbound_use_case() -> Any:
             create_async_session_store,
             create_contact_card_extractor_service,
             create_contact_card_store,
+            create_conversation_store,
+            create_decision_journal,
             create_otto_agent_service,
             create_transcription_service,
         )
@@ -44,9 +53,11 @@ def get_inbound_use_case() -> Any:
             dedupe=create_async_dedupe_store(),
             otto_agent=create_otto_agent_service(),
             outbound_sender=create_whatsapp_outbound_sender(),
+            conversation_store=create_conversation_store(),
             contact_card_store=create_contact_card_store(),
             transcription_service=create_transcription_service(),
             contact_card_extractor=create_contact_card_extractor_service(),
+            decision_journal=create_decision_journal(),
         )
     return _inbound_use_case
 
@@ -66,33 +77,28 @@ async def process_inbound_payload_safe(
             use_case=use_case,
             tenant_id=tenant_id,
         )
+    except ConversationLaneFullError:
+        # Retry fica com o chamador (Meta no inline, backoff no async, nack na fila)
+        logger.warning(
+            "webhook_processing_lane_full",
+            extra={"channel": "whatsapp", "correlation_id": correlation_id},
+        )
+        raise
     except Exception as exc:
-        if _is_validation_error(exc):
-            logger.warning(
-                "webhook_processing_validation_failed",
-                extra={
-                    "channel": "whatsapp",
-                    "correlation_id": correlation_id,
-                    "error_type": type(exc).__name__,
-                },
-            )
+        extra = {
+            "channel": "whatsapp",
+            "correlation_id": correlation_id,
+            "error_type": type(exc).__name__,
+        }
+        if is_validation_error(exc):
+            logger.warning("webhook_processing_validation_failed", extra=extra)
             return
-        if _is_infrastructure_error(exc):
-            logger.error(
-                "webhook_processing_infra_failed",
-                extra={
-                    "channel": "whatsapp",
-                    "correlation_id": correlation_id,
-                    "error_type": type(exc).__name__,
-                },
-            )
+        if is_infrastructure_error(exc):
+            logger.error("webhook_processing_infra_failed", extra=extra)
             raise
         logger.exception(
             "webhook_processing_failed",
-            extra={
-                "channel": "whatsapp",
-                "correlation_id": correlation_id,
-            },
+            extra={"channel": "whatsapp", "correlation_id": correlation_id},
         )
         raise
 
@@ -104,13 +110,22 @@ async def dispatch_inbound_processing(
     settings: Any,
     tenant_id: str = "default",
 ) -> None:
-    """Despacha processamento inline ou async conforme configuração."""
+    """Despacha processamento inline, async ou via fila conforme configuração."""
+    processing_mode = (settings.webhook_processing_mode or "async").lower()
+    if processing_mode == "queue":
+        # Use case só é construído no consumidor; request apenas publica
+        await enqueue_processing_item(
+            payload=payload,
+            correlation_id=correlation_id,
+            tenant_id=tenant_id,
+        )
+        return
+
     use_case = get_inbound_use_case()
     if use_case is None:
         _log_use_case_unavailable(correlation_id)
         return
 
-    processing_mode = (settings.webhook_processing_mode or "async").lower()
     if processing_mode == "inline":
         await process_inbound_payload_safe(
             payload=payload,
@@ -120,11 +135,7 @@ async def dispatch_inbound_processing(
         )
         logger.info(
             "webhook_processing_completed",
-            extra={
-                "channel": "whatsapp",
-                "correlation_id": correlation_id,
-                "mode": "inline",
-            },
+            extra={"channel": "whatsapp", "correlation_id": correlation_id, "mode": "inline"},
         )
         return
     _schedule_async_processing(
@@ -155,26 +166,25 @@ def _schedule_async_processing(
 ) -> None:
     schedule_processing_task(
         correlation_id=correlation_id,
-        coroutine=process_inbound_payload_safe(
-            payload=payload,
+        coroutine=run_with_lane_retry(
+            lambda: process_inbound_payload_safe(
+                payload=payload,
+                correlation_id=correlation_id,
+                use_case=use_case,
+                tenant_id=tenant_id,
+            ),
             correlation_id=correlation_id,
-            use_case=use_case,
-            tenant_id=tenant_id,
-        )
+        ),
+        limited=False,
     )
 
 
 async def drain_background_tasks(timeout_seconds: float = 30.0) -> None:
-    """Aguarda tasks async pendentes durante shutdown do processo."""
-    await drain_processing_tasks(timeout_seconds=timeout_seconds)
-
+    """Aguarda tasks async e consumidores da fila durante shutdown do processo."""
+    from app.sessions.conversation_write_behind import drain_conversation_write_behind
 
-def _is_validation_error(exc: Exception) -> bool:
-    return isinstance(exc, (ValueError, PydanticValidationError, OutboundValidationError))
-
-
-def _is_infrastructure_error(exc: Exception) -> bool:
-    if isinstance(exc, (RedisConnectionError, FirestoreUnavailableError)):
-        return True
-    module_name = type(exc).__module__
-    return module_name.startswith(("redis.", "google.api_core."))
+    await stop_queue_consumers(timeout_seconds=timeout_seconds)
+    await drain_processing_tasks(timeout_seconds=timeout_seconds)
+    # Depois do processamento: os turnos drenados ainda enfileiram dual-writes
+    await drain_conversation_write_behind(timeout_seconds=timeout_seconds)
+    flush_status_metrics()
@@ -0,0 +1,21 @@
+"""Classificação de erros do processamento inbound do webhook WhatsApp."""
+
+from __future__ import annotations
+
+from pydantic import ValidationError as PydanticValidationError
+
+from app.protocols.validator import ValidationError as OutboundValidationError
+from utils.errors import FirestoreUnavailableError, RedisConnectionError
+
+
+def is_validation_error(exc: Exception) -> bool:
+    """Erro de payload/validação: reprocessar não adianta."""
+    return isinstance(exc, (ValueError, PydanticValidationError, OutboundValidationError))
+
+
+def is_infrastructure_error(exc: Exception) -> bool:
+    """Falha de Redis/Firestore: transitória, vale retry."""
+    if isinstance(exc, (RedisConnectionError, FirestoreUnavailableError)):
+        return True
+    module_name = type(exc).__module__
+    return module_name.startswith(("redis.", "google.api_core."))
@@ -0,0 +1,83 @@
+"""Retry com backoff para lanes cheias no modo `async` do webhook.
+
+No modo `async` o 200 já foi devolvido à Meta antes do processamento, então
+`ConversationLaneFullError` não vira reentrega. A task tenta de novo até a
+lane aceitar ou estourar `WHATSAPP_INBOUND_LANE_RETRY_MAX_WAIT_SECONDS`.
+
+A vaga no limite global de concorrência só é reservada quando chega a vez
+da mensagem na lane (via `lane_admission`): esperando atrás do mesmo
+remetente ou no backoff, a task não ocupa vaga de outras conversas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from api.routes.whatsapp.webhook_runtime_tasks import processing_slot
+from app.observability import record_counter
+from app.services.conversation_lanes import ConversationLaneFullError, lane_admission
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_INITIAL_DELAY_SECONDS = 0.25
+_MAX_DELAY_SECONDS = 2.0
+
+
+async def run_with_lane_retry(
+    attempt: Callable[[], Awaitable[None]],
+    *,
+    correlation_id: str,
+    max_wait_seconds: float | None = None,
+) -> None:
+    """Executa `attempt` repetindo se a lane estiver cheia.
+
+    O trabalho dentro da lane roda com vaga no limite global (`processing_slot`).
+
+    Raises:
+        ConversationLaneFullError: Se a lane seguir cheia após `max_wait_seconds`.
+    """
+    if max_wait_seconds is None:
+        from config.settings import get_whatsapp_inbound_settings
+
+        max_wait_seconds = get_whatsapp_inbound_settings().lane_retry_max_wait_seconds
+    deadline = asyncio.get_running_loop().time() + max_wait_seconds
+    token = lane_admission.set(processing_slot)
+    try:
+        await _retry_until_admitted(attempt, correlation_id, deadline)
+    finally:
+        lane_admission.reset(token)
+
+
+async def _retry_until_admitted(
+    attempt: Callable[[], Awaitable[None]],
+    correlation_id: str,
+    deadline: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+    delay = _INITIAL_DELAY_SECONDS
+    retries = 0
+    while True:
+        try:
+            await attempt()
+            return
+        except ConversationLaneFullError:
+            if loop.time() + delay > deadline:
+                record_counter("webhook_lane_retry", "exhausted", correlation_id=correlation_id)
+                logger.error(
+                    "webhook_lane_retry_exhausted",
+                    extra={
+                        "channel": "whatsapp",
+                        "correlation_id": correlation_id,
+                        "retries": retries,
+                    },
+                )
+                raise
+        retries += 1
+        record_counter("webhook_lane_retry", "scheduled", correlation_id=correlation_id)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, _MAX_DELAY_SECONDS)
@@ -0,0 +1,117 @@
+"""Modo `queue` do webhook WhatsApp: publica na fila durável e consome.
+
+O request apenas publica o payload (ack rápido para a Meta); consumidores
+do processo reivindicam itens da fila compartilhada entre instâncias.
+Itens sem ack em reciclagem de instância voltam via visibility timeout.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+from typing import TYPE_CHECKING, Any
+
+from app.observability import reset_correlation_id, set_correlation_id
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.protocols.work_queue import WorkQueueProtocol
+    from app.services.work_queue_consumer import WorkQueueConsumerPool
+
+logger = logging.getLogger(__name__)
+
+_work_queue: WorkQueueProtocol | None = None
+_consumer_pool: WorkQueueConsumerPool | None = None
+
+
+def get_work_queue() -> WorkQueueProtocol:
+    """Obtém a fila de trabalho do webhook (lazy-loading)."""
+    global _work_queue
+    if _work_queue is None:
+        from app.bootstrap.dependencies import create_work_queue
+
+        _work_queue = create_work_queue()
+    return _work_queue
+
+
+async def enqueue_processing_item(
+    *,
+    payload: dict[str, Any],
+    correlation_id: str,
+    tenant_id: str,
+) -> str:
+    """Publica payload inbound na fila durável."""
+    item_id = await get_work_queue().enqueue(
+        {"payload": payload, "correlation_id": correlation_id, "tenant_id": tenant_id}
+    )
+    logger.info(
+        "webhook_processing_enqueued",
+        extra={"channel": "whatsapp", "correlation_id": correlation_id, "mode": "queue"},
+    )
+    return item_id
+
+
+async def process_queue_item(item: dict[str, Any]) -> None:
+    """Handler dos consumidores: exceções propagam e viram nack/retry."""
+    # Import tardio: webhook_runtime importa este módulo
+    from api.routes.whatsapp import webhook_runtime
+
+    correlation_id = str(item.get("correlation_id") or "")
+    token = set_correlation_id(correlation_id or None)
+    try:
+        use_case = webhook_runtime.get_inbound_use_case()
+        if use_case is None:
+            raise RuntimeError("inbound_use_case_unavailable")
+        await webhook_runtime.process_inbound_payload_safe(
+            payload=item.get("payload") or {},
+            correlation_id=correlation_id,
+            use_case=use_case,
+            tenant_id=str(item.get("tenant_id") or "default"),
+        )
+    finally:
+        reset_correlation_id(token)
+
+
+def start_background_workers(settings: Any) -> None:
+    """Inicia consumidores da fila quando o modo de processamento é `queue`."""
+    if (settings.webhook_processing_mode or "").lower() == "queue":
+        start_queue_consumers(process_queue_item)
+
+
+def start_queue_consumers(
+    handler: Callable[[dict[str, Any]], Awaitable[None]],
+) -> None:
+    """Inicia consumidores do processo (idempotente)."""
+    global _consumer_pool
+    from app.services.work_queue_consumer import WorkQueueConsumerPool
+    from config.settings import get_work_queue_settings
+
+    if _consumer_pool is not None and _consumer_pool.running:
+        return
+    settings = get_work_queue_settings()
+    _consumer_pool = WorkQueueConsumerPool(
+        get_work_queue(),
+        handler,
+        consumers=settings.consumers,
+        batch_size=settings.batch_size,
+        consumer_prefix=_consumer_prefix(),
+        # Renova bem antes de expirar: tolera uma renovação perdida
+        heartbeat_seconds=settings.visibility_timeout_seconds / 3,
+    )
+    _consumer_pool.start()
+
+
+async def stop_queue_consumers(timeout_seconds: float = 30.0) -> None:
+    """Para consumidores; itens sem ack permanecem na fila."""
+    global _consumer_pool
+    pool, _consumer_pool = _consumer_pool, None
+    if pool is not None:
+        await pool.stop(timeout_seconds=timeout_seconds)
+
+
+def _consumer_prefix() -> str:
+    # Nome único por instância: K_REVISION + hostname identifica o container
+    revision = os.getenv("K_REVISION", "local")
+    return f"{revision}-{socket.gethostname()}-{os.getpid()}"
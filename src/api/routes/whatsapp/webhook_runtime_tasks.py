@@ -8,21 +8,37 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable
+    from collections.abc import AsyncIterator, Awaitable
 
 logger = logging.getLogger(__name__)
 
-_TASK_SEMAPHORE = asyncio.Semaphore(100)
+_task_semaphore: asyncio.Semaphore | None = None
 _active_tasks: set[asyncio.Task[Any]] = set()
 
 
+def _get_task_semaphore() -> asyncio.Semaphore:
+    # Lazy: limite vem das settings (lanes por conversa permitem subir o teto)
+    global _task_semaphore
+    if _task_semaphore is None:
+        from config.settings import get_whatsapp_inbound_settings
+
+        limit = get_whatsapp_inbound_settings().webhook_max_concurrent_tasks
+        _task_semaphore = asyncio.Semaphore(max(1, limit))
+    return _task_semaphore
+
+
 def schedule_processing_task(
     *,
     correlation_id: str,
     coroutine: Awaitable[None],
+    limited: bool = True,
 ) -> int:
-    """Agenda task assíncrona com limite de concorrência."""
-    task = asyncio.create_task(_run_with_limit(coroutine))
+    """Agenda task assíncrona com limite de concorrência.
+
+    Com `limited=False` a própria coroutine reserva a vaga via
+    `processing_slot()` (ex.: só quando chega a vez na lane da conversa).
+    """
+    task = asyncio.create_task(_run_with_limit(coroutine) if limited else _run(coroutine))
     _active_tasks.add(task)
     task.add_done_callback(_on_processing_task_done)
     logger.info(
@@ -37,11 +53,22 @@ def schedule_processing_task(
     return len(_active_tasks)
 
 
+@contextlib.asynccontextmanager
+async def processing_slot() -> AsyncIterator[None]:
+    """Reserva uma vaga no limite global de processamento."""
+    async with _get_task_semaphore():
+        yield
+
+
 async def _run_with_limit(coroutine: Awaitable[None]) -> None:
-    async with _TASK_SEMAPHORE:
+    async with processing_slot():
         await coroutine
 
 
+async def _run(coroutine: Awaitable[None]) -> None:
+    await coroutine
+
+
 def _on_processing_task_done(task: asyncio.Task[Any]) -> None:
     _active_tasks.discard(task)
     with contextlib.suppress(asyncio.CancelledError):
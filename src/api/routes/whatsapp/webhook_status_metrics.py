@@ -0,0 +1,72 @@
+"""Agregação de callbacks de status do webhook em métrica periódica.
+
+Callbacks só de status recebem ack imediato, sem log por request; as
+contagens por status são acumuladas e emitidas como um único contador por
+intervalo (e no shutdown).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from app.observability import record_counter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 60.0
+
+
+class StatusCallbackAggregator:
+    """Acumula contagens de status e emite `record_counter` por intervalo."""
+
+    def __init__(
+        self,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._interval = max(0.0, flush_interval_seconds)
+        self._clock = clock
+        self._counts: dict[str, int] = {}
+        self._payloads = 0
+        self._last_flush = clock()
+
+    def add(self, status_counts: Mapping[str, int]) -> None:
+        """Acumula um payload acked sem processamento."""
+        self._payloads += 1
+        for status, count in status_counts.items():
+            self._counts[status] = self._counts.get(status, 0) + count
+        if self._clock() - self._last_flush >= self._interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emite o acumulado (no-op se vazio)."""
+        self._last_flush = self._clock()
+        if not self._payloads:
+            return
+        metadata: dict[str, str | float | int] = {
+            f"status_{status}": count for status, count in sorted(self._counts.items())
+        }
+        metadata["payloads"] = self._payloads
+        record_counter(
+            "whatsapp_webhook",
+            "status_callbacks",
+            value=sum(self._counts.values()),
+            metadata=metadata,
+        )
+        self._counts = {}
+        self._payloads = 0
+
+
+_aggregator = StatusCallbackAggregator()
+
+
+def record_status_only_payload(status_counts: Mapping[str, int]) -> None:
+    """Registra payload só de status/vazio no agregador do processo."""
+    _aggregator.add(status_counts)
+
+
+def flush_status_metrics() -> None:
+    """Emite contagens pendentes (shutdown)."""
+    _aggregator.flush()
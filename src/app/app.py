@@ -16,6 +16,7 @@ Cloud Run:
 from __future__ import annotations
 
 import asyncio
+import inspect
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
@@ -25,10 +26,25 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from api.routes import create_api_router
 from api.routes.whatsapp.webhook_runtime import drain_background_tasks
+from api.routes.whatsapp.webhook_runtime_queue import start_background_workers
 from app.bootstrap import initialize_app, validate_runtime_settings
-from app.bootstrap.clients import create_async_redis_client, create_firestore_client
+from app.bootstrap.clients import (
+    create_async_firestore_client,
+    create_async_redis_client,
+    create_firestore_client,
+)
+from app.bootstrap.outbound_sender import (
+    start_outbound_retry_recovery,
+    stop_outbound_retry_worker,
+)
+from app.bootstrap.whatsapp_adapters import close_graph_api_http_pool, open_graph_api_http_pool
+from app.infra.ai.openai_transport import (
+    close_shared_openai_client,
+    init_shared_openai_client,
+    warmup_shared_openai_client,
+)
 from config.logging import get_logger
-from config.settings import get_openai_settings
+from config.settings import get_firestore_settings, get_openai_settings, get_whatsapp_settings
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -41,16 +57,12 @@ logger = get_logger(__name__)
 
 async def _seed_firestore_health_doc(firestore_client: object) -> None:
     """Escreve documento mínimo de health para check de readiness."""
-
-    def _write_doc() -> None:
-        firestore_client.collection("_health").document("check").set(  # type: ignore[attr-defined]
-            {
-                "updated_at": datetime.now(UTC).isoformat(),
-                "service": "atende-pyloto",
-            }
-        )
-
-    await asyncio.to_thread(_write_doc)
+    doc_ref = firestore_client.collection("_health").document("check")  # type: ignore[attr-defined]
+    payload = {"updated_at": datetime.now(UTC).isoformat(), "service": "atende-pyloto"}
+    if inspect.iscoroutinefunction(doc_ref.set):
+        await doc_ref.set(payload)  # AsyncClient (FIRESTORE_ASYNC_CLIENT)
+        return
+    await asyncio.to_thread(doc_ref.set, payload)
 
 
 @asynccontextmanager
@@ -58,7 +70,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Gerencia ciclo de vida da aplicação.
 
     Startup:
-    - Inicializa conexões (Redis, Firestore)
+    - Inicializa conexões (Redis, Firestore, pools HTTP da Graph API e OpenAI)
     - Valida configurações
 
     Shutdown:
@@ -77,7 +89,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning("redis_client_not_ready", extra={"error_type": type(exc).__name__})
 
     try:
-        app.state.firestore_client = create_firestore_client()
+        open_graph_api_http_pool()
+    except Exception as exc:
+        logger.warning("graph_api_http_pool_not_ready", extra={"error_type": type(exc).__name__})
+
+    try:
+        app.state.firestore_client = (
+            create_async_firestore_client()
+            if get_firestore_settings().use_async_client
+            else create_firestore_client()
+        )
         await _seed_firestore_health_doc(app.state.firestore_client)
     except Exception as exc:
         logger.warning("firestore_client_not_ready", extra={"error_type": type(exc).__name__})
@@ -85,16 +106,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     openai_settings = get_openai_settings()
     if openai_settings.enabled and openai_settings.api_key:
         try:
-            from openai import AsyncOpenAI
-
-            app.state.openai_client = AsyncOpenAI(api_key=openai_settings.api_key)
+            # Mesmo pool usado por Otto/extrator/Whisper (e pelo readiness)
+            app.state.openai_client = init_shared_openai_client(openai_settings)
         except Exception as exc:
             logger.warning("openai_client_not_ready", extra={"error_type": type(exc).__name__})
+        else:
+            if openai_settings.warmup_enabled:
+                await warmup_shared_openai_client()
+
+    start_background_workers(get_whatsapp_settings())
+    start_outbound_retry_recovery()
 
     yield
 
     logger.info("app_shutting_down", extra={"service": "atende-pyloto"})
     await drain_background_tasks(timeout_seconds=30.0)
+    # Depois do drain: envios das tasks drenadas ainda podem agendar retries
+    await stop_outbound_retry_worker(timeout_seconds=30.0)
+    # Pool HTTP fecha depois do drain: tarefas pendentes ainda enviam respostas
+    await close_graph_api_http_pool()
+    await close_shared_openai_client()
     redis_client = getattr(app.state, "redis_client", None)
     if redis_client is not None:
         close_async = getattr(redis_client, "aclose", None)
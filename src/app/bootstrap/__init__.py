@@ -25,7 +25,11 @@ from config.logging import configure_logging
 from config.settings import (
     get_firestore_settings,
     get_openai_settings,
+    get_outbound_retry_settings,
+    get_whatsapp_inbound_settings,
+    get_whatsapp_outbound_settings,
     get_whatsapp_settings,
+    get_work_queue_settings,
 )
 
 # Nome do serviço para logs e métricas
@@ -85,6 +89,9 @@ def validate_runtime_settings() -> None:
 
     wa_errors = get_whatsapp_settings().validate()
     errors.extend(f"whatsapp: {error}" for error in wa_errors)
+    errors.extend(f"whatsapp: {error}" for error in get_whatsapp_outbound_settings().validate())
+    errors.extend(f"whatsapp: {error}" for error in get_whatsapp_inbound_settings().validate())
+    errors.extend(f"outbound_retry: {error}" for error in get_outbound_retry_settings().validate())
 
     openai_errors = get_openai_settings().validate()
     errors.extend(f"openai: {error}" for error in openai_errors)
@@ -97,6 +104,10 @@ def validate_runtime_settings() -> None:
     firestore_errors = get_firestore_settings().validate(gcp_project)
     errors.extend(f"firestore: {error}" for error in firestore_errors)
 
+    if get_whatsapp_settings().webhook_processing_mode == "queue":
+        queue_errors = get_work_queue_settings().validate()
+        errors.extend(f"work_queue: {error}" for error in queue_errors)
+
     if not errors:
         logger.info(
             "settings_validated",
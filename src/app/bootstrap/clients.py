@@ -13,6 +13,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from google.cloud.firestore import AsyncClient as AsyncFirestoreClient
     from google.cloud.firestore import Client as FirestoreClient
     from redis import Redis
     from redis.asyncio import Redis as AsyncRedis
@@ -103,3 +104,21 @@ def create_firestore_client() -> FirestoreClient:
     client = firestore.Client(project=project_id)
     logger.info("firestore_client_created", extra={"project": project_id})
     return client
+
+
+@lru_cache(maxsize=1)
+def create_async_firestore_client() -> AsyncFirestoreClient:
+    """Cria cliente Firestore assíncrono (singleton).
+
+    O canal gRPC asyncio fica preso ao event loop em que é usado pela
+    primeira vez; deve ser criado dentro do lifespan da aplicação.
+
+    Returns:
+        Cliente Firestore assíncrono
+    """
+    from google.cloud import firestore
+
+    project_id = os.getenv("GCP_PROJECT") or os.getenv("FIRESTORE_PROJECT_ID")
+    client = firestore.AsyncClient(project=project_id)
+    logger.info("async_firestore_client_created", extra={"project": project_id})
+    return client
@@ -5,6 +5,10 @@ Mantém API pública estável enquanto as implementações ficam modularizadas.
 
 from __future__ import annotations
 
+from app.bootstrap.dependencies_contact_card import create_contact_card_store
+from app.bootstrap.dependencies_conversation import create_conversation_store
+from app.bootstrap.dependencies_journal import create_decision_journal
+from app.bootstrap.dependencies_queues import create_work_queue
 from app.bootstrap.dependencies_services import (
     create_calendar_service,
     create_contact_card_extractor_service,
@@ -15,7 +19,6 @@ from app.bootstrap.dependencies_stores import (
     create_async_dedupe_store,
     create_async_session_store,
     create_audit_store,
-    create_contact_card_store,
     create_dedupe_store,
     create_session_store,
 )
@@ -27,8 +30,11 @@ __all__ = [
     "create_calendar_service",
     "create_contact_card_extractor_service",
     "create_contact_card_store",
+    "create_conversation_store",
+    "create_decision_journal",
     "create_dedupe_store",
     "create_otto_agent_service",
     "create_session_store",
     "create_transcription_service",
+    "create_work_queue",
 ]
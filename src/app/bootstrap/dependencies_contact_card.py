@@ -0,0 +1,94 @@
+"""Factory do store de ContactCard (Firestore/Redis/memória) e do cache L1/L2."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from app.bootstrap.clients import (
+    create_async_firestore_client,
+    create_async_redis_client,
+    create_firestore_client,
+    create_redis_client,
+)
+from app.bootstrap.dependencies_env import runtime_environment
+from app.infra.stores import (
+    AsyncFirestoreContactCardStore,
+    CachedContactCardStore,
+    FirestoreContactCardStore,
+    MemoryContactCardStore,
+    RedisContactCardStore,
+)
+
+if TYPE_CHECKING:
+    from app.protocols.contact_card_store import ContactCardStoreProtocol
+
+logger = logging.getLogger(__name__)
+
+
+def create_contact_card_store() -> ContactCardStoreProtocol:
+    """Cria store de ContactCard baseado na configuração."""
+    environment = runtime_environment()
+    default_backend = "firestore" if environment in ("staging", "production") else "memory"
+    backend = os.getenv("CONTACT_CARD_BACKEND") or os.getenv("LEAD_PROFILE_BACKEND")
+    backend = (backend or default_backend).lower()
+
+    if backend == "firestore":
+        from config.settings import get_firestore_settings
+
+        use_async = get_firestore_settings().use_async_client
+        store: ContactCardStoreProtocol
+        if use_async:
+            store = AsyncFirestoreContactCardStore(create_async_firestore_client())
+        else:
+            store = FirestoreContactCardStore(create_firestore_client())
+        logger.info(
+            "contact_card_store_created",
+            extra={"backend": "firestore", "async_client": use_async},
+        )
+        return _with_contact_card_cache(store)
+
+    if backend == "redis":
+        redis_client = create_redis_client()
+        try:
+            async_client = create_async_redis_client()
+        except Exception:
+            async_client = None
+        logger.info("contact_card_store_created", extra={"backend": "redis"})
+        return RedisContactCardStore(redis_client, async_client)
+
+    if backend == "memory":
+        if environment not in ("development", "test"):
+            logger.warning(
+                "memory_contact_card_in_non_dev",
+                extra={"backend": "memory", "environment": environment},
+            )
+        logger.info("contact_card_store_created", extra={"backend": "memory"})
+        return MemoryContactCardStore()
+
+    msg = f"CONTACT_CARD_BACKEND invalido: {backend}"
+    raise ValueError(msg)
+
+
+def _with_contact_card_cache(store: ContactCardStoreProtocol) -> ContactCardStoreProtocol:
+    """Envolve o store de origem no cache L1/L2 (L2 só com Redis disponível)."""
+    from config.settings import get_contact_card_cache_settings
+
+    settings = get_contact_card_cache_settings()
+    if not settings.enabled:
+        return store
+    redis_client = None
+    if settings.l2_enabled:
+        try:
+            redis_client = create_async_redis_client()
+        except Exception:
+            redis_client = None
+    logger.info("contact_card_cache_enabled", extra={"l2": redis_client is not None})
+    return CachedContactCardStore(
+        store,
+        redis_client=redis_client,
+        l1_max_entries=settings.l1_max_entries,
+        l1_ttl_seconds=settings.l1_ttl_seconds,
+        l2_ttl_seconds=settings.l2_ttl_seconds,
+    )
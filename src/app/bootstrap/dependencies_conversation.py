@@ -0,0 +1,49 @@
+"""Factory do store permanente de conversas (Firestore sync/async)."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from app.bootstrap.clients import create_async_firestore_client, create_firestore_client
+from app.bootstrap.dependencies_env import runtime_environment
+from app.infra.stores import AsyncFirestoreConversationStore, FirestoreConversationStore
+
+if TYPE_CHECKING:
+    from app.protocols.conversation_store import ConversationStoreProtocol
+
+logger = logging.getLogger(__name__)
+
+
+def create_conversation_store() -> ConversationStoreProtocol | None:
+    """Cria store de conversas baseado na configuração.
+
+    `CONVERSATION_STORE_BACKEND`: `none` (default em todo ambiente) ou
+    `firestore`. O dual-write e a recuperação de histórico são opt-in
+    explícito; sem store, o histórico fica só na sessão.
+    """
+    environment = runtime_environment()
+    backend = (os.getenv("CONVERSATION_STORE_BACKEND") or "none").strip().lower()
+
+    if backend == "none":
+        logger.info("conversation_store_disabled", extra={"environment": environment})
+        return None
+
+    if backend == "firestore":
+        from config.settings import get_firestore_settings
+
+        use_async = get_firestore_settings().use_async_client
+        store: ConversationStoreProtocol
+        if use_async:
+            store = AsyncFirestoreConversationStore(create_async_firestore_client())
+        else:
+            store = FirestoreConversationStore(create_firestore_client())
+        logger.info(
+            "conversation_store_created",
+            extra={"backend": "firestore", "async_client": use_async},
+        )
+        return store
+
+    msg = f"CONVERSATION_STORE_BACKEND invalido: {backend}"
+    raise ValueError(msg)
@@ -0,0 +1,15 @@
+"""Helpers de ambiente compartilhados pelas factories do bootstrap."""
+
+from __future__ import annotations
+
+import os
+
+
+def runtime_environment() -> str:
+    """Ambiente de execução (`ENVIRONMENT`, default development)."""
+    return os.getenv("ENVIRONMENT", "development").lower()
+
+
+def default_backend_for_env(environment: str) -> str:
+    """Backend padrão dos stores: Redis em staging/produção, memória no resto."""
+    return "redis" if environment in ("staging", "production") else "memory"
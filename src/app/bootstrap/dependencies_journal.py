@@ -0,0 +1,26 @@
+"""Factory do diário de decisões (mesmo backend do dedupe)."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from app.bootstrap.clients import create_async_redis_client
+from app.bootstrap.dependencies_env import default_backend_for_env, runtime_environment
+from app.infra.stores import MemoryDecisionJournal, RedisDecisionJournal
+
+if TYPE_CHECKING:
+    from app.protocols.decision_journal import DecisionJournalProtocol
+
+
+def create_decision_journal() -> DecisionJournalProtocol | None:
+    """Cria diário de decisões no mesmo backend do dedupe (None se TTL = 0)."""
+    from config.settings import get_dedupe_settings
+
+    ttl = get_dedupe_settings().decision_journal_ttl_seconds
+    if ttl <= 0:
+        return None
+    backend = os.getenv("DEDUPE_BACKEND", default_backend_for_env(runtime_environment()))
+    if backend.lower() == "redis":
+        return RedisDecisionJournal(create_async_redis_client(), ttl_seconds=ttl)
+    return MemoryDecisionJournal(ttl_seconds=ttl)
@@ -0,0 +1,48 @@
+"""Factory da fila de trabalho do webhook (modo `queue`)."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from app.bootstrap.clients import create_async_redis_client
+from app.bootstrap.dependencies_env import runtime_environment
+from app.infra.queues import MemoryWorkQueue, RedisStreamWorkQueue
+
+if TYPE_CHECKING:
+    from app.protocols.work_queue import WorkQueueProtocol
+
+logger = logging.getLogger(__name__)
+
+
+def create_work_queue() -> WorkQueueProtocol:
+    """Cria fila de trabalho do webhook (modo `queue`) conforme configuração."""
+    from config.settings import get_work_queue_settings
+
+    settings = get_work_queue_settings()
+    if settings.backend == "redis":
+        queue = RedisStreamWorkQueue(
+            create_async_redis_client(),
+            stream_key=settings.stream_key,
+            group=settings.group,
+            dead_letter_key=settings.dead_letter_key,
+            visibility_timeout_seconds=settings.visibility_timeout_seconds,
+            max_attempts=settings.max_attempts,
+            block_ms=settings.block_ms,
+        )
+        logger.info("work_queue_created", extra={"backend": "redis"})
+        return queue
+
+    environment = runtime_environment()
+    if environment not in ("development", "test"):
+        logger.warning(
+            "memory_work_queue_in_non_dev",
+            extra={"backend": "memory", "environment": environment},
+        )
+    memory_queue = MemoryWorkQueue(
+        visibility_timeout_seconds=settings.visibility_timeout_seconds,
+        max_attempts=settings.max_attempts,
+        block_seconds=settings.block_ms / 1000,
+    )
+    logger.info("work_queue_created", extra={"backend": "memory"})
+    return memory_queue
@@ -12,13 +12,44 @@ def create_otto_agent_service() -> Any:
     """Cria OttoAgentService com client OpenAI configurado."""
     from ai.services.otto_agent import OttoAgentService
     from app.infra.ai.otto_client import OttoClient
+    from config.settings.ai.openai import get_openai_settings
 
     client = OttoClient()
-    service = OttoAgentService(client=client)
+    service = OttoAgentService(
+        client=client,
+        prompt_layout=get_openai_settings().prompt_layout,
+        router=_create_otto_model_router(client),
+    )
     logger.info("otto_agent_service_created")
     return service
 
 
+def _create_otto_model_router(full_client: Any) -> Any:
+    """Cria o roteador rápido/principal do Otto se habilitado nas settings."""
+    from ai.rules.otto_model_routing import ModelRoutingPolicy
+    from ai.services.otto_model_router import OttoModelRouter
+    from app.infra.ai.otto_client import OttoClient
+    from config.settings.ai.model_routing import get_model_routing_settings
+
+    settings = get_model_routing_settings()
+    if not settings.enabled:
+        return None
+    policy = ModelRoutingPolicy(
+        fast_states=frozenset(settings.fast_states),
+        max_fast_chars=settings.max_fast_chars,
+        escalation_confidence=settings.escalation_confidence,
+    )
+    logger.info(
+        "otto_model_router_created",
+        extra={"component": "bootstrap", "fast_model": settings.fast_model},
+    )
+    return OttoModelRouter(
+        full_client=full_client,
+        fast_client=OttoClient(model=settings.fast_model),
+        policy=policy,
+    )
+
+
 def create_contact_card_extractor_service() -> Any:
     """Cria ContactCardExtractorService com client OpenAI."""
     from ai.services.contact_card_extractor import ContactCardExtractorService
@@ -32,12 +63,13 @@ def create_contact_card_extractor_service() -> Any:
 
 def create_transcription_service() -> Any:
     """Cria TranscriptionAgent com dependências padrão."""
+    from app.bootstrap.whatsapp_adapters import graph_api_http_client_provider
     from app.infra.ai.whisper_client import WhisperClient
     from app.infra.whatsapp.media_downloader import WhatsAppMediaDownloader
     from app.services.transcription_agent import TranscriptionAgent
 
     service = TranscriptionAgent(
-        downloader=WhatsAppMediaDownloader(),
+        downloader=WhatsAppMediaDownloader(client_provider=graph_api_http_client_provider),
         whisper_client=WhisperClient(),
     )
     logger.info("transcription_service_created")
@@ -1,4 +1,8 @@
-"""Factories de stores e infra baseadas em configuração de ambiente."""
+"""Factories de stores (sessão, dedupe, auditoria) baseadas no ambiente.
+
+ContactCard, diário de decisões e fila de trabalho têm módulos próprios
+(`dependencies_contact_card`, `dependencies_journal`, `dependencies_queues`).
+"""
 
 from __future__ import annotations
 
@@ -11,39 +15,30 @@ from app.bootstrap.clients import (
     create_firestore_client,
     create_redis_client,
 )
+from app.bootstrap.dependencies_env import default_backend_for_env, runtime_environment
 from app.infra.stores import (
     FirestoreAuditStore,
-    FirestoreContactCardStore,
     MemoryAuditStore,
-    MemoryContactCardStore,
     MemoryDedupeStore,
     MemorySessionStore,
-    RedisContactCardStore,
     RedisDedupeStore,
+    RedisHashSessionStore,
     RedisSessionStore,
 )
+from app.infra.stores.session_codec import create_session_codec
 from app.protocols.dedupe import AsyncDedupeProtocol, DedupeProtocol
 from app.protocols.session_store import AsyncSessionStoreProtocol, SessionStoreProtocol
 
 if TYPE_CHECKING:
-    from app.protocols.contact_card_store import ContactCardStoreProtocol
     from app.protocols.decision_audit_store import DecisionAuditStoreProtocol
 
 logger = logging.getLogger(__name__)
 
 
-def _runtime_environment() -> str:
-    return os.getenv("ENVIRONMENT", "development").lower()
-
-
-def _default_backend_for_env(environment: str) -> str:
-    return "redis" if environment in ("staging", "production") else "memory"
-
-
 def create_session_store() -> SessionStoreProtocol:
     """Cria store de sessão baseado na configuração."""
-    environment = _runtime_environment()
-    backend = os.getenv("SESSION_STORE_BACKEND", _default_backend_for_env(environment)).lower()
+    environment = runtime_environment()
+    backend = os.getenv("SESSION_STORE_BACKEND", default_backend_for_env(environment)).lower()
 
     if backend == "redis":
         redis_client = create_redis_client()
@@ -51,8 +46,27 @@ def create_session_store() -> SessionStoreProtocol:
             async_client = create_async_redis_client()
         except Exception:
             async_client = None
-        store = RedisSessionStore(redis_client, async_client)
-        logger.info("session_store_created", extra={"backend": "redis"})
+        from config.settings import get_session_settings
+
+        session_settings = get_session_settings()
+        codec = create_session_codec(
+            session_settings.codec,
+            compress_threshold_bytes=session_settings.compress_threshold_bytes,
+        )
+        store_cls = (
+            RedisHashSessionStore
+            if session_settings.redis_layout == "hash"
+            else RedisSessionStore
+        )
+        store = store_cls(redis_client, async_client, codec=codec)
+        logger.info(
+            "session_store_created",
+            extra={
+                "backend": "redis",
+                "codec": codec.name,
+                "layout": session_settings.redis_layout,
+            },
+        )
         return store
 
     if backend == "memory":
@@ -61,9 +75,8 @@ def create_session_store() -> SessionStoreProtocol:
                 "memory_store_in_non_dev",
                 extra={"backend": "memory", "environment": environment},
             )
-        store = MemorySessionStore()
         logger.info("session_store_created", extra={"backend": "memory"})
-        return store
+        return MemorySessionStore()
 
     msg = f"SESSION_STORE_BACKEND inválido: {backend}"
     raise ValueError(msg)
@@ -80,8 +93,8 @@ def create_async_session_store() -> AsyncSessionStoreProtocol:
 
 def create_dedupe_store() -> DedupeProtocol:
     """Cria store de dedupe baseado na configuração."""
-    environment = _runtime_environment()
-    backend = os.getenv("DEDUPE_BACKEND", _default_backend_for_env(environment)).lower()
+    environment = runtime_environment()
+    backend = os.getenv("DEDUPE_BACKEND", default_backend_for_env(environment)).lower()
 
     if backend == "redis":
         redis_client = create_redis_client()
@@ -130,40 +143,3 @@ def create_audit_store() -> DecisionAuditStoreProtocol:
         return store
     msg = f"AUDIT_STORE_BACKEND inválido: {backend}"
     raise ValueError(msg)
-
-
-def create_contact_card_store() -> ContactCardStoreProtocol:
-    """Cria store de ContactCard baseado na configuração."""
-    environment = _runtime_environment()
-    default_backend = "firestore" if environment in ("staging", "production") else "memory"
-    backend = os.getenv("CONTACT_CARD_BACKEND") or os.getenv("LEAD_PROFILE_BACKEND")
-    backend = (backend or default_backend).lower()
-
-    if backend == "firestore":
-        firestore_client = create_firestore_client()
-        store = FirestoreContactCardStore(firestore_client)
-        logger.info("contact_card_store_created", extra={"backend": "firestore"})
-        return store
-
-    if backend == "redis":
-        redis_client = create_redis_client()
-        try:
-            async_client = create_async_redis_client()
-        except Exception:
-            async_client = None
-        store = RedisContactCardStore(redis_client, async_client)
-        logger.info("contact_card_store_created", extra={"backend": "redis"})
-        return store
-
-    if backend == "memory":
-        if environment not in ("development", "test"):
-            logger.warning(
-                "memory_contact_card_in_non_dev",
-                extra={"backend": "memory", "environment": environment},
-            )
-        store = MemoryContactCardStore()
-        logger.info("contact_card_store_created", extra={"backend": "memory"})
-        return store
-
-    msg = f"CONTACT_CARD_BACKEND invalido: {backend}"
-    raise ValueError(msg)
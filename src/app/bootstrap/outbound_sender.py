@@ -0,0 +1,132 @@
+"""Wiring da cadeia de envio outbound WhatsApp (bootstrap).
+
+Cadeia: `RetryingOutboundSender` → `ThrottledOutboundSender` →
+`GraphApiOutboundSender`. O worker de retry usa o sender de entrega (sem a
+camada de retry, para não reagendar a si mesmo) e é único por processo:
+sobe no primeiro retry agendado (ou no startup com backend Redis, para
+recuperar itens de instâncias recicladas) e para no shutdown.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from api.connectors.whatsapp.http_client import create_whatsapp_http_client
+from app.bootstrap.clients import create_async_redis_client
+from app.bootstrap.whatsapp_adapters import GraphApiOutboundSender
+from app.infra.queues import MemoryOutboundRetryQueue, RedisOutboundRetryQueue
+from app.services.outbound_retry import RetryingOutboundSender
+from app.services.outbound_retry_worker import OutboundRetryWorker
+from app.services.outbound_scheduler import ThrottledOutboundSender
+from config.settings import (
+    get_outbound_retry_settings,
+    get_whatsapp_outbound_settings,
+    get_whatsapp_settings,
+)
+
+if TYPE_CHECKING:
+    from app.protocols.outbound_retry_queue import OutboundRetryQueueProtocol
+    from app.protocols.outbound_sender import OutboundSenderProtocol
+
+logger = logging.getLogger(__name__)
+
+_delivery_sender: OutboundSenderProtocol | None = None
+_retry_queue: OutboundRetryQueueProtocol | None = None
+_retry_worker: OutboundRetryWorker | None = None
+
+
+def create_outbound_sender() -> OutboundSenderProtocol:
+    """Cria o sender usado pelos use cases (com retry atrasado se ativo)."""
+    if get_outbound_retry_settings().backend == "inline":
+        return _get_delivery_sender()
+    settings = get_outbound_retry_settings()
+    return RetryingOutboundSender(
+        _get_delivery_sender(),
+        _get_retry_queue(),
+        max_age_seconds=settings.max_age_seconds,
+        backoff_base_seconds=settings.backoff_base_seconds,
+        backoff_max_seconds=settings.backoff_max_seconds,
+        on_scheduled=start_outbound_retry_worker,
+    )
+
+
+def start_outbound_retry_recovery() -> None:
+    """Startup: com backend Redis, retoma retries de instâncias recicladas."""
+    if get_outbound_retry_settings().backend == "redis":
+        start_outbound_retry_worker()
+
+
+def start_outbound_retry_worker() -> None:
+    """Inicia o worker de retry do processo (idempotente)."""
+    global _retry_worker
+    if get_outbound_retry_settings().backend == "inline":
+        return
+    if _retry_worker is None:
+        settings = get_outbound_retry_settings()
+        _retry_worker = OutboundRetryWorker(
+            _get_delivery_sender(),
+            _get_retry_queue(),
+            backoff_base_seconds=settings.backoff_base_seconds,
+            backoff_max_seconds=settings.backoff_max_seconds,
+            poll_interval_seconds=settings.poll_interval_seconds,
+            batch_size=settings.batch_size,
+            lease_seconds=settings.lease_seconds,
+        )
+    _retry_worker.start()
+
+
+async def stop_outbound_retry_worker(timeout_seconds: float = 30.0) -> None:
+    """Para o worker; retries pendentes permanecem na fila."""
+    global _retry_worker
+    worker, _retry_worker = _retry_worker, None
+    if worker is None:
+        return
+    await worker.stop(timeout_seconds=timeout_seconds)
+    if isinstance(_retry_queue, MemoryOutboundRetryQueue) and _retry_queue.pending_count():
+        logger.warning(
+            "outbound_retry_pending_lost",
+            extra={"backend": "memory", "pending": _retry_queue.pending_count()},
+        )
+
+
+def _get_delivery_sender() -> OutboundSenderProtocol:
+    global _delivery_sender
+    if _delivery_sender is None:
+        _delivery_sender = _create_delivery_sender()
+    return _delivery_sender
+
+
+def _create_delivery_sender() -> OutboundSenderProtocol:
+    whatsapp = get_whatsapp_settings()
+    if get_outbound_retry_settings().backend == "inline":
+        sender = GraphApiOutboundSender()
+    else:
+        # Sem backoff dentro da task: a falha transitória vai para a fila
+        no_inline_retry = replace(whatsapp, max_retries=0)
+        sender = GraphApiOutboundSender(create_whatsapp_http_client(no_inline_retry))
+    outbound = get_whatsapp_outbound_settings()
+    if outbound.rate_per_second <= 0:
+        return sender
+    return ThrottledOutboundSender(
+        sender,
+        rate_per_second=outbound.rate_per_second,
+        burst=outbound.rate_burst,
+        batch_size=outbound.batch_size,
+        key_fn=lambda _request: whatsapp.phone_number_id,
+    )
+
+
+def _get_retry_queue() -> OutboundRetryQueueProtocol:
+    global _retry_queue
+    if _retry_queue is None:
+        settings = get_outbound_retry_settings()
+        if settings.backend == "redis":
+            _retry_queue = RedisOutboundRetryQueue(
+                create_async_redis_client(), key_prefix=settings.key_prefix
+            )
+        else:
+            _retry_queue = MemoryOutboundRetryQueue()
+        logger.info("outbound_retry_queue_created", extra={"backend": settings.backend})
+    return _retry_queue
@@ -6,9 +6,17 @@ Este módulo é o único autorizado a acoplar app <-> api.
 from __future__ import annotations
 
 import logging
-from typing import Any
-
-from api.connectors.whatsapp.http_client import WhatsAppHttpClient
+from typing import TYPE_CHECKING, Any
+
+from api.connectors.whatsapp.http_base import HttpError
+from api.connectors.whatsapp.http_client import WhatsAppHttpClient, create_whatsapp_http_client
+from api.connectors.whatsapp.http_pool import (
+    HttpPoolConfig,
+    close_shared_http_client,
+    get_shared_http_client,
+    init_shared_http_client,
+)
+from api.connectors.whatsapp.resilience import BulkheadFullError, CircuitOpenError
 from api.normalizers.whatsapp.normalizer import normalize_messages
 from api.payload_builders.whatsapp.factory import build_full_payload
 from api.validators.whatsapp.errors import ValidationError as ApiValidationError
@@ -18,10 +26,18 @@ from app.protocols.normalizer import MessageNormalizerProtocol
 from app.protocols.outbound_sender import OutboundSenderProtocol
 from app.protocols.payload_builder import PayloadBuilderProtocol
 from app.protocols.validator import OutboundRequestValidatorProtocol, ValidationError
-from config.settings import get_whatsapp_settings
+from config.settings import get_whatsapp_outbound_settings, get_whatsapp_settings
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
+_REJECTED_ERROR_CODES: dict[type[Exception], str] = {
+    CircuitOpenError: "WHATSAPP_CIRCUIT_OPEN",
+    BulkheadFullError: "WHATSAPP_BULKHEAD_FULL",
+}
+
 
 class GraphApiNormalizer(MessageNormalizerProtocol):
     """Normalizador baseado em Graph API."""
@@ -51,7 +67,19 @@ class GraphApiOutboundValidator(OutboundRequestValidatorProtocol):
 
 
 class GraphApiOutboundSender(OutboundSenderProtocol):
-    """Sender outbound usando cliente HTTP WhatsApp."""
+    """Sender outbound usando cliente HTTP WhatsApp.
+
+    O cliente é criado uma vez e reaproveita o pool HTTP compartilhado,
+    evitando handshake TCP+TLS por mensagem.
+    """
+
+    def __init__(self, http_client: WhatsAppHttpClient | None = None) -> None:
+        self._http_client = http_client
+
+    def _get_http_client(self) -> WhatsAppHttpClient:
+        if self._http_client is None:
+            self._http_client = create_whatsapp_http_client()
+        return self._http_client
 
     async def send(
         self,
@@ -66,8 +94,7 @@ class GraphApiOutboundSender(OutboundSenderProtocol):
         endpoint = f"{base_url}/{api_version}/{phone_id}/messages"
 
         try:
-            http_client = WhatsAppHttpClient()
-            response = await http_client.send_message(
+            response = await self._get_http_client().send_message(
                 endpoint=endpoint,
                 access_token=whatsapp.access_token,
                 payload=payload,
@@ -87,6 +114,17 @@ class GraphApiOutboundSender(OutboundSenderProtocol):
                 message_id=message_id,
             )
 
+        except (CircuitOpenError, BulkheadFullError) as exc:
+            # Falha rápida: Graph API degradada ou saturada, sem segurar a task
+            logger.warning(
+                "whatsapp_send_rejected",
+                extra={"reason": str(exc), "request_id": request.idempotency_key},
+            )
+            return OutboundMessageResponse(
+                success=False,
+                error_code=_REJECTED_ERROR_CODES[type(exc)],
+                error_message=str(exc),
+            )
         except Exception as exc:
             logger.error(
                 "whatsapp_send_failed",
@@ -95,8 +133,27 @@ class GraphApiOutboundSender(OutboundSenderProtocol):
                     "request_id": request.idempotency_key,
                 },
             )
+            # Transitório (429/5xx/timeout) pode ir para a fila de retry
+            transient = isinstance(exc, HttpError) and exc.is_retryable
             return OutboundMessageResponse(
                 success=False,
-                error_code="WHATSAPP_API_ERROR",
+                error_code="WHATSAPP_API_TRANSIENT" if transient else "WHATSAPP_API_ERROR",
                 error_message=str(exc),
             )
+
+
+def open_graph_api_http_pool() -> None:
+    """Cria o pool HTTP compartilhado da Graph API (startup do lifespan)."""
+    init_shared_http_client(
+        HttpPoolConfig.from_settings(get_whatsapp_settings(), get_whatsapp_outbound_settings())
+    )
+
+
+async def close_graph_api_http_pool() -> None:
+    """Fecha o pool HTTP compartilhado da Graph API (shutdown do lifespan)."""
+    await close_shared_http_client()
+
+
+def graph_api_http_client_provider() -> httpx.AsyncClient:
+    """Provider do AsyncClient compartilhado para adapters em app/infra."""
+    return get_shared_http_client()
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from app.bootstrap.whatsapp_adapters import (
     GraphApiNormalizer,
@@ -14,6 +14,10 @@ from app.bootstrap.whatsapp_adapters import (
 from app.coordinators.whatsapp.flows.sender import create_flow_sender
 from app.use_cases.whatsapp.send_outbound_message import SendOutboundMessageUseCase
 
+if TYPE_CHECKING:
+    from app.protocols.models import NormalizedMessage
+    from app.protocols.outbound_sender import OutboundSenderProtocol
+
 
 @dataclass(frozen=True, slots=True)
 class _InfraCryptoFunctions:
@@ -80,12 +84,16 @@ def create_whatsapp_outbound_use_case() -> SendOutboundMessageUseCase:
     )
 
 
-def create_whatsapp_outbound_sender() -> GraphApiOutboundSender:
-    """Cria sender outbound direto (implementa OutboundSenderProtocol).
+def create_whatsapp_outbound_sender() -> OutboundSenderProtocol:
+    """Cria sender outbound (implementa OutboundSenderProtocol).
 
-    Use para injetar em use cases que esperam OutboundSenderProtocol.
+    Use para injetar em use cases que esperam OutboundSenderProtocol. A
+    cadeia (token bucket, fila de retry atrasado) fica em
+    `app.bootstrap.outbound_sender`.
     """
-    return GraphApiOutboundSender()
+    from app.bootstrap.outbound_sender import create_outbound_sender
+
+    return create_outbound_sender()
 
 
 def create_whatsapp_normalizer() -> GraphApiNormalizer:
@@ -125,6 +133,7 @@ def create_process_inbound_canonical(
     transcription_service: Any | None = None,
     contact_card_extractor: Any | None = None,
     calendar_service: Any | None = None,
+    decision_journal: Any | None = None,
 ) -> Any:
     """Wiring para `ProcessInboundCanonicalUseCase` — injeta protocolos concretos.
 
@@ -136,16 +145,41 @@ def create_process_inbound_canonical(
         outbound_sender: Sender outbound
         conversation_store: Store de conversas permanente (Firestore, opcional)
         contact_card_store: Store de ContactCard (opcional)
+        decision_journal: Diário de decisões por message_id (opcional)
     """
+    from app.services.conversation_lanes import ConversationLaneScheduler
+    from app.services.message_burst_coalescer import MessageBurstCoalescer
+    from app.sessions.conversation_write_behind import ConversationWriteBehind
+    from app.sessions.history_compaction import HistoryCompactor
     from app.sessions.manager import SessionManager
     from app.use_cases.whatsapp.process_inbound_canonical import (
         ProcessInboundCanonicalUseCase,
     )
-
+    from config.settings import get_session_settings, get_whatsapp_inbound_settings
+
+    settings = get_whatsapp_inbound_settings()
+    session_settings = get_session_settings()
+    # A janela quente limita a sessão sempre; sem store o excedente só vira resumo
+    history_compactor = HistoryCompactor(
+        hot_window=session_settings.history_hot_window,
+        summary_max_chars=session_settings.history_summary_max_chars,
+    )
+    write_behind = None
+    if conversation_store is not None:
+        write_behind = ConversationWriteBehind.from_settings(conversation_store, session_settings)
     session_manager = SessionManager(
         store=session_store,
         conversation_store=conversation_store,
+        history_compactor=history_compactor,
+        write_behind=write_behind,
     )
+    burst_coalescer: MessageBurstCoalescer[NormalizedMessage] | None = None
+    if settings.coalesce_window_seconds > 0:
+        burst_coalescer = MessageBurstCoalescer(
+            window_seconds=settings.coalesce_window_seconds,
+            max_wait_seconds=settings.coalesce_max_wait_seconds,
+            max_items=settings.coalesce_max_messages,
+        )
 
     return ProcessInboundCanonicalUseCase(
         normalizer=normalizer,
@@ -157,4 +191,9 @@ def create_process_inbound_canonical(
         transcription_service=transcription_service,
         contact_card_extractor=contact_card_extractor,
         calendar_service=calendar_service,
+        decision_journal=decision_journal,
+        lane_scheduler=ConversationLaneScheduler(
+            max_depth=settings.lane_max_depth,
+        ),
+        burst_coalescer=burst_coalescer,
     )
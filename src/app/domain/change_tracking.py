@@ -0,0 +1,82 @@
+"""Rastreamento de campos alterados para escritas parciais nos stores.
+
+Toda atribuição a um campo do modelo marca o campo como sujo; contadores
+usam `increment()` para virar incremento no servidor (Firestore
+`Increment`, Redis `HINCRBY`) em vez de sobrescrever o valor absoluto.
+
+Mutação in-place de listas/dicts não é detectada: atribua um novo valor
+(como faz o merge de patch do ContactCard).
+
+`is_persisted` separa card novo (escrita completa) de card lido do store
+(escrita só dos campos sujos). Instâncias criadas/validadas do zero nunca
+são consideradas persistidas — na dúvida o store grava o documento todo.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr
+
+
+@dataclass(frozen=True, slots=True)
+class ModelChanges:
+    """Alterações pendentes: valores absolutos e incrementos por campo."""
+
+    values: dict[str, Any] = field(default_factory=dict)
+    increments: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.values and not self.increments
+
+    @property
+    def field_paths(self) -> list[str]:
+        return [*self.values, *self.increments]
+
+
+class ChangeTrackedModel(BaseModel):
+    """BaseModel que registra os campos alterados desde a última escrita."""
+
+    _dirty_fields: set[str] = PrivateAttr(default_factory=set)
+    _increments: dict[str, int] = PrivateAttr(default_factory=dict)
+    _persisted: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._dirty_fields.add(name)
+            # Valor absoluto atribuído depois vence o incremento pendente
+            self._increments.pop(name, None)
+
+    def __eq__(self, other: object) -> bool:
+        # Estado de rastreamento não faz parte da identidade do modelo
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def is_persisted(self) -> bool:
+        return self._persisted
+
+    def increment(self, field_name: str, by: int = 1) -> None:
+        """Soma `by` ao contador localmente e registra o incremento."""
+        super().__setattr__(field_name, getattr(self, field_name) + by)
+        if field_name in self._dirty_fields:
+            return  # já vai como valor absoluto
+        self._increments[field_name] = self._increments.get(field_name, 0) + by
+
+    def pending_changes(self) -> ModelChanges:
+        return ModelChanges(
+            values=self.model_dump(include=set(self._dirty_fields)),
+            increments=dict(self._increments),
+        )
+
+    def mark_persisted(self) -> None:
+        """Chamado pelo store após ler ou gravar: zera as alterações pendentes."""
+        self._dirty_fields.clear()
+        self._increments.clear()
+        self._persisted = True
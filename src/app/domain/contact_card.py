@@ -9,7 +9,9 @@ import re
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import Field, field_validator
+
+from app.domain.change_tracking import ChangeTrackedModel
 
 _PHONE_REGEX = re.compile(r"^\d{12,15}$")
 
@@ -18,8 +20,8 @@ def _utcnow() -> datetime:
     return datetime.now(UTC)
 
 
-class ContactCard(BaseModel):
-    """Perfil do lead armazenado no Firestore."""
+class ContactCard(ChangeTrackedModel):
+    """Perfil do lead armazenado no Firestore (com rastreamento de alterações)."""
 
     # Identificacao (sempre disponivel no webhook)
     wa_id: str = Field(..., description="WhatsApp ID unico", pattern=r"^\d{12,15}$")
@@ -192,6 +194,13 @@ def _append_status_lines(card: ContactCard, parts: list[str]) -> None:
 
 
 def _append_pending_lines(card: ContactCard, parts: list[str]) -> None:
+    missing = pending_crm_fields(card)
+    if missing:
+        parts.append(f"Pendencias CRM: {', '.join(missing[:6])}")
+
+
+def pending_crm_fields(card: ContactCard) -> list[str]:
+    """Campos de qualificação ainda não coletados (rótulos do prompt)."""
     missing: list[str] = []
     if not card.full_name:
         missing.append("nome")
@@ -209,8 +218,7 @@ def _append_pending_lines(card: ContactCard, parts: list[str]) -> None:
         missing.append("urgencia")
     if not card.budget_indication:
         missing.append("orcamento")
-    if missing:
-        parts.append(f"Pendencias CRM: {', '.join(missing[:6])}")
+    return missing
 
 
 def _append_if_not_none(parts: list[str], label: str, value: int | None) -> None:
@@ -7,20 +7,24 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
-
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING, Any
 
 from ai.utils._json_extractor import extract_json_from_response
+from app.infra.ai.openai_transport import get_shared_openai_client, hedged_create
+from app.infra.ai.openai_usage import record_openai_usage
+from app.infra.ai.request_hedging import RequestHedger, get_openai_request_hedger
 from config.settings.ai.openai import OpenAISettings, get_openai_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 
 class ContactCardExtractorClient:
     """Cliente LLM para extracao de patch do ContactCard."""
 
-    __slots__ = ("_client", "_model", "_timeout_seconds")
+    __slots__ = ("_client", "_hedger", "_model", "_timeout_seconds")
 
     def __init__(
         self,
@@ -30,16 +34,18 @@ class ContactCardExtractorClient:
         model: str | None = None,
         timeout_seconds: float | None = None,
         client: AsyncOpenAI | None = None,
+        hedger: RequestHedger | None = None,
     ) -> None:
         cfg = settings or get_openai_settings()
         self._model = model or cfg.model or "gpt-4o-mini"
+        self._hedger = hedger or get_openai_request_hedger()
         # Timeout curto conforme requisito (5-8s)
         self._timeout_seconds = float(timeout_seconds or min(cfg.timeout_seconds, 8.0))
         if client is not None:
             self._client = client
         else:
-            self._client = AsyncOpenAI(
-                api_key=api_key or cfg.api_key,
+            self._client = get_shared_openai_client().with_options(
+                api_key=api_key,
                 timeout=self._timeout_seconds,
             )
 
@@ -51,7 +57,9 @@ class ContactCardExtractorClient:
     ) -> dict[str, Any] | None:
         """Executa chamada OpenAI e retorna JSON parseado."""
         try:
-            response = await self._client.chat.completions.create(
+            response = await hedged_create(
+                self._client,
+                self._hedger,
                 model=self._model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -67,6 +75,7 @@ class ContactCardExtractorClient:
                 extra={"error_type": type(exc).__name__},
             )
             return None
+        record_openai_usage(response, "contact_card_extractor", "extract")
 
         content = None
         try:
@@ -0,0 +1,176 @@
+"""Transporte OpenAI compartilhado (process-wide) com pool e warmup.
+
+Responsabilidades:
+- Manter um único `AsyncOpenAI` por processo sobre um httpx.AsyncClient com
+  limites, keep-alive e HTTP/2 quando o pacote `h2` estiver disponível
+- Abrir a conexão (TCP+TLS) no startup para o primeiro turno não pagá-la
+- Contar requisições e conexões novas (reuso = requisições - conexões)
+- Encaminhar chat completions pelo hedger de cauda (`hedged_create`)
+
+Motivo: cada cliente (Otto, extrator, Whisper) criava o próprio AsyncOpenAI,
+com pool próprio; após cold start cada um pagava o handshake na primeira
+chamada. Os clientes derivam deste via `with_options` (mesmo pool, timeout
+próprio).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from openai import AsyncOpenAI
+
+from config.settings.ai.openai import OpenAISettings, get_openai_settings
+
+if TYPE_CHECKING:
+    from app.infra.ai.request_hedging import RequestHedger
+
+logger = logging.getLogger(__name__)
+
+_NEW_CONNECTION_EVENT = "connection.connect_tcp.complete"
+
+_shared_client: AsyncOpenAI | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OpenAIConnectionStats:
+    """Snapshot de reuso de conexões do transporte compartilhado."""
+
+    requests: int
+    new_connections: int
+
+    @property
+    def reused(self) -> int:
+        return max(0, self.requests - self.new_connections)
+
+    def as_dict(self) -> dict[str, Any]:
+        ratio = self.reused / self.requests if self.requests else 0.0
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused": self.reused,
+            "reuse_ratio": round(ratio, 4),
+        }
+
+
+class _ConnectionCounter:
+    """Conta requisições e conexões abertas via trace do httpcore."""
+
+    __slots__ = ("new_connections", "requests")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.new_connections = 0
+
+    async def on_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == _NEW_CONNECTION_EVENT:
+            self.new_connections += 1
+
+
+_counter = _ConnectionCounter()
+
+
+def _build_http_client(settings: OpenAISettings) -> httpx.AsyncClient:
+    use_http2 = settings.http2_enabled and importlib.util.find_spec("h2") is not None
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    return httpx.AsyncClient(
+        http2=use_http2,
+        limits=limits,
+        timeout=settings.timeout_seconds,
+        event_hooks={"request": [_counter.on_request]},
+    )
+
+
+def init_shared_openai_client(settings: OpenAISettings | None = None) -> AsyncOpenAI:
+    """Cria (ou reaproveita) o cliente OpenAI compartilhado do processo."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed():
+        return _shared_client
+    cfg = settings or get_openai_settings()
+    _shared_client = AsyncOpenAI(
+        api_key=cfg.api_key,
+        timeout=cfg.timeout_seconds,
+        http_client=_build_http_client(cfg),
+    )
+    logger.info(
+        "openai_transport_created",
+        extra={"component": "openai_transport", "action": "init", "result": "ok"},
+    )
+    return _shared_client
+
+
+def get_shared_openai_client() -> AsyncOpenAI:
+    """Retorna o cliente compartilhado, criando sob demanda fora do lifespan."""
+    if _shared_client is not None and not _shared_client.is_closed():
+        return _shared_client
+    return init_shared_openai_client()
+
+
+async def warmup_shared_openai_client(timeout_seconds: float = 5.0) -> bool:
+    """Abre a conexão com a API (melhor esforço; falha não bloqueia o boot)."""
+    client = get_shared_openai_client()
+    try:
+        await asyncio.wait_for(client.models.list(), timeout=timeout_seconds)
+    except Exception as exc:
+        logger.warning(
+            "openai_transport_warmup_failed",
+            extra={"component": "openai_transport", "error_type": type(exc).__name__},
+        )
+        return False
+    logger.info(
+        "openai_transport_warmed",
+        extra={"component": "openai_transport", "action": "warmup", "result": "ok"},
+    )
+    return True
+
+
+async def hedged_create(
+    client: AsyncOpenAI,
+    hedger: RequestHedger | None,
+    *,
+    model: str,
+    **kwargs: Any,
+) -> Any:
+    """Chat completion via hedger do processo (chamada direta sem hedger)."""
+    create = client.chat.completions.create
+    if hedger is None:
+        return await create(model=model, **kwargs)
+    return await hedger.run(model, lambda: create(model=model, **kwargs))
+
+
+def get_openai_connection_stats() -> OpenAIConnectionStats:
+    """Snapshot das estatísticas de reuso de conexão."""
+    return OpenAIConnectionStats(
+        requests=_counter.requests,
+        new_connections=_counter.new_connections,
+    )
+
+
+async def close_shared_openai_client() -> None:
+    """Fecha o cliente compartilhado (shutdown)."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is None or client.is_closed():
+        return
+    await client.close()
+    logger.info(
+        "openai_transport_closed",
+        extra={
+            "component": "openai_transport",
+            "action": "close",
+            "result": "ok",
+            **get_openai_connection_stats().as_dict(),
+        },
+    )
@@ -0,0 +1,29 @@
+"""Telemetria de uso de tokens das respostas OpenAI (incluindo cache de prompt)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.observability import get_correlation_id, record_token_usage
+
+
+def record_openai_usage(response: Any, component: str, operation: str) -> None:
+    """Registra `usage` da resposta; `cached_tokens` mede acerto do cache de prefixo."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    record_token_usage(
+        component,
+        operation,
+        prompt_tokens=_as_int(getattr(usage, "prompt_tokens", 0)),
+        completion_tokens=_as_int(getattr(usage, "completion_tokens", 0)),
+        total_tokens=_as_int(getattr(usage, "total_tokens", 0)),
+        correlation_id=get_correlation_id() or None,
+        cached_tokens=_as_int(getattr(details, "cached_tokens", 0)),
+    )
+
+
+def _as_int(value: Any) -> int:
+    # bool é int; respostas mockadas/parciais caem para 0
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
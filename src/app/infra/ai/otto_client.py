@@ -4,15 +4,20 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI
 from pydantic import ValidationError
 
 from ai.models.otto import OttoDecision
 from ai.utils._json_extractor import extract_json_from_response
+from app.infra.ai.openai_transport import get_shared_openai_client, hedged_create
+from app.infra.ai.openai_usage import record_openai_usage
+from app.infra.ai.request_hedging import RequestHedger, get_openai_request_hedger
 from config.settings.ai.openai import OpenAISettings, get_openai_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 _ALLOWED_STATES = [
@@ -34,7 +39,7 @@ _ALLOWED_MESSAGE_TYPES = ["text", "interactive_button", "interactive_list"]
 class OttoClient:
     """Cliente LLM para decisao do OttoAgent."""
 
-    __slots__ = ("_client", "_model", "_timeout_seconds", "_use_json_schema")
+    __slots__ = ("_client", "_hedger", "_model", "_timeout_seconds", "_use_json_schema")
 
     def __init__(
         self,
@@ -44,17 +49,19 @@ class OttoClient:
         model: str | None = None,
         timeout_seconds: float | None = None,
         client: AsyncOpenAI | None = None,
+        hedger: RequestHedger | None = None,
     ) -> None:
         cfg = settings or get_openai_settings()
         self._model = model or cfg.model or "gpt-4o"
+        self._hedger = hedger or get_openai_request_hedger()
         base_timeout = float(timeout_seconds or cfg.timeout_seconds or 12.0)
         self._timeout_seconds = max(10.0, min(base_timeout, 15.0))
         self._use_json_schema = True
         if client is not None:
             self._client = client
         else:
-            self._client = AsyncOpenAI(
-                api_key=api_key or cfg.api_key,
+            self._client = get_shared_openai_client().with_options(
+                api_key=api_key,
                 timeout=self._timeout_seconds,
             )
 
@@ -63,6 +70,7 @@ class OttoClient:
         response = await self._call_openai(system_prompt, user_prompt)
         if response is None:
             return None
+        record_openai_usage(response, "otto_client", "decide")
 
         content = _extract_content(response)
         if not content:
@@ -84,7 +92,9 @@ class OttoClient:
         if self._use_json_schema:
             response_format = _build_response_format()
             try:
-                return await self._client.chat.completions.create(
+                return await hedged_create(
+                    self._client,
+                    self._hedger,
                     model=self._model,
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -106,7 +116,9 @@ class OttoClient:
                     self._use_json_schema = False
 
         try:
-            return await self._client.chat.completions.create(
+            return await hedged_create(
+                self._client,
+                self._hedger,
                 model=self._model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -0,0 +1,165 @@
+"""Hedging de requisições OpenAI para cortar a cauda de latência.
+
+Se a requisição primária não responde até o percentil configurado da
+latência observada do modelo, dispara uma segunda idêntica e fica com a que
+terminar primeiro (a outra é cancelada). Um orçamento global limita as
+requisições extras a uma fração do tráfego (ex.: 5%), para que uma
+degradação do provedor não vire o dobro de chamadas.
+
+O hedger é compartilhado no processo (`get_openai_request_hedger`): Otto e
+extrator alimentam o mesmo orçamento e janelas de latência por modelo.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from app.observability import record_counter
+from config.settings.ai.hedging import OpenAIHedgeSettings, get_openai_hedge_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_METRIC_COMPONENT = "openai_hedge"
+_BUDGET_MAX_CREDITS = 10.0
+
+
+class LatencyWindow:
+    """Janela deslizante de latências por modelo com percentil sob demanda."""
+
+    __slots__ = ("_min_samples", "_samples", "_size")
+
+    def __init__(self, *, size: int, min_samples: int) -> None:
+        self._size = size
+        self._min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+
+    def observe(self, model: str, seconds: float) -> None:
+        window = self._samples.get(model)
+        if window is None:
+            window = self._samples[model] = deque(maxlen=self._size)
+        window.append(seconds)
+
+    def quantile(self, model: str, q: float) -> float | None:
+        """Percentil (nearest-rank) ou None enquanto não há amostras suficientes."""
+        window = self._samples.get(model)
+        if window is None or len(window) < self._min_samples:
+            return None
+        ordered = sorted(window)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """Orçamento de hedges: cada requisição credita `ratio`, cada hedge gasta 1.
+
+    Começa zerado, então o primeiro hedge só sai após ~1/ratio requisições;
+    o teto de créditos limita rajadas de hedge após períodos calmos.
+    """
+
+    __slots__ = ("_credits", "_lock", "_ratio")
+
+    def __init__(self, ratio: float) -> None:
+        self._ratio = ratio
+        self._credits = 0.0
+        self._lock = threading.Lock()
+
+    def on_request(self) -> None:
+        with self._lock:
+            self._credits = min(_BUDGET_MAX_CREDITS, self._credits + self._ratio)
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self._credits < 1.0:
+                return False
+            self._credits -= 1.0
+            return True
+
+
+class RequestHedger:
+    """Executa chamadas com hedge condicionado ao percentil do modelo."""
+
+    __slots__ = ("_budget", "_clock", "_settings", "_window")
+
+    def __init__(
+        self,
+        settings: OpenAIHedgeSettings,
+        *,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._settings = settings
+        self._clock = clock
+        self._window = LatencyWindow(size=settings.window_size, min_samples=settings.min_samples)
+        self._budget = HedgeBudget(settings.budget_ratio)
+
+    def hedge_delay(self, model: str) -> float | None:
+        """Atraso até o hedge, ou None se ainda não há histórico do modelo."""
+        threshold = self._window.quantile(model, self._settings.quantile)
+        if threshold is None:
+            return None
+        return max(threshold, self._settings.min_delay_seconds)
+
+    async def run[T](self, model: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Executa `call` (fábrica da requisição) com hedge se ela atrasar.
+
+        Se a primeira a terminar falhou, espera a outra; se ambas falharem,
+        propaga o erro da primeira. Cancelamento do chamador cancela ambas.
+        """
+        self._budget.on_request()
+        delay = self.hedge_delay(model)
+        started = self._clock()
+        primary = asyncio.ensure_future(call())
+        pending: set[asyncio.Future[T]] = {primary}
+        try:
+            if delay is not None:
+                await asyncio.wait(pending, timeout=delay)
+                if not primary.done():
+                    if self._budget.try_acquire():
+                        record_counter(_METRIC_COMPONENT, "fired", metadata={"model": model})
+                        pending.add(asyncio.ensure_future(call()))
+                    else:
+                        record_counter(
+                            _METRIC_COMPONENT, "budget_exhausted", metadata={"model": model}
+                        )
+            result = await self._first_success(pending, primary, model)
+            # Só sucessos entram na janela (erros rápidos puxariam o percentil
+            # para baixo); se o hedge venceu, o valor é um piso da primária.
+            self._window.observe(model, self._clock() - started)
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    async def _first_success[T](
+        pending: set[asyncio.Future[T]],
+        primary: asyncio.Future[T],
+        model: str,
+    ) -> T:
+        errors: list[BaseException] = []
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                error = task.exception()
+                if error is None:
+                    if task is not primary:
+                        record_counter(_METRIC_COMPONENT, "hedge_won", metadata={"model": model})
+                    return task.result()
+                errors.append(error)
+        raise errors[0]
+
+
+@lru_cache(maxsize=1)
+def get_openai_request_hedger() -> RequestHedger | None:
+    """Hedger compartilhado do processo (None quando hedging desligado)."""
+    settings = get_openai_hedge_settings()
+    if not settings.enabled:
+        return None
+    return RequestHedger(settings)
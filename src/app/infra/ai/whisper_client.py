@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import io
 import logging
-from typing import Any
-
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING, Any
 
+from app.infra.ai.openai_transport import get_shared_openai_client
 from app.protocols.transcription_service import TranscriptionResult
 from config.settings.ai.openai import OpenAISettings, get_openai_settings
 
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,8 +47,8 @@ class WhisperClient:
         if client is not None:
             self._client = client
         else:
-            self._client = AsyncOpenAI(
-                api_key=api_key or cfg.api_key,
+            self._client = get_shared_openai_client().with_options(
+                api_key=api_key,
                 timeout=self._timeout_seconds,
             )
 
@@ -0,0 +1,22 @@
+"""Queues — implementações concretas de filas de trabalho.
+
+Módulos disponíveis:
+    - redis_stream_work_queue: Fila durável com Redis Streams (consumer group)
+    - memory_work_queue: Fila em memória para desenvolvimento/testes
+    - redis_retry_queue: Retry atrasado de envios outbound (sorted set)
+    - memory_retry_queue: Retry outbound em memória (instância única)
+"""
+
+from __future__ import annotations
+
+from app.infra.queues.memory_retry_queue import MemoryOutboundRetryQueue
+from app.infra.queues.memory_work_queue import MemoryWorkQueue
+from app.infra.queues.redis_retry_queue import RedisOutboundRetryQueue
+from app.infra.queues.redis_stream_work_queue import RedisStreamWorkQueue
+
+__all__ = [
+    "MemoryOutboundRetryQueue",
+    "MemoryWorkQueue",
+    "RedisOutboundRetryQueue",
+    "RedisStreamWorkQueue",
+]
@@ -0,0 +1,56 @@
+"""Fila de retry outbound em memória — desenvolvimento e instância única.
+
+Mesma semântica do backend Redis (vencimento + arrendamento), sem
+durabilidade: envios pendentes se perdem em reinício do processo.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING
+
+from app.protocols.outbound_retry_queue import OutboundRetryQueueProtocol
+
+if TYPE_CHECKING:
+    from app.protocols.outbound_retry_queue import OutboundRetryEntry
+
+
+class MemoryOutboundRetryQueue(OutboundRetryQueueProtocol):
+    """Heap de vencimentos com remoção preguiçosa de reagendamentos."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, OutboundRetryEntry] = {}
+        self._due: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    async def schedule(self, entry: OutboundRetryEntry, due_at: float) -> None:
+        self._entries[entry.key] = entry
+        self._set_due(entry.key, due_at)
+
+    async def claim_due(
+        self,
+        now: float,
+        limit: int,
+        lease_seconds: float,
+    ) -> list[OutboundRetryEntry]:
+        claimed: list[OutboundRetryEntry] = []
+        while self._heap and self._heap[0][0] <= now and len(claimed) < limit:
+            due_at, key = heapq.heappop(self._heap)
+            if self._due.get(key) != due_at:
+                continue  # reagendado ou removido depois de entrar no heap
+            claimed.append(self._entries[key])
+        for entry in claimed:
+            self._set_due(entry.key, now + lease_seconds)
+        return claimed
+
+    async def ack(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._due.pop(key, None)
+
+    def pending_count(self) -> int:
+        """Envios aguardando nova tentativa (inclui arrendados)."""
+        return len(self._entries)
+
+    def _set_due(self, key: str, due_at: float) -> None:
+        self._due[key] = due_at
+        heapq.heappush(self._heap, (due_at, key))
@@ -0,0 +1,105 @@
+"""Fila de trabalho em memória — apenas para desenvolvimento e testes.
+
+Reproduz a semântica do backend Redis Streams (at-least-once, visibility
+timeout, dead-letter) sem durabilidade entre reinícios.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from app.protocols.work_queue import WorkItem, WorkQueueProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class MemoryWorkQueue(WorkQueueProtocol):
+    """Fila em memória com visibility timeout e dead-letter."""
+
+    def __init__(
+        self,
+        *,
+        visibility_timeout_seconds: float = 60.0,
+        max_attempts: int = 5,
+        block_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._visibility_timeout = visibility_timeout_seconds
+        self._max_attempts = max_attempts
+        self._block_seconds = block_seconds
+        self._clock = clock
+        self._ids = itertools.count(1)
+        self._ready: deque[WorkItem] = deque()
+        self._in_flight: dict[str, tuple[WorkItem, float]] = {}
+        self._dead_letters: list[tuple[WorkItem, str]] = []
+        self._available = asyncio.Event()
+
+    async def enqueue(self, payload: dict[str, Any]) -> str:
+        item = WorkItem(item_id=f"mem-{next(self._ids)}", payload=dict(payload))
+        self._push(item)
+        return item.item_id
+
+    async def claim(self, consumer: str, count: int = 1) -> list[WorkItem]:
+        self._reclaim_expired()
+        if not self._ready:
+            self._available.clear()
+            try:
+                await asyncio.wait_for(self._available.wait(), timeout=self._block_seconds)
+            except TimeoutError:
+                return []
+        deadline = self._clock() + self._visibility_timeout
+        claimed: list[WorkItem] = []
+        while self._ready and len(claimed) < count:
+            item = self._ready.popleft()
+            self._in_flight[item.item_id] = (item, deadline)
+            claimed.append(item)
+        return claimed
+
+    async def extend(self, consumer: str, items: list[WorkItem]) -> None:
+        deadline = self._clock() + self._visibility_timeout
+        for item in items:
+            if item.item_id in self._in_flight:
+                self._in_flight[item.item_id] = (item, deadline)
+
+    async def ack(self, item: WorkItem) -> None:
+        self._in_flight.pop(item.item_id, None)
+
+    async def nack(self, item: WorkItem, error_type: str) -> bool:
+        if self._in_flight.pop(item.item_id, None) is None:
+            # Visibility expirou e outro consumidor já reivindicou
+            return True
+        return self._retry_or_dead_letter(item, error_type)
+
+    @property
+    def dead_letters(self) -> list[tuple[WorkItem, str]]:
+        """Itens descartados com o motivo (apenas para testes)."""
+        return list(self._dead_letters)
+
+    def pending_count(self) -> int:
+        """Itens prontos + em processamento."""
+        return len(self._ready) + len(self._in_flight)
+
+    def _push(self, item: WorkItem) -> None:
+        self._ready.append(item)
+        self._available.set()
+
+    def _retry_or_dead_letter(self, item: WorkItem, error_type: str) -> bool:
+        attempts = item.attempts + 1
+        if attempts >= self._max_attempts:
+            self._dead_letters.append((item, error_type))
+            return False
+        self._push(WorkItem(item_id=item.item_id, payload=item.payload, attempts=attempts))
+        return True
+
+    def _reclaim_expired(self) -> None:
+        now = self._clock()
+        expired = [item for item, deadline in self._in_flight.values() if deadline <= now]
+        for item in expired:
+            # Consumidor sumiu sem ack: reentrega sem contar tentativa
+            del self._in_flight[item.item_id]
+            self._push(item)
@@ -0,0 +1,104 @@
+"""Fila de retry outbound sobre Redis (sorted set + hash).
+
+Layout:
+- `{prefix}:due`   ZSET  key -> epoch de vencimento
+- `{prefix}:items` HASH  key -> envio serializado (JSON)
+
+`claim_due` roda num script Lua: lê os vencidos e empurra o score para
+`now + lease`, de modo que duas instâncias nunca reivindicam o mesmo envio
+e um worker morto sem `ack` devolve o item após o arrendamento.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from app.protocols.outbound_retry_queue import OutboundRetryEntry, OutboundRetryQueueProtocol
+from utils.errors import RedisConnectionError
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+
+# KEYS = (due, items); ARGV = now, limit, lease_until.
+# Retorna [key, json, key, json, ...] dos itens arrendados.
+_CLAIM_SCRIPT = """
+local keys = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+local result = {}
+for _, key in ipairs(keys) do
+    local raw = redis.call('HGET', KEYS[2], key)
+    if raw then
+        redis.call('ZADD', KEYS[1], ARGV[3], key)
+        result[#result + 1] = key
+        result[#result + 1] = raw
+    else
+        redis.call('ZREM', KEYS[1], key)
+    end
+end
+return result
+"""
+
+
+class RedisOutboundRetryQueue(OutboundRetryQueueProtocol):
+    """Fila de retry compartilhada entre instâncias."""
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis[bytes],
+        *,
+        key_prefix: str = "whatsapp:outbound_retry",
+    ) -> None:
+        self._redis = redis_client
+        self._due_key = f"{key_prefix}:due"
+        self._items_key = f"{key_prefix}:items"
+        self._claim_script: Any = None
+
+    async def schedule(self, entry: OutboundRetryEntry, due_at: float) -> None:
+        try:
+            pipeline = self._redis.pipeline(transaction=True)
+            pipeline.hset(self._items_key, entry.key, json.dumps(asdict(entry), ensure_ascii=False))
+            pipeline.zadd(self._due_key, {entry.key: due_at})
+            await pipeline.execute()
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao agendar retry outbound no Redis") from exc
+
+    async def claim_due(
+        self,
+        now: float,
+        limit: int,
+        lease_seconds: float,
+    ) -> list[OutboundRetryEntry]:
+        if self._claim_script is None:
+            self._claim_script = self._redis.register_script(_CLAIM_SCRIPT)
+        try:
+            flat = await self._claim_script(
+                keys=[self._due_key, self._items_key],
+                args=[now, limit, now + lease_seconds],
+            )
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao reivindicar retries outbound no Redis") from exc
+        raw_items = (flat or [])[1::2]
+        return [_decode_entry(raw) for raw in raw_items]
+
+    async def ack(self, key: str) -> None:
+        try:
+            pipeline = self._redis.pipeline(transaction=True)
+            pipeline.zrem(self._due_key, key)
+            pipeline.hdel(self._items_key, key)
+            await pipeline.execute()
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao remover retry outbound do Redis") from exc
+
+
+def _decode_entry(raw: Any) -> OutboundRetryEntry:
+    text = raw.decode("utf-8") if isinstance(raw, bytes) else str(raw)
+    data = json.loads(text)
+    return OutboundRetryEntry(
+        key=str(data.get("key") or ""),
+        request=data.get("request") or {},
+        payload=data.get("payload") or {},
+        attempts=int(data.get("attempts") or 1),
+        deadline_at=float(data.get("deadline_at") or 0.0),
+        correlation_id=str(data.get("correlation_id") or ""),
+    )
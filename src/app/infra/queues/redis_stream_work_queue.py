@@ -0,0 +1,186 @@
+"""Fila de trabalho durável sobre Redis Streams (consumer groups).
+
+Semântica:
+- XADD publica; XREADGROUP entrega a um único consumidor do grupo
+- Item só sai do stream com XACK (at-least-once)
+- O consumidor renova o arrendamento com XCLAIM JUSTID (zera a ociosidade)
+- XAUTOCLAIM recupera itens ociosos além do visibility timeout
+  (instância reciclada pelo Cloud Run sem ack) e os reentrega como estão
+- Após `max_attempts` falhas (nack) o item vai para o stream de dead-letter
+
+Tentativas ficam no próprio item (campo `attempts`): retry = XADD de uma
+cópia com attempts+1 seguido de XACK/XDEL do original, na mesma transação.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+from app.protocols.work_queue import WorkItem, WorkQueueProtocol
+from utils.errors import RedisConnectionError
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis as AsyncRedis
+
+logger = logging.getLogger(__name__)
+
+_DEAD_LETTER_MAXLEN = 10_000
+
+
+class RedisStreamWorkQueue(WorkQueueProtocol):
+    """Fila durável usando Redis Streams + consumer group."""
+
+    def __init__(
+        self,
+        redis_client: AsyncRedis[bytes],
+        *,
+        stream_key: str,
+        group: str,
+        dead_letter_key: str,
+        visibility_timeout_seconds: float = 60.0,
+        max_attempts: int = 5,
+        block_ms: int = 1000,
+    ) -> None:
+        self._redis = redis_client
+        self._stream = stream_key
+        self._group = group
+        self._dead_letter = dead_letter_key
+        self._visibility_ms = int(visibility_timeout_seconds * 1000)
+        self._max_attempts = max_attempts
+        self._block_ms = block_ms
+        self._group_ready = False
+
+    async def enqueue(self, payload: dict[str, Any]) -> str:
+        try:
+            item_id = await self._redis.xadd(self._stream, _encode_fields(payload, attempts=0))
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao publicar item na fila Redis") from exc
+        return _as_str(item_id)
+
+    async def claim(self, consumer: str, count: int = 1) -> list[WorkItem]:
+        try:
+            await self._ensure_group()
+            items = await self._reclaim_idle(consumer, count)
+            if len(items) >= count:
+                return items
+            response = await self._redis.xreadgroup(
+                self._group,
+                consumer,
+                {self._stream: ">"},
+                count=count - len(items),
+                # Com itens reivindicados não espera por novos
+                block=None if items else self._block_ms,
+            )
+        except RedisConnectionError:
+            raise
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao consumir fila Redis") from exc
+        items.extend(
+            _decode_item(entry_id, fields) for entry_id, fields in _stream_entries(response)
+        )
+        return items
+
+    async def extend(self, consumer: str, items: list[WorkItem]) -> None:
+        if not items:
+            return
+        try:
+            await self._redis.xclaim(
+                self._stream,
+                self._group,
+                consumer,
+                min_idle_time=0,
+                message_ids=[item.item_id for item in items],
+                justid=True,
+            )
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao renovar itens da fila Redis") from exc
+
+    async def ack(self, item: WorkItem) -> None:
+        try:
+            pipeline = self._redis.pipeline(transaction=True)
+            pipeline.xack(self._stream, self._group, item.item_id)
+            pipeline.xdel(self._stream, item.item_id)
+            await pipeline.execute()
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao confirmar item da fila Redis") from exc
+
+    async def nack(self, item: WorkItem, error_type: str) -> bool:
+        attempts = item.attempts + 1
+        requeue = attempts < self._max_attempts
+        try:
+            pipeline = self._redis.pipeline(transaction=True)
+            if requeue:
+                pipeline.xadd(self._stream, _encode_fields(item.payload, attempts=attempts))
+            else:
+                fields = _encode_fields(item.payload, attempts=attempts)
+                fields["error_type"] = error_type
+                pipeline.xadd(
+                    self._dead_letter, fields, maxlen=_DEAD_LETTER_MAXLEN, approximate=True
+                )
+            pipeline.xack(self._stream, self._group, item.item_id)
+            pipeline.xdel(self._stream, item.item_id)
+            await pipeline.execute()
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao devolver item à fila Redis") from exc
+        if not requeue:
+            logger.warning(
+                "work_queue_dead_lettered",
+                extra={
+                    "component": "work_queue",
+                    "action": "nack",
+                    "result": "dead_letter",
+                    "attempts": attempts,
+                    "error_type": error_type,
+                },
+            )
+        return requeue
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self._redis.xgroup_create(self._stream, self._group, id="0", mkstream=True)
+        except Exception as exc:
+            # BUSYGROUP = grupo já existe (outra instância criou)
+            if "BUSYGROUP" not in str(exc):
+                raise
+        self._group_ready = True
+
+    async def _reclaim_idle(self, consumer: str, count: int) -> list[WorkItem]:
+        response = await self._redis.xautoclaim(
+            self._stream,
+            self._group,
+            consumer,
+            min_idle_time=self._visibility_ms,
+            start_id="0-0",
+            count=count,
+        )
+        claimed = response[1] if len(response) > 1 else []
+        return [_decode_item(entry_id, fields) for entry_id, fields in claimed if fields]
+
+
+def _encode_fields(payload: dict[str, Any], *, attempts: int) -> dict[str, str]:
+    return {"payload": json.dumps(payload, ensure_ascii=False), "attempts": str(attempts)}
+
+
+def _decode_item(entry_id: Any, fields: dict[Any, Any]) -> WorkItem:
+    decoded = {_as_str(key): _as_str(value) for key, value in fields.items()}
+    return WorkItem(
+        item_id=_as_str(entry_id),
+        payload=json.loads(decoded.get("payload") or "{}"),
+        attempts=int(decoded.get("attempts") or 0),
+    )
+
+
+def _stream_entries(response: Any) -> list[tuple[Any, dict[Any, Any]]]:
+    # Formato RESP2 do XREADGROUP: [[stream, [(id, fields), ...]], ...]
+    entries: list[tuple[Any, dict[Any, Any]]] = []
+    for _stream, stream_entries in response or []:
+        entries.extend((entry_id, fields) for entry_id, fields in stream_entries if fields)
+    return entries
+
+
+def _as_str(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
@@ -2,20 +2,34 @@
 
 Módulos disponíveis:
     - redis_session_store: Store de sessão usando Redis (Upstash)
+    - redis_hash_session_store: Store de sessão em hash + lista (escrita por delta)
     - redis_dedupe_store: Store de dedupe usando Redis (Upstash)
+    - redis_dedupe_batch: Claim em lote do dedupe Redis (scripts Lua)
     - firestore_audit_store: Store de auditoria usando Firestore
     - firestore_conversation_store: Store de conversas usando Firestore
     - contact_card_store: Store de ContactCard (Memory/Redis)
+    - contact_card_cache: Cache L1/L2 read-through de ContactCard
     - firestore_contact_card_store: Store de ContactCard (Firestore)
+    - firestore_async_contact_card_store: Store de ContactCard (Firestore AsyncClient)
+    - firestore_async_conversation_store: Store de conversas (Firestore AsyncClient)
     - memory_stores: Stores em memória para desenvolvimento/testes
+    - memory_dedupe_batch: Claim em lote do dedupe em memória
+    - decision_journal_store: Diário de decisões por message_id (Memory/Redis)
 """
 
 from __future__ import annotations
 
+from app.infra.stores.contact_card_cache import CachedContactCardStore
 from app.infra.stores.contact_card_store import (
     MemoryContactCardStore,
     RedisContactCardStore,
 )
+from app.infra.stores.decision_journal_store import (
+    MemoryDecisionJournal,
+    RedisDecisionJournal,
+)
+from app.infra.stores.firestore_async_contact_card_store import AsyncFirestoreContactCardStore
+from app.infra.stores.firestore_async_conversation_store import AsyncFirestoreConversationStore
 from app.infra.stores.firestore_audit_store import FirestoreAuditStore
 from app.infra.stores.firestore_contact_card_store import FirestoreContactCardStore
 from app.infra.stores.firestore_conversation_store import FirestoreConversationStore
@@ -25,17 +39,24 @@ from app.infra.stores.memory_stores import (
     MemorySessionStore,
 )
 from app.infra.stores.redis_dedupe_store import RedisDedupeStore
+from app.infra.stores.redis_hash_session_store import RedisHashSessionStore
 from app.infra.stores.redis_session_store import RedisSessionStore
 
 __all__ = [
+    "AsyncFirestoreContactCardStore",
+    "AsyncFirestoreConversationStore",
+    "CachedContactCardStore",
     "FirestoreAuditStore",
     "FirestoreContactCardStore",
     "FirestoreConversationStore",
     "MemoryAuditStore",
     "MemoryContactCardStore",
+    "MemoryDecisionJournal",
     "MemoryDedupeStore",
     "MemorySessionStore",
     "RedisContactCardStore",
+    "RedisDecisionJournal",
     "RedisDedupeStore",
+    "RedisHashSessionStore",
     "RedisSessionStore",
 ]
@@ -0,0 +1,150 @@
+"""Cache read-through em camadas para ContactCard (L1 processo → L2 Redis → store).
+
+- Carimbo de versão: `contact_card_cache:ver:{wa_id}` no Redis, INCR a
+  cada upsert. L1 e L2 guardam o carimbo com que foram preenchidos e só
+  valem enquanto ele for o atual — um upsert em outra instância invalida
+  as cópias das demais, e um preenchimento atrasado (lido antes de um
+  upsert concorrente) nunca volta a ser servido.
+- L1: LRU por processo com TTL; um hit custa só o GET do carimbo (sem
+  Redis, o TTL é o único limite de staleness).
+- L2: Redis compartilhado entre instâncias (card + carimbo).
+- Singleflight: buscas concorrentes do mesmo wa_id dividem uma única ida
+  ao store de origem (Firestore).
+
+Falhas do Redis degradam para o store de origem; o cache nunca é a fonte
+da verdade. Cards são copiados na entrada/saída do L1 para que mutações
+do chamador não vazem para outros turnos antes do upsert.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from app.infra.stores.contact_card_cache_l2 import RedisContactCardLayer
+from app.observability import record_counter
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.domain.contact_card import ContactCard
+    from app.protocols.contact_card_store import ContactCardStoreProtocol
+
+_METRIC_COMPONENT = "contact_card_cache"
+
+
+class CachedContactCardStore:
+    """Decorator de `ContactCardStoreProtocol` com L1/L2 e singleflight."""
+
+    def __init__(
+        self,
+        backend: ContactCardStoreProtocol,
+        *,
+        redis_client: Any | None = None,
+        l1_max_entries: int = 2048,
+        l1_ttl_seconds: float = 30.0,
+        l2_ttl_seconds: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._backend = backend
+        self._l2 = (
+            RedisContactCardLayer(redis_client, l2_ttl_seconds)
+            if redis_client is not None
+            else None
+        )
+        self._l1: OrderedDict[str, tuple[float, int | None, ContactCard]] = OrderedDict()
+        self._l1_max_entries = l1_max_entries
+        self._l1_ttl_seconds = l1_ttl_seconds
+        self._clock = clock
+        self._inflight: dict[str, asyncio.Task[ContactCard | None]] = {}
+        # Upserts durante uma busca em voo: o resultado dela pode ser anterior
+        # ao upsert e não deve sobrescrever o L1
+        self._generation = 0
+
+    async def get(self, wa_id: str) -> ContactCard | None:
+        return await self._read_through(wa_id, lambda: self._backend.get(wa_id))
+
+    async def get_or_create(self, wa_id: str, whatsapp_name: str) -> ContactCard:
+        card = await self._read_through(
+            wa_id,
+            lambda: self._backend.get_or_create(wa_id, whatsapp_name),
+        )
+        if card is None:  # busca em voo era um `get` de card inexistente
+            card = await self._backend.get_or_create(wa_id, whatsapp_name)
+        return card
+
+    async def upsert(self, contact_card: ContactCard) -> None:
+        await self._backend.upsert(contact_card)
+        self._generation += 1
+        version = await self._l2.bump_version(contact_card.wa_id) if self._l2 else None
+        self._l1_put(contact_card, version)
+        if self._l2 is not None and version is not None:
+            await self._l2.put(contact_card, version)
+
+    async def _read_through(
+        self,
+        wa_id: str,
+        load: Callable[[], Awaitable[ContactCard | None]],
+    ) -> ContactCard | None:
+        cached = self._l1_get(wa_id)
+        if cached is not None:
+            version, card = cached
+            current = await self._l2.current_version(wa_id) if self._l2 else None
+            if current in (version, None):
+                record_counter(_METRIC_COMPONENT, "hit", metadata={"layer": "l1"})
+                return card.model_copy(deep=True)
+            record_counter(_METRIC_COMPONENT, "stale", metadata={"layer": "l1"})
+        task = self._inflight.get(wa_id)
+        if task is None:
+            task = asyncio.create_task(self._load_layers(wa_id, load, self._generation))
+            self._inflight[wa_id] = task
+            task.add_done_callback(lambda done: self._release(wa_id, done))
+        else:
+            record_counter(_METRIC_COMPONENT, "coalesced")
+        # shield: cancelar um chamador não derruba a busca dos demais
+        loaded = await asyncio.shield(task)
+        return loaded.model_copy(deep=True) if loaded is not None else None
+
+    def _release(self, wa_id: str, task: asyncio.Task[ContactCard | None]) -> None:
+        if self._inflight.get(wa_id) is task:
+            del self._inflight[wa_id]
+        if not task.cancelled():
+            task.exception()  # consumida aqui caso todos os chamadores tenham saído
+
+    async def _load_layers(
+        self,
+        wa_id: str,
+        load: Callable[[], Awaitable[ContactCard | None]],
+        generation: int,
+    ) -> ContactCard | None:
+        card, version = await self._l2.get(wa_id) if self._l2 else (None, None)
+        if card is None:
+            record_counter(_METRIC_COMPONENT, "miss")
+            card = await load()
+            if card is not None and self._l2 is not None and version is not None:
+                await self._l2.put(card, version)
+        else:
+            record_counter(_METRIC_COMPONENT, "hit", metadata={"layer": "l2"})
+        if card is not None and generation == self._generation:
+            self._l1_put(card, version)
+        return card
+
+    def _l1_get(self, wa_id: str) -> tuple[int | None, ContactCard] | None:
+        entry = self._l1.get(wa_id)
+        if entry is None:
+            return None
+        expires_at, version, card = entry
+        if expires_at <= self._clock():
+            del self._l1[wa_id]
+            return None
+        self._l1.move_to_end(wa_id)
+        return version, card
+
+    def _l1_put(self, card: ContactCard, version: int | None) -> None:
+        expires_at = self._clock() + self._l1_ttl_seconds
+        self._l1[card.wa_id] = (expires_at, version, card.model_copy(deep=True))
+        self._l1.move_to_end(card.wa_id)
+        while len(self._l1) > self._l1_max_entries:
+            self._l1.popitem(last=False)
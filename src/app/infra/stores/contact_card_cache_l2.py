@@ -0,0 +1,92 @@
+"""Camada L2 (Redis) do cache de ContactCard, com carimbo de versão.
+
+Chaves:
+    contact_card_cache:{wa_id}      JSON {"v": versão, "card": {...}} com TTL
+    contact_card_cache:ver:{wa_id}  contador INCR a cada upsert
+
+Erros do Redis são contados e logados; quem chama cai para o store de
+origem.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+from app.domain.contact_card import ContactCard
+from app.observability import record_counter
+
+logger = logging.getLogger(__name__)
+
+_METRIC_COMPONENT = "contact_card_cache"
+_L2_PREFIX = "contact_card_cache:"
+_VERSION_PREFIX = "contact_card_cache:ver:"
+
+
+class RedisContactCardLayer:
+    """Cards versionados no Redis compartilhado entre instâncias."""
+
+    def __init__(self, redis_client: Any, ttl_seconds: int) -> None:
+        self._redis = redis_client
+        self._ttl_seconds = ttl_seconds
+
+    async def current_version(self, wa_id: str) -> int | None:
+        """Carimbo vigente; None em erro (o L1 segue valendo até o TTL)."""
+        try:
+            return int(await self._redis.get(f"{_VERSION_PREFIX}{wa_id}") or 0)
+        except Exception as exc:
+            _log_l2_error("version", exc)
+            return None
+
+    async def get(self, wa_id: str) -> tuple[ContactCard | None, int | None]:
+        """Card do L2 (se o carimbo for atual) e a versão vigente."""
+        try:
+            raw, raw_version = await self._redis.mget(
+                f"{_L2_PREFIX}{wa_id}",
+                f"{_VERSION_PREFIX}{wa_id}",
+            )
+            version = int(raw_version or 0)
+            if not raw:
+                return None, version
+            payload = json.loads(raw)
+            if payload.get("v") != version:
+                record_counter(_METRIC_COMPONENT, "stale", metadata={"layer": "l2"})
+                return None, version
+            card = ContactCard.model_validate(payload["card"])
+            card.mark_persisted()  # espelha o store: próximo upsert grava só o diff
+            return card, version
+        except Exception as exc:
+            _log_l2_error("get", exc)
+            return None, None
+
+    async def put(self, card: ContactCard, version: int) -> None:
+        payload = json.dumps({"v": version, "card": card.model_dump(mode="json")})
+        try:
+            await self._redis.set(f"{_L2_PREFIX}{card.wa_id}", payload, ex=self._ttl_seconds)
+        except Exception as exc:
+            _log_l2_error("set", exc)
+
+    async def bump_version(self, wa_id: str) -> int | None:
+        key = f"{_VERSION_PREFIX}{wa_id}"
+        try:
+            version = int(await self._redis.incr(key))
+            # Carimbo vive mais que qualquer card do L2: ao expirar, nenhum
+            # payload antigo pode coincidir com a versão reiniciada
+            await self._redis.expire(key, self._ttl_seconds * 2)
+        except Exception as exc:
+            _log_l2_error("incr", exc)
+            return None
+        return version
+
+
+def _log_l2_error(action: str, exc: Exception) -> None:
+    record_counter(_METRIC_COMPONENT, "l2_error", metadata={"action": action})
+    logger.warning(
+        "contact_card_cache_l2_error",
+        extra={
+            "component": _METRIC_COMPONENT,
+            "action": action,
+            "error_type": type(exc).__name__,
+        },
+    )
@@ -1,19 +1,25 @@
 """Implementacoes de store para ContactCard.
 
 Memory: desenvolvimento/testes.
-Redis: opcional para staging/produção.
+Redis: opcional para staging/produção. Cada card é um hash (um campo JSON
+por atributo), para que upserts gravem só os campos alterados (HSET/HDEL)
+e contadores usem HINCRBY. Cards no formato antigo (string JSON) são
+lidos e migrados para o hash na primeira leitura.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 from typing import Any
 
 from app.domain.contact_card import ContactCard
+from app.observability import record_counter
 
 logger = logging.getLogger(__name__)
 
 CONTACT_CARD_PREFIX = "contact_card:"
+CONTACT_CARD_HASH_PREFIX = "contact_card:h:"
 CONTACT_CARD_INDEX = "contact_cards:index"
 
 
@@ -30,11 +36,13 @@ class MemoryContactCardStore:
         card = self._cards.get(wa_id)
         if card is None:
             card = ContactCard(wa_id=wa_id, phone=wa_id, whatsapp_name=whatsapp_name)
+            card.mark_persisted()
             self._cards[wa_id] = card
             logger.info("contact_card_created", extra={"backend": "memory"})
         return card
 
     async def upsert(self, contact_card: ContactCard) -> None:
+        contact_card.mark_persisted()
         self._cards[contact_card.wa_id] = contact_card
 
 
@@ -52,24 +60,41 @@ class RedisContactCardStore:
     def _key(self, wa_id: str) -> str:
         return f"{CONTACT_CARD_PREFIX}{wa_id}"
 
-    async def get(self, wa_id: str) -> ContactCard | None:
-        if self._async_redis:
-            data = await self._async_redis.get(self._key(wa_id))
-        else:
-            data = self._redis.get(self._key(wa_id))
+    def _hash_key(self, wa_id: str) -> str:
+        return f"{CONTACT_CARD_HASH_PREFIX}{wa_id}"
 
-        if not data:
-            return None
+    async def _run(self, command: str, *args: Any) -> Any:
+        if self._async_redis:
+            return await getattr(self._async_redis, command)(*args)
+        return getattr(self._redis, command)(*args)
 
+    async def get(self, wa_id: str) -> ContactCard | None:
+        fields = await self._run("hgetall", self._hash_key(wa_id))
+        card: ContactCard | None
         try:
-            data_str = data if isinstance(data, str) else data.decode()
-            return ContactCard.model_validate_json(data_str)
+            if fields:
+                card = ContactCard.model_validate(
+                    {_text(name): json.loads(value) for name, value in fields.items()}
+                )
+            else:
+                card = await self._get_legacy(wa_id)
+                if card is None:
+                    return None
+                await self.upsert(card)  # migra para o hash
         except Exception as exc:
             logger.warning(
                 "contact_card_parse_error",
                 extra={"error": str(exc), "error_type": type(exc).__name__},
             )
             return None
+        card.mark_persisted()
+        return card
+
+    async def _get_legacy(self, wa_id: str) -> ContactCard | None:
+        data = await self._run("get", self._key(wa_id))
+        if not data:
+            return None
+        return ContactCard.model_validate_json(_text(data))
 
     async def get_or_create(self, wa_id: str, whatsapp_name: str) -> ContactCard:
         card = await self.get(wa_id)
@@ -79,11 +104,44 @@ class RedisContactCardStore:
         return card
 
     async def upsert(self, contact_card: ContactCard) -> None:
-        payload = contact_card.model_dump_json(exclude_none=True)
-        key = self._key(contact_card.wa_id)
+        changes = contact_card.pending_changes()
+        if contact_card.is_persisted and changes.is_empty:
+            record_counter("contact_card_store", "write_skipped")
+            return
+        client = self._async_redis or self._redis
+        pipe = client.pipeline(transaction=True)
+        key = self._hash_key(contact_card.wa_id)
+        if contact_card.is_persisted:
+            values = contact_card.model_dump(mode="json", include=set(changes.values))
+            _stage_partial_write(pipe, key, values, changes.increments)
+        else:
+            payload = contact_card.model_dump(mode="json", exclude_none=True)
+            pipe.delete(key, self._key(contact_card.wa_id))
+            pipe.hset(key, mapping={name: json.dumps(value) for name, value in payload.items()})
+            pipe.sadd(CONTACT_CARD_INDEX, contact_card.wa_id)
         if self._async_redis:
-            await self._async_redis.set(key, payload)
-            await self._async_redis.sadd(CONTACT_CARD_INDEX, contact_card.wa_id)
+            await pipe.execute()
         else:
-            self._redis.set(key, payload)
-            self._redis.sadd(CONTACT_CARD_INDEX, contact_card.wa_id)
+            pipe.execute()
+        contact_card.mark_persisted()
+
+
+def _stage_partial_write(
+    pipe: Any,
+    key: str,
+    values: dict[str, Any],
+    increments: dict[str, int],
+) -> None:
+    """Enfileira HSET/HDEL dos campos sujos e HINCRBY dos contadores."""
+    set_fields = {name: json.dumps(value) for name, value in values.items() if value is not None}
+    removed = [name for name, value in values.items() if value is None]
+    if set_fields:
+        pipe.hset(key, mapping=set_fields)
+    if removed:
+        pipe.hdel(key, *removed)
+    for name, amount in increments.items():
+        pipe.hincrby(key, name, amount)
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else value.decode()
@@ -0,0 +1,84 @@
+"""Stores do diário de decisões por message_id (Memory/Redis).
+
+O Redis compartilha o diário entre instâncias (a reentrega da Meta pode
+cair em outra); o backend em memória só ajuda quando a nova tentativa
+chega ao mesmo processo.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from app.protocols.decision_journal import DecisionJournalEntry, DecisionJournalProtocol
+from utils.errors import RedisConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from redis.asyncio import Redis as AsyncRedis
+
+DECISION_JOURNAL_PREFIX = "decision_journal:"
+
+
+class MemoryDecisionJournal(DecisionJournalProtocol):
+    """Diário em memória com expiração preguiçosa."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: dict[str, tuple[DecisionJournalEntry, float]] = {}
+
+    async def get(self, message_id: str) -> DecisionJournalEntry | None:
+        item = self._entries.get(message_id)
+        if item is None:
+            return None
+        entry, expires_at = item
+        if self._clock() >= expires_at:
+            del self._entries[message_id]
+            return None
+        return entry
+
+    async def save(self, message_id: str, entry: DecisionJournalEntry) -> None:
+        self._entries[message_id] = (entry, self._clock() + self._ttl)
+
+
+class RedisDecisionJournal(DecisionJournalProtocol):
+    """Diário em Redis: uma chave JSON por message_id com TTL."""
+
+    def __init__(self, redis_client: AsyncRedis[bytes], ttl_seconds: int = 3600) -> None:
+        self._redis = redis_client
+        self._ttl = ttl_seconds
+
+    async def get(self, message_id: str) -> DecisionJournalEntry | None:
+        try:
+            raw = await self._redis.get(f"{DECISION_JOURNAL_PREFIX}{message_id}")
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao ler diário de decisão no Redis") from exc
+        if not raw:
+            return None
+        return _decode_entry(raw)
+
+    async def save(self, message_id: str, entry: DecisionJournalEntry) -> None:
+        data = json.dumps(asdict(entry), ensure_ascii=False)
+        try:
+            await self._redis.set(f"{DECISION_JOURNAL_PREFIX}{message_id}", data, ex=self._ttl)
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao gravar diário de decisão no Redis") from exc
+
+
+def _decode_entry(raw: Any) -> DecisionJournalEntry:
+    data = json.loads(raw.decode("utf-8") if isinstance(raw, bytes) else raw)
+    sent = data.get("sent")
+    return DecisionJournalEntry(
+        decision=data.get("decision") or {},
+        tenant_intent=data.get("tenant_intent"),
+        loaded_contexts=list(data.get("loaded_contexts") or []),
+        sent=sent if isinstance(sent, bool) else None,
+    )
@@ -0,0 +1,79 @@
+"""Store de ContactCard usando o AsyncClient do Firestore.
+
+Mesma collection e formato do `FirestoreContactCardStore`, sem
+`asyncio.to_thread`: as chamadas vão direto pelo canal gRPC asyncio.
+Leituras degradam para None e escritas só logam em caso de erro.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from app.domain.contact_card import ContactCard
+from app.infra.stores.firestore_contact_card_store import (
+    CONTACT_CARDS_COLLECTION,
+    contact_card_changes,
+    is_missing_document,
+    new_contact_card,
+    skip_unchanged_contact_card,
+)
+from app.protocols.contact_card_store import ContactCardStoreProtocol
+
+if TYPE_CHECKING:
+    from google.cloud.firestore import AsyncClient as AsyncFirestoreClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFirestoreContactCardStore(ContactCardStoreProtocol):
+    """Store de ContactCard usando o AsyncClient do Firestore."""
+
+    def __init__(self, firestore_client: AsyncFirestoreClient) -> None:
+        self._db = firestore_client
+
+    async def get(self, wa_id: str) -> ContactCard | None:
+        try:
+            doc = await self._db.collection(CONTACT_CARDS_COLLECTION).document(wa_id).get()
+            if not doc.exists:
+                return None
+            card = ContactCard.from_firestore_dict(doc.to_dict() or {})
+            card.mark_persisted()
+            return card
+        except Exception as exc:
+            logger.error(
+                "contact_card_get_failed",
+                extra={"error": str(exc), "error_type": type(exc).__name__},
+            )
+            return None
+
+    async def get_or_create(self, wa_id: str, whatsapp_name: str) -> ContactCard:
+        existing = await self.get(wa_id)
+        if existing is not None:
+            return existing
+
+        contact_card = new_contact_card(wa_id, whatsapp_name)
+        await self.upsert(contact_card)
+        return contact_card
+
+    async def upsert(self, contact_card: ContactCard) -> None:
+        if skip_unchanged_contact_card(contact_card):
+            return
+        ref = self._db.collection(CONTACT_CARDS_COLLECTION).document(contact_card.wa_id)
+        try:
+            if not contact_card.is_persisted:
+                await ref.set(contact_card.to_firestore_dict(), merge=True)
+            else:
+                try:
+                    await ref.update(contact_card_changes(contact_card))
+                except Exception as exc:
+                    if not is_missing_document(exc):
+                        raise
+                    await ref.set(contact_card.to_firestore_dict(), merge=True)
+            contact_card.mark_persisted()
+            logger.debug("contact_card_upserted")
+        except Exception as exc:
+            logger.error(
+                "contact_card_upsert_failed",
+                extra={"error": str(exc), "error_type": type(exc).__name__},
+            )
@@ -0,0 +1,141 @@
+"""Store de conversas usando o AsyncClient do Firestore.
+
+Mesmas collections, chaves e formato de documento do
+`FirestoreConversationStore`, sem `asyncio.to_thread`: as chamadas vão
+direto pelo canal gRPC asyncio, sem ocupar o pool de threads default em
+picos de tráfego. Leituras degradam para vazio/None e escritas levantam
+`ConversationStoreError`, como no store síncrono.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from app.infra.stores.firestore_conversation_documents import (
+    CONVERSATIONS_COLLECTION,
+    LEADS_COLLECTION,
+    MAX_BATCH_WRITES,
+    conversation_key,
+    lead_from_document,
+    lead_to_document,
+    message_from_document,
+    message_to_document,
+    stage_batch_writes,
+)
+from app.protocols.conversation_store import (
+    ConversationMessage,
+    ConversationStoreError,
+    ConversationStoreProtocol,
+    LeadData,
+    PendingConversationMessage,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from google.cloud.firestore import AsyncClient as AsyncFirestoreClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFirestoreConversationStore(ConversationStoreProtocol):
+    """Store de conversas usando o AsyncClient do Firestore."""
+
+    def __init__(self, firestore_client: AsyncFirestoreClient) -> None:
+        self._db = firestore_client
+
+    def _messages(self, conv_key: str):  # type: ignore[no-untyped-def]
+        return (
+            self._db.collection(CONVERSATIONS_COLLECTION)
+            .document(conv_key)
+            .collection("messages")
+        )
+
+    async def append_message(
+        self,
+        phone_hash: str,
+        message: ConversationMessage,
+        *,
+        tenant_id: str = "default",
+    ) -> None:
+        conv_key = conversation_key(phone_hash, tenant_id)
+        try:
+            await (
+                self._messages(conv_key)
+                .document(message.message_id)
+                .set(message_to_document(message))
+            )
+        except Exception as exc:
+            logger.error(
+                "conversation_append_error",
+                extra={"error": str(exc), "conv_key": conv_key},
+            )
+            raise ConversationStoreError(f"Erro ao persistir mensagem: {exc}") from exc
+
+    async def get_messages(
+        self,
+        phone_hash: str,
+        *,
+        limit: int = 20,
+        tenant_id: str = "default",
+    ) -> Sequence[ConversationMessage]:
+        conv_key = conversation_key(phone_hash, tenant_id)
+        try:
+            query = self._messages(conv_key).order_by("timestamp").limit(limit)
+            return [message_from_document(doc.id, doc.to_dict()) async for doc in query.stream()]
+        except Exception as exc:
+            logger.error(
+                "conversation_get_error",
+                extra={"error": str(exc), "conv_key": conv_key},
+            )
+            return []
+
+    async def upsert_lead(self, lead: LeadData) -> None:
+        lead_key = conversation_key(lead.phone_hash, lead.tenant_id)
+        try:
+            await (
+                self._db.collection(LEADS_COLLECTION)
+                .document(lead_key)
+                .set(lead_to_document(lead), merge=True)
+            )
+        except Exception as exc:
+            logger.error(
+                "lead_upsert_error",
+                extra={"error": str(exc), "lead_key": lead_key},
+            )
+            raise ConversationStoreError(f"Erro ao persistir lead: {exc}") from exc
+
+    async def get_lead(
+        self,
+        phone_hash: str,
+        *,
+        tenant_id: str = "default",
+    ) -> LeadData | None:
+        lead_key = conversation_key(phone_hash, tenant_id)
+        try:
+            doc = await self._db.collection(LEADS_COLLECTION).document(lead_key).get()
+            if not doc.exists:
+                return None
+            return lead_from_document(doc.to_dict() or {}, phone_hash, tenant_id)
+        except Exception as exc:
+            logger.error(
+                "lead_get_error",
+                extra={"error": str(exc), "lead_key": lead_key},
+            )
+            return None
+
+    async def write_batch(
+        self,
+        messages: Sequence[PendingConversationMessage],
+        leads: Sequence[LeadData] = (),
+    ) -> None:
+        if len(messages) + len(leads) > MAX_BATCH_WRITES:
+            raise ConversationStoreError(f"Lote excede {MAX_BATCH_WRITES} escritas")
+        try:
+            batch = self._db.batch()
+            stage_batch_writes(self._db, batch, messages, leads)
+            await batch.commit()
+        except Exception as exc:
+            logger.error("conversation_batch_error", extra={"error": str(exc)})
+            raise ConversationStoreError(f"Erro ao persistir lote: {exc}") from exc
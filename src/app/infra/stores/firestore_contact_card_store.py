@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from app.domain.contact_card import ContactCard
+from app.observability import record_counter
 from app.protocols.contact_card_store import ContactCardStoreProtocol
 
 if TYPE_CHECKING:
@@ -32,7 +33,9 @@ class FirestoreContactCardStore(ContactCardStoreProtocol):
             if not doc.exists:
                 return None
             data = doc.to_dict() or {}
-            return ContactCard.from_firestore_dict(data)
+            card = ContactCard.from_firestore_dict(data)
+            card.mark_persisted()
+            return card
         except Exception as exc:
             logger.error(
                 "contact_card_get_failed",
@@ -45,26 +48,74 @@ class FirestoreContactCardStore(ContactCardStoreProtocol):
         if existing is not None:
             return existing
 
-        contact_card = ContactCard(
-            wa_id=wa_id,
-            phone=wa_id,
-            whatsapp_name=whatsapp_name,
-        )
+        contact_card = new_contact_card(wa_id, whatsapp_name)
         await self.upsert(contact_card)
         return contact_card
 
     async def upsert(self, contact_card: ContactCard) -> None:
+        if skip_unchanged_contact_card(contact_card):
+            return
         await asyncio.to_thread(self._upsert_sync, contact_card)
 
     def _upsert_sync(self, contact_card: ContactCard) -> None:
+        ref = self._db.collection(CONTACT_CARDS_COLLECTION).document(contact_card.wa_id)
         try:
-            data = contact_card.to_firestore_dict()
-            self._db.collection(CONTACT_CARDS_COLLECTION).document(contact_card.wa_id).set(
-                data, merge=True
-            )
+            if not contact_card.is_persisted:
+                ref.set(contact_card.to_firestore_dict(), merge=True)
+            else:
+                try:
+                    ref.update(contact_card_changes(contact_card))
+                except Exception as exc:
+                    if not is_missing_document(exc):
+                        raise
+                    ref.set(contact_card.to_firestore_dict(), merge=True)
+            contact_card.mark_persisted()
             logger.debug("contact_card_upserted")
         except Exception as exc:
             logger.error(
                 "contact_card_upsert_failed",
                 extra={"error": str(exc), "error_type": type(exc).__name__},
             )
+
+
+def new_contact_card(wa_id: str, whatsapp_name: str) -> ContactCard:
+    """Card novo (ainda não persistido) para o primeiro contato."""
+    return ContactCard.model_validate(
+        {"wa_id": wa_id, "phone": wa_id, "whatsapp_name": whatsapp_name}
+    )
+
+
+def skip_unchanged_contact_card(contact_card: ContactCard) -> bool:
+    """Card já persistido sem alterações: nenhuma escrita é necessária."""
+    if contact_card.is_persisted and contact_card.pending_changes().is_empty:
+        record_counter("contact_card_store", "write_skipped")
+        return True
+    return False
+
+
+def contact_card_changes(contact_card: ContactCard) -> dict[str, Any]:
+    """Campos alterados de um card já persistido, para `update`.
+
+    As chaves do `update` são a máscara: o Firestore grava só esses caminhos;
+    contadores viram `Increment` no servidor. Card novo usa o documento
+    completo (`to_firestore_dict`).
+    """
+    from google.cloud import firestore
+
+    changes = contact_card.pending_changes()
+    data: dict[str, Any] = dict(changes.values)
+    for field_name, amount in changes.increments.items():
+        data[field_name] = firestore.Increment(amount)
+    record_counter(
+        "contact_card_store",
+        "partial_write",
+        metadata={"fields": len(changes.field_paths)},
+    )
+    return data
+
+
+def is_missing_document(exc: Exception) -> bool:
+    """`update` em documento removido fora do app: regrava o card completo."""
+    from google.api_core.exceptions import NotFound
+
+    return isinstance(exc, NotFound)
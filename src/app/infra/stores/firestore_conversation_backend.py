@@ -3,22 +3,33 @@
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from app.protocols.conversation_store import (
-    ConversationMessage,
-    ConversationStoreError,
-    LeadData,
+from app.infra.stores.firestore_conversation_documents import (
+    CONVERSATIONS_COLLECTION,
+    LEADS_COLLECTION,
+    MAX_BATCH_WRITES,
+    conversation_key,
+    lead_from_document,
+    lead_to_document,
+    message_from_document,
+    message_to_document,
+    stage_batch_writes,
 )
+from app.protocols.conversation_store import ConversationStoreError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from google.cloud.firestore import Client as FirestoreClient
 
-logger = logging.getLogger(__name__)
+    from app.protocols.conversation_store import (
+        ConversationMessage,
+        LeadData,
+        PendingConversationMessage,
+    )
 
-CONVERSATIONS_COLLECTION = "conversations"
-LEADS_COLLECTION = "leads"
+logger = logging.getLogger(__name__)
 
 
 class FirestoreConversationBackend:
@@ -29,7 +40,7 @@ class FirestoreConversationBackend:
 
     @staticmethod
     def conversation_key(phone_hash: str, tenant_id: str) -> str:
-        return f"{tenant_id}_{phone_hash}"
+        return conversation_key(phone_hash, tenant_id)
 
     def append_message(
         self,
@@ -38,16 +49,7 @@ class FirestoreConversationBackend:
         tenant_id: str,
     ) -> None:
         conv_key = self.conversation_key(phone_hash, tenant_id)
-        doc_data = {
-            "message_id": message.message_id,
-            "role": message.role,
-            "content": message.content,
-            "timestamp": message.timestamp.isoformat(),
-            "channel": message.channel,
-            "detected_intent": message.detected_intent,
-            "metadata": message.metadata,
-            "created_at": datetime.now(UTC),
-        }
+        doc_data = message_to_document(message)
         try:
             (
                 self._db.collection(CONVERSATIONS_COLLECTION)
@@ -87,20 +89,7 @@ class FirestoreConversationBackend:
                 .limit(limit)
                 .stream()
             )
-            messages: list[ConversationMessage] = []
-            for doc in docs:
-                data = doc.to_dict()
-                messages.append(
-                    ConversationMessage(
-                        message_id=data.get("message_id", doc.id),
-                        role=data.get("role", "user"),
-                        content=data.get("content", ""),
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
-                        channel=data.get("channel", "whatsapp"),
-                        detected_intent=data.get("detected_intent", ""),
-                        metadata=data.get("metadata", {}),
-                    )
-                )
+            messages = [message_from_document(doc.id, doc.to_dict()) for doc in docs]
             logger.debug(
                 "conversation_messages_retrieved",
                 extra={"conv_key": conv_key, "count": len(messages)},
@@ -115,19 +104,7 @@ class FirestoreConversationBackend:
 
     def upsert_lead(self, lead: LeadData) -> None:
         lead_key = self.conversation_key(lead.phone_hash, lead.tenant_id)
-        doc_data = {
-            "phone_hash": lead.phone_hash,
-            "name": lead.name,
-            "email": lead.email,
-            "first_contact": lead.first_contact.isoformat() if lead.first_contact else None,
-            "last_contact": lead.last_contact.isoformat() if lead.last_contact else None,
-            "primary_intent": lead.primary_intent,
-            "total_messages": lead.total_messages,
-            "tenant_id": lead.tenant_id,
-            "channel": lead.channel,
-            "metadata": lead.metadata,
-            "updated_at": datetime.now(UTC),
-        }
+        doc_data = lead_to_document(lead)
         try:
             self._db.collection(LEADS_COLLECTION).document(lead_key).set(doc_data, merge=True)
             logger.debug("lead_upserted", extra={"lead_key": lead_key})
@@ -144,30 +121,26 @@ class FirestoreConversationBackend:
             doc = self._db.collection(LEADS_COLLECTION).document(lead_key).get()
             if not doc.exists:
                 return None
-            data = doc.to_dict()
-            return LeadData(
-                phone_hash=data.get("phone_hash", phone_hash),
-                name=data.get("name", ""),
-                email=data.get("email", ""),
-                first_contact=(
-                    datetime.fromisoformat(data["first_contact"])
-                    if data.get("first_contact")
-                    else None
-                ),
-                last_contact=(
-                    datetime.fromisoformat(data["last_contact"])
-                    if data.get("last_contact")
-                    else None
-                ),
-                primary_intent=data.get("primary_intent", ""),
-                total_messages=data.get("total_messages", 0),
-                tenant_id=data.get("tenant_id", tenant_id),
-                channel=data.get("channel", "whatsapp"),
-                metadata=data.get("metadata", {}),
-            )
+            return lead_from_document(doc.to_dict() or {}, phone_hash, tenant_id)
         except Exception as exc:
             logger.error(
                 "lead_get_error",
                 extra={"error": str(exc), "lead_key": lead_key},
             )
             return None
+
+    def write_batch(
+        self,
+        messages: Sequence[PendingConversationMessage],
+        leads: Sequence[LeadData],
+    ) -> None:
+        if len(messages) + len(leads) > MAX_BATCH_WRITES:
+            raise ConversationStoreError(f"Lote excede {MAX_BATCH_WRITES} escritas")
+        try:
+            batch = self._db.batch()
+            writes = stage_batch_writes(self._db, batch, messages, leads)
+            batch.commit()
+            logger.debug("conversation_batch_committed", extra={"writes": writes})
+        except Exception as exc:
+            logger.error("conversation_batch_error", extra={"error": str(exc)})
+            raise ConversationStoreError(f"Erro ao persistir lote: {exc}") from exc
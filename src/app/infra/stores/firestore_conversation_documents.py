@@ -0,0 +1,107 @@
+"""Formato dos documentos de conversa/lead no Firestore.
+
+Compartilhado pelos backends síncrono e assíncrono para que ambos gravem
+(e leiam) exatamente o mesmo formato, inclusive nas escritas em lote.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from app.protocols.conversation_store import ConversationMessage, LeadData
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.protocols.conversation_store import PendingConversationMessage
+
+CONVERSATIONS_COLLECTION = "conversations"
+LEADS_COLLECTION = "leads"
+# Limite de operações por commit de WriteBatch do Firestore
+MAX_BATCH_WRITES = 500
+
+
+def conversation_key(phone_hash: str, tenant_id: str) -> str:
+    return f"{tenant_id}_{phone_hash}"
+
+
+def stage_batch_writes(
+    db: Any,
+    batch: Any,
+    messages: Sequence[PendingConversationMessage],
+    leads: Sequence[LeadData],
+) -> int:
+    """Adiciona os sets ao batch (sync ou async: só o commit difere)."""
+    for pending in messages:
+        ref = (
+            db.collection(CONVERSATIONS_COLLECTION)
+            .document(conversation_key(pending.phone_hash, pending.tenant_id))
+            .collection("messages")
+            .document(pending.message.message_id)
+        )
+        batch.set(ref, message_to_document(pending.message))
+    for lead in leads:
+        ref = db.collection(LEADS_COLLECTION).document(
+            conversation_key(lead.phone_hash, lead.tenant_id)
+        )
+        batch.set(ref, lead_to_document(lead), merge=True)
+    return len(messages) + len(leads)
+
+
+def message_to_document(message: ConversationMessage) -> dict[str, Any]:
+    return {
+        "message_id": message.message_id,
+        "role": message.role,
+        "content": message.content,
+        "timestamp": message.timestamp.isoformat(),
+        "channel": message.channel,
+        "detected_intent": message.detected_intent,
+        "metadata": message.metadata,
+        "created_at": datetime.now(UTC),
+    }
+
+
+def message_from_document(doc_id: str, data: dict[str, Any]) -> ConversationMessage:
+    return ConversationMessage(
+        message_id=data.get("message_id", doc_id),
+        role=data.get("role", "user"),
+        content=data.get("content", ""),
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        channel=data.get("channel", "whatsapp"),
+        detected_intent=data.get("detected_intent", ""),
+        metadata=data.get("metadata", {}),
+    )
+
+
+def lead_to_document(lead: LeadData) -> dict[str, Any]:
+    return {
+        "phone_hash": lead.phone_hash,
+        "name": lead.name,
+        "email": lead.email,
+        "first_contact": lead.first_contact.isoformat() if lead.first_contact else None,
+        "last_contact": lead.last_contact.isoformat() if lead.last_contact else None,
+        "primary_intent": lead.primary_intent,
+        "total_messages": lead.total_messages,
+        "tenant_id": lead.tenant_id,
+        "channel": lead.channel,
+        "metadata": lead.metadata,
+        "updated_at": datetime.now(UTC),
+    }
+
+
+def lead_from_document(data: dict[str, Any], phone_hash: str, tenant_id: str) -> LeadData:
+    first_contact = data.get("first_contact")
+    last_contact = data.get("last_contact")
+    return LeadData(
+        phone_hash=data.get("phone_hash", phone_hash),
+        name=data.get("name", ""),
+        email=data.get("email", ""),
+        first_contact=datetime.fromisoformat(first_contact) if first_contact else None,
+        last_contact=datetime.fromisoformat(last_contact) if last_contact else None,
+        primary_intent=data.get("primary_intent", ""),
+        total_messages=data.get("total_messages", 0),
+        tenant_id=data.get("tenant_id", tenant_id),
+        channel=data.get("channel", "whatsapp"),
+        metadata=data.get("metadata", {}),
+    )
@@ -10,6 +10,7 @@ from app.protocols.conversation_store import (
     ConversationMessage,
     ConversationStoreProtocol,
     LeadData,
+    PendingConversationMessage,
 )
 
 if TYPE_CHECKING:
@@ -64,3 +65,11 @@ class FirestoreConversationStore(ConversationStoreProtocol):
         tenant_id: str = "default",
     ) -> LeadData | None:
         return await asyncio.to_thread(self._backend.get_lead, phone_hash, tenant_id)
+
+    async def write_batch(
+        self,
+        messages: Sequence[PendingConversationMessage],
+        leads: Sequence[LeadData] = (),
+    ) -> None:
+        """Um único commit de WriteBatch para todo o lote."""
+        await asyncio.to_thread(self._backend.write_batch, messages, leads)
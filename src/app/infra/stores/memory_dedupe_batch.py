@@ -0,0 +1,57 @@
+"""Claim em lote do dedupe em memória (token de posse por chave).
+
+Sem await entre check e mark, o claim é atômico dentro do event loop.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class MemoryDedupeBatchMixin:
+    """API de claim em lote sobre o estado do `MemoryDedupeStore`."""
+
+    _processed: dict[str, float]
+    _processing: dict[str, float]
+    _claim_tokens: dict[str, str]
+    _cleanup_expired: Callable[[], None]
+
+    async def claim_many(
+        self,
+        keys: Iterable[str],
+        ttl: int | None = None,
+    ) -> dict[str, str]:
+        """Reivindica chaves novas (atômico: sem await entre check e mark)."""
+        self._cleanup_expired()
+        token = uuid.uuid4().hex
+        expires_at = time.time() + (30 if ttl is None else ttl)
+        claims: dict[str, str] = {}
+        for key in dict.fromkeys(keys):
+            if key in self._processed or key in self._processing:
+                continue
+            self._processing[key] = expires_at
+            self._claim_tokens[key] = token
+            claims[key] = token
+        return claims
+
+    async def complete_many(self, claims: dict[str, str], ttl: int | None = None) -> None:
+        """Marca processadas; só remove claims que ainda pertencem ao token."""
+        expires_at = time.time() + (3600 if ttl is None else ttl)
+        for key, token in claims.items():
+            self._processed[key] = expires_at
+            self._drop_owned_claim(key, token)
+
+    async def release_many(self, claims: dict[str, str]) -> None:
+        """Libera apenas claims que ainda pertencem ao token."""
+        for key, token in claims.items():
+            self._drop_owned_claim(key, token)
+
+    def _drop_owned_claim(self, key: str, token: str) -> None:
+        if self._claim_tokens.get(key) == token:
+            self._processing.pop(key, None)
+            self._claim_tokens.pop(key, None)
@@ -9,6 +9,7 @@ import json
 import time
 from typing import Any
 
+from app.infra.stores.memory_dedupe_batch import MemoryDedupeBatchMixin
 from app.protocols.decision_audit_store import DecisionAuditStoreProtocol
 from app.protocols.dedupe import AsyncDedupeProtocol, DedupeProtocol
 from app.protocols.session_store import AsyncSessionStoreProtocol, SessionStoreProtocol
@@ -96,12 +97,13 @@ class MemorySessionStore(SessionStoreProtocol, AsyncSessionStoreProtocol):
         return self._exists_sync(session_id)
 
 
-class MemoryDedupeStore(DedupeProtocol, AsyncDedupeProtocol):
+class MemoryDedupeStore(MemoryDedupeBatchMixin, DedupeProtocol, AsyncDedupeProtocol):
     """Store de dedupe em memória — apenas para dev/test."""
 
     def __init__(self) -> None:
         self._processed: dict[str, float] = {}  # key -> expires_at
         self._processing: dict[str, float] = {}  # key -> expires_at
+        self._claim_tokens: dict[str, str] = {}  # key -> token do claim
 
     def _cleanup_expired(self) -> None:
         """Remove entradas expiradas."""
@@ -112,6 +114,7 @@ class MemoryDedupeStore(DedupeProtocol, AsyncDedupeProtocol):
         processing_expired = [k for k, v in self._processing.items() if v < now]
         for k in processing_expired:
             del self._processing[k]
+            self._claim_tokens.pop(k, None)
 
     def seen(self, key: str, ttl: int) -> bool:
         """Verifica e marca chave atomicamente (sync)."""
@@ -146,6 +149,7 @@ class MemoryDedupeStore(DedupeProtocol, AsyncDedupeProtocol):
     async def unmark_processing(self, key: str) -> None:
         """Remove marca de processamento para permitir retry."""
         self._processing.pop(key, None)
+        self._claim_tokens.pop(key, None)
 
 
 class MemoryAuditStore(DecisionAuditStoreProtocol):
@@ -0,0 +1,138 @@
+"""Claim em lote do dedupe Redis (scripts Lua + API claim/complete/release).
+
+`claim_many` verifica e reivindica todos os message_ids de uma vez (uma ida
+ao Redis, sem corrida entre instâncias). O claim guarda um token: só o dono
+conclui (`complete_many`) ou libera (`release_many`) o lock de processamento.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from utils.errors import RedisConnectionError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from redis.asyncio import Redis as AsyncRedis
+
+# KEYS em pares (processed, processing); ARGV = token, ttl do claim.
+# Retorna 1 por par reivindicado, 0 para duplicado/em processamento.
+CLAIM_SCRIPT = """
+local result = {}
+for i = 1, #KEYS, 2 do
+    if redis.call('EXISTS', KEYS[i]) == 0
+        and redis.call('SET', KEYS[i + 1], ARGV[1], 'NX', 'EX', ARGV[2]) then
+        result[#result + 1] = 1
+    else
+        result[#result + 1] = 0
+    end
+end
+return result
+"""
+
+# KEYS em pares (processed, processing); ARGV = ttl, depois um token por par.
+# Sempre marca processado; só remove o lock se ainda pertence ao token.
+COMPLETE_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    redis.call('SET', KEYS[i], '1', 'EX', ARGV[1])
+    if redis.call('GET', KEYS[i + 1]) == ARGV[(i + 1) / 2 + 1] then
+        redis.call('DEL', KEYS[i + 1])
+    end
+end
+return 1
+"""
+
+# KEYS = processing keys; ARGV = um token por chave (compare-and-delete).
+RELEASE_SCRIPT = """
+local released = 0
+for i = 1, #KEYS do
+    if redis.call('GET', KEYS[i]) == ARGV[i] then
+        released = released + redis.call('DEL', KEYS[i])
+    end
+end
+return released
+"""
+
+
+class RedisDedupeBatchMixin:
+    """API de claim em lote sobre o cliente async do `RedisDedupeStore`."""
+
+    _async_redis: AsyncRedis[bytes] | None
+    _scripts: dict[str, Any]
+    _key: Callable[[str], str]
+    _processing_key: Callable[[str], str]
+
+    def _script(self, name: str, source: str) -> Any:
+        """Registra script uma vez (EVALSHA com fallback para EVAL)."""
+        script = self._scripts.get(name)
+        if script is None:
+            if self._async_redis is None:
+                msg = "Async Redis client não configurado"
+                raise RuntimeError(msg)
+            script = self._async_redis.register_script(source)
+            self._scripts[name] = script
+        return script
+
+    def _key_pairs(self, keys: Iterable[str]) -> list[str]:
+        """Chaves (processed, processing) intercaladas, como os scripts esperam."""
+        return [
+            redis_key for key in keys for redis_key in (self._key(key), self._processing_key(key))
+        ]
+
+    async def claim_many(
+        self,
+        keys: Iterable[str],
+        ttl: int | None = None,
+    ) -> dict[str, str]:
+        """Verifica e reivindica chaves novas atomicamente (uma ida ao Redis).
+
+        Args:
+            keys: Chaves únicas (ex.: message_ids do payload)
+            ttl: TTL do lock de processamento (padrão 30s)
+
+        Returns:
+            Mapa chave -> token apenas das chaves reivindicadas agora.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+        script = self._script("claim", CLAIM_SCRIPT)
+        token = uuid.uuid4().hex
+        try:
+            flags = await script(
+                keys=self._key_pairs(unique_keys),
+                args=[token, 30 if ttl is None else ttl],
+            )
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao reivindicar dedupe no Redis") from exc
+        return {
+            key: token for key, flag in zip(unique_keys, flags, strict=True) if int(flag)
+        }
+
+    async def complete_many(self, claims: dict[str, str], ttl: int | None = None) -> None:
+        """Marca chaves como processadas e libera locks ainda pertencentes ao token."""
+        if not claims:
+            return
+        script = self._script("complete", COMPLETE_SCRIPT)
+        try:
+            await script(
+                keys=self._key_pairs(claims),
+                args=[3600 if ttl is None else ttl, *claims.values()],
+            )
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao concluir dedupe no Redis") from exc
+
+    async def release_many(self, claims: dict[str, str]) -> None:
+        """Libera locks de processamento apenas se ainda pertencem ao token."""
+        if not claims:
+            return
+        script = self._script("release", RELEASE_SCRIPT)
+        try:
+            await script(
+                keys=[self._processing_key(key) for key in claims],
+                args=list(claims.values()),
+            )
+        except Exception as exc:
+            raise RedisConnectionError("Falha ao remover lock de dedupe no Redis") from exc
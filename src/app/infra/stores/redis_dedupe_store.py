@@ -3,6 +3,9 @@
 Store de deduplicação otimizado para alta concorrência.
 Usa SET NX (set if not exists) para operação atômica.
 
+No hot path, o claim em lote (`redis_dedupe_batch`) verifica e reivindica
+todos os message_ids de uma vez via script Lua, com token de posse.
+
 Contrato de Keys:
     As keys devem ser IDs opacos ou hashes (ex.: message_id, SHA256).
     NUNCA passar dados sensíveis (PII, telefones, emails) como key.
@@ -14,8 +17,9 @@ Referência: FUNCIONAMENTO.md § 4.3 — Dedupe + Anti-abuso
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from app.infra.stores.redis_dedupe_batch import RedisDedupeBatchMixin
 from app.protocols.dedupe import AsyncDedupeProtocol, DedupeProtocol
 from utils.errors import RedisConnectionError
 
@@ -29,7 +33,7 @@ logger = logging.getLogger(__name__)
 DEDUPE_PREFIX = "dedupe:"
 
 
-class RedisDedupeStore(DedupeProtocol, AsyncDedupeProtocol):
+class RedisDedupeStore(RedisDedupeBatchMixin, DedupeProtocol, AsyncDedupeProtocol):
     """Store de dedupe usando Redis (Upstash compatível).
 
     Usa SET NX (set if not exists) para garantir atomicidade.
@@ -47,6 +51,7 @@ class RedisDedupeStore(DedupeProtocol, AsyncDedupeProtocol):
     ) -> None:
         self._redis = redis_client
         self._async_redis = async_redis_client
+        self._scripts: dict[str, Any] = {}
 
     def _key(self, key: str) -> str:
         """Gera chave Redis com namespace."""
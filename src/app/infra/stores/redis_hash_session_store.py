@@ -0,0 +1,198 @@
+"""Redis Session Store com layout em hash + lista limitada (escrita por delta).
+
+Alternativa ao `RedisSessionStore` (um blob JSON por `SETEX`), ativada com
+`SESSION_REDIS_LAYOUT=hash`. Layout e plano de escrita em
+`redis_session_layout`.
+
+- Leitura: HGETALL + LRANGE + GET do card (e do blob legado) num único
+  round-trip em pipeline.
+- Escrita: só os campos/entradas que mudaram desde a última leitura ou
+  escrita desta instância, aplicados por script Lua que confere `version`.
+- Concorrência otimista: se outro escritor gravou depois do snapshot, o
+  delta não é aplicado sobre a base divergente; a sessão inteira é
+  regravada (último escritor vence, como no `SETEX` do blob) e o conflito
+  é contado em `redis_session_store.version_conflict`.
+
+Sessões no blob legado continuam legíveis; a primeira escrita migra para
+o hash e remove o blob.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+from app.infra.stores.redis_session_layout import (
+    ANY_VERSION,
+    SAVE_SESSION_SCRIPT,
+    SessionSnapshot,
+    decode_session,
+    encode_value,
+    plan_session_write,
+    session_keys,
+    snapshot_session,
+)
+from app.infra.stores.redis_session_store import SESSION_PREFIX
+from app.infra.stores.session_codec import JsonSessionCodec, SessionCodec, SessionCodecError
+from app.observability import record_counter
+from app.protocols.session_store import AsyncSessionStoreProtocol, SessionStoreProtocol
+from app.sessions.models import Session
+
+if TYPE_CHECKING:
+    from redis import Redis
+    from redis.asyncio import Redis as AsyncRedis
+
+logger = logging.getLogger(__name__)
+
+_METRIC_COMPONENT = "redis_session_store"
+
+
+class RedisHashSessionStore(SessionStoreProtocol, AsyncSessionStoreProtocol):
+    """Store de sessão em hash + lista + card, com versão otimista.
+
+    Args:
+        redis_client: Cliente Redis síncrono
+        async_redis_client: Cliente Redis assíncrono (opcional)
+        codec: Codec para ler sessões ainda no blob legado
+        max_snapshots: Snapshots mantidos em memória para calcular deltas
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis[bytes],
+        async_redis_client: AsyncRedis[bytes] | None = None,
+        codec: SessionCodec | None = None,
+        max_snapshots: int = 10_000,
+    ) -> None:
+        self._redis = redis_client
+        self._async_redis = async_redis_client
+        self._codec = codec or JsonSessionCodec()
+        self._max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, SessionSnapshot] = OrderedDict()
+        self._save_script = redis_client.register_script(SAVE_SESSION_SCRIPT)
+        self._async_save_script = (
+            async_redis_client.register_script(SAVE_SESSION_SCRIPT)
+            if async_redis_client is not None
+            else None
+        )
+
+    def _keys(self, session_id: str) -> list[str]:
+        return [*session_keys(SESSION_PREFIX, session_id), f"{SESSION_PREFIX}{session_id}"]
+
+    # ──────────────────────────────────────────────────────────────
+    # Sync API
+    # ──────────────────────────────────────────────────────────────
+
+    def save(self, session: Any, ttl_seconds: int = 7200) -> None:
+        """Grava só o delta desde o último snapshot desta sessão."""
+        session_id, current, previous = self._prepare_save(session)
+        keys = self._keys(session_id)
+        result = self._save_script(keys=keys, args=self._args(current, previous, ttl_seconds))
+        if int(result) < 0:
+            self._record_conflict(session_id)
+            result = self._save_script(keys=keys, args=self._args(current, None, ttl_seconds))
+        self._remember(session_id, current, int(result))
+
+    def load(self, session_id: str) -> Session | None:
+        """Carrega a sessão num único round-trip."""
+        pipe = self._redis.pipeline(transaction=False)
+        self._queue_load(pipe, session_id)
+        return self._finish_load(session_id, pipe.execute())
+
+    def delete(self, session_id: str) -> bool:
+        self._snapshots.pop(session_id, None)
+        return bool(self._redis.delete(*self._keys(session_id)))
+
+    def exists(self, session_id: str) -> bool:
+        hash_key, *_, legacy_key = self._keys(session_id)
+        return bool(self._redis.exists(hash_key, legacy_key))
+
+    # ──────────────────────────────────────────────────────────────
+    # Async API
+    # ──────────────────────────────────────────────────────────────
+
+    async def save_async(self, session: Any, ttl_seconds: int = 7200) -> None:
+        """Grava só o delta desde o último snapshot desta sessão (async)."""
+        script = self._require_async(self._async_save_script)
+        session_id, current, previous = self._prepare_save(session)
+        keys = self._keys(session_id)
+        result = await script(keys=keys, args=self._args(current, previous, ttl_seconds))
+        if int(result) < 0:
+            self._record_conflict(session_id)
+            result = await script(keys=keys, args=self._args(current, None, ttl_seconds))
+        self._remember(session_id, current, int(result))
+
+    async def load_async(self, session_id: str) -> Session | None:
+        """Carrega a sessão num único round-trip (async)."""
+        client = self._require_async(self._async_redis)
+        pipe = client.pipeline(transaction=False)
+        self._queue_load(pipe, session_id)
+        return self._finish_load(session_id, await pipe.execute())
+
+    async def delete_async(self, session_id: str) -> bool:
+        client = self._require_async(self._async_redis)
+        self._snapshots.pop(session_id, None)
+        return bool(await client.delete(*self._keys(session_id)))
+
+    async def exists_async(self, session_id: str) -> bool:
+        client = self._require_async(self._async_redis)
+        hash_key, *_, legacy_key = self._keys(session_id)
+        return bool(await client.exists(hash_key, legacy_key))
+
+    def _prepare_save(self, session: Any) -> tuple[str, SessionSnapshot, SessionSnapshot | None]:
+        data = session.to_dict() if isinstance(session, Session) else session
+        session_id = data.get("session_id", "")
+        return session_id, snapshot_session(data), self._snapshots.get(session_id)
+
+    def _args(
+        self,
+        current: SessionSnapshot,
+        previous: SessionSnapshot | None,
+        ttl_seconds: int,
+    ) -> list[str]:
+        # Sem snapshot não há base para comparar: reescrita completa sem conferir
+        expected = str(previous.version) if previous is not None else ANY_VERSION
+        return [expected, encode_value(plan_session_write(current, previous, ttl_seconds))]
+
+    def _queue_load(self, pipe: Any, session_id: str) -> None:
+        hash_key, history_key, card_key, legacy_key = self._keys(session_id)
+        pipe.hgetall(hash_key)
+        pipe.lrange(history_key, 0, -1)
+        pipe.get(card_key)
+        pipe.get(legacy_key)
+
+    def _finish_load(self, session_id: str, results: list[Any]) -> Session | None:
+        raw_fields, raw_history, raw_card, legacy = results
+        try:
+            if raw_fields:
+                data, snapshot = decode_session(raw_fields, raw_history, raw_card)
+                self._remember(session_id, snapshot, snapshot.version)
+                return Session.from_dict(data)
+            if legacy is not None:
+                self._snapshots.pop(session_id, None)
+                return Session.from_dict(self._codec.decode(legacy))
+        except (SessionCodecError, KeyError, ValueError) as exc:
+            logger.warning(
+                "session_load_error",
+                extra={"session_id": session_id, "error": str(exc)},
+            )
+        return None
+
+    def _remember(self, session_id: str, snapshot: SessionSnapshot, version: int) -> None:
+        self._snapshots[session_id] = replace(snapshot, version=version)
+        self._snapshots.move_to_end(session_id)
+        while len(self._snapshots) > self._max_snapshots:
+            self._snapshots.popitem(last=False)
+
+    def _record_conflict(self, session_id: str) -> None:
+        record_counter(_METRIC_COMPONENT, "version_conflict")
+        logger.warning("session_version_conflict", extra={"session_id": session_id})
+
+    @staticmethod
+    def _require_async[T](client: T | None) -> T:
+        if client is None:
+            msg = "Async Redis client não configurado"
+            raise RuntimeError(msg)
+        return client
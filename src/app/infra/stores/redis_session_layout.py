@@ -0,0 +1,164 @@
+"""Layout de sessão em várias chaves Redis (hash + lista limitada + card).
+
+Chaves (a hash tag `{session_id}` mantém todas no mesmo slot do cluster):
+    session:{id}:h        HASH    campos escalares (JSON por campo) + `version`
+    session:{id}:history  LIST    entradas do histórico (JSON), cortada por LTRIM
+    session:{id}:card     STRING  ContactCard (JSON)
+
+`plan_session_write` compara a sessão com o snapshot da última leitura ou
+escrita e devolve só os comandos necessários: HSET dos campos alterados,
+RPUSH das entradas novas + LTRIM no tamanho atual do histórico e SET/DEL
+do card. Sem snapshot, o plano reescreve tudo (e remove o blob legado).
+
+Os comandos referenciam as chaves por índice (1-based, como `KEYS` no Lua)
+e são aplicados atomicamente por `SAVE_SESSION_SCRIPT`.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+SCALAR_FIELDS = (
+    "session_id",
+    "sender_id",
+    "current_state",
+    "context",
+    "history_summary",
+    "history_persisted_at",
+    "turn_count",
+    "created_at",
+    "updated_at",
+    "expires_at",
+)
+VERSION_FIELD = "version"
+ANY_VERSION = "*"
+
+_HASH, _HISTORY, _CARD, _LEGACY = 1, 2, 3, 4
+
+# KEYS = (hash, history, card, blob legado); ARGV = versão esperada ('*' não
+# confere), comandos JSON [[cmd, índice da chave, args...], ...].
+# Retorna a nova versão, ou -1 se outro escritor gravou antes (nada é aplicado).
+SAVE_SESSION_SCRIPT = """
+local current = redis.call('HGET', KEYS[1], 'version') or '0'
+if ARGV[1] ~= '*' and current ~= ARGV[1] then
+    return -1
+end
+for _, command in ipairs(cjson.decode(ARGV[2])) do
+    local args = {command[1], KEYS[command[2]]}
+    for i = 3, #command do
+        args[#args + 1] = command[i]
+    end
+    redis.call(unpack(args))
+end
+return redis.call('HINCRBY', KEYS[1], 'version', 1)
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """Sessão codificada como está (ou estará) no Redis, com sua versão."""
+
+    version: int
+    fields: dict[str, str]
+    history: tuple[str, ...]
+    card: str | None
+
+
+def session_keys(prefix: str, session_id: str) -> tuple[str, str, str]:
+    """Chaves (hash, histórico, card) da sessão."""
+    base = f"{prefix}{{{session_id}}}"
+    return f"{base}:h", f"{base}:history", f"{base}:card"
+
+
+def encode_value(value: Any) -> str:
+    """JSON canônico: o mesmo valor sempre gera os mesmos bytes."""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def snapshot_session(data: dict[str, Any], version: int = 0) -> SessionSnapshot:
+    """Codifica o dict de `Session.to_dict()` no layout do Redis."""
+    card = data.get("contact_card") or None
+    return SessionSnapshot(
+        version=version,
+        fields={name: encode_value(data.get(name)) for name in SCALAR_FIELDS},
+        history=tuple(encode_value(entry) for entry in data.get("history", [])),
+        card=encode_value(card) if card else None,
+    )
+
+
+def decode_session(
+    raw_fields: dict[Any, Any],
+    raw_history: list[Any],
+    raw_card: Any | None,
+) -> tuple[dict[str, Any], SessionSnapshot]:
+    """Reconstrói o dict da sessão e o snapshot do que foi lido (bytes ou str)."""
+    fields = {_text(name): _text(value) for name, value in raw_fields.items()}
+    history = [_text(entry) for entry in raw_history]
+    card = _text(raw_card) if raw_card else None
+    data: dict[str, Any] = {
+        name: json.loads(value) for name, value in fields.items() if name != VERSION_FIELD
+    }
+    data["history"] = [json.loads(entry) for entry in history]
+    data["contact_card"] = json.loads(card) if card else {}
+    snapshot = SessionSnapshot(
+        version=int(fields.get(VERSION_FIELD, 0)),
+        fields={name: value for name, value in fields.items() if name != VERSION_FIELD},
+        history=tuple(history),
+        card=card,
+    )
+    return data, snapshot
+
+
+def plan_session_write(
+    current: SessionSnapshot,
+    previous: SessionSnapshot | None,
+    ttl_seconds: int,
+) -> list[list[Any]]:
+    """Comandos que levam o Redis de `previous` (None = desconhecido) a `current`."""
+    commands: list[list[Any]] = []
+    if previous is None:
+        commands.append(["DEL", _LEGACY])
+    fields = {
+        name: value
+        for name, value in current.fields.items()
+        if previous is None or previous.fields.get(name) != value
+    }
+    if fields:
+        commands.append(["HSET", _HASH, *chain.from_iterable(fields.items())])
+    commands.extend(_plan_history(current.history, previous.history if previous else None))
+    if previous is None or previous.card != current.card:
+        commands.append(["SET", _CARD, current.card] if current.card else ["DEL", _CARD])
+    commands.extend(["EXPIRE", key, ttl_seconds] for key in (_HASH, _HISTORY, _CARD))
+    return commands
+
+
+def _plan_history(
+    current: tuple[str, ...],
+    previous: tuple[str, ...] | None,
+) -> list[list[Any]]:
+    if current == previous:
+        return []
+    if not current:
+        return [["DEL", _HISTORY]]
+    appended = _new_entries(current, previous or ())
+    # LTRIM no tamanho atual descarta o que saiu pela janela FIFO (ou pela
+    # compactação); sem sobreposição, o RPUSH de tudo + LTRIM ainda converge
+    commands: list[list[Any]] = [["RPUSH", _HISTORY, *appended]] if appended else []
+    commands.append(["LTRIM", _HISTORY, -len(current), -1])
+    return commands
+
+
+def _new_entries(current: tuple[str, ...], previous: tuple[str, ...]) -> tuple[str, ...]:
+    """Entradas ao fim de `current` após o maior sufixo de `previous` mantido."""
+    for dropped in range(len(previous) + 1):
+        kept = previous[dropped:]
+        if current[: len(kept)] == kept:
+            return current[len(kept) :]
+    return current
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else value.decode()
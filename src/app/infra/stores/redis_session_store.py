@@ -8,10 +8,10 @@ Referência: FUNCIONAMENTO.md § 6 — Concorrência e escalabilidade
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING, Any
 
+from app.infra.stores.session_codec import JsonSessionCodec, SessionCodec, SessionCodecError
 from app.protocols.session_store import AsyncSessionStoreProtocol, SessionStoreProtocol
 from app.sessions.models import Session
 
@@ -33,37 +33,41 @@ class RedisSessionStore(SessionStoreProtocol, AsyncSessionStoreProtocol):
         - TTL automático por sessão
         - Suporte sync e async
         - Compatível com Upstash Redis (REST API)
+        - Codec plugável (JSON legado ou envelope binário versionado)
 
     Args:
         redis_client: Cliente Redis síncrono
         async_redis_client: Cliente Redis assíncrono (opcional)
+        codec: Codec de escrita; a leitura aceita qualquer formato conhecido
     """
 
     def __init__(
         self,
         redis_client: Redis[bytes],
         async_redis_client: AsyncRedis[bytes] | None = None,
+        codec: SessionCodec | None = None,
     ) -> None:
         self._redis = redis_client
         self._async_redis = async_redis_client
+        self._codec = codec or JsonSessionCodec()
 
     def _key(self, session_id: str) -> str:
         """Gera chave Redis com namespace."""
         return f"{SESSION_PREFIX}{session_id}"
 
+    def _encode(self, session: Any) -> tuple[str, bytes | str]:
+        """Serializa sessão (entidade ou dict) com o codec configurado."""
+        if isinstance(session, Session):
+            return session.session_id, self._codec.encode(session.to_dict())
+        return session.get("session_id", ""), self._codec.encode(session)
+
     # ──────────────────────────────────────────────────────────────
     # Sync API
     # ──────────────────────────────────────────────────────────────
 
     def save(self, session: Any, ttl_seconds: int = 7200) -> None:
         """Salva sessão no Redis com TTL."""
-        if isinstance(session, Session):
-            data = json.dumps(session.to_dict())
-            session_id = session.session_id
-        else:
-            data = json.dumps(session)
-            session_id = session.get("session_id", "")
-
+        session_id, data = self._encode(session)
         key = self._key(session_id)
         self._redis.setex(key, ttl_seconds, data)
         logger.debug("session_saved", extra={"session_id": session_id, "ttl": ttl_seconds})
@@ -75,8 +79,8 @@ class RedisSessionStore(SessionStoreProtocol, AsyncSessionStoreProtocol):
         if data is None:
             return None
         try:
-            return Session.from_dict(json.loads(data))
-        except (json.JSONDecodeError, KeyError) as e:
+            return Session.from_dict(self._codec.decode(data))
+        except (SessionCodecError, KeyError) as e:
             logger.warning("session_load_error", extra={"session_id": session_id, "error": str(e)})
             return None
 
@@ -101,13 +105,7 @@ class RedisSessionStore(SessionStoreProtocol, AsyncSessionStoreProtocol):
             msg = "Async Redis client não configurado"
             raise RuntimeError(msg)
 
-        if isinstance(session, Session):
-            data = json.dumps(session.to_dict())
-            session_id = session.session_id
-        else:
-            data = json.dumps(session)
-            session_id = session.get("session_id", "")
-
+        session_id, data = self._encode(session)
         key = self._key(session_id)
         await self._async_redis.setex(key, ttl_seconds, data)
         logger.debug("session_saved_async", extra={"session_id": session_id, "ttl": ttl_seconds})
@@ -123,8 +121,8 @@ class RedisSessionStore(SessionStoreProtocol, AsyncSessionStoreProtocol):
         if data is None:
             return None
         try:
-            return Session.from_dict(json.loads(data))
-        except (json.JSONDecodeError, KeyError) as e:
+            return Session.from_dict(self._codec.decode(data))
+        except (SessionCodecError, KeyError) as e:
             logger.warning(
                 "session_load_error_async", extra={"session_id": session_id, "error": str(e)}
             )
@@ -0,0 +1,175 @@
+"""Codecs de serialização de sessão para stores remotos (Redis).
+
+Formatos:
+    - json: texto JSON legado (`json.dumps(session.to_dict())`).
+    - binary: envelope versionado `MAGIC | schema | encoding | compressão | corpo`.
+      Corpo em JSON compacto (orjson quando instalado, senão stdlib — mesmos
+      bytes lógicos) comprimido acima de um limiar (zstd quando instalado,
+      senão zlib). O byte de compressão registra o algoritmo usado, então
+      qualquer instância decodifica o que outra gravou.
+
+`decode` aceita ambos os formatos: sessões JSON existentes continuam legíveis
+após trocar o codec de escrita. Em rollout, publique a versão que lê o
+envelope antes de ativar `SESSION_CODEC=binary`.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from typing import Any
+
+SESSION_SCHEMA_VERSION = 1
+
+# JSON legado sempre começa com "{" ou espaço; NUL nunca é o primeiro byte
+_MAGIC = b"\x00SES"
+_HEADER_SIZE = len(_MAGIC) + 3
+
+_ENCODING_JSON = 1
+
+_COMPRESSION_NONE = 0
+_COMPRESSION_ZLIB = 1
+_COMPRESSION_ZSTD = 2
+
+DEFAULT_COMPRESS_THRESHOLD_BYTES = 4096
+
+
+class SessionCodecError(ValueError):
+    """Payload de sessão inválido ou em versão não suportada."""
+
+
+class SessionCodec(ABC):
+    """Converte o dict de sessão (`Session.to_dict`) em bytes e vice-versa."""
+
+    name: str = ""
+
+    @abstractmethod
+    def encode(self, data: dict[str, Any]) -> bytes | str:
+        """Serializa o dict de sessão."""
+
+    def decode(self, raw: bytes | str) -> dict[str, Any]:
+        """Desserializa envelope binário ou JSON legado.
+
+        Raises:
+            SessionCodecError: Se o payload estiver corrompido.
+        """
+        if isinstance(raw, bytes) and raw.startswith(_MAGIC):
+            return _decode_envelope(raw)
+        try:
+            data = _json_loads(raw)
+        except ValueError as exc:
+            raise SessionCodecError("session_payload_invalid") from exc
+        if not isinstance(data, dict):
+            raise SessionCodecError("session_payload_invalid")
+        return data
+
+
+class JsonSessionCodec(SessionCodec):
+    """Formato legado (texto JSON)."""
+
+    name = "json"
+
+    def encode(self, data: dict[str, Any]) -> str:
+        return json.dumps(data)
+
+
+class BinarySessionCodec(SessionCodec):
+    """Envelope versionado com JSON compacto e compressão acima do limiar."""
+
+    name = "binary"
+
+    def __init__(
+        self,
+        compress_threshold_bytes: int = DEFAULT_COMPRESS_THRESHOLD_BYTES,
+        compression_level: int = 3,
+    ) -> None:
+        self._threshold = max(0, compress_threshold_bytes)
+        self._level = compression_level
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        body = _json_dumps(data)
+        compression = _COMPRESSION_NONE
+        if self._threshold and len(body) >= self._threshold:
+            compression, body = _compress(body, self._level)
+        header = _MAGIC + bytes((SESSION_SCHEMA_VERSION, _ENCODING_JSON, compression))
+        return header + body
+
+
+def create_session_codec(
+    name: str = "json",
+    compress_threshold_bytes: int = DEFAULT_COMPRESS_THRESHOLD_BYTES,
+) -> SessionCodec:
+    """Cria codec pelo nome configurado (`SESSION_CODEC`)."""
+    if name == "json":
+        return JsonSessionCodec()
+    if name == "binary":
+        return BinarySessionCodec(compress_threshold_bytes=compress_threshold_bytes)
+    msg = f"SESSION_CODEC inválido: {name}"
+    raise ValueError(msg)
+
+
+def _decode_envelope(raw: bytes) -> dict[str, Any]:
+    if len(raw) < _HEADER_SIZE:
+        raise SessionCodecError("session_payload_truncated")
+    version, encoding, compression = raw[len(_MAGIC) : _HEADER_SIZE]
+    if version > SESSION_SCHEMA_VERSION or encoding != _ENCODING_JSON:
+        raise SessionCodecError(f"session_schema_unsupported:{version}:{encoding}")
+    body = _decompress(compression, raw[_HEADER_SIZE:])
+    try:
+        data = _json_loads(body)
+    except ValueError as exc:
+        raise SessionCodecError("session_payload_invalid") from exc
+    if not isinstance(data, dict):
+        raise SessionCodecError("session_payload_invalid")
+    return data
+
+
+def _compress(body: bytes, level: int) -> tuple[int, bytes]:
+    if _zstd is not None:
+        return _COMPRESSION_ZSTD, _zstd.ZstdCompressor(level=level).compress(body)
+    return _COMPRESSION_ZLIB, zlib.compress(body, level)
+
+
+def _decompress(compression: int, body: bytes) -> bytes:
+    if compression == _COMPRESSION_NONE:
+        return body
+    try:
+        if compression == _COMPRESSION_ZLIB:
+            return zlib.decompress(body)
+        if compression == _COMPRESSION_ZSTD:
+            if _zstd is None:
+                raise SessionCodecError("session_zstd_unavailable")
+            return _zstd.ZstdDecompressor().decompress(body)
+    except (zlib.error, _ZstdError) as exc:
+        raise SessionCodecError("session_payload_corrupted") from exc
+    raise SessionCodecError(f"session_compression_unsupported:{compression}")
+
+
+# Dependências opcionais (extra `perf`): ausência cai para stdlib
+if find_spec("orjson") is not None:
+    import orjson
+
+    def _json_dumps(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    def _json_loads(raw: bytes | str) -> Any:
+        return orjson.loads(raw)
+
+else:
+
+    def _json_dumps(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def _json_loads(raw: bytes | str) -> Any:
+        return json.loads(raw)
+
+
+if find_spec("zstandard") is not None:
+    import zstandard as _zstd
+
+    _ZstdError: type[Exception] = _zstd.ZstdError
+else:
+    _zstd = None  # type: ignore[assignment]
+    _ZstdError = zlib.error
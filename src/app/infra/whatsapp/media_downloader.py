@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 import httpx
 
 from config.settings import get_whatsapp_settings
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,11 +27,28 @@ class MediaDownloadResult:
 
 
 class WhatsAppMediaDownloader:
-    """Helper para baixar mídia via Graph API."""
+    """Helper para baixar mídia via Graph API.
+
+    `client_provider` devolve o AsyncClient compartilhado do processo
+    (injetado pelo bootstrap); sem ele, abre um cliente por tentativa.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        client_provider: Callable[[], httpx.AsyncClient] | None = None,
+    ) -> None:
         self._settings = get_whatsapp_settings()
         self._timeout = min(self._settings.request_timeout_seconds, 30.0)
+        self._client_provider = client_provider
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client_provider is not None:
+            # Pool compartilhado pertence ao lifespan; não fechar aqui
+            yield self._client_provider()
+            return
+        async with httpx.AsyncClient(timeout=self._timeout) as client:
+            yield client
 
     async def download(
         self,
@@ -75,7 +97,7 @@ class WhatsAppMediaDownloader:
         media_id: str | None,
         media_url: str | None,
     ) -> MediaDownloadResult | None:
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        async with self._client() as client:
             url, mime_type = await self._resolve_media_url(client, media_id, media_url)
             if not url:
                 return MediaDownloadResult(
@@ -86,6 +108,7 @@ class WhatsAppMediaDownloader:
             response = await client.get(
                 url,
                 headers={"Authorization": f"Bearer {self._settings.access_token}"},
+                timeout=self._timeout,
             )
             response.raise_for_status()
             if self._is_too_large(response):
@@ -114,7 +137,7 @@ class WhatsAppMediaDownloader:
 
         endpoint = f"{self._settings.api_endpoint}/{media_id}"
         headers = {"Authorization": f"Bearer {self._settings.access_token}"}
-        response = await client.get(endpoint, headers=headers)
+        response = await client.get(endpoint, headers=headers, timeout=self._timeout)
         response.raise_for_status()
         data = response.json()
 
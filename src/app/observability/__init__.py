@@ -15,6 +15,8 @@ from app.observability.correlation import (
 )
 from app.observability.metrics import (
     record_confidence,
+    record_counter,
+    record_gauge,
     record_handoff,
     record_latency,
     record_token_usage,
@@ -24,6 +26,8 @@ __all__ = [
     "generate_correlation_id",
     "get_correlation_id",
     "record_confidence",
+    "record_counter",
+    "record_gauge",
     "record_handoff",
     "record_latency",
     "record_token_usage",
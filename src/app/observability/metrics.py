@@ -9,6 +9,7 @@ Métricas suportadas:
 - Latência: histogram de tempos de execução por componente/operação
 - Confidence: gauge de confiança média das decisões LLM
 - Handoff: counter de escalações para humano com motivo
+- Counter/Gauge genéricos: contagens e níveis (filas, lanes, cache, etc.)
 
 Uso:
     from app.observability.metrics import record_latency, record_confidence, record_handoff
@@ -119,6 +120,7 @@ def record_token_usage(
     completion_tokens: int,
     total_tokens: int,
     correlation_id: str | None = None,
+    cached_tokens: int = 0,
 ) -> None:
     """Registra uso de tokens (custo).
 
@@ -129,6 +131,7 @@ def record_token_usage(
         completion_tokens: Tokens na resposta
         total_tokens: Total de tokens
         correlation_id: ID de correlação para rastreamento
+        cached_tokens: Tokens do prompt servidos pelo cache de prefixo do provedor
     """
     logger.info(
         "metric_token_usage",
@@ -139,6 +142,58 @@ def record_token_usage(
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
+            "cached_tokens": cached_tokens,
             "correlation_id": correlation_id,
         },
     )
+
+
+def record_counter(
+    component: str,
+    operation: str,
+    value: int = 1,
+    correlation_id: str | None = None,
+    metadata: dict[str, str | float | int] | None = None,
+) -> None:
+    """Registra incremento de contador.
+
+    Args:
+        component: Nome do componente (ex: "conversation_lanes")
+        operation: Nome do evento contado (ex: "lane_rejected")
+        value: Incremento (default 1)
+        correlation_id: ID de correlação para rastreamento
+        metadata: Dimensões adicionais opcionais (sem PII)
+    """
+    extra: dict[str, str | float | int | None] = {
+        "metric_type": "counter",
+        "component": component,
+        "operation": operation,
+        "value": value,
+        "correlation_id": correlation_id,
+    }
+    if metadata:
+        extra.update(metadata)
+    logger.info("metric_counter", extra=extra)
+
+
+def record_gauge(
+    component: str,
+    operation: str,
+    value: float,
+    correlation_id: str | None = None,
+    metadata: dict[str, str | float | int] | None = None,
+) -> None:
+    """Registra valor instantâneo (profundidade de fila, lanes ativas, etc.).
+
+    Mesmos argumentos de `record_counter`; `value` é o valor observado.
+    """
+    extra: dict[str, str | float | int | None] = {
+        "metric_type": "gauge",
+        "component": component,
+        "operation": operation,
+        "value": round(value, 3),
+        "correlation_id": correlation_id,
+    }
+    if metadata:
+        extra.update(metadata)
+    logger.info("metric_gauge", extra=extra)
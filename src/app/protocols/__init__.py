@@ -6,8 +6,10 @@ from .conversation_store import (
     ConversationStoreError,
     ConversationStoreProtocol,
     LeadData,
+    PendingConversationMessage,
 )
 from .decision_audit_store import DecisionAuditStoreProtocol
+from .decision_journal import DecisionJournalEntry, DecisionJournalProtocol
 from .decision_review_client import DecisionReviewClientProtocol
 from .dedupe import AsyncDedupeProtocol, DedupeProtocol
 from .http_client import WhatsAppHttpClientProtocol
@@ -19,11 +21,13 @@ from .models import (
     WebhookProcessingSummary,
 )
 from .normalizer import MessageNormalizerProtocol
+from .outbound_retry_queue import OutboundRetryEntry, OutboundRetryQueueProtocol
 from .outbound_sender import OutboundSenderProtocol
 from .payload_builder import PayloadBuilderProtocol
 from .session_store import AsyncSessionStoreProtocol, SessionStoreProtocol
 from .transcription_service import TranscriptionResult, TranscriptionServiceProtocol
 from .validator import OutboundRequestValidatorProtocol, ValidationError
+from .work_queue import WorkItem, WorkQueueProtocol
 
 __all__ = [
     "AsyncDedupeProtocol",
@@ -33,6 +37,8 @@ __all__ = [
     "ConversationStoreError",
     "ConversationStoreProtocol",
     "DecisionAuditStoreProtocol",
+    "DecisionJournalEntry",
+    "DecisionJournalProtocol",
     "DecisionReviewClientProtocol",
     "DedupeProtocol",
     "InboundMessageEvent",
@@ -42,12 +48,17 @@ __all__ = [
     "OutboundMessageRequest",
     "OutboundMessageResponse",
     "OutboundRequestValidatorProtocol",
+    "OutboundRetryEntry",
+    "OutboundRetryQueueProtocol",
     "OutboundSenderProtocol",
     "PayloadBuilderProtocol",
+    "PendingConversationMessage",
     "SessionStoreProtocol",
     "TranscriptionResult",
     "TranscriptionServiceProtocol",
     "ValidationError",
     "WebhookProcessingSummary",
     "WhatsAppHttpClientProtocol",
+    "WorkItem",
+    "WorkQueueProtocol",
 ]
@@ -54,6 +54,15 @@ class LeadData:
     metadata: dict[str, str] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class PendingConversationMessage:
+    """Mensagem enfileirada para escrita em lote (chave do lead + mensagem)."""
+
+    phone_hash: str
+    tenant_id: str
+    message: ConversationMessage
+
+
 class ConversationStoreProtocol(ABC):
     """Contrato para armazenamento permanente de conversas.
 
@@ -139,5 +148,32 @@ class ConversationStoreProtocol(ABC):
         """
 
 
+    async def write_batch(
+        self,
+        messages: Sequence[PendingConversationMessage],
+        leads: Sequence[LeadData] = (),
+    ) -> None:
+        """Persiste um lote de mensagens e leads.
+
+        Implementação padrão: uma escrita por item. Backends com escrita em
+        lote nativa (Firestore batch) sobrescrevem para um único commit.
+
+        Args:
+            messages: Mensagens com a chave do lead de cada uma
+            leads: Leads a atualizar (merge)
+
+        Raises:
+            ConversationStoreError: Erro de persistência
+        """
+        for pending in messages:
+            await self.append_message(
+                pending.phone_hash,
+                pending.message,
+                tenant_id=pending.tenant_id,
+            )
+        for lead in leads:
+            await self.upsert_lead(lead)
+
+
 class ConversationStoreError(Exception):
     """Erro de persistência em ConversationStore."""
@@ -0,0 +1,43 @@
+"""Protocolo do diário de decisões por message_id.
+
+Quando algo falha depois da decisão do Otto (envio, save da sessão), o
+dedupe libera a mensagem e a reentrega da Meta refaria o pipeline inteiro,
+incluindo as chamadas ao LLM — e poderia responder duas vezes. O diário
+guarda a decisão validada e o status do envio com TTL curto para que a
+nova tentativa retome do último estágio concluído.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class DecisionJournalEntry:
+    """Estágios concluídos do processamento de uma mensagem.
+
+    Attributes:
+        decision: OttoDecision final (pós guards/validação) serializada
+        tenant_intent: Vertente usada no prompt (para atualizar a sessão)
+        loaded_contexts: Contextos dinâmicos carregados no prompt
+        sent: None = envio não tentado; bool = resultado da tentativa
+    """
+
+    decision: dict[str, Any] = field(default_factory=dict)
+    tenant_intent: str | None = None
+    loaded_contexts: list[str] = field(default_factory=list)
+    sent: bool | None = None
+
+
+class DecisionJournalProtocol(ABC):
+    """Contrato assíncrono do diário de decisões (melhor esforço, com TTL)."""
+
+    @abstractmethod
+    async def get(self, message_id: str) -> DecisionJournalEntry | None:
+        """Retorna o registro da mensagem, se existir e não tiver expirado."""
+
+    @abstractmethod
+    async def save(self, message_id: str, entry: DecisionJournalEntry) -> None:
+        """Grava (substitui) o registro da mensagem renovando o TTL."""
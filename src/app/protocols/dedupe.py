@@ -5,7 +5,13 @@ Interfaces leves (ABCs) dependidas por Application.
 
 from __future__ import annotations
 
+import contextlib
+import uuid
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 class DedupeProtocol(ABC):
@@ -42,6 +48,15 @@ class AsyncDedupeProtocol(ABC):
       Marca a chave como processada com TTL.
     - unmark_processing(key: str) -> None
       Remove marca de processamento (rollback em falha).
+
+    API de claim (lote, com token de posse):
+    - claim_many(keys, ttl) -> dict[key, token]
+      Verifica e marca em processamento as chaves novas numa única operação.
+    - complete_many(claims, ttl) / release_many(claims)
+      Concluem ou liberam apenas chaves cujo claim ainda pertence ao token.
+
+    As implementações padrão compõem os métodos acima (não atômicas);
+    stores remotos devem sobrescrevê-las com uma operação atômica.
     """
 
     @abstractmethod
@@ -77,3 +92,42 @@ class AsyncDedupeProtocol(ABC):
     @abstractmethod
     async def unmark_processing(self, key: str) -> None:
         """Remove marca de processamento para permitir retry."""
+
+    async def claim_many(
+        self,
+        keys: Iterable[str],
+        ttl: int | None = None,
+    ) -> dict[str, str]:
+        """Reivindica as chaves novas para processamento.
+
+        Args:
+            keys: Chaves únicas (ex.: message_ids do payload)
+            ttl: TTL curto do claim em segundos (None usa o padrão do store)
+
+        Returns:
+            Mapa chave -> token apenas das chaves reivindicadas agora.
+        """
+        token = uuid.uuid4().hex
+        claims: dict[str, str] = {}
+        try:
+            for key in dict.fromkeys(keys):
+                if await self.is_duplicate(key):
+                    continue
+                await (self.mark_processing(key) if ttl is None else self.mark_processing(key, ttl))
+                claims[key] = token
+        except Exception:
+            for key in claims:
+                with contextlib.suppress(Exception):
+                    await self.unmark_processing(key)
+            raise
+        return claims
+
+    async def complete_many(self, claims: dict[str, str], ttl: int | None = None) -> None:
+        """Marca como processadas as chaves reivindicadas."""
+        for key in claims:
+            await (self.mark_processed(key) if ttl is None else self.mark_processed(key, ttl))
+
+    async def release_many(self, claims: dict[str, str]) -> None:
+        """Libera claims para retry (rollback em falha)."""
+        for key in claims:
+            await self.unmark_processing(key)
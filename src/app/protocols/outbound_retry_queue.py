@@ -0,0 +1,55 @@
+"""Protocolo da fila de retry atrasado para envios outbound.
+
+Envios com falha transitória (429, 5xx, timeout, circuito aberto) saem da
+task de processamento e entram aqui com horário de vencimento. `claim_due`
+arrenda os itens vencidos por `lease_seconds`: se o worker morrer antes do
+`ack`/`schedule`, o item volta a vencer e outra instância o reenvia.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class OutboundRetryEntry:
+    """Envio pendente de nova tentativa.
+
+    Attributes:
+        key: Chave de idempotência do envio (única na fila)
+        request: OutboundMessageRequest serializado (`model_dump`)
+        payload: Payload Graph API já montado
+        attempts: Tentativas já feitas (incluindo a original)
+        deadline_at: Epoch após o qual o envio é descartado
+        correlation_id: Correlation ID do processamento original
+    """
+
+    key: str
+    request: dict[str, Any] = field(default_factory=dict)
+    payload: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 1
+    deadline_at: float = 0.0
+    correlation_id: str = ""
+
+
+class OutboundRetryQueueProtocol(ABC):
+    """Fila de retry ordenada por vencimento (epoch em segundos)."""
+
+    @abstractmethod
+    async def schedule(self, entry: OutboundRetryEntry, due_at: float) -> None:
+        """Agenda (ou reagenda) o envio; a mesma `key` substitui a anterior."""
+
+    @abstractmethod
+    async def claim_due(
+        self,
+        now: float,
+        limit: int,
+        lease_seconds: float,
+    ) -> list[OutboundRetryEntry]:
+        """Reivindica até `limit` envios vencidos, arrendando-os."""
+
+    @abstractmethod
+    async def ack(self, key: str) -> None:
+        """Remove o envio definitivamente (entregue ou descartado)."""
@@ -0,0 +1,60 @@
+"""Protocolo de fila de trabalho durável (processamento do webhook).
+
+Contrato at-least-once: um item reivindicado (`claim`) só sai da fila com
+`ack`. O consumidor renova o arrendamento (`extend`) enquanto processa;
+itens sem renovação voltam a ficar visíveis após o visibility timeout.
+Após `max_attempts` falhas (`nack`) vão para a dead-letter.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class WorkItem:
+    """Item reivindicado da fila.
+
+    Attributes:
+        item_id: ID opaco atribuído pelo backend (ex.: ID do stream)
+        payload: Dados do trabalho (JSON-serializável)
+        attempts: Número de processamentos anteriores que falharam (nack)
+    """
+
+    item_id: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+
+
+class WorkQueueProtocol(ABC):
+    """Contrato mínimo assíncrono para filas de trabalho duráveis."""
+
+    @abstractmethod
+    async def enqueue(self, payload: dict[str, Any]) -> str:
+        """Publica item na fila e retorna o ID atribuído."""
+
+    @abstractmethod
+    async def claim(self, consumer: str, count: int = 1) -> list[WorkItem]:
+        """Reivindica até `count` itens visíveis para o consumidor.
+
+        Inclui itens cujo visibility timeout expirou (consumidor anterior
+        morreu sem ack); a reentrega não conta como tentativa falha.
+        """
+
+    @abstractmethod
+    async def extend(self, consumer: str, items: list[WorkItem]) -> None:
+        """Renova o visibility timeout de itens ainda em processamento."""
+
+    @abstractmethod
+    async def ack(self, item: WorkItem) -> None:
+        """Confirma processamento; remove o item definitivamente."""
+
+    @abstractmethod
+    async def nack(self, item: WorkItem, error_type: str) -> bool:
+        """Devolve item para nova tentativa.
+
+        Returns:
+            True se reenfileirado; False se foi para a dead-letter.
+        """
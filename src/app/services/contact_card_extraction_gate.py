@@ -0,0 +1,136 @@
+"""Pré-gate determinístico do extrator de ContactCard.
+
+Prevê se a mensagem pode gerar algum campo do `ContactCardPatch` usando os
+helpers léxicos já existentes (confirmação, números, regex de PII,
+pergunta pendente do Otto). Na dúvida o extrator roda: só são pulados
+turnos sem conteúdo, small talk e confirmações que não respondem a uma
+pergunta de campo.
+
+Uma amostra das mensagens puladas roda o extrator mesmo assim (shadow);
+se ele devolver patch, conta como miss do gate — base para calibrar.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from ai.services.prompt_micro_agents_text import extract_numbers, normalize
+from ai.utils.sanitizer import contains_pii
+from app.observability import record_counter
+from app.services.otto_guard_detection import detect_question_type, is_confirmation_message
+from config.settings.ai.extraction_gate import get_extraction_gate_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+_METRIC_COMPONENT = "contact_card_gate"
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_LAUGH_RE = re.compile(r"^(k{2,}|(ha){2,}h?|(he){2,}h?|rs+)$")
+_SMALL_TALK = frozenset(
+    {
+        "oi",
+        "ola",
+        "opa",
+        "e ai",
+        "bom dia",
+        "boa tarde",
+        "boa noite",
+        "tudo bem",
+        "tudo bom",
+        "obrigado",
+        "obrigada",
+        "muito obrigado",
+        "muito obrigada",
+        "valeu",
+        "vlw",
+        "tchau",
+        "ate mais",
+        "ate logo",
+        "show",
+        "top",
+        "legal",
+        "otimo",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ExtractionGateDecision:
+    """Resultado do gate: rodar o extrator? (`shadow` = pulo amostrado)."""
+
+    run: bool
+    reason: str
+    shadow: bool = False
+
+
+def predict_extractable(user_text: str, assistant_last_message: str) -> tuple[bool, str]:
+    """Regras puras: (pode gerar patch?, motivo)."""
+    normalized = normalize(user_text)
+    cleaned = " ".join(_NON_WORD_RE.sub(" ", normalized).split())
+    if not cleaned:
+        return False, "no_content"
+    if contains_pii(user_text) or extract_numbers(normalized):
+        return True, "data_pattern"
+    if cleaned in _SMALL_TALK or _LAUGH_RE.match(cleaned.replace(" ", "")):
+        return False, "small_talk"
+    if is_confirmation_message(cleaned):
+        # "sim" só carrega dado quando responde a uma pergunta de campo (ex.: CRM)
+        if detect_question_type(assistant_last_message):
+            return True, "answers_pending_question"
+        return False, "confirmation"
+    return True, "default"
+
+
+class ContactCardExtractionGate:
+    """Aplica as regras, a amostragem shadow e as métricas do gate."""
+
+    __slots__ = ("_enabled", "_rng", "_shadow_sample_rate")
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        shadow_sample_rate: float = 0.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._enabled = enabled
+        self._shadow_sample_rate = shadow_sample_rate
+        self._rng = rng
+
+    def evaluate(self, user_text: str, assistant_last_message: str) -> ExtractionGateDecision:
+        if not self._enabled:
+            return ExtractionGateDecision(run=True, reason="disabled")
+        run, reason = predict_extractable(user_text, assistant_last_message)
+        if run:
+            record_counter(_METRIC_COMPONENT, "passed", metadata={"reason": reason})
+            return ExtractionGateDecision(run=True, reason=reason)
+        if self._rng() < self._shadow_sample_rate:
+            record_counter(_METRIC_COMPONENT, "shadow_checked", metadata={"reason": reason})
+            return ExtractionGateDecision(run=True, reason=reason, shadow=True)
+        record_counter(_METRIC_COMPONENT, "skipped", metadata={"reason": reason})
+        return ExtractionGateDecision(run=False, reason=reason)
+
+    @staticmethod
+    async def observe_shadow(
+        extraction: Awaitable[Any],
+        decision: ExtractionGateDecision,
+    ) -> Any:
+        """Aguarda a extração amostrada e conta miss se ela trouxe patch."""
+        result = await extraction
+        if getattr(result, "has_updates", False):
+            record_counter(_METRIC_COMPONENT, "shadow_miss", metadata={"reason": decision.reason})
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_contact_card_extraction_gate() -> ContactCardExtractionGate:
+    """Gate do processo montado a partir das settings."""
+    settings = get_extraction_gate_settings()
+    return ContactCardExtractionGate(
+        enabled=settings.enabled,
+        shadow_sample_rate=settings.shadow_sample_rate,
+    )
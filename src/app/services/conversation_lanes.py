@@ -0,0 +1,108 @@
+"""Lanes de execução ordenada por conversa (sender).
+
+Mensagens do mesmo remetente que chegam em webhooks distintos disputariam
+a mesma sessão (load → save, último save vence). Cada chave tem uma lane
+FIFO: trabalhos da mesma conversa rodam em série, conversas diferentes
+seguem em paralelo. A profundidade por lane é limitada para que um
+remetente em rajada não acumule tarefas sem fim.
+
+Escopo: serialização dentro do processo. Entre instâncias a ordem depende
+do roteamento da fila (modo `queue`).
+
+`lane_admission` permite ao chamador exigir uma vaga extra (ex.: o limite
+global de tasks do webhook) só quando chega a vez na lane: trabalho parado
+atrás do mesmo remetente não ocupa vaga de outras conversas.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypeVar
+
+from app.observability import record_counter, record_gauge, record_latency
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from contextlib import AbstractAsyncContextManager
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_LANE_DEPTH = 20
+
+# Vaga adquirida dentro da lane, antes de `work` (None = sem vaga extra)
+lane_admission: ContextVar[Callable[[], AbstractAsyncContextManager[None]] | None] = ContextVar(
+    "lane_admission", default=None
+)
+
+
+class ConversationLaneFullError(RuntimeError):
+    """Lane da conversa atingiu a profundidade máxima (retry posterior)."""
+
+
+@dataclass(slots=True)
+class _Lane:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    depth: int = 0
+
+
+class ConversationLaneScheduler:
+    """Serializa trabalhos por chave mantendo paralelismo entre chaves."""
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_LANE_DEPTH) -> None:
+        self._max_depth = max(1, max_depth)
+        self._lanes: dict[str, _Lane] = {}
+
+    @property
+    def active_lanes(self) -> int:
+        return len(self._lanes)
+
+    def depth(self, key: str) -> int:
+        """Trabalhos em execução + aguardando na lane da chave."""
+        lane = self._lanes.get(key)
+        return lane.depth if lane else 0
+
+    async def run(
+        self,
+        key: str,
+        work: Callable[[], Awaitable[T]],
+        correlation_id: str | None = None,
+    ) -> T:
+        """Executa `work` quando todos os trabalhos anteriores da chave terminarem.
+
+        Raises:
+            ConversationLaneFullError: Se a lane já tem `max_depth` trabalhos.
+        """
+        lane = self._lanes.setdefault(key, _Lane())
+        if lane.depth >= self._max_depth:
+            record_counter(
+                "conversation_lanes",
+                "lane_rejected",
+                correlation_id=correlation_id,
+                metadata={"lane_depth": lane.depth},
+            )
+            raise ConversationLaneFullError("conversation_lane_full")
+        contended = lane.depth > 0
+        lane.depth += 1
+        enqueued_at = time.perf_counter()
+        try:
+            async with lane.lock:
+                if contended:
+                    # Só registra quando havia trabalho à frente na mesma conversa
+                    wait_ms = (time.perf_counter() - enqueued_at) * 1000
+                    record_latency("conversation_lanes", "lane_wait", wait_ms, correlation_id)
+                    record_gauge("conversation_lanes", "active_lanes", len(self._lanes))
+                admission = lane_admission.get()
+                if admission is None:
+                    return await work()
+                async with admission():
+                    return await work()
+        finally:
+            lane.depth -= 1
+            if lane.depth == 0 and self._lanes.get(key) is lane:
+                del self._lanes[key]
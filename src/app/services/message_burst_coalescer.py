@@ -0,0 +1,101 @@
+"""Agregação de rajadas de mensagens por remetente (janela de debounce).
+
+Usuários de WhatsApp costumam mandar várias mensagens curtas seguidas
+("oi", "tudo bem?", "quero saber do SaaS"). Sem agregação, cada uma gera
+uma rodada completa de LLM e uma resposta separada.
+
+A primeira mensagem de uma chave abre uma rajada e vira líder: espera até
+`window_seconds` sem novas chegadas (cada chegada reinicia a janela, limitada
+por `max_wait_seconds` e `max_items`). Mensagens que chegam com a rajada
+aberta entram nela e retornam na hora (não ocupam task/consumidor da fila):
+o líder responde por todas, inclusive pela falha, cujo retry reprocessa a
+rajada a partir do item do líder.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+from app.observability import record_counter
+
+DEFAULT_WINDOW_SECONDS = 1.5
+DEFAULT_MAX_WAIT_SECONDS = 4.0
+DEFAULT_MAX_ITEMS = 5
+
+
+@dataclass(slots=True)
+class MessageBurst[T]:
+    """Rajada fechada entregue ao líder, que processa todos os itens."""
+
+    items: list[T]
+    closed: bool = False
+    _arrived: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class MessageBurstCoalescer[T]:
+    """Agrupa itens da mesma chave que chegam dentro da janela de debounce."""
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        max_items: int = DEFAULT_MAX_ITEMS,
+    ) -> None:
+        self._window = max(0.0, window_seconds)
+        self._max_wait = max(self._window, max_wait_seconds)
+        self._max_items = max(1, max_items)
+        self._open: dict[str, MessageBurst[T]] = {}
+
+    @property
+    def open_bursts(self) -> int:
+        return len(self._open)
+
+    async def join(
+        self,
+        key: str,
+        item: T,
+        correlation_id: str | None = None,
+    ) -> MessageBurst[T] | None:
+        """Entra na rajada aberta da chave ou abre uma nova.
+
+        Returns:
+            A rajada fechada quando o chamador é o líder; None, sem esperar,
+            quando o item foi agregado à rajada aberta de outra mensagem.
+        """
+        burst = self._open.get(key)
+        if burst is not None and not burst.closed and len(burst.items) < self._max_items:
+            burst.items.append(item)
+            burst._arrived.set()
+            record_counter("message_burst", "coalesced", correlation_id=correlation_id)
+            return None
+
+        burst = MessageBurst[T](items=[item])
+        self._open[key] = burst
+        try:
+            await self._wait_quiet(burst)
+        finally:
+            burst.closed = True
+            if self._open.get(key) is burst:
+                del self._open[key]
+        if len(burst.items) > 1:
+            record_counter(
+                "message_burst",
+                "burst_closed",
+                correlation_id=correlation_id,
+                metadata={"burst_size": len(burst.items)},
+            )
+        return burst
+
+    async def _wait_quiet(self, burst: MessageBurst[T]) -> None:
+        loop = asyncio.get_running_loop()
+        hard_deadline = loop.time() + self._max_wait
+        while len(burst.items) < self._max_items:
+            timeout = min(self._window, hard_deadline - loop.time())
+            if timeout <= 0:
+                return
+            burst._arrived.clear()
+            try:
+                await asyncio.wait_for(burst._arrived.wait(), timeout=timeout)
+            except TimeoutError:
+                return
@@ -0,0 +1,104 @@
+"""Retry atrasado de envios outbound fora da task de processamento.
+
+Com retry inline, o `HttpClient` dorme entre tentativas (2s, 4s, 8s...) e a
+task de processamento da mensagem fica viva até ~30s por envio falho,
+segurando a vaga de concorrência. Aqui a falha transitória é agendada numa
+fila ordenada por vencimento e a task termina na hora; o
+`OutboundRetryWorker` reenvia com backoff exponencial com jitter, mantendo
+a chave de idempotência, até o prazo `max_age_seconds`.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from app.observability import get_correlation_id, record_counter
+from app.protocols.outbound_retry_queue import OutboundRetryEntry
+from app.protocols.outbound_sender import OutboundSenderProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.protocols.models import OutboundMessageRequest, OutboundMessageResponse
+    from app.protocols.outbound_retry_queue import OutboundRetryQueueProtocol
+
+logger = logging.getLogger(__name__)
+
+# 429/5xx/timeout, circuito aberto e bulkhead cheio: vale tentar de novo
+RETRYABLE_SEND_ERROR_CODES = frozenset(
+    {"WHATSAPP_API_TRANSIENT", "WHATSAPP_CIRCUIT_OPEN", "WHATSAPP_BULKHEAD_FULL"}
+)
+RETRY_SCHEDULED_ERROR_CODE = "WHATSAPP_RETRY_SCHEDULED"
+
+
+def retry_delay_seconds(
+    attempts: int,
+    base_seconds: float,
+    max_seconds: float,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Backoff exponencial com jitter (metade fixa, metade aleatória)."""
+    ceiling = min(max_seconds, base_seconds * 2.0 ** max(0, attempts - 1))
+    return ceiling / 2 + rng() * ceiling / 2
+
+
+class RetryingOutboundSender(OutboundSenderProtocol):
+    """Agenda na fila os envios com falha transitória e retorna sem esperar."""
+
+    def __init__(
+        self,
+        sender: OutboundSenderProtocol,
+        queue: OutboundRetryQueueProtocol,
+        *,
+        max_age_seconds: float = 300.0,
+        backoff_base_seconds: float = 2.0,
+        backoff_max_seconds: float = 60.0,
+        on_scheduled: Callable[[], None] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._sender = sender
+        self._queue = queue
+        self._max_age = max_age_seconds
+        self._base = backoff_base_seconds
+        self._max = backoff_max_seconds
+        self._on_scheduled = on_scheduled
+        self._clock = clock
+
+    async def send(
+        self,
+        request: OutboundMessageRequest,
+        payload: dict[str, Any],
+    ) -> OutboundMessageResponse:
+        response = await self._sender.send(request, payload)
+        key = request.idempotency_key
+        if response.success or response.error_code not in RETRYABLE_SEND_ERROR_CODES or not key:
+            return response
+        now = self._clock()
+        entry = OutboundRetryEntry(
+            key=key,
+            request=request.model_dump(mode="json"),
+            payload=dict(payload),
+            deadline_at=now + self._max_age,
+            correlation_id=get_correlation_id(),
+        )
+        try:
+            await self._queue.schedule(entry, now + retry_delay_seconds(1, self._base, self._max))
+        except Exception as exc:
+            logger.error(
+                "outbound_retry_schedule_failed",
+                extra={"request_id": key, "error_type": type(exc).__name__},
+            )
+            return response
+        record_counter("outbound_retry", "scheduled")
+        logger.info(
+            "outbound_retry_scheduled",
+            extra={"request_id": key, "error_code": response.error_code},
+        )
+        if self._on_scheduled is not None:
+            self._on_scheduled()
+        return response.model_copy(
+            update={"error_code": RETRY_SCHEDULED_ERROR_CODE, "error_message": response.error_code}
+        )
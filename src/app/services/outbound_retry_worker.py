@@ -0,0 +1,138 @@
+"""Worker que reenvia os envios outbound agendados na fila de retry.
+
+Cada ciclo reivindica os vencidos (arrendados por `lease_seconds`), reenvia
+pelo sender real com a mesma chave de idempotência e decide: `ack` em caso
+de sucesso, reagendamento com backoff enquanto couber no prazo do envio, ou
+descarte (falha permanente/prazo esgotado) com log e métrica.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from app.observability import record_counter, reset_correlation_id, set_correlation_id
+from app.protocols.models import OutboundMessageRequest, OutboundMessageResponse
+from app.services.outbound_retry import RETRYABLE_SEND_ERROR_CODES, retry_delay_seconds
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.protocols.outbound_retry_queue import (
+        OutboundRetryEntry,
+        OutboundRetryQueueProtocol,
+    )
+    from app.protocols.outbound_sender import OutboundSenderProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class OutboundRetryWorker:
+    """Loop que reivindica retries vencidos e os reenvia pelo sender real."""
+
+    def __init__(
+        self,
+        sender: OutboundSenderProtocol,
+        queue: OutboundRetryQueueProtocol,
+        *,
+        backoff_base_seconds: float = 2.0,
+        backoff_max_seconds: float = 60.0,
+        poll_interval_seconds: float = 1.0,
+        batch_size: int = 20,
+        lease_seconds: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._sender = sender
+        self._queue = queue
+        self._base = backoff_base_seconds
+        self._max = backoff_max_seconds
+        self._poll_interval = poll_interval_seconds
+        self._batch_size = max(1, batch_size)
+        self._lease = lease_seconds
+        self._clock = clock
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Inicia o loop (idempotente)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout_seconds: float = 30.0) -> None:
+        """Para o loop; retries pendentes ficam na fila."""
+        self._stopping.set()
+        task, self._task = self._task, None
+        if task is None:
+            return
+        _, pending = await asyncio.wait({task}, timeout=timeout_seconds)
+        for item in pending:
+            item.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def run_once(self) -> int:
+        """Reenvia os retries vencidos agora; retorna quantos foram reivindicados."""
+        try:
+            entries = await self._queue.claim_due(self._clock(), self._batch_size, self._lease)
+        except Exception as exc:
+            logger.error("outbound_retry_claim_failed", extra={"error_type": type(exc).__name__})
+            return 0
+        await asyncio.gather(*(self._retry(entry) for entry in entries))
+        return len(entries)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            if await self.run_once() >= self._batch_size:
+                continue  # ainda há vencidos: não espera o próximo ciclo
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), self._poll_interval)
+
+    async def _retry(self, entry: OutboundRetryEntry) -> None:
+        token = set_correlation_id(entry.correlation_id or None)
+        try:
+            response = await self._resend(entry)
+            attempts = entry.attempts + 1
+            due_at = self._clock() + retry_delay_seconds(attempts, self._base, self._max)
+            if response.success:
+                await self._queue.ack(entry.key)
+                record_counter("outbound_retry", "delivered", metadata={"attempts": attempts})
+            elif response.error_code in RETRYABLE_SEND_ERROR_CODES and due_at < entry.deadline_at:
+                await self._queue.schedule(replace(entry, attempts=attempts), due_at)
+                record_counter("outbound_retry", "rescheduled")
+            else:
+                await self._queue.ack(entry.key)
+                record_counter("outbound_retry", "gave_up")
+                logger.warning(
+                    "outbound_retry_gave_up",
+                    extra={
+                        "request_id": entry.key,
+                        "attempts": attempts,
+                        "error_code": response.error_code,
+                    },
+                )
+        except Exception as exc:
+            # Fila indisponível: o arrendamento expira e o item volta
+            logger.error(
+                "outbound_retry_settle_failed",
+                extra={"request_id": entry.key, "error_type": type(exc).__name__},
+            )
+        finally:
+            reset_correlation_id(token)
+
+    async def _resend(self, entry: OutboundRetryEntry) -> OutboundMessageResponse:
+        try:
+            request = OutboundMessageRequest.model_validate(entry.request)
+            return await self._sender.send(request, entry.payload)
+        except Exception as exc:
+            return OutboundMessageResponse(
+                success=False, error_code="OUTBOUND_RETRY_ERROR", error_message=type(exc).__name__
+            )
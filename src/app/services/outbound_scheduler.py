@@ -0,0 +1,176 @@
+"""Agendador outbound com token bucket por número e lane de prioridade.
+
+Sem controle, cada task de processamento chama a Graph API assim que chega em
+`_send_response`; em rajadas a Meta responde 429 e cada 429 custa backoff
+dentro da task. Aqui os envios entram numa fila por `phone_number_id`, um
+worker drena em lotes respeitando o token bucket (vazão sustentada no limite
+do provedor) e respostas de conversa passam à frente de templates/agendamento.
+
+O worker existe só enquanto há fila: sobe no primeiro envio e encerra quando
+ela esvazia (o shutdown aguarda as tasks de processamento, que aguardam seus
+envios).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from app.observability import record_latency
+from app.protocols.outbound_sender import OutboundSenderProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.protocols.models import OutboundMessageRequest, OutboundMessageResponse
+
+PRIORITY_CONVERSATIONAL = 0
+PRIORITY_BULK = 1
+
+DEFAULT_RATE_PER_SECOND = 80.0
+DEFAULT_BURST = 20
+DEFAULT_BATCH_SIZE = 10
+
+_BULK_CATEGORIES = frozenset({"MARKETING", "UTILITY"})
+# Refill em ponto flutuante pode parar em 0.999...; sem tolerância o worker
+# dormiria intervalos menores que a resolução do relógio (busy loop)
+_TOKEN_EPSILON = 1e-6
+_MIN_WAIT_SECONDS = 0.001
+
+
+def outbound_priority(request: OutboundMessageRequest) -> int:
+    """Templates e envios de categoria MARKETING/UTILITY vão para a lane bulk."""
+    if request.message_type == "template" or (request.category or "").upper() in _BULK_CATEGORIES:
+        return PRIORITY_BULK
+    return PRIORITY_CONVERSATIONAL
+
+
+class TokenBucket:
+    """Token bucket contínuo (`rate_per_second`, capacidade `burst`)."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = max(rate_per_second, 0.001)
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated_at = clock()
+
+    def take(self, wanted: int) -> int:
+        """Retira até `wanted` tokens inteiros; retorna quantos foram concedidos."""
+        self._refill()
+        granted = min(wanted, int(self._tokens + _TOKEN_EPSILON))
+        self._tokens = max(0.0, self._tokens - granted)
+        return granted
+
+    def seconds_until_available(self) -> float:
+        self._refill()
+        return max(_MIN_WAIT_SECONDS, (1.0 - self._tokens) / self._rate)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+
+@dataclass(order=True, slots=True)
+class _Pending:
+    priority: int
+    seq: int
+    request: OutboundMessageRequest = field(compare=False)
+    payload: dict[str, Any] = field(compare=False)
+    future: asyncio.Future[OutboundMessageResponse] = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+@dataclass(slots=True)
+class _Lane:
+    bucket: TokenBucket
+    pending: list[_Pending] = field(default_factory=list)
+    worker: asyncio.Task[None] | None = None
+
+
+class ThrottledOutboundSender(OutboundSenderProtocol):
+    """Envolve um sender aplicando token bucket por número e prioridade."""
+
+    def __init__(
+        self,
+        sender: OutboundSenderProtocol,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        key_fn: Callable[[OutboundMessageRequest], str] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self._sender = sender
+        self._rate = rate_per_second
+        self._burst = burst
+        self._batch_size = max(1, batch_size)
+        self._key_fn = key_fn or (lambda _request: "default")
+        self._clock = clock
+        self._sleep = sleep
+        self._lanes: dict[str, _Lane] = {}
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._seq = itertools.count()
+
+    def queued(self, key: str = "default") -> int:
+        lane = self._lanes.get(key)
+        return len(lane.pending) if lane else 0
+
+    async def send(
+        self,
+        request: OutboundMessageRequest,
+        payload: dict[str, Any],
+    ) -> OutboundMessageResponse:
+        """Enfileira o envio e aguarda a resposta do sender real."""
+        key = self._key_fn(request)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane(TokenBucket(self._rate, self._burst, self._clock))
+        future: asyncio.Future[OutboundMessageResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        item = _Pending(
+            outbound_priority(request), next(self._seq), request, payload, future, self._clock()
+        )
+        heapq.heappush(lane.pending, item)
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.create_task(self._drain(lane))
+        return await future
+
+    async def _drain(self, lane: _Lane) -> None:
+        while lane.pending:
+            granted = lane.bucket.take(min(self._batch_size, len(lane.pending)))
+            if not granted:
+                await self._sleep(lane.bucket.seconds_until_available())
+                continue
+            for _ in range(granted):
+                item = heapq.heappop(lane.pending)
+                task = asyncio.create_task(self._dispatch(item))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, item: _Pending) -> None:
+        if item.future.done():  # chamador cancelado
+            return
+        wait_ms = (self._clock() - item.enqueued_at) * 1000
+        if wait_ms >= 1:
+            record_latency("outbound_scheduler", "queue_wait", wait_ms)
+        try:
+            response = await self._sender.send(item.request, item.payload)
+        except Exception as exc:
+            if not item.future.done():
+                item.future.set_exception(exc)
+            return
+        if not item.future.done():
+            item.future.set_result(response)
@@ -0,0 +1,148 @@
+"""Pool de consumidores para WorkQueueProtocol.
+
+Executa N loops concorrentes por processo: claim → handler → ack/nack.
+Enquanto o lote é processado, um heartbeat renova o arrendamento dos itens
+ainda sem ack (handler lento não vira reentrega duplicada). Falhas do
+handler devolvem o item (nack) para retry/dead-letter; no shutdown, itens
+ainda sem ack permanecem na fila e são recuperados por outra instância
+após o visibility timeout.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from app.protocols.work_queue import WorkItem, WorkQueueProtocol
+
+logger = logging.getLogger(__name__)
+
+_ERROR_BACKOFF_SECONDS = 1.0
+
+
+class WorkQueueConsumerPool:
+    """Gerencia consumidores concorrentes de uma fila de trabalho."""
+
+    def __init__(
+        self,
+        queue: WorkQueueProtocol,
+        handler: Callable[[dict[str, Any]], Awaitable[None]],
+        *,
+        consumers: int = 4,
+        batch_size: int = 1,
+        consumer_prefix: str = "worker",
+        heartbeat_seconds: float = 20.0,
+    ) -> None:
+        self._queue = queue
+        self._handler = handler
+        self._consumers = max(1, consumers)
+        self._batch_size = max(1, batch_size)
+        self._prefix = consumer_prefix
+        self._heartbeat_seconds = heartbeat_seconds
+        self._stopping = asyncio.Event()
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def start(self) -> None:
+        """Inicia os loops de consumo (idempotente)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._tasks = [
+            asyncio.create_task(self._consume_loop(f"{self._prefix}-{index}"))
+            for index in range(self._consumers)
+        ]
+        logger.info(
+            "work_queue_consumers_started",
+            extra={"component": "work_queue", "action": "start", "consumers": self._consumers},
+        )
+
+    async def stop(self, timeout_seconds: float = 30.0) -> None:
+        """Para de reivindicar itens e aguarda os handlers em andamento."""
+        self._stopping.set()
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(self._tasks, timeout=timeout_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info(
+            "work_queue_consumers_stopped",
+            extra={
+                "component": "work_queue",
+                "action": "stop",
+                "cancelled_consumers": len(pending),
+            },
+        )
+
+    async def _consume_loop(self, consumer: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                items = await self._queue.claim(consumer, count=self._batch_size)
+            except Exception as exc:
+                logger.error(
+                    "work_queue_claim_failed",
+                    extra={"component": "work_queue", "error_type": type(exc).__name__},
+                )
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._stopping.wait(), _ERROR_BACKOFF_SECONDS)
+                continue
+            if items:
+                await self._run_batch(consumer, items)
+
+    async def _run_batch(self, consumer: str, items: list[WorkItem]) -> None:
+        pending = list(items)
+        heartbeat = asyncio.create_task(self._heartbeat(consumer, pending))
+        try:
+            for item in items:
+                try:
+                    await self._run_item(item)
+                except Exception as exc:
+                    # ack/nack falhou: item volta após o visibility timeout
+                    logger.error(
+                        "work_queue_settle_failed",
+                        extra={"component": "work_queue", "error_type": type(exc).__name__},
+                    )
+                pending.remove(item)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _heartbeat(self, consumer: str, pending: list[WorkItem]) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_seconds)
+            try:
+                await self._queue.extend(consumer, list(pending))
+            except Exception as exc:
+                logger.warning(
+                    "work_queue_extend_failed",
+                    extra={"component": "work_queue", "error_type": type(exc).__name__},
+                )
+
+    async def _run_item(self, item: WorkItem) -> None:
+        try:
+            await self._handler(item.payload)
+        except Exception as exc:
+            requeued = await self._queue.nack(item, type(exc).__name__)
+            logger.warning(
+                "work_queue_item_failed",
+                extra={
+                    "component": "work_queue",
+                    "action": "handle",
+                    "result": "requeued" if requeued else "dead_letter",
+                    "attempts": item.attempts + 1,
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return
+        await self._queue.ack(item)
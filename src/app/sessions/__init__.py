@@ -3,6 +3,7 @@
 Exporta modelos e gerenciador de sessões.
 """
 
+from app.sessions.conversation_write_behind import ConversationWriteBehind
 from app.sessions.manager import DEFAULT_SESSION_TTL_SECONDS, SessionManager
 from app.sessions.models import (
     ContactCard,
@@ -15,6 +16,7 @@ from app.sessions.models import (
 __all__ = [
     "DEFAULT_SESSION_TTL_SECONDS",
     "ContactCard",
+    "ConversationWriteBehind",
     "HistoryEntry",
     "HistoryRole",
     "Session",
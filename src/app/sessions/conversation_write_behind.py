@@ -0,0 +1,177 @@
+"""Write-behind das escritas permanentes de conversa (dual-write Firestore).
+
+Mensagens e leads entram num buffer limitado e vão ao store em lote
+(`ConversationStoreProtocol.write_batch`, um WriteBatch por commit no
+Firestore) quando o lote enche ou após `flush_interval_seconds`.
+
+Buffer cheio aplica backpressure: quem enfileira aguarda um flush em vez
+de acumular tasks sem limite. Upserts do mesmo lead no buffer colapsam na
+versão mais recente. Falha de escrita é logada e descartada (mesma
+semântica do fire-and-forget anterior); o shutdown drena o buffer via
+`drain_conversation_write_behind`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import weakref
+from typing import TYPE_CHECKING
+
+from app.observability import record_counter, record_gauge, record_latency
+from app.protocols.conversation_store import PendingConversationMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable
+    from typing import Any
+
+    from app.protocols.conversation_store import (
+        ConversationMessage,
+        ConversationStoreProtocol,
+        LeadData,
+    )
+    from config.settings.base.session import SessionSettings
+
+logger = logging.getLogger(__name__)
+
+_METRIC_COMPONENT = "conversation_write_behind"
+_instances: weakref.WeakSet[ConversationWriteBehind] = weakref.WeakSet()
+
+
+class ConversationWriteBehind:
+    """Buffer limitado com flush por tamanho/tempo para o ConversationStore."""
+
+    def __init__(
+        self,
+        store: ConversationStoreProtocol,
+        *,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 0.5,
+        max_pending: int = 1000,
+    ) -> None:
+        self._store = store
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._max_pending = max(max_pending, batch_size)
+        self._messages: list[PendingConversationMessage] = []
+        self._leads: dict[tuple[str, str], LeadData] = {}
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        _instances.add(self)
+
+    @classmethod
+    def from_settings(
+        cls,
+        store: ConversationStoreProtocol,
+        settings: SessionSettings,
+    ) -> ConversationWriteBehind:
+        return cls(
+            store,
+            batch_size=settings.conversation_write_batch_size,
+            flush_interval_seconds=settings.conversation_write_flush_seconds,
+            max_pending=settings.conversation_write_max_pending,
+        )
+
+    @property
+    def depth(self) -> int:
+        return len(self._messages) + len(self._leads)
+
+    async def enqueue_messages(
+        self,
+        phone_hash: str,
+        messages: Iterable[ConversationMessage],
+        *,
+        tenant_id: str,
+    ) -> None:
+        for message in messages:
+            await self._reserve()
+            self._messages.append(PendingConversationMessage(phone_hash, tenant_id, message))
+        self._after_enqueue()
+
+    async def enqueue_lead(self, lead: LeadData) -> None:
+        key = (lead.tenant_id, lead.phone_hash)
+        if key not in self._leads:
+            await self._reserve()
+        self._leads[key] = lead
+        self._after_enqueue()
+
+    async def flush(self) -> None:
+        """Grava todo o buffer em lotes de até `batch_size` escritas."""
+        async with self._flush_lock:
+            while self._messages or self._leads:
+                messages = self._messages[: self._batch_size]
+                del self._messages[: self._batch_size]
+                leads = [
+                    self._leads.pop(key)
+                    for key in list(self._leads)[: self._batch_size - len(messages)]
+                ]
+                await self._commit(messages, leads)
+
+    async def drain(self, timeout_seconds: float = 30.0) -> None:
+        """Esvazia o buffer no shutdown; timers/flushes restantes são cancelados."""
+        try:
+            await asyncio.wait_for(self.flush(), timeout=timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                "conversation_write_behind_drain_timeout",
+                extra={"component": _METRIC_COMPONENT, "dropped_writes": self.depth},
+            )
+        pending = list(self._tasks)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _reserve(self) -> None:
+        if self.depth < self._max_pending:
+            return
+        # Backpressure: o chamador paga o flush em vez de crescer o buffer
+        record_counter(_METRIC_COMPONENT, "backpressure")
+        await self.flush()
+
+    def _after_enqueue(self) -> None:
+        record_gauge(_METRIC_COMPONENT, "queue_depth", self.depth)
+        if self.depth >= self._batch_size:
+            self._spawn(self.flush())
+        elif self._timer is None or self._timer.done():
+            self._timer = self._spawn(self._flush_after_interval())
+
+    async def _flush_after_interval(self) -> None:
+        await asyncio.sleep(self._flush_interval_seconds)
+        await self.flush()
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task[None]:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _commit(
+        self,
+        messages: list[PendingConversationMessage],
+        leads: list[LeadData],
+    ) -> None:
+        writes = len(messages) + len(leads)
+        started_at = time.perf_counter()
+        try:
+            await self._store.write_batch(messages, leads)
+        except Exception as exc:
+            record_counter(_METRIC_COMPONENT, "flush_failed", value=writes)
+            logger.warning(
+                "conversation_write_behind_flush_failed",
+                extra={
+                    "component": _METRIC_COMPONENT,
+                    "writes": writes,
+                    "error_type": type(exc).__name__,
+                },
+            )
+            return
+        record_latency(_METRIC_COMPONENT, "flush", (time.perf_counter() - started_at) * 1000)
+        record_counter(_METRIC_COMPONENT, "flushed", value=writes)
+
+
+async def drain_conversation_write_behind(timeout_seconds: float = 30.0) -> None:
+    """Drena todos os buffers do processo (chamado no shutdown)."""
+    for write_behind in list(_instances):
+        await write_behind.drain(timeout_seconds=timeout_seconds)
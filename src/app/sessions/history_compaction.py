@@ -0,0 +1,76 @@
+"""Compactação do histórico da sessão (janela quente + resumo incremental).
+
+A sessão guarda apenas as últimas `hot_window` entradas; as mais antigas
+saem da sessão (e vão para o conversation store permanente, quando houver)
+e viram linhas condensadas num resumo acumulado, limitado a
+`summary_max_chars` (mantém o trecho mais recente). Assim o tamanho da
+sessão no Redis e a latência de save ficam constantes com a conversa longa.
+
+O resumo é determinístico (sem LLM): o contexto factual relevante já vive
+no ContactCard; o resumo só preserva o fio da conversa para o prompt.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.sessions.history import HistoryRole
+
+if TYPE_CHECKING:
+    from app.sessions.history import HistoryEntry
+    from app.sessions.session_entity import Session
+
+DEFAULT_HOT_WINDOW = 20
+DEFAULT_SUMMARY_MAX_CHARS = 600
+_ENTRY_SUMMARY_CHARS = 120
+_SUMMARY_SEPARATOR = " | "
+
+
+class HistoryCompactor:
+    """Mantém a janela quente do histórico e atualiza o resumo acumulado."""
+
+    def __init__(
+        self,
+        hot_window: int = DEFAULT_HOT_WINDOW,
+        summary_max_chars: int = DEFAULT_SUMMARY_MAX_CHARS,
+    ) -> None:
+        self._hot_window = max(1, hot_window)
+        self._summary_max_chars = max(0, summary_max_chars)
+
+    def compact(self, session: Session) -> list[HistoryEntry]:
+        """Remove entradas além da janela quente e as resume.
+
+        Returns:
+            Entradas removidas da sessão (mais antigas primeiro).
+        """
+        overflow = len(session.history) - self._hot_window
+        if overflow <= 0:
+            return []
+        evicted = session.history[:overflow]
+        session.history = session.history[overflow:]
+        session.history_summary = roll_summary(
+            session.history_summary,
+            evicted,
+            max_chars=self._summary_max_chars,
+        )
+        return evicted
+
+
+def roll_summary(summary: str, entries: list[HistoryEntry], *, max_chars: int) -> str:
+    """Acrescenta entradas condensadas ao resumo, mantendo o final mais recente."""
+    if max_chars <= 0:
+        return ""
+    parts = [summary] if summary else []
+    parts.extend(_condense(entry) for entry in entries if entry.content.strip())
+    text = _SUMMARY_SEPARATOR.join(parts)
+    if len(text) <= max_chars:
+        return text
+    return "..." + text[-(max_chars - 3) :].lstrip()
+
+
+def _condense(entry: HistoryEntry) -> str:
+    prefix = "U" if entry.role == HistoryRole.USER else "O"
+    content = " ".join(entry.content.split())
+    if len(content) > _ENTRY_SUMMARY_CHARS:
+        content = content[: _ENTRY_SUMMARY_CHARS - 3].rstrip() + "..."
+    return f"{prefix}: {content}"
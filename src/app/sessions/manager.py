@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import logging
 from typing import TYPE_CHECKING
 
 from app.domain.contact_card import ContactCard
+from app.sessions.conversation_write_behind import ConversationWriteBehind
+from app.sessions.history_compaction import HistoryCompactor
 from app.sessions.manager_persistence import (
-    persist_lead_to_firestore,
-    persist_message_to_firestore,
+    build_history_messages,
+    build_lead,
+    take_unpersisted_history,
 )
 from app.sessions.manager_recovery import create_new_session, recover_contact_and_history
 from app.sessions.session_entity import Session
@@ -25,17 +27,30 @@ DEFAULT_SESSION_TTL_SECONDS = 7200
 
 
 class SessionManager:
-    __slots__ = ("_conversation_store", "_store", "_ttl_seconds")
+    __slots__ = (
+        "_conversation_store",
+        "_history_compactor",
+        "_store",
+        "_ttl_seconds",
+        "_write_behind",
+    )
 
     def __init__(
         self,
         store: AsyncSessionStoreProtocol,
         ttl_seconds: int = DEFAULT_SESSION_TTL_SECONDS,
         conversation_store: ConversationStoreProtocol | None = None,
+        history_compactor: HistoryCompactor | None = None,
+        write_behind: ConversationWriteBehind | None = None,
     ) -> None:
         self._store = store
         self._ttl_seconds = ttl_seconds
         self._conversation_store = conversation_store
+        # A janela quente vale sempre; o store só decide se o excedente é persistido
+        self._history_compactor = history_compactor or HistoryCompactor()
+        if write_behind is None and conversation_store is not None:
+            write_behind = ConversationWriteBehind(conversation_store)
+        self._write_behind = write_behind
 
     @staticmethod
     def _hash_sender(sender_id: str) -> str:
@@ -123,23 +138,9 @@ class SessionManager:
         role: HistoryRole,
         *,
         detected_intent: str | None = None,
-        channel: str = "whatsapp",
-        message_id: str | None = None,
     ) -> None:
-        session.add_to_history(content, role, detected_intent)
+        session.add_to_history(content, role, detected_intent, max_history=None)
         await self.save(session)
-        if self._conversation_store is not None:
-            asyncio.create_task(  # noqa: RUF006
-                persist_message_to_firestore(
-                    conversation_store=self._conversation_store,
-                    session=session,
-                    content=content,
-                    role=role,
-                    detected_intent=detected_intent,
-                    channel=channel,
-                    message_id=message_id,
-                )
-            )
 
     async def update_contact_card(
         self,
@@ -158,18 +159,30 @@ class SessionManager:
         if primary_interest:
             session.contact_card.primary_interest = primary_interest
         await self.save(session)
-        if self._conversation_store is not None:
-            asyncio.create_task(  # noqa: RUF006
-                persist_lead_to_firestore(
-                    conversation_store=self._conversation_store,
-                    session=session,
-                )
-            )
+        lead = build_lead(session)
+        if self._write_behind is not None and lead is not None:
+            await self._write_behind.enqueue_lead(lead)
 
     async def save(self, session: Session) -> None:
-        await self._store.save_async(session.to_dict(), self._ttl_seconds)
+        await self._compact_history(session)
+        await self._store.save_async(session, self._ttl_seconds)
         logger.debug("session_saved", extra={"session_id": session.session_id})
 
+    async def _compact_history(self, session: Session) -> None:
+        evicted = self._history_compactor.compact(session)
+        if self._write_behind is None:
+            return
+        # Turnos novos vão ao store já no save (não só ao sair da janela):
+        # a recuperação após expirar a sessão inclui a janela quente
+        pending = take_unpersisted_history(session, evicted)
+        if not pending:
+            return
+        await self._write_behind.enqueue_messages(
+            session.sender_id,
+            build_history_messages(pending),
+            tenant_id=session.context.tenant_id or "default",
+        )
+
     async def close(self, session: Session, reason: str = "normal") -> None:
         await self._store.delete_async(session.session_id)
         logger.info("session_closed", extra={"session_id": session.session_id, "reason": reason})
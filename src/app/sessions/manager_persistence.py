@@ -1,85 +1,79 @@
-"""Helpers de dual-write do SessionManager."""
+"""Helpers de dual-write do SessionManager.
+
+Montam as mensagens/leads permanentes a partir da sessão; a escrita fica a
+cargo do `ConversationWriteBehind` (lotes, backpressure e drain no shutdown).
+"""
 
 from __future__ import annotations
 
-import logging
-import uuid
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from app.protocols.conversation_store import ConversationMessage, LeadData
 from app.sessions.history import HistoryRole
 
 if TYPE_CHECKING:
-    from app.protocols.conversation_store import ConversationStoreProtocol
+    from app.sessions.history import HistoryEntry
     from app.sessions.session_entity import Session
 
-logger = logging.getLogger(__name__)
-
 
-async def persist_message_to_firestore(
-    *,
-    conversation_store: ConversationStoreProtocol,
+def take_unpersisted_history(
     session: Session,
-    content: str,
-    role: HistoryRole,
-    detected_intent: str | None,
-    channel: str,
-    message_id: str | None,
-) -> None:
-    """Persiste mensagem no Firestore sem propagar falhas."""
-    try:
-        msg_id = message_id or f"{datetime.now(UTC).timestamp()}_{uuid.uuid4().hex[:8]}"
-        message = ConversationMessage(
-            message_id=msg_id,
-            role="assistant" if role == HistoryRole.ASSISTANT else "user",
-            content=content,
-            timestamp=datetime.now(UTC),
-            channel=channel,
-            detected_intent=detected_intent or "",
-        )
-        await conversation_store.append_message(
-            phone_hash=session.sender_id,
-            message=message,
-            tenant_id=session.context.tenant_id or "default",
-        )
-        logger.debug(
-            "message_persisted_firestore",
-            extra={
-                "session_id": session.session_id,
-                "message_id": msg_id,
-                "role": role.value,
-            },
-        )
-    except Exception as exc:
-        logger.warning(
-            "firestore_persist_failed",
-            extra={"error": str(exc), "session_id": session.session_id},
-        )
+    evicted: list[HistoryEntry],
+) -> list[HistoryEntry]:
+    """Entradas (evictadas + janela quente) ainda não enviadas ao store.
 
+    Avança `session.history_persisted_at`; assim cada turno vai ao store uma
+    vez, inclusive os que ainda estão na sessão quando ela expira.
+    """
+    watermark = session.history_persisted_at
+    pending = [
+        entry
+        for entry in (*evicted, *session.history)
+        if watermark is None or entry.timestamp > watermark
+    ]
+    if pending:
+        session.history_persisted_at = max(entry.timestamp for entry in pending)
+    return pending
 
-async def persist_lead_to_firestore(
-    *,
-    conversation_store: ConversationStoreProtocol,
-    session: Session,
-) -> None:
-    """Persiste lead no Firestore sem propagar falhas."""
-    try:
-        contact = session.contact_card
-        if contact is None:
-            return
-        lead = LeadData(
-            phone_hash=session.sender_id,
-            name=contact.full_name or contact.whatsapp_name or "",
-            email=contact.email or "",
-            primary_intent=contact.primary_interest or "",
-            tenant_id=session.context.tenant_id or "default",
-            last_contact=datetime.now(UTC),
+
+def build_history_messages(
+    entries: list[HistoryEntry],
+    channel: str = "whatsapp",
+) -> list[ConversationMessage]:
+    """Mensagens das entradas compactadas da janela quente.
+
+    message_id deriva do timestamp + role: reenvio da mesma entrada é
+    idempotente no store (append por message_id).
+    """
+    messages: list[ConversationMessage] = []
+    for entry in entries:
+        role: Literal["user", "assistant"] = (
+            "assistant" if entry.role == HistoryRole.ASSISTANT else "user"
         )
-        await conversation_store.upsert_lead(lead)
-        logger.debug("lead_persisted_firestore", extra={"session_id": session.session_id})
-    except Exception as exc:
-        logger.warning(
-            "firestore_lead_persist_failed",
-            extra={"error": str(exc), "session_id": session.session_id},
+        messages.append(
+            ConversationMessage(
+                message_id=f"hist_{int(entry.timestamp.timestamp() * 1_000_000)}_{role}",
+                role=role,
+                content=entry.content,
+                timestamp=entry.timestamp,
+                channel=channel,
+                detected_intent=entry.detected_intent or "",
+            )
         )
+    return messages
+
+
+def build_lead(session: Session) -> LeadData | None:
+    """Lead permanente a partir do ContactCard da sessão (None sem contato)."""
+    contact = session.contact_card
+    if contact is None:
+        return None
+    return LeadData(
+        phone_hash=session.sender_id,
+        name=contact.full_name or contact.whatsapp_name or "",
+        email=contact.email or "",
+        primary_intent=contact.primary_interest or "",
+        tenant_id=session.context.tenant_id or "default",
+        last_contact=datetime.now(UTC),
+    )
@@ -133,13 +133,15 @@ async def create_new_session(
         current_state=DEFAULT_INITIAL_STATE,
         context=SessionContext(tenant_id=tenant_id, vertente=vertente),
         history=recovered_history or [],
+        # O que veio do store já está persistido
+        history_persisted_at=recovered_history[-1].timestamp if recovered_history else None,
         contact_card=contact_card,
         turn_count=0,
         created_at=now,
         updated_at=now,
         expires_at=now + timedelta(seconds=ttl_seconds),
     )
-    await store.save_async(session.to_dict(), ttl_seconds)
+    await store.save_async(session, ttl_seconds)
     logger.info(
         "session_created",
         extra={
@@ -49,6 +49,9 @@ class Session:
     current_state: SessionState = DEFAULT_INITIAL_STATE
     context: SessionContext = field(default_factory=SessionContext)
     history: list[HistoryEntry] = field(default_factory=list)
+    history_summary: str = ""
+    # Timestamp da última entrada já enviada ao conversation store
+    history_persisted_at: datetime | None = None
     contact_card: ContactCard | None = None
     turn_count: int = 0
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -113,6 +116,10 @@ class Session:
                 "prompt_contexts": list(self.context.prompt_contexts),
             },
             "history": [entry.to_dict() for entry in self.history],
+            "history_summary": self.history_summary,
+            "history_persisted_at": (
+                self.history_persisted_at.isoformat() if self.history_persisted_at else None
+            ),
             "contact_card": (
                 self.contact_card.model_dump(mode="json", exclude_none=True)
                 if self.contact_card
@@ -157,6 +164,12 @@ class Session:
                 prompt_contexts=context_data.get("prompt_contexts", []) or [],
             ),
             history=history,
+            history_summary=data.get("history_summary", "") or "",
+            history_persisted_at=(
+                datetime.fromisoformat(data["history_persisted_at"])
+                if data.get("history_persisted_at")
+                else None
+            ),
             contact_card=contact_card,
             turn_count=data.get("turn_count", 0),
             created_at=(
@@ -0,0 +1,90 @@
+"""Execução dos agentes inbound como tasks independentes com prazos próprios.
+
+Antes, Otto e extrator rodavam num `gather` com timeout único: um extrator
+lento cancelava os dois e o Otto era chamado de novo do zero (latência e
+custo dobrados). Agora o Otto sempre tem seu resultado aproveitado; o
+extrator tem prazo próprio contado do início da rodada e, se estourar, é
+abandonado (cancelado) — a rodada segue só com a decisão.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from app.observability import record_counter, record_latency
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
+logger = logging.getLogger(__name__)
+
+AGENTS_METRIC_COMPONENT = "inbound_agents"
+
+
+def start_agent_task[T](
+    operation: str,
+    awaitable: Awaitable[T],
+    correlation_id: str,
+) -> asyncio.Task[T]:
+    """Cria a task do agente registrando a latência quando ela conclui."""
+
+    async def _timed() -> T:
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            record_latency(AGENTS_METRIC_COMPONENT, operation, elapsed_ms, correlation_id)
+
+    return asyncio.create_task(_timed())
+
+
+async def await_optional_agent(
+    task: asyncio.Task[Any],
+    *,
+    operation: str,
+    deadline: float,
+    correlation_id: str,
+) -> Any | None:
+    """Aguarda um agente opcional até `deadline` (`time.monotonic`).
+
+    Estouro de prazo cancela a task; erro do agente vira None. Em ambos os
+    casos a rodada segue sem o resultado.
+    """
+    remaining = deadline - time.monotonic()
+    if not task.done() and remaining > 0:
+        await asyncio.wait({task}, timeout=remaining)
+    if not task.done():
+        task.cancel()
+        record_counter(AGENTS_METRIC_COMPONENT, f"{operation}_timeout")
+        logger.warning(
+            "inbound_agent_deadline_exceeded",
+            extra={
+                "component": "inbound_processor",
+                "action": "run_agents",
+                "result": "abandoned",
+                "agent": operation,
+                "correlation_id": correlation_id,
+            },
+        )
+        return None
+    if task.cancelled():
+        return None
+    exc = task.exception()
+    if exc is not None:
+        record_counter(AGENTS_METRIC_COMPONENT, f"{operation}_error")
+        logger.warning(
+            "inbound_agent_failed",
+            extra={
+                "component": "inbound_processor",
+                "action": "run_agents",
+                "agent": operation,
+                "correlation_id": correlation_id,
+                "error_type": type(exc).__name__,
+            },
+        )
+        return None
+    return task.result()
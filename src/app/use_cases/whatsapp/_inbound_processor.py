@@ -4,11 +4,16 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import logging
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
+from ai.models.otto import OttoDecision
 from ai.services.decision_validator import DecisionValidatorService
 from ai.utils.sanitizer import sanitize_pii
+from app.protocols.decision_journal import DecisionJournalEntry
+from app.services.conversation_lanes import ConversationLaneScheduler
 from app.services.meeting_time_validator import extract_hour, is_within_business_hours
 from app.services.otto_repetition_guard import (
     apply_business_hours_guard,
@@ -19,17 +24,21 @@ from app.services.whatsapp_fixed_replies import match_fixed_reply
 from app.use_cases.whatsapp._inbound_processor_contact import InboundProcessorContactMixin
 from app.use_cases.whatsapp._inbound_processor_context import InboundProcessorContextMixin
 from app.use_cases.whatsapp._inbound_processor_dispatch import InboundProcessorDispatchMixin
+from app.use_cases.whatsapp._inbound_processor_journal import InboundProcessorJournalMixin
 
 if TYPE_CHECKING:
-    from ai.models.otto import OttoDecision, OttoRequest
+    from ai.models.otto import OttoRequest
     from ai.services.contact_card_extractor import ContactCardExtractorService
     from ai.services.otto_agent import OttoAgentService
-    from app.protocols import AsyncDedupeProtocol, OutboundSenderProtocol
+    from app.protocols import OutboundSenderProtocol
     from app.protocols.calendar_service import CalendarServiceProtocol
     from app.protocols.contact_card_store import ContactCardStoreProtocol
+    from app.protocols.decision_journal import DecisionJournalProtocol
+    from app.protocols.dedupe import AsyncDedupeProtocol
     from app.protocols.models import NormalizedMessage
     from app.protocols.session_manager import SessionManagerProtocol
     from app.protocols.transcription_service import TranscriptionServiceProtocol
+    from app.services.message_burst_coalescer import MessageBurstCoalescer
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +47,7 @@ class InboundMessageProcessor(
     InboundProcessorContextMixin,
     InboundProcessorContactMixin,
     InboundProcessorDispatchMixin,
+    InboundProcessorJournalMixin,
 ):
     """Orquestra processamento inbound mantendo compatibilidade do contrato atual."""
 
@@ -53,6 +63,9 @@ class InboundMessageProcessor(
         transcription_service: TranscriptionServiceProtocol | None = None,
         contact_card_extractor: ContactCardExtractorService | None = None,
         calendar_service: CalendarServiceProtocol | None = None,
+        decision_journal: DecisionJournalProtocol | None = None,
+        lane_scheduler: ConversationLaneScheduler | None = None,
+        burst_coalescer: MessageBurstCoalescer[NormalizedMessage] | None = None,
     ) -> None:
         self._session_manager = session_manager
         self._dedupe = dedupe
@@ -63,6 +76,9 @@ class InboundMessageProcessor(
         self._transcription_service = transcription_service
         self._contact_card_extractor = contact_card_extractor
         self._calendar_service = calendar_service
+        self._decision_journal = decision_journal
+        self._lanes = lane_scheduler or ConversationLaneScheduler()
+        self._coalescer = burst_coalescer
 
     async def process(
         self,
@@ -72,56 +88,117 @@ class InboundMessageProcessor(
     ) -> dict[str, Any] | None:
         if self._should_skip_message(msg):
             return None
-        if await self._dedupe.is_duplicate(msg.message_id):
+        lane_key = _lane_key(msg)
+        if self._coalescer is None or not _is_coalescible(msg):
+            return await self._run_in_lane(lane_key, [msg], correlation_id, tenant_id)
+        burst = await self._coalescer.join(lane_key, msg, correlation_id)
+        if burst is None:
+            # Agregada à rajada de outra mensagem: o líder responde por ela
             return None
-        await self._dedupe.mark_processing(msg.message_id)
+        return await self._run_in_lane(lane_key, burst.items, correlation_id, tenant_id)
+
+    async def _run_in_lane(
+        self,
+        lane_key: str,
+        messages: list[NormalizedMessage],
+        correlation_id: str,
+        tenant_id: str,
+    ) -> dict[str, Any] | None:
+        # Serializa por remetente: load/save da sessão não pode intercalar
+        return await self._lanes.run(
+            lane_key,
+            lambda: self._process_in_lane(messages, correlation_id, tenant_id),
+            correlation_id,
+        )
+
+    async def _process_in_lane(
+        self,
+        messages: list[NormalizedMessage],
+        correlation_id: str,
+        tenant_id: str,
+    ) -> dict[str, Any] | None:
+        claims = await self._claim_messages(messages)
+        if not claims:
+            return None
+        claimed = list({m.message_id: m for m in messages if m.message_id in claims}.values())
         try:
-            session = await self._resolve_session(msg, tenant_id)
-            if self._is_flow_completion_message(msg):
-                await self._handle_flow_completion(
-                    msg=msg,
-                    session=session,
-                    correlation_id=correlation_id,
-                )
-                result = self._build_result(session, False)
-                await self._dedupe.mark_processed(msg.message_id)
-                return result
-            raw_user_text, early_sent = await self._resolve_user_text(
-                msg=msg,
-                session=session,
-                correlation_id=correlation_id,
+            result = await self._process_claimed(
+                _merge_burst(claimed),
+                correlation_id,
+                tenant_id,
             )
-            if raw_user_text is None:
-                result = self._build_result(session, bool(early_sent))
-            else:
-                sanitized_input = sanitize_pii(raw_user_text)
-                fixed_reply = match_fixed_reply(raw_user_text)
-                if fixed_reply:
-                    sent = await self._send_fixed_reply(msg, fixed_reply, correlation_id)
-                    await self._apply_fixed_reply_to_session(
-                        session=session,
-                        sanitized_input=sanitized_input,
-                        fixed_reply=fixed_reply,
-                        correlation_id=correlation_id,
-                        message_id=msg.message_id,
-                    )
-                    result = self._build_result(session, sent)
-                else:
-                    result = await _process_with_agents(
-                        self,
-                        msg=msg,
-                        session=session,
-                        sanitized_input=sanitized_input,
-                        raw_user_text=raw_user_text,
-                        correlation_id=correlation_id,
-                    )
-            await self._dedupe.mark_processed(msg.message_id)
+            await self._dedupe.complete_many(claims)
             return result
         except Exception:
             with contextlib.suppress(Exception):
-                await self._dedupe.unmark_processing(msg.message_id)
+                await self._dedupe.release_many(claims)
             raise
 
+    async def _claim_messages(self, messages: list[NormalizedMessage]) -> dict[str, str]:
+        """Reivindica (check + mark) todos os message_ids numa operação de dedupe."""
+        return await self._dedupe.claim_many([m.message_id for m in messages])
+
+    async def _process_claimed(
+        self,
+        msg: NormalizedMessage,
+        correlation_id: str,
+        tenant_id: str,
+    ) -> dict[str, Any]:
+        session = await self._resolve_session(msg, tenant_id)
+        if self._is_flow_completion_message(msg):
+            await self._handle_flow_completion(
+                msg=msg,
+                session=session,
+                correlation_id=correlation_id,
+            )
+            return self._build_result(session, False)
+        raw_user_text, early_sent = await self._resolve_user_text(
+            msg=msg,
+            session=session,
+            correlation_id=correlation_id,
+        )
+        if raw_user_text is None:
+            return self._build_result(session, bool(early_sent))
+        sanitized_input = sanitize_pii(raw_user_text)
+        fixed_reply = match_fixed_reply(raw_user_text)
+        if fixed_reply:
+            sent = await self._send_fixed_reply(msg, fixed_reply, correlation_id)
+            await self._apply_fixed_reply_to_session(
+                session=session,
+                sanitized_input=sanitized_input,
+                fixed_reply=fixed_reply,
+                correlation_id=correlation_id,
+                message_id=msg.message_id,
+            )
+            return self._build_result(session, sent)
+        return await _process_with_agents(
+            self,
+            msg=msg,
+            session=session,
+            sanitized_input=sanitized_input,
+            raw_user_text=raw_user_text,
+            correlation_id=correlation_id,
+        )
+
+
+def _lane_key(msg: NormalizedMessage) -> str:
+    # Hash do remetente (mesmo esquema do session_id) evita PII em memória/métricas
+    return hashlib.sha256((msg.from_number or "").encode()).hexdigest()[:16]
+
+
+def _is_coalescible(msg: NormalizedMessage) -> bool:
+    # Só texto simples entra em rajada; áudio/flow/interativos seguem individuais
+    return msg.message_type == "text" and bool((msg.text or "").strip())
+
+
+def _merge_burst(messages: list[NormalizedMessage]) -> NormalizedMessage:
+    """Une textos da rajada na última mensagem (resposta cita a mais recente)."""
+    last = messages[-1]
+    if len(messages) == 1:
+        return last
+    merged_text = "\n".join((item.text or "").strip() for item in messages)
+    return last.model_copy(update={"text": merged_text})
+
 
 async def _process_with_agents(
     processor: InboundMessageProcessor,
@@ -132,7 +209,47 @@ async def _process_with_agents(
     raw_user_text: str,
     correlation_id: str,
 ) -> dict[str, Any]:
+    # Reentrega após falha pós-decisão retoma do diário sem chamar o LLM de novo
+    journal = await processor._load_journal(msg.message_id, correlation_id)
+    if journal is None:
+        decision, journal = await _decide_and_journal(
+            processor,
+            msg=msg,
+            session=session,
+            sanitized_input=sanitized_input,
+            raw_user_text=raw_user_text,
+            correlation_id=correlation_id,
+        )
+    else:
+        decision = OttoDecision.model_validate(journal.decision)
+    sent = journal.sent
+    if sent is None:
+        sent = await processor._send_response(msg, decision, correlation_id)
+        await processor._save_journal(msg.message_id, replace(journal, sent=sent), correlation_id)
+    await processor._update_session(
+        session,
+        sanitized_input,
+        decision,
+        correlation_id,
+        tenant_intent=journal.tenant_intent,
+        loaded_contexts=journal.loaded_contexts,
+    )
+    return processor._build_result(session, sent)
+
+
+async def _decide_and_journal(
+    processor: InboundMessageProcessor,
+    *,
+    msg: NormalizedMessage,
+    session: Any,
+    sanitized_input: str,
+    raw_user_text: str,
+    correlation_id: str,
+) -> tuple[OttoDecision, DecisionJournalEntry]:
     contact_card, history, card_summary = await processor._prepare_context(msg, session)
+    if contact_card is not None:
+        # Incremento no servidor: vai na escrita do card deste turno
+        contact_card.increment("total_messages")
     otto_request, decision, extraction = await processor._run_agents(
         session=session,
         sanitized_input=sanitized_input,
@@ -152,15 +269,13 @@ async def _process_with_agents(
         correlation_id=correlation_id,
         message_id=msg.message_id,
     )
-    sent = await processor._send_response(msg, decision, correlation_id)
-    await processor._update_session(
-        session,
-        sanitized_input,
-        decision,
-        correlation_id,
-        otto_request,
+    journal = DecisionJournalEntry(
+        decision=decision.model_dump(mode="json"),
+        tenant_intent=str(otto_request.tenant_intent) if otto_request.tenant_intent else None,
+        loaded_contexts=list(otto_request.loaded_contexts or []),
     )
-    return processor._build_result(session, sent)
+    await processor._save_journal(msg.message_id, journal, correlation_id)
+    return decision, journal
 
 
 async def _post_process_decision(
@@ -181,6 +296,7 @@ async def _post_process_decision(
         correlation_id=correlation_id,
         message_id=message_id,
     )
+    await processor._flush_contact_card(contact_card)
     guarded = await _apply_guards(
         processor,
         decision=decision,
@@ -22,6 +22,8 @@ logger = logging.getLogger(__name__)
 class InboundProcessorContactMixin:
     """Métodos de patch de contato, transcrição e respostas fixas."""
 
+    _contact_card_store: Any
+
     async def _apply_contact_card_patch(
         self,
         *,
@@ -54,6 +56,14 @@ class InboundProcessorContactMixin:
                 },
             )
 
+    async def _flush_contact_card(self, contact_card: Any) -> None:
+        """Grava o que ficou pendente no card sem patch (ex.: contador do turno)."""
+        if contact_card is None or self._contact_card_store is None:
+            return
+        if contact_card.is_persisted and contact_card.pending_changes().is_empty:
+            return
+        await self._contact_card_store.upsert(contact_card)
+
     def _log_contact_card_snapshot(
         self,
         *,
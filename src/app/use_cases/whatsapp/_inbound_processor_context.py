@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
-import asyncio
 import contextlib
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
+from ai.models.contact_card_extraction import ContactCardExtractionRequest
 from ai.models.otto import OttoDecision, OttoRequest
+from app.domain.contact_card import pending_crm_fields
+from app.services.contact_card_extraction_gate import get_contact_card_extraction_gate
+from app.services.otto_guard_detection import detect_question_type
+from app.use_cases.whatsapp._inbound_agent_tasks import await_optional_agent, start_agent_task
 from app.use_cases.whatsapp._inbound_helpers import (
     build_tenant_intent,
     get_valid_transitions,
@@ -20,7 +25,9 @@ if TYPE_CHECKING:
     from app.protocols.models import NormalizedMessage
 
 logger = logging.getLogger(__name__)
-_AGENTS_PARALLEL_TIMEOUT_SECONDS = 5.0
+# Prazo do extrator contado do início da rodada (o Otto não tem prazo aqui:
+# sua decisão é sempre aproveitada; timeouts de rede ficam no cliente)
+_EXTRACTOR_DEADLINE_SECONDS = 5.0
 
 
 class InboundProcessorContextMixin:
@@ -96,27 +103,25 @@ class InboundProcessorContextMixin:
             assistant_last_message=last_assistant_message(session),
             correlation_id=correlation_id,
         )
-        otto_task = self._otto_agent.decide(otto_request)
-        if extraction_task:
-            try:
-                decision, extraction = await asyncio.wait_for(
-                    asyncio.gather(otto_task, extraction_task),
-                    timeout=_AGENTS_PARALLEL_TIMEOUT_SECONDS,
-                )
-                return otto_request, decision, extraction
-            except TimeoutError:
-                logger.warning(
-                    "inbound_agents_timeout",
-                    extra={
-                        "component": "inbound_processor",
-                        "action": "run_agents",
-                        "result": "timeout_fallback",
-                        "correlation_id": correlation_id,
-                        "timeout_seconds": _AGENTS_PARALLEL_TIMEOUT_SECONDS,
-                    },
-                )
-                return otto_request, await self._otto_agent.decide(otto_request), None
-        return otto_request, await otto_task, None
+        deadline = time.monotonic() + _EXTRACTOR_DEADLINE_SECONDS
+        otto_task = start_agent_task(
+            "otto_decide", self._otto_agent.decide(otto_request), correlation_id
+        )
+        if extraction_task is None:
+            return otto_request, await otto_task, None
+        extractor = start_agent_task("contact_card_extract", extraction_task, correlation_id)
+        try:
+            decision = await otto_task
+        except BaseException:
+            extractor.cancel()
+            raise
+        extraction = await await_optional_agent(
+            extractor,
+            operation="contact_card_extract",
+            deadline=deadline,
+            correlation_id=correlation_id,
+        )
+        return otto_request, decision, extraction
 
     async def _validate_decision(
         self,
@@ -139,6 +144,7 @@ class InboundProcessorContextMixin:
         correlation_id: str,
     ) -> OttoRequest:
         tenant_intent, intent_confidence = build_tenant_intent(session, sanitized_input)
+        contact_card = getattr(session, "contact_card", None)
         loaded_contexts = []
         if getattr(session, "context", None) is not None:
             loaded_contexts = list(getattr(session.context, "prompt_contexts", []) or [])
@@ -147,14 +153,17 @@ class InboundProcessorContextMixin:
             session_state=session.current_state.name,
             correlation_id=correlation_id,
             history=history,
+            history_summary=getattr(session, "history_summary", "") or "",
             contact_card_summary=card_summary,
-            contact_card_signals=_extract_contact_card_signals(
-                getattr(session, "contact_card", None)
-            ),
+            contact_card_signals=_extract_contact_card_signals(contact_card),
             tenant_intent=tenant_intent,
             intent_confidence=intent_confidence,
             loaded_contexts=loaded_contexts,
             valid_transitions=list(get_valid_transitions(session.current_state)),
+            pending_question=detect_question_type(last_assistant_message(session)),
+            contact_missing_fields=(
+                len(pending_crm_fields(contact_card)) if contact_card is not None else None
+            ),
         )
 
     def _build_extraction_task(
@@ -167,15 +176,18 @@ class InboundProcessorContextMixin:
     ) -> Any | None:
         if not self._contact_card_extractor or not contact_card:
             return None
-        from ai.models.contact_card_extraction import ContactCardExtractionRequest
-
-        return self._contact_card_extractor.extract(
+        gate = get_contact_card_extraction_gate()
+        decision = gate.evaluate(raw_user_text, assistant_last_message)
+        if not decision.run:
+            return None
+        extraction = self._contact_card_extractor.extract(
             ContactCardExtractionRequest(
                 user_message=raw_user_text,
                 assistant_last_message=assistant_last_message,
                 correlation_id=correlation_id,
             )
         )
+        return gate.observe_shadow(extraction, decision) if decision.shadow else extraction
 
     async def _resolve_contact_card(self, msg: NormalizedMessage, session: Any) -> Any:
         if self._contact_card_store is None:
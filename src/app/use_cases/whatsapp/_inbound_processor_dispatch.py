@@ -34,25 +34,22 @@ class InboundProcessorDispatchMixin:
         sanitized_input: str,
         decision: OttoDecision,
         correlation_id: str,
-        otto_request: OttoRequest,
+        *,
+        tenant_intent: str | None,
+        loaded_contexts: list[str],
     ) -> None:
         from app.sessions.models import HistoryRole, SessionContext
 
         self._apply_decision_to_session(session, decision, correlation_id)
         if getattr(session, "context", None) is not None:
             current = session.context
-            prompt_vertical = (
-                str(otto_request.tenant_intent)
-                if otto_request.tenant_intent
-                else current.prompt_vertical
-            )
             session.context = SessionContext(
                 tenant_id=current.tenant_id,
                 vertente=current.vertente,
                 rules=current.rules,
                 limits=current.limits,
-                prompt_vertical=prompt_vertical,
-                prompt_contexts=list(otto_request.loaded_contexts or []),
+                prompt_vertical=tenant_intent or current.prompt_vertical,
+                prompt_contexts=list(loaded_contexts),
             )
         session.add_to_history(sanitized_input, max_history=None)
         if decision.response_text:
@@ -0,0 +1,64 @@
+"""Mixin do diário de decisões (retomada após falha pós-decisão).
+
+Leitura e escrita são melhor esforço: o diário indisponível só faz a
+reentrega refazer o pipeline completo (comportamento anterior), nunca
+derruba o processamento.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from app.observability import record_counter
+
+if TYPE_CHECKING:
+    from app.protocols.decision_journal import DecisionJournalEntry, DecisionJournalProtocol
+
+logger = logging.getLogger(__name__)
+
+
+class InboundProcessorJournalMixin:
+    """Carrega/grava o estágio concluído de cada message_id."""
+
+    _decision_journal: DecisionJournalProtocol | None
+
+    async def _load_journal(
+        self,
+        message_id: str | None,
+        correlation_id: str,
+    ) -> DecisionJournalEntry | None:
+        if self._decision_journal is None or not message_id:
+            return None
+        try:
+            entry = await self._decision_journal.get(message_id)
+        except Exception as exc:
+            logger.warning(
+                "decision_journal_read_failed",
+                extra={"correlation_id": correlation_id, "error_type": type(exc).__name__},
+            )
+            return None
+        if entry is not None:
+            stage = "decided" if entry.sent is None else "sent"
+            record_counter("decision_journal", "resumed", metadata={"stage": stage})
+            logger.info(
+                "decision_journal_resumed",
+                extra={"correlation_id": correlation_id, "message_id": message_id, "stage": stage},
+            )
+        return entry
+
+    async def _save_journal(
+        self,
+        message_id: str | None,
+        entry: DecisionJournalEntry,
+        correlation_id: str,
+    ) -> None:
+        if self._decision_journal is None or not message_id:
+            return
+        try:
+            await self._decision_journal.save(message_id, entry)
+        except Exception as exc:
+            logger.warning(
+                "decision_journal_write_failed",
+                extra={"correlation_id": correlation_id, "error_type": type(exc).__name__},
+            )
@@ -11,7 +11,7 @@ from app.use_cases.whatsapp._inbound_processor_common import (
 )
 from app.use_cases.whatsapp._inbound_processor_contact import InboundProcessorContactMixin
 from app.use_cases.whatsapp._inbound_processor_context import (
-    _AGENTS_PARALLEL_TIMEOUT_SECONDS,
+    _EXTRACTOR_DEADLINE_SECONDS,
     InboundProcessorContextMixin,
 )
 from app.use_cases.whatsapp._inbound_processor_dispatch import InboundProcessorDispatchMixin
@@ -20,11 +20,14 @@ from app.use_cases.whatsapp._inbound_processor_state_adjustments import (
     adjust_for_meeting_question,
 )
 
+# Nome antigo: o timeout único da rodada virou o prazo do extrator
+_AGENTS_PARALLEL_TIMEOUT_SECONDS = _EXTRACTOR_DEADLINE_SECONDS
 _adjust_for_meeting_collected = adjust_for_meeting_collected
 _adjust_for_meeting_question = adjust_for_meeting_question
 
 __all__ = [
     "_AGENTS_PARALLEL_TIMEOUT_SECONDS",
+    "_EXTRACTOR_DEADLINE_SECONDS",
     "InboundProcessorContactMixin",
     "InboundProcessorContextMixin",
     "InboundProcessorDispatchMixin",
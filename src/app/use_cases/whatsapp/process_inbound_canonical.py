@@ -2,6 +2,7 @@
 
 Fluxo novo (Otto + utilitários):
 - normaliza + dedupe
+- opcional: agrega rajadas do mesmo remetente numa única rodada
 - se audio: transcreve
 - carrega ContactCard (Firestore)
 - paralelo: OttoAgent + ContactCardExtractor
@@ -11,6 +12,7 @@ Fluxo novo (Otto + utilitários):
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -28,8 +30,12 @@ if TYPE_CHECKING:
     )
     from app.protocols.calendar_service import CalendarServiceProtocol
     from app.protocols.contact_card_store import ContactCardStoreProtocol
+    from app.protocols.decision_journal import DecisionJournalProtocol
+    from app.protocols.models import NormalizedMessage
     from app.protocols.session_manager import SessionManagerProtocol
     from app.protocols.transcription_service import TranscriptionServiceProtocol
+    from app.services.conversation_lanes import ConversationLaneScheduler
+    from app.services.message_burst_coalescer import MessageBurstCoalescer
 
 
 @dataclass(frozen=True, slots=True)
@@ -61,6 +67,9 @@ class ProcessInboundCanonicalUseCase:
         transcription_service: TranscriptionServiceProtocol | None = None,
         contact_card_extractor: ContactCardExtractorService | None = None,
         calendar_service: CalendarServiceProtocol | None = None,
+        decision_journal: DecisionJournalProtocol | None = None,
+        lane_scheduler: ConversationLaneScheduler | None = None,
+        burst_coalescer: MessageBurstCoalescer[NormalizedMessage] | None = None,
     ) -> None:
         self._normalizer = normalizer
 
@@ -73,6 +82,7 @@ class ProcessInboundCanonicalUseCase:
         else:
             raise ValueError("Either session_manager or session_store must be provided")
 
+        self._coalesces_bursts = burst_coalescer is not None
         self._processor = InboundMessageProcessor(
             session_manager=self._session_manager,
             dedupe=dedupe,
@@ -83,6 +93,9 @@ class ProcessInboundCanonicalUseCase:
             transcription_service=transcription_service,
             contact_card_extractor=contact_card_extractor,
             calendar_service=calendar_service,
+            decision_journal=decision_journal,
+            lane_scheduler=lane_scheduler,
+            burst_coalescer=burst_coalescer,
         )
 
     async def execute(
@@ -96,8 +109,17 @@ class ProcessInboundCanonicalUseCase:
         processed, skipped, sent = 0, 0, 0
         session_id, final_state, closed = "", "ENTRY", False
 
-        for msg in messages:
-            result = await self._processor.process(msg, correlation_id, tenant_id)
+        if self._coalesces_bursts and len(messages) > 1:
+            # Concorrente para que mensagens do mesmo payload caiam na mesma rajada;
+            # a ordem por remetente segue garantida pelas lanes
+            results = await self._process_concurrently(messages, correlation_id, tenant_id)
+        else:
+            results = [
+                await self._processor.process(msg, correlation_id, tenant_id)
+                for msg in messages
+            ]
+
+        for result in results:
             if result is None:
                 skipped += 1
                 continue
@@ -115,3 +137,22 @@ class ProcessInboundCanonicalUseCase:
             final_state=final_state,
             closed=closed,
         )
+
+    async def _process_concurrently(
+        self,
+        messages: list[NormalizedMessage],
+        correlation_id: str,
+        tenant_id: str,
+    ) -> list[dict[str, Any] | None]:
+        tasks = [
+            asyncio.create_task(self._processor.process(msg, correlation_id, tenant_id))
+            for msg in messages
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # Falha (ou cancelamento) de uma não deixa as irmãs rodando soltas
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
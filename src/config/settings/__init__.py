@@ -8,9 +8,15 @@ from __future__ import annotations
 
 # AI/LLM settings
 from config.settings.ai import (
+    ExtractionGateSettings,
     FloodDetectionSettings,
+    ModelRoutingSettings,
+    OpenAIHedgeSettings,
     OpenAISettings,
+    get_extraction_gate_settings,
     get_flood_detection_settings,
+    get_model_routing_settings,
+    get_openai_hedge_settings,
     get_openai_settings,
 )
 
@@ -36,17 +42,25 @@ from config.settings.calendar import (
 # Infrastructure settings
 from config.settings.infra import (
     CloudTasksSettings,
+    ContactCardCacheSettings,
     FirestoreSettings,
     GCSSettings,
     InboundLogSettings,
     LogBackend,
+    OutboundRetryBackend,
+    OutboundRetrySettings,
     PubSubSettings,
     QueueBackend,
+    WorkQueueBackend,
+    WorkQueueSettings,
     get_cloud_tasks_settings,
+    get_contact_card_cache_settings,
     get_firestore_settings,
     get_gcs_settings,
     get_inbound_log_settings,
+    get_outbound_retry_settings,
     get_pubsub_settings,
+    get_work_queue_settings,
 )
 
 # Channel-specific settings
@@ -56,6 +70,14 @@ from config.settings.whatsapp import (
     WhatsAppSettings,
     get_whatsapp_settings,
 )
+from config.settings.whatsapp_inbound import (
+    WhatsAppInboundSettings,
+    get_whatsapp_inbound_settings,
+)
+from config.settings.whatsapp_outbound import (
+    WhatsAppOutboundSettings,
+    get_whatsapp_outbound_settings,
+)
 
 __all__ = [
     # Constants
@@ -65,33 +87,51 @@ __all__ = [
     "BaseSettings",
     "CalendarSettings",
     "CloudTasksSettings",
+    "ContactCardCacheSettings",
     "DedupeBackend",
     "DedupeSettings",
     "Environment",
+    "ExtractionGateSettings",
     # Infrastructure
     "FirestoreSettings",
     "FloodDetectionSettings",
     "GCSSettings",
     "InboundLogSettings",
     "LogBackend",
+    "ModelRoutingSettings",
     # AI
+    "OpenAIHedgeSettings",
     "OpenAISettings",
+    "OutboundRetryBackend",
+    "OutboundRetrySettings",
     "PubSubSettings",
     "QueueBackend",
     "SessionSettings",
     "SessionStoreBackend",
     # Channels
+    "WhatsAppInboundSettings",
+    "WhatsAppOutboundSettings",
     "WhatsAppSettings",
+    "WorkQueueBackend",
+    "WorkQueueSettings",
     "get_base_settings",
     "get_calendar_settings",
     "get_cloud_tasks_settings",
+    "get_contact_card_cache_settings",
     "get_dedupe_settings",
+    "get_extraction_gate_settings",
     "get_firestore_settings",
     "get_flood_detection_settings",
     "get_gcs_settings",
     "get_inbound_log_settings",
+    "get_model_routing_settings",
+    "get_openai_hedge_settings",
     "get_openai_settings",
+    "get_outbound_retry_settings",
     "get_pubsub_settings",
     "get_session_settings",
+    "get_whatsapp_inbound_settings",
+    "get_whatsapp_outbound_settings",
     "get_whatsapp_settings",
+    "get_work_queue_settings",
 ]
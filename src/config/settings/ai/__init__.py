@@ -5,20 +5,40 @@ Re-exporta todas as settings de IA para uso externo.
 
 from __future__ import annotations
 
+from config.settings.ai.extraction_gate import (
+    ExtractionGateSettings,
+    get_extraction_gate_settings,
+)
 from config.settings.ai.flood import (
     FloodDetectionSettings,
     get_flood_detection_settings,
 )
+from config.settings.ai.hedging import (
+    OpenAIHedgeSettings,
+    get_openai_hedge_settings,
+)
+from config.settings.ai.model_routing import (
+    ModelRoutingSettings,
+    get_model_routing_settings,
+)
 from config.settings.ai.openai import (
     OpenAISettings,
     get_openai_settings,
 )
 
 __all__ = [
+    # Gate do extrator
+    "ExtractionGateSettings",
     # Flood
     "FloodDetectionSettings",
+    # Roteamento de modelo
+    "ModelRoutingSettings",
     # OpenAI
+    "OpenAIHedgeSettings",
     "OpenAISettings",
+    "get_extraction_gate_settings",
     "get_flood_detection_settings",
+    "get_model_routing_settings",
+    "get_openai_hedge_settings",
     "get_openai_settings",
 ]
@@ -0,0 +1,52 @@
+"""Settings do pré-gate do extrator de ContactCard.
+
+O gate evita a chamada LLM do extrator em mensagens sem dado extraível
+(saudações, agradecimentos, emoji, confirmações soltas).
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class ExtractionGateSettings:
+    """Configurações do pré-gate do extrator.
+
+    Attributes:
+        enabled: Se o gate está habilitado (desligado: extrator em todo turno)
+        shadow_sample_rate: Fração das mensagens puladas que roda o extrator
+            mesmo assim, para medir a taxa de erro do gate (miss-rate)
+    """
+
+    enabled: bool = True
+    shadow_sample_rate: float = 0.05
+
+    def validate(self) -> list[str]:
+        """Valida configurações do gate.
+
+        Returns:
+            Lista de erros de validação.
+        """
+        errors: list[str] = []
+
+        if not 0 <= self.shadow_sample_rate <= 1:
+            errors.append("CONTACT_CARD_GATE_SHADOW_SAMPLE_RATE deve estar entre 0 e 1")
+
+        return errors
+
+
+def _load_extraction_gate_from_env() -> ExtractionGateSettings:
+    """Carrega ExtractionGateSettings de variáveis de ambiente."""
+    return ExtractionGateSettings(
+        enabled=os.getenv("CONTACT_CARD_GATE_ENABLED", "true").lower() in ("true", "1", "yes"),
+        shadow_sample_rate=float(os.getenv("CONTACT_CARD_GATE_SHADOW_SAMPLE_RATE", "0.05")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_extraction_gate_settings() -> ExtractionGateSettings:
+    """Retorna instância cacheada de ExtractionGateSettings."""
+    return _load_extraction_gate_from_env()
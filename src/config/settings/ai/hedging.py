@@ -0,0 +1,76 @@
+"""Settings de hedging das chamadas OpenAI (cauda de latência).
+
+Com hedging ligado, uma chamada que passa do percentil observado do modelo
+ganha uma segunda requisição idêntica; vale a que terminar primeiro.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class OpenAIHedgeSettings:
+    """Configurações de hedging de requisições OpenAI.
+
+    Attributes:
+        enabled: Se hedging está habilitado (desligado por padrão: custa tokens)
+        quantile: Percentil de latência (por modelo) que dispara o hedge
+        budget_ratio: Fração máxima de requisições extras (0.05 = 5%)
+        min_samples: Amostras mínimas por modelo antes de hedgear
+        window_size: Tamanho da janela de latências mantida por modelo
+        min_delay_seconds: Piso do atraso do hedge (evita duplicar chamadas
+            rápidas quando a janela ainda é otimista)
+    """
+
+    enabled: bool = False
+    quantile: float = 0.95
+    budget_ratio: float = 0.05
+    min_samples: int = 20
+    window_size: int = 200
+    min_delay_seconds: float = 0.5
+
+    def validate(self) -> list[str]:
+        """Valida configurações de hedging.
+
+        Returns:
+            Lista de erros de validação.
+        """
+        errors: list[str] = []
+
+        if not 0 < self.quantile < 1:
+            errors.append("OPENAI_HEDGE_QUANTILE deve estar entre 0 e 1")
+
+        if not 0 <= self.budget_ratio <= 1:
+            errors.append("OPENAI_HEDGE_BUDGET_RATIO deve estar entre 0 e 1")
+
+        if self.min_samples < 1:
+            errors.append("OPENAI_HEDGE_MIN_SAMPLES deve ser >= 1")
+
+        if self.window_size < self.min_samples:
+            errors.append("OPENAI_HEDGE_WINDOW_SIZE deve ser >= OPENAI_HEDGE_MIN_SAMPLES")
+
+        if self.min_delay_seconds < 0:
+            errors.append("OPENAI_HEDGE_MIN_DELAY_SECONDS deve ser >= 0")
+
+        return errors
+
+
+def _load_openai_hedge_from_env() -> OpenAIHedgeSettings:
+    """Carrega OpenAIHedgeSettings de variáveis de ambiente."""
+    return OpenAIHedgeSettings(
+        enabled=os.getenv("OPENAI_HEDGE_ENABLED", "false").lower() in ("true", "1", "yes"),
+        quantile=float(os.getenv("OPENAI_HEDGE_QUANTILE", "0.95")),
+        budget_ratio=float(os.getenv("OPENAI_HEDGE_BUDGET_RATIO", "0.05")),
+        min_samples=int(os.getenv("OPENAI_HEDGE_MIN_SAMPLES", "20")),
+        window_size=int(os.getenv("OPENAI_HEDGE_WINDOW_SIZE", "200")),
+        min_delay_seconds=float(os.getenv("OPENAI_HEDGE_MIN_DELAY_SECONDS", "0.5")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_openai_hedge_settings() -> OpenAIHedgeSettings:
+    """Retorna instância cacheada de OpenAIHedgeSettings."""
+    return _load_openai_hedge_from_env()
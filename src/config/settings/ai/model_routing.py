@@ -0,0 +1,76 @@
+"""Settings de roteamento adaptativo de modelo do Otto.
+
+Turnos simples (ex.: "ok", "sim" em COLLECTING_INFO) vão para um modelo
+rápido/barato; o modelo principal (`OPENAI_MODEL`) fica para o resto e
+para escalonamento quando o rápido responde com baixa confiança.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+_DEFAULT_FAST_STATES = ("INITIAL", "TRIAGE", "COLLECTING_INFO")
+
+
+@dataclass(frozen=True)
+class ModelRoutingSettings:
+    """Configurações do roteamento de modelo.
+
+    Attributes:
+        enabled: Se o roteamento está habilitado (desligado: sempre modelo principal)
+        fast_model: Modelo usado nos turnos simples
+        fast_states: Estados de sessão elegíveis ao modelo rápido
+        max_fast_chars: Tamanho máximo da mensagem para o modelo rápido
+        escalation_confidence: Confiança mínima do modelo rápido; abaixo
+            disso o turno é refeito no modelo principal
+    """
+
+    enabled: bool = False
+    fast_model: str = "gpt-4o-mini"
+    fast_states: tuple[str, ...] = field(default=_DEFAULT_FAST_STATES)
+    max_fast_chars: int = 60
+    escalation_confidence: float = 0.7
+
+    def validate(self) -> list[str]:
+        """Valida configurações de roteamento.
+
+        Returns:
+            Lista de erros de validação.
+        """
+        errors: list[str] = []
+
+        if self.enabled and not self.fast_model:
+            errors.append("OTTO_ROUTING_FAST_MODEL não configurado mas OTTO_ROUTING_ENABLED=true")
+
+        if self.max_fast_chars < 1:
+            errors.append("OTTO_ROUTING_MAX_FAST_CHARS deve ser >= 1")
+
+        if not 0 <= self.escalation_confidence <= 1:
+            errors.append("OTTO_ROUTING_ESCALATION_CONFIDENCE deve estar entre 0 e 1")
+
+        return errors
+
+
+def _parse_states(raw: str | None) -> tuple[str, ...]:
+    if raw is None:
+        return _DEFAULT_FAST_STATES
+    return tuple(state.strip().upper() for state in raw.split(",") if state.strip())
+
+
+def _load_model_routing_from_env() -> ModelRoutingSettings:
+    """Carrega ModelRoutingSettings de variáveis de ambiente."""
+    return ModelRoutingSettings(
+        enabled=os.getenv("OTTO_ROUTING_ENABLED", "false").lower() in ("true", "1", "yes"),
+        fast_model=os.getenv("OTTO_ROUTING_FAST_MODEL", "gpt-4o-mini").strip(),
+        fast_states=_parse_states(os.getenv("OTTO_ROUTING_FAST_STATES")),
+        max_fast_chars=int(os.getenv("OTTO_ROUTING_MAX_FAST_CHARS", "60")),
+        escalation_confidence=float(os.getenv("OTTO_ROUTING_ESCALATION_CONFIDENCE", "0.7")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_model_routing_settings() -> ModelRoutingSettings:
+    """Retorna instância cacheada de ModelRoutingSettings."""
+    return _load_model_routing_from_env()
@@ -20,6 +20,13 @@ class OpenAISettings:
         timeout_seconds: Timeout para chamadas à API
         max_retries: Máximo de tentativas em caso de erro
         enabled: Se integração OpenAI está habilitada
+        prompt_layout: Layout do prompt do Otto (`legacy` ou `cache_prefix`,
+            prefixo SYSTEM estável para cache de prompt do provedor)
+        http_max_connections: Máximo de conexões no pool HTTP compartilhado
+        http_max_keepalive_connections: Máximo de conexões ociosas mantidas
+        http_keepalive_expiry_seconds: Tempo até descartar conexão ociosa
+        http2_enabled: Usa HTTP/2 quando disponível (pacote h2)
+        warmup_enabled: Abre a conexão (TLS) com a API no startup
     """
 
     api_key: str = ""
@@ -27,6 +34,12 @@ class OpenAISettings:
     timeout_seconds: float = 30.0
     max_retries: int = 3
     enabled: bool = True
+    prompt_layout: str = "legacy"
+    http_max_connections: int = 50
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 60.0
+    http2_enabled: bool = True
+    warmup_enabled: bool = True
 
     def validate(self) -> list[str]:
         """Valida configurações do OpenAI.
@@ -45,6 +58,18 @@ class OpenAISettings:
         if self.max_retries < 0:
             errors.append("OPENAI_MAX_RETRIES deve ser >= 0")
 
+        if self.prompt_layout not in ("legacy", "cache_prefix"):
+            errors.append("OPENAI_PROMPT_LAYOUT deve ser 'legacy' ou 'cache_prefix'")
+
+        if self.http_max_connections <= 0:
+            errors.append("OPENAI_HTTP_MAX_CONNECTIONS deve ser > 0")
+
+        if not 0 <= self.http_max_keepalive_connections <= self.http_max_connections:
+            errors.append(
+                "OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS deve estar entre 0 e "
+                "OPENAI_HTTP_MAX_CONNECTIONS"
+            )
+
         return errors
 
 
@@ -56,6 +81,16 @@ def _load_openai_from_env() -> OpenAISettings:
         timeout_seconds=float(os.getenv("OPENAI_TIMEOUT_SECONDS", "30")),
         max_retries=int(os.getenv("OPENAI_MAX_RETRIES", "3")),
         enabled=os.getenv("OPENAI_ENABLED", "true").lower() in ("true", "1", "yes"),
+        prompt_layout=os.getenv("OPENAI_PROMPT_LAYOUT", "legacy").strip().lower(),
+        http_max_connections=int(os.getenv("OPENAI_HTTP_MAX_CONNECTIONS", "50")),
+        http_max_keepalive_connections=int(
+            os.getenv("OPENAI_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+        ),
+        http_keepalive_expiry_seconds=float(
+            os.getenv("OPENAI_HTTP_KEEPALIVE_EXPIRY_SECONDS", "60")
+        ),
+        http2_enabled=os.getenv("OPENAI_HTTP2_ENABLED", "true").lower() in ("true", "1", "yes"),
+        warmup_enabled=os.getenv("OPENAI_WARMUP_ENABLED", "true").lower() in ("true", "1", "yes"),
     )
 
 
@@ -23,10 +23,12 @@ class DedupeSettings:
     Attributes:
         backend: Backend para dedupe (memory|redis|firestore)
         ttl_seconds: TTL para entradas de dedupe
+        decision_journal_ttl_seconds: TTL do diário de decisões (0 desativa)
     """
 
     backend: DedupeBackend = "memory"
     ttl_seconds: int = 86400  # 24h
+    decision_journal_ttl_seconds: int = 3600
 
     def validate(self, base: BaseSettings) -> list[str]:
         """Valida configurações de dedupe.
@@ -58,6 +60,9 @@ class DedupeSettings:
         if self.ttl_seconds <= 0:
             errors.append("DEDUPE_TTL_SECONDS deve ser > 0")
 
+        if self.decision_journal_ttl_seconds < 0:
+            errors.append("DEDUPE_DECISION_JOURNAL_TTL_SECONDS deve ser >= 0")
+
         return errors
 
 
@@ -70,6 +75,9 @@ def _load_dedupe_from_env() -> DedupeSettings:
     return DedupeSettings(
         backend=backend,
         ttl_seconds=int(os.getenv("DEDUPE_TTL_SECONDS", "86400")),
+        decision_journal_ttl_seconds=int(
+            os.getenv("DEDUPE_DECISION_JOURNAL_TTL_SECONDS", "3600")
+        ),
     )
 
 
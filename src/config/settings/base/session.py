@@ -14,6 +14,8 @@ if TYPE_CHECKING:
     from config.settings.base.core import BaseSettings
 
 SessionStoreBackend = Literal["memory", "redis", "firestore"]
+SessionCodecName = Literal["json", "binary"]
+SessionRedisLayout = Literal["blob", "hash"]
 
 
 @dataclass(frozen=True)
@@ -24,11 +26,30 @@ class SessionSettings:
         timeout_seconds: Timeout de sessão inativa
         max_intents_per_session: Máximo de intents por sessão
         store_backend: Backend para armazenamento de sessão
+        codec: Formato de escrita no Redis (json legado | binary versionado)
+        compress_threshold_bytes: Tamanho mínimo para comprimir no codec binary
+        redis_layout: Layout no Redis (blob: um JSON por SETEX | hash: hash +
+            lista limitada + card, gravando só o delta com versão otimista)
+        history_hot_window: Entradas de histórico mantidas na sessão
+        history_summary_max_chars: Tamanho máximo do resumo acumulado
+        conversation_write_batch_size: Escritas por commit do write-behind
+            de conversas no Firestore (limite do WriteBatch: 500)
+        conversation_write_flush_seconds: Espera máxima antes de um flush
+        conversation_write_max_pending: Escritas em buffer antes de aplicar
+            backpressure (o chamador aguarda o flush)
     """
 
     timeout_seconds: int = 1800  # 30 min
     max_intents_per_session: int = 10
     store_backend: SessionStoreBackend = "memory"
+    codec: SessionCodecName = "json"
+    compress_threshold_bytes: int = 4096
+    redis_layout: SessionRedisLayout = "blob"
+    history_hot_window: int = 20
+    history_summary_max_chars: int = 600
+    conversation_write_batch_size: int = 100
+    conversation_write_flush_seconds: float = 0.5
+    conversation_write_max_pending: int = 1000
 
     def validate(self, base: BaseSettings) -> list[str]:
         """Valida configurações de sessão.
@@ -51,6 +72,33 @@ class SessionSettings:
         if self.store_backend not in valid_backends:
             errors.append(f"SESSION_STORE_BACKEND inválido: {self.store_backend}")
 
+        if self.codec not in ("json", "binary"):
+            errors.append(f"SESSION_CODEC inválido: {self.codec}")
+
+        if self.redis_layout not in ("blob", "hash"):
+            errors.append(f"SESSION_REDIS_LAYOUT inválido: {self.redis_layout}")
+
+        if self.compress_threshold_bytes < 0:
+            errors.append("SESSION_COMPRESS_THRESHOLD_BYTES deve ser >= 0")
+
+        if self.history_hot_window < 2:
+            errors.append("SESSION_HISTORY_HOT_WINDOW deve ser >= 2")
+
+        if self.history_summary_max_chars < 0:
+            errors.append("SESSION_HISTORY_SUMMARY_MAX_CHARS deve ser >= 0")
+
+        if not 1 <= self.conversation_write_batch_size <= 500:
+            errors.append("SESSION_CONVERSATION_WRITE_BATCH_SIZE deve estar entre 1 e 500")
+
+        if self.conversation_write_flush_seconds <= 0:
+            errors.append("SESSION_CONVERSATION_WRITE_FLUSH_SECONDS deve ser > 0")
+
+        if self.conversation_write_max_pending < self.conversation_write_batch_size:
+            errors.append(
+                "SESSION_CONVERSATION_WRITE_MAX_PENDING deve ser >= "
+                "SESSION_CONVERSATION_WRITE_BATCH_SIZE"
+            )
+
         if self.store_backend == "memory" and not base.is_development:
             errors.append("SESSION_STORE_BACKEND=memory proibido em staging/production")
 
@@ -63,10 +111,28 @@ def _load_session_from_env() -> SessionSettings:
     backend: SessionStoreBackend = (
         backend_str if backend_str in ("memory", "redis", "firestore") else "memory"
     )
+    codec_str = os.getenv("SESSION_CODEC", "json").lower()
+    codec: SessionCodecName = "binary" if codec_str == "binary" else "json"
+    layout_str = os.getenv("SESSION_REDIS_LAYOUT", "blob").lower()
+    redis_layout: SessionRedisLayout = "hash" if layout_str == "hash" else "blob"
     return SessionSettings(
         timeout_seconds=int(os.getenv("SESSION_TIMEOUT_SECONDS", "1800")),
         max_intents_per_session=int(os.getenv("SESSION_MAX_INTENTS", "10")),
         store_backend=backend,
+        codec=codec,
+        compress_threshold_bytes=int(os.getenv("SESSION_COMPRESS_THRESHOLD_BYTES", "4096")),
+        redis_layout=redis_layout,
+        history_hot_window=int(os.getenv("SESSION_HISTORY_HOT_WINDOW", "20")),
+        history_summary_max_chars=int(os.getenv("SESSION_HISTORY_SUMMARY_MAX_CHARS", "600")),
+        conversation_write_batch_size=int(
+            os.getenv("SESSION_CONVERSATION_WRITE_BATCH_SIZE", "100")
+        ),
+        conversation_write_flush_seconds=float(
+            os.getenv("SESSION_CONVERSATION_WRITE_FLUSH_SECONDS", "0.5")
+        ),
+        conversation_write_max_pending=int(
+            os.getenv("SESSION_CONVERSATION_WRITE_MAX_PENDING", "1000")
+        ),
     )
 
 
@@ -10,6 +10,10 @@ from config.settings.infra.cloud_tasks import (
     QueueBackend,
     get_cloud_tasks_settings,
 )
+from config.settings.infra.contact_card_cache import (
+    ContactCardCacheSettings,
+    get_contact_card_cache_settings,
+)
 from config.settings.infra.firestore import (
     FirestoreSettings,
     get_firestore_settings,
@@ -23,14 +27,26 @@ from config.settings.infra.inbound_log import (
     LogBackend,
     get_inbound_log_settings,
 )
+from config.settings.infra.outbound_retry import (
+    OutboundRetryBackend,
+    OutboundRetrySettings,
+    get_outbound_retry_settings,
+)
 from config.settings.infra.pubsub import (
     PubSubSettings,
     get_pubsub_settings,
 )
+from config.settings.infra.work_queue import (
+    WorkQueueBackend,
+    WorkQueueSettings,
+    get_work_queue_settings,
+)
 
 __all__ = [
     # Cloud Tasks
     "CloudTasksSettings",
+    # ContactCard cache
+    "ContactCardCacheSettings",
     # Firestore
     "FirestoreSettings",
     # GCS
@@ -38,13 +54,22 @@ __all__ = [
     # Inbound Log
     "InboundLogSettings",
     "LogBackend",
+    # Outbound retry
+    "OutboundRetryBackend",
+    "OutboundRetrySettings",
     # Pub/Sub
     "PubSubSettings",
     # Types
     "QueueBackend",
+    # Work queue (webhook)
+    "WorkQueueBackend",
+    "WorkQueueSettings",
     "get_cloud_tasks_settings",
+    "get_contact_card_cache_settings",
     "get_firestore_settings",
     "get_gcs_settings",
     "get_inbound_log_settings",
+    "get_outbound_retry_settings",
     "get_pubsub_settings",
+    "get_work_queue_settings",
 ]
@@ -0,0 +1,63 @@
+"""Settings do cache em camadas de ContactCard (L1 processo / L2 Redis).
+
+O cache fica na frente do store Firestore de ContactCard para tirar o
+`document().get()` do caminho de cada turno.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class ContactCardCacheSettings:
+    """Configurações do cache de ContactCard.
+
+    Attributes:
+        enabled: Se o cache envolve o store Firestore
+        l1_max_entries: Cards mantidos no LRU do processo
+        l1_ttl_seconds: Validade no L1 (limita staleness entre instâncias)
+        l2_enabled: Usa Redis como L2 compartilhado (quando REDIS_URL existe)
+        l2_ttl_seconds: Validade dos cards no Redis
+    """
+
+    enabled: bool = True
+    l1_max_entries: int = 2048
+    l1_ttl_seconds: float = 30.0
+    l2_enabled: bool = True
+    l2_ttl_seconds: int = 3600
+
+    def validate(self) -> list[str]:
+        """Valida configurações do cache.
+
+        Returns:
+            Lista de erros de validação.
+        """
+        errors: list[str] = []
+        if self.l1_max_entries < 1:
+            errors.append("CONTACT_CARD_CACHE_L1_MAX_ENTRIES deve ser >= 1")
+        if self.l1_ttl_seconds <= 0:
+            errors.append("CONTACT_CARD_CACHE_L1_TTL_SECONDS deve ser > 0")
+        if self.l2_ttl_seconds < 1:
+            errors.append("CONTACT_CARD_CACHE_L2_TTL_SECONDS deve ser >= 1")
+        return errors
+
+
+def _load_contact_card_cache_from_env() -> ContactCardCacheSettings:
+    """Carrega ContactCardCacheSettings de variáveis de ambiente."""
+    return ContactCardCacheSettings(
+        enabled=os.getenv("CONTACT_CARD_CACHE_ENABLED", "true").lower() in ("true", "1", "yes"),
+        l1_max_entries=int(os.getenv("CONTACT_CARD_CACHE_L1_MAX_ENTRIES", "2048")),
+        l1_ttl_seconds=float(os.getenv("CONTACT_CARD_CACHE_L1_TTL_SECONDS", "30")),
+        l2_enabled=os.getenv("CONTACT_CARD_CACHE_L2_ENABLED", "true").lower()
+        in ("true", "1", "yes"),
+        l2_ttl_seconds=int(os.getenv("CONTACT_CARD_CACHE_L2_TTL_SECONDS", "3600")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_contact_card_cache_settings() -> ContactCardCacheSettings:
+    """Retorna instância cacheada de ContactCardCacheSettings."""
+    return _load_contact_card_cache_from_env()
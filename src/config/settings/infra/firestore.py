@@ -20,6 +20,8 @@ class FirestoreSettings:
         collection_messages: Collection para mensagens
         collection_dedupe: Collection para dedupe
         collection_audit: Collection para auditoria
+        use_async_client: Usa o AsyncClient (gRPC asyncio) nos stores em vez
+            do Client síncrono via asyncio.to_thread (sem thread por chamada)
     """
 
     project_id: str = ""
@@ -27,6 +29,7 @@ class FirestoreSettings:
     collection_messages: str = "messages"
     collection_dedupe: str = "dedupe"
     collection_audit: str = "audit"
+    use_async_client: bool = False
 
     def validate(self, gcp_project: str) -> list[str]:
         """Valida configurações do Firestore.
@@ -56,6 +59,8 @@ def _load_firestore_from_env() -> FirestoreSettings:
         collection_messages=os.getenv("FIRESTORE_COLLECTION_MESSAGES", "messages"),
         collection_dedupe=os.getenv("FIRESTORE_COLLECTION_DEDUPE", "dedupe"),
         collection_audit=os.getenv("FIRESTORE_COLLECTION_AUDIT", "audit"),
+        use_async_client=os.getenv("FIRESTORE_ASYNC_CLIENT", "false").lower()
+        in ("true", "1", "yes"),
     )
 
 
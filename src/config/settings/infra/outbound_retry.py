@@ -0,0 +1,101 @@
+"""Settings da fila de retry atrasado de envios outbound.
+
+Com backend `memory` ou `redis`, falhas transitórias de envio saem da task
+de processamento (sem backoff inline) e são reenviadas por um worker.
+`inline` mantém o comportamento anterior (retry com backoff no HttpClient).
+Sem `OUTBOUND_RETRY_BACKEND`, usa `redis` se houver `REDIS_URL` e `inline`
+caso contrário; `memory` (perde retries no reciclo) só por opt-in explícito.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+OutboundRetryBackend = Literal["inline", "memory", "redis"]
+_BACKENDS: dict[str, OutboundRetryBackend] = {
+    "inline": "inline",
+    "memory": "memory",
+    "redis": "redis",
+}
+
+
+@dataclass(frozen=True)
+class OutboundRetrySettings:
+    """Configurações do retry outbound.
+
+    Attributes:
+        backend: Onde ficam os retries (inline|memory|redis)
+        key_prefix: Prefixo das chaves Redis (sorted set + hash)
+        max_age_seconds: Prazo desde a falha original até desistir do envio
+        backoff_base_seconds: Atraso da primeira nova tentativa (dobra a cada falha)
+        backoff_max_seconds: Teto do atraso entre tentativas
+        poll_interval_seconds: Intervalo do worker entre buscas de vencidos
+        batch_size: Envios reivindicados por busca
+        lease_seconds: Arrendamento do item enquanto o worker o reenvia
+    """
+
+    backend: OutboundRetryBackend = "inline"
+    key_prefix: str = "whatsapp:outbound_retry"
+    max_age_seconds: float = 300.0
+    backoff_base_seconds: float = 2.0
+    backoff_max_seconds: float = 60.0
+    poll_interval_seconds: float = 1.0
+    batch_size: int = 20
+    lease_seconds: float = 30.0
+
+    def validate(self) -> list[str]:
+        """Valida configurações do retry outbound.
+
+        Returns:
+            Lista de erros de validação.
+        """
+        errors: list[str] = []
+        if self.backend not in _BACKENDS:
+            errors.append(f"OUTBOUND_RETRY_BACKEND inválido: {self.backend}")
+        if self.max_age_seconds <= 0:
+            errors.append("OUTBOUND_RETRY_MAX_AGE_SECONDS deve ser > 0")
+        if self.backoff_base_seconds <= 0:
+            errors.append("OUTBOUND_RETRY_BACKOFF_BASE_SECONDS deve ser > 0")
+        if self.backoff_max_seconds < self.backoff_base_seconds:
+            errors.append("OUTBOUND_RETRY_BACKOFF_MAX_SECONDS deve ser >= backoff base")
+        if self.poll_interval_seconds <= 0:
+            errors.append("OUTBOUND_RETRY_POLL_INTERVAL_SECONDS deve ser > 0")
+        if self.batch_size < 1:
+            errors.append("OUTBOUND_RETRY_BATCH_SIZE deve ser >= 1")
+        if self.lease_seconds <= 0:
+            errors.append("OUTBOUND_RETRY_LEASE_SECONDS deve ser > 0")
+        return errors
+
+
+def _load_outbound_retry_from_env() -> OutboundRetrySettings:
+    """Carrega OutboundRetrySettings de variáveis de ambiente.
+
+    Raises:
+        ValueError: Se OUTBOUND_RETRY_BACKEND não for inline|memory|redis.
+    """
+    backend_str = os.getenv("OUTBOUND_RETRY_BACKEND", "").strip().lower()
+    if not backend_str:
+        backend_str = "redis" if os.getenv("REDIS_URL") else "inline"
+    backend = _BACKENDS.get(backend_str)
+    if backend is None:
+        msg = f"OUTBOUND_RETRY_BACKEND inválido: {backend_str}"
+        raise ValueError(msg)
+    return OutboundRetrySettings(
+        backend=backend,
+        key_prefix=os.getenv("OUTBOUND_RETRY_KEY_PREFIX", "whatsapp:outbound_retry"),
+        max_age_seconds=float(os.getenv("OUTBOUND_RETRY_MAX_AGE_SECONDS", "300")),
+        backoff_base_seconds=float(os.getenv("OUTBOUND_RETRY_BACKOFF_BASE_SECONDS", "2")),
+        backoff_max_seconds=float(os.getenv("OUTBOUND_RETRY_BACKOFF_MAX_SECONDS", "60")),
+        poll_interval_seconds=float(os.getenv("OUTBOUND_RETRY_POLL_INTERVAL_SECONDS", "1")),
+        batch_size=int(os.getenv("OUTBOUND_RETRY_BATCH_SIZE", "20")),
+        lease_seconds=float(os.getenv("OUTBOUND_RETRY_LEASE_SECONDS", "30")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_outbound_retry_settings() -> OutboundRetrySettings:
+    """Retorna instância cacheada de OutboundRetrySettings."""
+    return _load_outbound_retry_from_env()
@@ -0,0 +1,84 @@
+"""Settings da fila de trabalho do webhook (modo `queue`).
+
+Configurações para o backend durável (Redis Streams) ou em memória.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal
+
+WorkQueueBackend = Literal["memory", "redis"]
+
+
+@dataclass(frozen=True)
+class WorkQueueSettings:
+    """Configurações da fila de trabalho.
+
+    Attributes:
+        backend: Backend da fila (memory|redis)
+        stream_key: Chave do stream Redis com itens pendentes
+        group: Nome do consumer group
+        dead_letter_key: Stream para itens que esgotaram tentativas
+        visibility_timeout_seconds: Ociosidade até o item ser reentregue
+        max_attempts: Entregas antes de ir para a dead-letter
+        consumers: Consumidores concorrentes por processo
+        batch_size: Itens reivindicados por leitura
+        block_ms: Tempo máximo de espera por item (long polling)
+    """
+
+    backend: WorkQueueBackend = "memory"
+    stream_key: str = "webhook:inbound"
+    group: str = "webhook-processors"
+    dead_letter_key: str = "webhook:inbound:dead"
+    visibility_timeout_seconds: float = 120.0
+    max_attempts: int = 5
+    consumers: int = 8
+    batch_size: int = 1
+    block_ms: int = 1000
+
+    def validate(self) -> list[str]:
+        """Valida configurações da fila.
+
+        Returns:
+            Lista de erros de validação.
+        """
+        errors: list[str] = []
+        if self.backend not in ("memory", "redis"):
+            errors.append(f"WORK_QUEUE_BACKEND inválido: {self.backend}")
+        if self.visibility_timeout_seconds <= 0:
+            errors.append("WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS deve ser > 0")
+        if self.max_attempts < 1:
+            errors.append("WORK_QUEUE_MAX_ATTEMPTS deve ser >= 1")
+        if self.consumers < 1:
+            errors.append("WORK_QUEUE_CONSUMERS deve ser >= 1")
+        if self.batch_size < 1:
+            errors.append("WORK_QUEUE_BATCH_SIZE deve ser >= 1")
+        return errors
+
+
+def _load_work_queue_from_env() -> WorkQueueSettings:
+    """Carrega WorkQueueSettings de variáveis de ambiente."""
+    backend_str = os.getenv("WORK_QUEUE_BACKEND", "memory").lower()
+    backend: WorkQueueBackend = "redis" if backend_str == "redis" else "memory"
+    return WorkQueueSettings(
+        backend=backend,
+        stream_key=os.getenv("WORK_QUEUE_STREAM_KEY", "webhook:inbound"),
+        group=os.getenv("WORK_QUEUE_GROUP", "webhook-processors"),
+        dead_letter_key=os.getenv("WORK_QUEUE_DEAD_LETTER_KEY", "webhook:inbound:dead"),
+        visibility_timeout_seconds=float(
+            os.getenv("WORK_QUEUE_VISIBILITY_TIMEOUT_SECONDS", "120")
+        ),
+        max_attempts=int(os.getenv("WORK_QUEUE_MAX_ATTEMPTS", "5")),
+        consumers=int(os.getenv("WORK_QUEUE_CONSUMERS", "8")),
+        batch_size=int(os.getenv("WORK_QUEUE_BATCH_SIZE", "1")),
+        block_ms=int(os.getenv("WORK_QUEUE_BLOCK_MS", "1000")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_work_queue_settings() -> WorkQueueSettings:
+    """Retorna instância cacheada de WorkQueueSettings."""
+    return _load_work_queue_from_env()
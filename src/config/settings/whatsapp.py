@@ -31,7 +31,7 @@ class WhatsAppSettings:
         max_retries: Máximo de tentativas em caso de erro
         circuit_breaker_threshold: Limiar para abrir circuit breaker
         circuit_breaker_reset_seconds: Tempo para reset do circuit breaker
-        webhook_processing_mode: Modo de processamento do webhook (async|inline)
+        webhook_processing_mode: Modo de processamento do webhook (async|inline|queue)
     """
 
     # Credenciais (carregadas de env ou Secret Manager)
@@ -128,9 +128,12 @@ class WhatsAppSettings:
         if self.max_retries < 0:
             errors.append("WHATSAPP_MAX_RETRIES deve ser >= 0")
 
-        if self.webhook_processing_mode not in ("async", "inline"):
+        if self.circuit_breaker_threshold <= 0:
+            errors.append("WHATSAPP_CIRCUIT_BREAKER_THRESHOLD deve ser > 0")
+
+        if self.webhook_processing_mode not in ("async", "inline", "queue"):
             errors.append(
-                "WHATSAPP_WEBHOOK_PROCESSING_MODE deve ser 'async' ou 'inline'"
+                "WHATSAPP_WEBHOOK_PROCESSING_MODE deve ser 'async', 'inline' ou 'queue'"
             )
 
         if self.flow_endpoint_enabled:
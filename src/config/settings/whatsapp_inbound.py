@@ -0,0 +1,85 @@
+"""Settings de processamento inbound do WhatsApp (tasks, lanes e rajadas).
+
+Separadas de `WhatsAppSettings` (credenciais/endpoints do canal). Variáveis
+de ambiente mantêm o prefixo `WHATSAPP_`.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class WhatsAppInboundSettings:
+    """Concorrência e agregação do processamento de mensagens recebidas.
+
+    Attributes:
+        webhook_max_concurrent_tasks: Limite global de tasks no modo async
+        lane_max_depth: Máximo de mensagens pendentes por conversa
+        lane_retry_max_wait_seconds: Espera máxima por vaga na lane (modo async)
+        coalesce_window_seconds: Janela de agregação de rajadas (0 desativa)
+        coalesce_max_wait_seconds: Espera máxima de uma rajada aberta
+        coalesce_max_messages: Máximo de mensagens agregadas por rajada
+    """
+
+    webhook_max_concurrent_tasks: int = 100
+    lane_max_depth: int = 20
+    lane_retry_max_wait_seconds: float = 300.0
+    coalesce_window_seconds: float = 0.0
+    coalesce_max_wait_seconds: float = 4.0
+    coalesce_max_messages: int = 5
+
+    def validate(self) -> list[str]:
+        """Valida limites de concorrência e janela de agregação."""
+        errors: list[str] = []
+
+        if self.webhook_max_concurrent_tasks <= 0:
+            errors.append("WHATSAPP_WEBHOOK_MAX_CONCURRENT_TASKS deve ser > 0")
+
+        if self.lane_max_depth <= 0:
+            errors.append("WHATSAPP_INBOUND_LANE_MAX_DEPTH deve ser > 0")
+
+        if self.lane_retry_max_wait_seconds < 0:
+            errors.append("WHATSAPP_INBOUND_LANE_RETRY_MAX_WAIT_SECONDS deve ser >= 0")
+
+        if not 0 <= self.coalesce_window_seconds <= 10:
+            errors.append("WHATSAPP_INBOUND_COALESCE_WINDOW_SECONDS deve estar entre 0 e 10")
+
+        if self.coalesce_max_wait_seconds < self.coalesce_window_seconds:
+            errors.append(
+                "WHATSAPP_INBOUND_COALESCE_MAX_WAIT_SECONDS deve ser >= "
+                "WHATSAPP_INBOUND_COALESCE_WINDOW_SECONDS"
+            )
+
+        if self.coalesce_max_messages <= 0:
+            errors.append("WHATSAPP_INBOUND_COALESCE_MAX_MESSAGES deve ser > 0")
+
+        return errors
+
+
+def _load_inbound_from_env() -> WhatsAppInboundSettings:
+    """Carrega WhatsAppInboundSettings de variáveis de ambiente."""
+    return WhatsAppInboundSettings(
+        webhook_max_concurrent_tasks=int(
+            os.getenv("WHATSAPP_WEBHOOK_MAX_CONCURRENT_TASKS", "100")
+        ),
+        lane_max_depth=int(os.getenv("WHATSAPP_INBOUND_LANE_MAX_DEPTH", "20")),
+        lane_retry_max_wait_seconds=float(
+            os.getenv("WHATSAPP_INBOUND_LANE_RETRY_MAX_WAIT_SECONDS", "300")
+        ),
+        coalesce_window_seconds=float(
+            os.getenv("WHATSAPP_INBOUND_COALESCE_WINDOW_SECONDS", "0")
+        ),
+        coalesce_max_wait_seconds=float(
+            os.getenv("WHATSAPP_INBOUND_COALESCE_MAX_WAIT_SECONDS", "4")
+        ),
+        coalesce_max_messages=int(os.getenv("WHATSAPP_INBOUND_COALESCE_MAX_MESSAGES", "5")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_whatsapp_inbound_settings() -> WhatsAppInboundSettings:
+    """Retorna instância cacheada de WhatsAppInboundSettings."""
+    return _load_inbound_from_env()
@@ -0,0 +1,101 @@
+"""Settings de tráfego outbound do WhatsApp (pool HTTP, bulkhead e throttle).
+
+Separadas de `WhatsAppSettings` (credenciais/endpoints do canal) para manter
+o ajuste de capacidade num lugar só. Variáveis de ambiente mantêm o prefixo
+`WHATSAPP_`.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class WhatsAppOutboundSettings:
+    """Capacidade e resiliência dos envios à Graph API.
+
+    Attributes:
+        http_max_connections: Máximo de conexões no pool HTTP compartilhado
+        http_max_keepalive_connections: Máximo de conexões ociosas mantidas
+        http_keepalive_expiry_seconds: Tempo até descartar conexão ociosa
+        http2_enabled: Usa HTTP/2 quando disponível (pacote h2)
+        max_concurrent_sends: Bulkhead de envios simultâneos à Graph API
+        bulkhead_timeout_seconds: Espera máxima por vaga antes de falhar
+        rate_per_second: Vazão outbound por número (token bucket; 0 desativa)
+        rate_burst: Capacidade do token bucket outbound
+        batch_size: Máximo de envios liberados por drenagem da fila
+    """
+
+    # Pool HTTP compartilhado (keep-alive)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = True
+
+    # Bulkhead
+    max_concurrent_sends: int = 20
+    bulkhead_timeout_seconds: float = 0.5
+
+    # Throttle (token bucket por número)
+    rate_per_second: float = 80.0
+    rate_burst: int = 20
+    batch_size: int = 10
+
+    def validate(self) -> list[str]:
+        """Valida limites de pool, bulkhead e throttle."""
+        errors: list[str] = []
+
+        if self.http_max_connections <= 0:
+            errors.append("WHATSAPP_HTTP_MAX_CONNECTIONS deve ser > 0")
+
+        if not 0 <= self.http_max_keepalive_connections <= self.http_max_connections:
+            errors.append(
+                "WHATSAPP_HTTP_MAX_KEEPALIVE_CONNECTIONS deve estar entre 0 e "
+                "WHATSAPP_HTTP_MAX_CONNECTIONS"
+            )
+
+        if self.max_concurrent_sends <= 0:
+            errors.append("WHATSAPP_OUTBOUND_MAX_CONCURRENT_SENDS deve ser > 0")
+
+        if self.bulkhead_timeout_seconds < 0:
+            errors.append("WHATSAPP_OUTBOUND_BULKHEAD_TIMEOUT_SECONDS deve ser >= 0")
+
+        if self.rate_per_second < 0:
+            errors.append("WHATSAPP_OUTBOUND_RATE_PER_SECOND deve ser >= 0")
+
+        if self.rate_burst <= 0 or self.batch_size <= 0:
+            errors.append(
+                "WHATSAPP_OUTBOUND_RATE_BURST e WHATSAPP_OUTBOUND_BATCH_SIZE devem ser > 0"
+            )
+
+        return errors
+
+
+def _load_outbound_from_env() -> WhatsAppOutboundSettings:
+    """Carrega WhatsAppOutboundSettings de variáveis de ambiente."""
+    return WhatsAppOutboundSettings(
+        http_max_connections=int(os.getenv("WHATSAPP_HTTP_MAX_CONNECTIONS", "100")),
+        http_max_keepalive_connections=int(
+            os.getenv("WHATSAPP_HTTP_MAX_KEEPALIVE_CONNECTIONS", "20")
+        ),
+        http_keepalive_expiry_seconds=float(
+            os.getenv("WHATSAPP_HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")
+        ),
+        http2_enabled=os.getenv("WHATSAPP_HTTP2_ENABLED", "true").lower()
+        in ("1", "true", "yes", "on"),
+        max_concurrent_sends=int(os.getenv("WHATSAPP_OUTBOUND_MAX_CONCURRENT_SENDS", "20")),
+        bulkhead_timeout_seconds=float(
+            os.getenv("WHATSAPP_OUTBOUND_BULKHEAD_TIMEOUT_SECONDS", "0.5")
+        ),
+        rate_per_second=float(os.getenv("WHATSAPP_OUTBOUND_RATE_PER_SECOND", "80")),
+        rate_burst=int(os.getenv("WHATSAPP_OUTBOUND_RATE_BURST", "20")),
+        batch_size=int(os.getenv("WHATSAPP_OUTBOUND_BATCH_SIZE", "10")),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_whatsapp_outbound_settings() -> WhatsAppOutboundSettings:
+    """Retorna instância cacheada de WhatsAppOutboundSettings."""
+    return _load_outbound_from_env()
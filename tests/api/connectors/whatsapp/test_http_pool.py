@@ -0,0 +1,64 @@
+"""Testes do pool HTTP compartilhado da Graph API."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from api.connectors.whatsapp import http_pool
+from api.connectors.whatsapp.http_base import HttpClientConfig
+from api.connectors.whatsapp.http_client import WhatsAppHttpClient
+from api.connectors.whatsapp.http_pool import (
+    HttpPoolConfig,
+    close_shared_http_client,
+    get_shared_http_client,
+    init_shared_http_client,
+)
+
+
+@pytest.fixture(autouse=True)
+async def _reset_pool():
+    await close_shared_http_client()
+    yield
+    await close_shared_http_client()
+
+
+async def test_init_returns_same_client_until_closed() -> None:
+    first = init_shared_http_client(HttpPoolConfig(http2=False))
+    second = get_shared_http_client()
+
+    assert first is second
+
+    await close_shared_http_client()
+    assert first.is_closed
+    assert get_shared_http_client() is not first
+
+
+async def test_http2_falls_back_when_h2_missing(monkeypatch) -> None:
+    monkeypatch.setattr(http_pool, "http2_available", lambda: False)
+
+    client = http_pool.build_async_client(HttpPoolConfig(http2=True))
+
+    assert isinstance(client, httpx.AsyncClient)
+    await client.aclose()
+
+
+async def test_whatsapp_client_reuses_injected_pool_across_sends() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"messages": [{"id": "wamid.1"}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as pooled:
+        client = WhatsAppHttpClient(config=HttpClientConfig(max_retries=0), client=pooled)
+        for _ in range(3):
+            response = await client.send_message(
+                endpoint="https://graph.example/v24.0/123/messages",
+                access_token="token",
+                payload={"to": "5511999999999"},
+            )
+            assert response["messages"][0]["id"] == "wamid.1"
+        assert not pooled.is_closed
+
+    assert len(calls) == 3
@@ -0,0 +1,163 @@
+"""Testes do circuit breaker e bulkhead da Graph API."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from api.connectors.whatsapp.http_base import HttpClient, HttpClientConfig, HttpError
+from api.connectors.whatsapp.http_client import WhatsAppHttpClient, create_whatsapp_http_client
+from api.connectors.whatsapp.resilience import (
+    Bulkhead,
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+)
+from config.settings import WhatsAppSettings
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_after_threshold_and_half_opens_after_reset() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now = 31.0
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # só um teste por vez
+
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_failed_half_open_probe_reopens_circuit() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 11.0
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+async def test_bulkhead_rejects_when_no_slot_frees_in_time() -> None:
+    bulkhead = Bulkhead(max_concurrent=1, acquire_timeout_seconds=0.01)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with bulkhead.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    with pytest.raises(BulkheadFullError):
+        async with bulkhead.slot():
+            pass
+
+    release.set()
+    await holder
+    async with bulkhead.slot():
+        pass
+
+
+async def test_open_circuit_fails_fast_without_calling_graph_api() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(503, json={})
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    config = HttpClientConfig(max_retries=3, backoff_base_seconds=0.0)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as pooled:
+        client = WhatsAppHttpClient(config=config, client=pooled, circuit_breaker=breaker)
+        send = {
+            "endpoint": "https://graph.example/v24.0/123/messages",
+            "access_token": "token",
+            "payload": {"to": "5511999999999"},
+        }
+        with pytest.raises(CircuitOpenError):
+            await client.send_message(**send)
+        with pytest.raises(HttpError) as second:
+            await client.send_message(**send)
+
+    assert len(calls) == 1
+    assert isinstance(second.value, CircuitOpenError)
+    assert second.value.is_retryable is True
+
+
+class _ScriptedClient(HttpClient):
+    """Cliente cujo envio levanta o erro configurado."""
+
+    def __init__(self, breaker: CircuitBreaker, error: BaseException) -> None:
+        super().__init__(config=HttpClientConfig(max_retries=0), circuit_breaker=breaker)
+        self._error = error
+
+    async def _post_once(self, url, json, headers) -> httpx.Response:
+        raise self._error
+
+
+def _half_open_breaker(clock: _Clock) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 11.0
+    return breaker
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_state"),
+    [
+        (HttpError("bad_request", status_code=400), CircuitState.CLOSED),
+        (httpx.ReadError("read"), CircuitState.OPEN),
+        (httpx.RemoteProtocolError("protocol"), CircuitState.OPEN),
+        (asyncio.CancelledError(), CircuitState.HALF_OPEN),
+    ],
+)
+async def test_half_open_probe_is_always_resolved(
+    error: BaseException,
+    expected_state: CircuitState,
+) -> None:
+    clock = _Clock()
+    breaker = _half_open_breaker(clock)
+
+    with pytest.raises(type(error)):
+        await _ScriptedClient(breaker, error).post("https://graph.example", json={})
+
+    assert breaker.state is expected_state
+    if expected_state is CircuitState.HALF_OPEN:
+        breaker.before_call()  # teste liberado: nova chamada de teste permitida
+
+
+def test_factory_clients_share_breaker_and_bulkhead() -> None:
+    settings = WhatsAppSettings()
+
+    inline = create_whatsapp_http_client(settings)
+    retry_mode = create_whatsapp_http_client(replace(settings, max_retries=0))
+
+    assert inline._breaker is retry_mode._breaker
+    assert inline._bulkhead is retry_mode._bulkhead
@@ -0,0 +1,37 @@
+"""Testes do classificador de payload do webhook."""
+
+from __future__ import annotations
+
+from api.connectors.whatsapp.webhook.classify import classify_webhook_payload
+
+
+def _payload(**value: object) -> dict[str, object]:
+    return {"entry": [{"changes": [{"value": value}]}]}
+
+
+def test_status_only_payload_does_not_require_processing() -> None:
+    summary = classify_webhook_payload(
+        _payload(statuses=[{"status": "delivered"}, {"status": "read"}, {"status": "read"}])
+    )
+
+    assert summary.requires_processing is False
+    assert summary.status_counts == {"delivered": 1, "read": 2}
+
+
+def test_empty_payload_does_not_require_processing() -> None:
+    assert classify_webhook_payload({}).requires_processing is False
+    assert classify_webhook_payload({"entry": []}).requires_processing is False
+
+
+def test_payload_with_message_id_requires_processing() -> None:
+    summary = classify_webhook_payload(
+        _payload(messages=[{"id": "wamid.1"}, {"type": "text"}], statuses=[{"status": "sent"}])
+    )
+
+    assert summary.requires_processing is True
+    assert summary.message_count == 1
+
+
+def test_unexpected_structure_is_left_to_pipeline() -> None:
+    assert classify_webhook_payload({"entry": "x"}).requires_processing is True
+    assert classify_webhook_payload(_payload(messages={"id": "1"})).requires_processing is True
@@ -11,6 +11,10 @@ from api.connectors.whatsapp.signature import SignatureResult
 from api.connectors.whatsapp.webhook.receive import InvalidJsonError, InvalidSignatureError
 from api.routes.whatsapp import webhook
 
+_MESSAGE_PAYLOAD: dict[str, object] = {
+    "entry": [{"changes": [{"value": {"messages": [{"id": "wamid.1", "type": "text"}]}}]}]
+}
+
 
 def _build_request(
     *,
@@ -92,7 +96,7 @@ async def test_receive_webhook_success(monkeypatch: pytest.MonkeyPatch) -> None:
         webhook,
         "parse_webhook_request",
         lambda raw_body, headers, secret: (
-            {"entry": []},
+            _MESSAGE_PAYLOAD,
             SignatureResult(valid=True, skipped=False),
         ),
     )
@@ -120,7 +124,7 @@ async def test_receive_webhook_success(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert response == {"status": "received", "correlation_id": "cid-123"}
     assert captured == {
-        "payload": {"entry": []},
+        "payload": _MESSAGE_PAYLOAD,
         "correlation_id": "cid-123",
         "tenant_id": "default",
     }
@@ -139,7 +143,7 @@ async def test_receive_webhook_dispatch_failure_returns_500(
         webhook,
         "parse_webhook_request",
         lambda raw_body, headers, secret: (
-            {"entry": []},
+            _MESSAGE_PAYLOAD,
             SignatureResult(valid=True, skipped=False),
         ),
     )
@@ -209,3 +213,35 @@ async def test_receive_webhook_invalid_json(monkeypatch: pytest.MonkeyPatch) ->
 
     assert response.status_code == 400
     assert response.body == b"Bad Request"
+
+
+@pytest.mark.asyncio
+async def test_receive_webhook_acks_status_only_without_dispatch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recorded: list[dict[str, int]] = []
+    monkeypatch.setattr(
+        webhook,
+        "get_whatsapp_settings",
+        lambda: SimpleNamespace(webhook_secret="secret", webhook_processing_mode="async"),
+    )
+    monkeypatch.setattr(
+        webhook,
+        "parse_webhook_request",
+        lambda raw_body, headers, secret: (
+            {"entry": [{"changes": [{"value": {"statuses": [{"status": "read"}]}}]}]},
+            SignatureResult(valid=True, skipped=False),
+        ),
+    )
+
+    async def _fail_dispatch(**_: object) -> None:
+        raise AssertionError("status-only payload must not be dispatched")
+
+    monkeypatch.setattr(webhook, "dispatch_inbound_processing", _fail_dispatch)
+    monkeypatch.setattr(webhook, "record_status_only_payload", recorded.append)
+
+    request = _build_request(method="POST", body=b"{}", headers={"x-correlation-id": "cid-s"})
+    response = await webhook.receive_webhook(request)
+
+    assert response == {"status": "received", "correlation_id": "cid-s"}
+    assert recorded == [{"read": 1}]
@@ -156,3 +156,76 @@ async def test_process_inbound_payload_safe_swallows_validation_error(
         use_case=object(),
         tenant_id="tenant-c",
     )
+
+
+@pytest.mark.asyncio
+async def test_dispatch_inbound_processing_queue_mode_enqueues_without_use_case(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from api.routes.whatsapp import webhook_runtime_queue
+    from app.infra.queues import MemoryWorkQueue
+
+    queue = MemoryWorkQueue(block_seconds=0.01)
+    monkeypatch.setattr(webhook_runtime_queue, "_work_queue", queue)
+
+    def _fail_use_case() -> object:
+        raise AssertionError("use case não deve ser construído no request")
+
+    monkeypatch.setattr(webhook_runtime, "get_inbound_use_case", _fail_use_case)
+
+    await webhook_runtime.dispatch_inbound_processing(
+        payload={"entry": []},
+        correlation_id="corr-queue",
+        settings=SimpleNamespace(webhook_processing_mode="queue"),
+        tenant_id="tenant-q",
+    )
+
+    [item] = await queue.claim("c1")
+    assert item.payload == {
+        "payload": {"entry": []},
+        "correlation_id": "corr-queue",
+        "tenant_id": "tenant-q",
+    }
+
+
+def _patch_inbound_factories(
+    monkeypatch: pytest.MonkeyPatch, conversation_store: object | None
+) -> None:
+    from app.bootstrap import dependencies, whatsapp_factory
+
+    for name in (
+        "create_async_dedupe_store",
+        "create_async_session_store",
+        "create_contact_card_extractor_service",
+        "create_contact_card_store",
+        "create_decision_journal",
+        "create_otto_agent_service",
+        "create_transcription_service",
+    ):
+        monkeypatch.setattr(dependencies, name, lambda: None)
+    monkeypatch.setattr(dependencies, "create_conversation_store", lambda: conversation_store)
+    monkeypatch.setattr(whatsapp_factory, "create_whatsapp_normalizer", lambda: None)
+    monkeypatch.setattr(whatsapp_factory, "create_whatsapp_outbound_sender", lambda: None)
+    monkeypatch.setattr(webhook_runtime, "_inbound_use_case", None)
+
+
+def test_get_inbound_use_case_wires_conversation_write_behind(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_inbound_factories(monkeypatch, conversation_store=object())
+
+    session_manager = webhook_runtime.get_inbound_use_case()._session_manager
+
+    assert session_manager._write_behind is not None
+    assert session_manager._history_compactor is not None
+
+
+def test_get_inbound_use_case_without_conversation_store_still_compacts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _patch_inbound_factories(monkeypatch, conversation_store=None)
+
+    session_manager = webhook_runtime.get_inbound_use_case()._session_manager
+
+    assert session_manager._write_behind is None
+    assert session_manager._history_compactor is not None
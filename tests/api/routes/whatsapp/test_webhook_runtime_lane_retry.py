@@ -0,0 +1,111 @@
+"""Testes do retry de lanes cheias no modo async do webhook."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from api.routes.whatsapp import webhook_runtime, webhook_runtime_lane_retry, webhook_runtime_tasks
+from app.services.conversation_lanes import (
+    ConversationLaneFullError,
+    ConversationLaneScheduler,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fast_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(webhook_runtime_lane_retry, "_INITIAL_DELAY_SECONDS", 0.001)
+    monkeypatch.setattr(webhook_runtime_lane_retry, "_MAX_DELAY_SECONDS", 0.001)
+
+
+def _flaky(failures: int) -> tuple[list[str], Any]:
+    calls: list[str] = []
+
+    async def attempt() -> None:
+        calls.append("attempt")
+        if len(calls) <= failures:
+            raise ConversationLaneFullError("conversation_lane_full")
+
+    return calls, attempt
+
+
+async def test_retries_until_lane_accepts() -> None:
+    calls, attempt = _flaky(failures=2)
+
+    await webhook_runtime_lane_retry.run_with_lane_retry(
+        attempt, correlation_id="corr-1", max_wait_seconds=5.0
+    )
+
+    assert len(calls) == 3
+
+
+async def test_gives_up_after_max_wait(caplog: pytest.LogCaptureFixture) -> None:
+    calls, attempt = _flaky(failures=100)
+
+    with caplog.at_level("ERROR"), pytest.raises(ConversationLaneFullError):
+        await webhook_runtime_lane_retry.run_with_lane_retry(
+            attempt, correlation_id="corr-2", max_wait_seconds=0.0
+        )
+
+    assert len(calls) == 1
+    assert "webhook_lane_retry_exhausted" in caplog.text
+
+
+async def test_async_mode_reprocesses_payload_after_lane_full(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    processed: list[str] = []
+
+    async def _process_inbound_payload(**kwargs: Any) -> None:
+        processed.append(kwargs["correlation_id"])
+        if len(processed) == 1:
+            raise ConversationLaneFullError("conversation_lane_full")
+
+    monkeypatch.setattr(webhook_runtime, "process_inbound_payload", _process_inbound_payload)
+
+    webhook_runtime._schedule_async_processing(
+        payload={"entry": []},
+        correlation_id="corr-async",
+        use_case=object(),
+        tenant_id="tenant-a",
+    )
+    await webhook_runtime_tasks.drain_processing_tasks(timeout_seconds=1.0)
+
+    assert processed == ["corr-async", "corr-async"]
+    assert not webhook_runtime_tasks._active_tasks
+
+
+async def test_sender_waiting_in_its_lane_does_not_hold_a_global_slot(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(webhook_runtime_tasks, "_task_semaphore", asyncio.Semaphore(2))
+    lanes = ConversationLaneScheduler()
+    release_hot = asyncio.Event()
+    done: list[str] = []
+
+    async def work(name: str) -> None:
+        if name == "hot-1":
+            await release_hot.wait()
+        done.append(name)
+
+    def schedule(key: str, name: str) -> asyncio.Task[None]:
+        return asyncio.create_task(
+            webhook_runtime_lane_retry.run_with_lane_retry(
+                lambda: lanes.run(key, lambda: work(name)),
+                correlation_id=name,
+                max_wait_seconds=1.0,
+            )
+        )
+
+    hot = [schedule("sender-hot", f"hot-{n}") for n in (1, 2, 3)]
+    await asyncio.sleep(0)
+    other = schedule("sender-other", "other-1")
+
+    await asyncio.wait_for(other, timeout=1.0)
+    assert done == ["other-1"]
+
+    release_hot.set()
+    await asyncio.gather(*hot)
+    assert done == ["other-1", "hot-1", "hot-2", "hot-3"]
@@ -0,0 +1,45 @@
+"""Testes da agregação de callbacks de status do webhook."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from api.routes.whatsapp.webhook_status_metrics import StatusCallbackAggregator
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_aggregator_emits_single_counter_per_interval() -> None:
+    clock = _Clock()
+    aggregator = StatusCallbackAggregator(flush_interval_seconds=60, clock=clock)
+
+    with patch("api.routes.whatsapp.webhook_status_metrics.record_counter") as record:
+        aggregator.add({"delivered": 2})
+        aggregator.add({"read": 1})
+        record.assert_not_called()
+
+        clock.now = 61.0
+        aggregator.add({"read": 1, "delivered": 1})
+
+    record.assert_called_once()
+    assert record.call_args.kwargs["value"] == 5
+    assert record.call_args.kwargs["metadata"] == {
+        "status_delivered": 3,
+        "status_read": 2,
+        "payloads": 3,
+    }
+
+
+def test_flush_without_payloads_is_noop() -> None:
+    aggregator = StatusCallbackAggregator()
+
+    with patch("api.routes.whatsapp.webhook_status_metrics.record_counter") as record:
+        aggregator.flush()
+
+    record.assert_not_called()
@@ -0,0 +1,95 @@
+"""Testes das filas de retry outbound (memória e Redis com mock)."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infra.queues import MemoryOutboundRetryQueue, RedisOutboundRetryQueue
+from app.protocols.outbound_retry_queue import OutboundRetryEntry
+from utils.errors import RedisConnectionError
+
+
+def _entry(key: str = "k1", attempts: int = 1) -> OutboundRetryEntry:
+    return OutboundRetryEntry(
+        key=key,
+        request={"to": "+5511999999999", "text": "oi"},
+        payload={"to": "5511999999999"},
+        attempts=attempts,
+        deadline_at=300.0,
+        correlation_id="corr-1",
+    )
+
+
+async def test_memory_retry_queue_claims_only_due_entries() -> None:
+    queue = MemoryOutboundRetryQueue()
+    await queue.schedule(_entry("early"), due_at=10.0)
+    await queue.schedule(_entry("late"), due_at=50.0)
+
+    assert await queue.claim_due(now=5.0, limit=10, lease_seconds=30) == []
+    claimed = await queue.claim_due(now=10.0, limit=10, lease_seconds=30)
+
+    assert [entry.key for entry in claimed] == ["early"]
+
+
+async def test_memory_retry_queue_lease_returns_entry_without_ack() -> None:
+    queue = MemoryOutboundRetryQueue()
+    await queue.schedule(_entry(), due_at=0.0)
+
+    assert len(await queue.claim_due(now=1.0, limit=10, lease_seconds=30)) == 1
+    assert await queue.claim_due(now=20.0, limit=10, lease_seconds=30) == []
+    assert len(await queue.claim_due(now=31.0, limit=10, lease_seconds=30)) == 1
+
+    await queue.ack("k1")
+    assert await queue.claim_due(now=1000.0, limit=10, lease_seconds=30) == []
+    assert queue.pending_count() == 0
+
+
+async def test_memory_retry_queue_reschedule_replaces_previous_due() -> None:
+    queue = MemoryOutboundRetryQueue()
+    await queue.schedule(_entry(attempts=1), due_at=5.0)
+    await queue.schedule(_entry(attempts=2), due_at=60.0)
+
+    assert await queue.claim_due(now=10.0, limit=10, lease_seconds=30) == []
+    [claimed] = await queue.claim_due(now=60.0, limit=10, lease_seconds=30)
+    assert claimed.attempts == 2
+    assert queue.pending_count() == 1
+
+
+async def test_redis_retry_queue_schedule_writes_hash_and_zset() -> None:
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(return_value=[1, 1])
+    redis = MagicMock()
+    redis.pipeline.return_value = pipeline
+    queue = RedisOutboundRetryQueue(redis, key_prefix="retry")
+
+    await queue.schedule(_entry(), due_at=42.0)
+
+    key, field_name, raw = pipeline.hset.call_args.args
+    assert (key, field_name) == ("retry:items", "k1")
+    assert json.loads(raw)["correlation_id"] == "corr-1"
+    pipeline.zadd.assert_called_once_with("retry:due", {"k1": 42.0})
+
+
+async def test_redis_retry_queue_claim_decodes_leased_entries() -> None:
+    script = AsyncMock(return_value=[b"k1", json.dumps(asdict(_entry(attempts=3))).encode()])
+    redis = MagicMock()
+    redis.register_script.return_value = script
+    queue = RedisOutboundRetryQueue(redis, key_prefix="retry")
+
+    [entry] = await queue.claim_due(now=100.0, limit=5, lease_seconds=30)
+
+    assert entry == _entry(attempts=3)
+    script.assert_awaited_once_with(keys=["retry:due", "retry:items"], args=[100.0, 5, 130.0])
+
+
+async def test_redis_retry_queue_wraps_connection_errors() -> None:
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock(side_effect=ConnectionError("down"))
+    queue = RedisOutboundRetryQueue(redis)
+
+    with pytest.raises(RedisConnectionError):
+        await queue.claim_due(now=1.0, limit=1, lease_seconds=1)
@@ -0,0 +1,159 @@
+"""Testes das filas de trabalho (memória e Redis Streams com mock)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infra.queues import MemoryWorkQueue, RedisStreamWorkQueue
+from app.protocols.work_queue import WorkItem
+from utils.errors import RedisConnectionError
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_memory_queue_ack_removes_item() -> None:
+    queue = MemoryWorkQueue(block_seconds=0.01)
+    await queue.enqueue({"n": 1})
+
+    [item] = await queue.claim("c1")
+    await queue.ack(item)
+
+    assert item.payload == {"n": 1}
+    assert queue.pending_count() == 0
+    assert await queue.claim("c1") == []
+
+
+async def test_memory_queue_redelivers_after_visibility_timeout() -> None:
+    clock = _Clock()
+    queue = MemoryWorkQueue(visibility_timeout_seconds=10, block_seconds=0.01, clock=clock)
+    await queue.enqueue({"n": 1})
+    [first] = await queue.claim("c1")
+
+    assert await queue.claim("c2") == []
+    clock.now = 11.0
+    [redelivered] = await queue.claim("c2")
+
+    assert redelivered.item_id == first.item_id
+    assert redelivered.attempts == 0
+
+
+async def test_memory_queue_extend_keeps_item_invisible() -> None:
+    clock = _Clock()
+    queue = MemoryWorkQueue(visibility_timeout_seconds=10, block_seconds=0.01, clock=clock)
+    await queue.enqueue({"n": 1})
+    [item] = await queue.claim("c1")
+
+    clock.now = 8.0
+    await queue.extend("c1", [item])
+    clock.now = 15.0
+
+    assert await queue.claim("c2") == []
+
+
+async def test_memory_queue_dead_letters_after_max_attempts() -> None:
+    queue = MemoryWorkQueue(max_attempts=2, block_seconds=0.01)
+    await queue.enqueue({"n": 1})
+
+    [item] = await queue.claim("c1")
+    assert await queue.nack(item, "RuntimeError") is True
+    [item] = await queue.claim("c1")
+    assert await queue.nack(item, "RuntimeError") is False
+
+    assert queue.pending_count() == 0
+    assert queue.dead_letters[0][1] == "RuntimeError"
+
+
+def _redis_with_pipeline() -> tuple[MagicMock, MagicMock]:
+    redis = MagicMock()
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(return_value=[])
+    redis.pipeline.return_value = pipeline
+    redis.xgroup_create = AsyncMock()
+    redis.xautoclaim = AsyncMock(return_value=[b"0-0", [], []])
+    return redis, pipeline
+
+
+def _queue(redis: MagicMock, max_attempts: int = 3) -> RedisStreamWorkQueue:
+    return RedisStreamWorkQueue(
+        redis,
+        stream_key="q",
+        group="g",
+        dead_letter_key="q:dead",
+        max_attempts=max_attempts,
+    )
+
+
+async def test_redis_queue_claim_decodes_stream_entries() -> None:
+    redis, _ = _redis_with_pipeline()
+    fields = {b"payload": json.dumps({"n": 1}).encode(), b"attempts": b"2"}
+    redis.xreadgroup = AsyncMock(return_value=[[b"q", [(b"1-0", fields)]]])
+
+    items = await _queue(redis).claim("c1", count=5)
+
+    assert items == [WorkItem(item_id="1-0", payload={"n": 1}, attempts=2)]
+    redis.xgroup_create.assert_awaited_once_with("q", "g", id="0", mkstream=True)
+    redis.xreadgroup.assert_awaited_once_with("g", "c1", {"q": ">"}, count=5, block=1000)
+
+
+async def test_redis_queue_redelivers_idle_entries_without_counting_attempt() -> None:
+    redis, pipeline = _redis_with_pipeline()
+    fields = {b"payload": json.dumps({"n": 1}).encode(), b"attempts": b"1"}
+    redis.xautoclaim = AsyncMock(return_value=[b"0-0", [(b"1-0", fields)], []])
+    redis.xreadgroup = AsyncMock(return_value=[])
+
+    items = await _queue(redis).claim("c2", count=2)
+
+    assert items == [WorkItem(item_id="1-0", payload={"n": 1}, attempts=1)]
+    pipeline.xadd.assert_not_called()
+    redis.xreadgroup.assert_awaited_once_with("g", "c2", {"q": ">"}, count=1, block=None)
+
+
+async def test_redis_queue_extend_resets_idle_time() -> None:
+    redis, _ = _redis_with_pipeline()
+    redis.xclaim = AsyncMock(return_value=[b"1-0"])
+
+    await _queue(redis).extend("c1", [WorkItem(item_id="1-0")])
+
+    redis.xclaim.assert_awaited_once_with(
+        "q", "g", "c1", min_idle_time=0, message_ids=["1-0"], justid=True
+    )
+
+
+async def test_redis_queue_nack_requeues_then_dead_letters() -> None:
+    redis, pipeline = _redis_with_pipeline()
+    queue = _queue(redis, max_attempts=2)
+
+    assert await queue.nack(WorkItem(item_id="1-0", payload={"n": 1}), "Boom") is True
+    assert pipeline.xadd.call_args.args[0] == "q"
+    assert await queue.nack(WorkItem("2-0", {"n": 1}, attempts=1), "Boom") is False
+    assert pipeline.xadd.call_args.args[0] == "q:dead"
+    pipeline.xack.assert_called_with("q", "g", "2-0")
+
+
+async def test_redis_queue_ignores_existing_group() -> None:
+    redis, _ = _redis_with_pipeline()
+    redis.xgroup_create = AsyncMock(side_effect=Exception("BUSYGROUP exists"))
+    redis.xreadgroup = AsyncMock(return_value=[])
+
+    assert await _queue(redis).claim("c1") == []
+
+
+async def test_redis_queue_wraps_connection_errors() -> None:
+    redis, _ = _redis_with_pipeline()
+    redis.xadd = AsyncMock(side_effect=OSError("down"))
+    redis.xreadgroup = AsyncMock(side_effect=OSError("down"))
+    queue = _queue(redis)
+
+    with pytest.raises(RedisConnectionError):
+        await queue.enqueue({})
+    with pytest.raises(RedisConnectionError):
+        await queue.claim("c1")
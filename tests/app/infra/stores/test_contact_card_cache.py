@@ -0,0 +1,146 @@
+"""Testes do cache L1/L2 de ContactCard (versão, singleflight e fallback)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.domain.contact_card import ContactCard
+from app.infra.stores.contact_card_cache import CachedContactCardStore
+
+_WA_ID = "5511999999999"
+
+
+class _CountingStore:
+    """Store de origem em memória que conta as leituras."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.cards: dict[str, ContactCard] = {}
+        self.reads = 0
+        self._delay = delay
+
+    async def get(self, wa_id: str) -> ContactCard | None:
+        self.reads += 1
+        await asyncio.sleep(self._delay)
+        card = self.cards.get(wa_id)
+        return card.model_copy(deep=True) if card else None
+
+    async def get_or_create(self, wa_id: str, whatsapp_name: str) -> ContactCard:
+        card = await self.get(wa_id)
+        if card is None:
+            card = ContactCard(wa_id=wa_id, phone=wa_id, whatsapp_name=whatsapp_name)
+            await self.upsert(card)
+        return card
+
+    async def upsert(self, contact_card: ContactCard) -> None:
+        self.cards[contact_card.wa_id] = contact_card.model_copy(deep=True)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.fail = False
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+
+    async def get(self, key: str) -> Any:
+        self._check()
+        return self.data.get(key)
+
+    async def mget(self, *keys: str) -> list[Any]:
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ex: int | None = None) -> None:
+        self._check()
+        self.data[key] = value
+
+    async def incr(self, key: str) -> int:
+        self._check()
+        self.data[key] = int(self.data.get(key) or 0) + 1
+        return self.data[key]
+
+    async def expire(self, key: str, seconds: int) -> None:
+        self._check()
+
+
+@pytest.fixture
+def origin() -> _CountingStore:
+    return _CountingStore()
+
+
+@pytest.fixture
+def redis() -> _FakeRedis:
+    return _FakeRedis()
+
+
+async def test_l1_hit_skips_origin_and_isolates_mutations(
+    origin: _CountingStore,
+    redis: _FakeRedis,
+) -> None:
+    cache = CachedContactCardStore(origin, redis_client=redis)
+
+    first = await cache.get_or_create(_WA_ID, "Maria")
+    first.full_name = "Mutado sem upsert"
+    second = await cache.get_or_create(_WA_ID, "Maria")
+
+    assert origin.reads == 1
+    assert second.full_name is None
+
+
+async def test_concurrent_lookups_share_one_origin_read(redis: _FakeRedis) -> None:
+    origin = _CountingStore(delay=0.01)
+    origin.cards[_WA_ID] = ContactCard(wa_id=_WA_ID, phone=_WA_ID, whatsapp_name="Maria")
+    cache = CachedContactCardStore(origin, redis_client=redis)
+
+    cards = await asyncio.gather(*(cache.get(_WA_ID) for _ in range(5)))
+
+    assert origin.reads == 1
+    assert {card.whatsapp_name for card in cards if card} == {"Maria"}
+
+
+async def test_upsert_on_other_instance_invalidates_l1(
+    origin: _CountingStore,
+    redis: _FakeRedis,
+) -> None:
+    instance_a = CachedContactCardStore(origin, redis_client=redis)
+    instance_b = CachedContactCardStore(origin, redis_client=redis)
+    card = await instance_a.get_or_create(_WA_ID, "Maria")
+
+    card.full_name = "Maria Souza"
+    await instance_b.upsert(card)
+    refreshed = await instance_a.get(_WA_ID)
+
+    assert refreshed is not None
+    assert refreshed.full_name == "Maria Souza"
+    # Veio do L2 atualizado pelo upsert, sem nova leitura na origem
+    assert origin.reads == 1
+
+
+async def test_stale_l2_fill_is_ignored(origin: _CountingStore, redis: _FakeRedis) -> None:
+    origin.cards[_WA_ID] = ContactCard(wa_id=_WA_ID, phone=_WA_ID, whatsapp_name="Maria")
+    await CachedContactCardStore(origin, redis_client=redis).get(_WA_ID)
+    redis.data[f"contact_card_cache:ver:{_WA_ID}"] = 7  # upsert em outra instância
+
+    await CachedContactCardStore(origin, redis_client=redis).get(_WA_ID)
+
+    assert origin.reads == 2
+
+
+async def test_redis_failure_falls_back_to_origin(
+    origin: _CountingStore,
+    redis: _FakeRedis,
+) -> None:
+    redis.fail = True
+    cache = CachedContactCardStore(origin, redis_client=redis)
+
+    card = await cache.get_or_create(_WA_ID, "Maria")
+    card.email = "maria@example.com"
+    await cache.upsert(card)
+
+    assert origin.cards[_WA_ID].email == "maria@example.com"
+    assert (await cache.get(_WA_ID)).email == "maria@example.com"  # type: ignore[union-attr]
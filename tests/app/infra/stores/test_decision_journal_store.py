@@ -0,0 +1,59 @@
+"""Testes dos stores do diário de decisões (memória e Redis com mock)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infra.stores import MemoryDecisionJournal, RedisDecisionJournal
+from app.protocols.decision_journal import DecisionJournalEntry
+from utils.errors import RedisConnectionError
+
+_ENTRY = DecisionJournalEntry(
+    decision={"next_state": "TRIAGE", "response_text": "oi"},
+    tenant_intent="automacao",
+    loaded_contexts=["automacao/pricing.yaml"],
+    sent=True,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_memory_journal_expires_after_ttl() -> None:
+    clock = _Clock()
+    journal = MemoryDecisionJournal(ttl_seconds=60, clock=clock)
+    await journal.save("mid-1", _ENTRY)
+
+    assert await journal.get("mid-1") == _ENTRY
+    clock.now = 60
+    assert await journal.get("mid-1") is None
+
+
+async def test_redis_journal_round_trip_with_ttl() -> None:
+    stored: dict[str, str] = {}
+    redis = MagicMock()
+    redis.set = AsyncMock(side_effect=lambda key, value, ex: stored.__setitem__(key, value))
+    redis.get = AsyncMock(side_effect=lambda key: stored.get(key, "").encode() or None)
+    journal = RedisDecisionJournal(redis, ttl_seconds=900)
+
+    await journal.save("mid-1", _ENTRY)
+
+    assert redis.set.call_args.kwargs == {"ex": 900}
+    assert redis.set.call_args.args[0] == "decision_journal:mid-1"
+    assert await journal.get("mid-1") == _ENTRY
+    assert await journal.get("mid-2") is None
+
+
+async def test_redis_journal_wraps_connection_errors() -> None:
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+
+    with pytest.raises(RedisConnectionError):
+        await RedisDecisionJournal(redis).get("mid-1")
@@ -0,0 +1,222 @@
+"""Testes dos stores Firestore assíncronos com AsyncClient fake em memória."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud import firestore
+
+from app.domain.contact_card import ContactCard
+from app.infra.stores.firestore_async_contact_card_store import AsyncFirestoreContactCardStore
+from app.infra.stores.firestore_async_conversation_store import AsyncFirestoreConversationStore
+from app.protocols.conversation_store import (
+    ConversationMessage,
+    ConversationStoreError,
+    LeadData,
+    PendingConversationMessage,
+)
+
+_WA_ID = "5511999999999"
+
+
+class _FakeDoc:
+    def __init__(self, db: _FakeAsyncFirestore, path: str) -> None:
+        self._db = db
+        self.id = path.rsplit("/", 1)[-1]
+        self._path = path
+
+    def collection(self, name: str) -> _FakeCollection:
+        return _FakeCollection(self._db, f"{self._path}/{name}")
+
+    async def get(self) -> SimpleNamespace:
+        data = self._db.docs.get(self._path)
+        return SimpleNamespace(exists=data is not None, to_dict=lambda: dict(data or {}))
+
+    async def set(self, data: dict[str, Any], merge: bool = False) -> None:
+        if self._db.fail_writes:
+            raise RuntimeError("unavailable")
+        self._db.sets.append((self._path, data, merge))
+        base = self._db.docs.get(self._path, {}) if merge else {}
+        self._db.docs[self._path] = {**base, **data}
+
+    async def update(self, data: dict[str, Any]) -> None:
+        if self._path not in self._db.docs:
+            raise NotFound("document missing")
+        self._db.updates.append((self._path, data))
+        self._db.docs[self._path].update(data)
+
+
+class _FakeCollection:
+    def __init__(self, db: _FakeAsyncFirestore, path: str) -> None:
+        self._db = db
+        self._path = path
+        self._order: str | None = None
+        self._limit: int | None = None
+
+    def document(self, doc_id: str) -> _FakeDoc:
+        return _FakeDoc(self._db, f"{self._path}/{doc_id}")
+
+    def order_by(self, field: str) -> _FakeCollection:
+        self._order = field
+        return self
+
+    def limit(self, count: int) -> _FakeCollection:
+        self._limit = count
+        return self
+
+    async def stream(self) -> Any:
+        prefix = f"{self._path}/"
+        items = [
+            (path, data)
+            for path, data in self._db.docs.items()
+            if path.startswith(prefix) and "/" not in path[len(prefix) :]
+        ]
+        if self._order:
+            items.sort(key=lambda item: item[1][self._order])
+        for path, data in items[: self._limit]:
+            yield SimpleNamespace(id=path.rsplit("/", 1)[-1], to_dict=lambda d=data: dict(d))
+
+
+class _FakeBatch:
+    def __init__(self, db: _FakeAsyncFirestore) -> None:
+        self._db = db
+        self._writes: list[tuple[_FakeDoc, dict[str, Any], bool]] = []
+
+    def set(self, ref: _FakeDoc, data: dict[str, Any], merge: bool = False) -> None:
+        self._writes.append((ref, data, merge))
+
+    async def commit(self) -> None:
+        self._db.commits += 1
+        for ref, data, merge in self._writes:
+            await ref.set(data, merge=merge)
+
+
+class _FakeAsyncFirestore:
+    def __init__(self) -> None:
+        self.docs: dict[str, dict[str, Any]] = {}
+        self.fail_writes = False
+        self.commits = 0
+        self.sets: list[tuple[str, dict[str, Any], bool]] = []
+        self.updates: list[tuple[str, dict[str, Any]]] = []
+
+    def collection(self, name: str) -> _FakeCollection:
+        return _FakeCollection(self, name)
+
+    def batch(self) -> _FakeBatch:
+        return _FakeBatch(self)
+
+
+@pytest.fixture
+def db() -> _FakeAsyncFirestore:
+    return _FakeAsyncFirestore()
+
+
+def _message(message_id: str, minute: int) -> ConversationMessage:
+    return ConversationMessage(
+        message_id=message_id,
+        role="user",
+        content=f"mensagem {message_id}",
+        timestamp=datetime(2026, 1, 1, 12, minute, tzinfo=UTC),
+    )
+
+
+async def test_contact_card_get_or_create_persists_once(db: _FakeAsyncFirestore) -> None:
+    store = AsyncFirestoreContactCardStore(db)  # type: ignore[arg-type]
+
+    created = await store.get_or_create(_WA_ID, "Maria")
+    loaded = await store.get(_WA_ID)
+
+    assert created.whatsapp_name == "Maria"
+    assert loaded is not None
+    assert loaded.wa_id == _WA_ID
+    assert list(db.docs) == [f"lead_contacts/{_WA_ID}"]
+
+
+async def test_contact_card_upsert_writes_only_changed_paths(db: _FakeAsyncFirestore) -> None:
+    store = AsyncFirestoreContactCardStore(db)  # type: ignore[arg-type]
+    await store.get_or_create(_WA_ID, "Maria")
+    card = await store.get(_WA_ID)
+    assert card is not None
+
+    await store.upsert(card)  # nada mudou: sem escrita
+    card.email = "maria@example.com"
+    card.increment("total_messages")
+    await store.upsert(card)
+
+    assert len(db.sets) == 1  # só a criação grava o documento completo
+    _, data = db.updates[-1]
+    assert list(data) == ["email", "total_messages"]
+    assert data["email"] == "maria@example.com"
+    assert isinstance(data["total_messages"], firestore.Increment)
+
+
+async def test_contact_card_upsert_rewrites_document_removed_outside_app(
+    db: _FakeAsyncFirestore,
+) -> None:
+    store = AsyncFirestoreContactCardStore(db)  # type: ignore[arg-type]
+    card = await store.get_or_create(_WA_ID, "Maria")
+    db.docs.clear()
+
+    card.email = "maria@example.com"
+    await store.upsert(card)
+
+    assert db.updates == []
+    assert db.docs[f"lead_contacts/{_WA_ID}"]["email"] == "maria@example.com"
+
+
+async def test_contact_card_upsert_swallows_errors(db: _FakeAsyncFirestore) -> None:
+    db.fail_writes = True
+    store = AsyncFirestoreContactCardStore(db)  # type: ignore[arg-type]
+
+    await store.upsert(ContactCard(wa_id=_WA_ID, phone=_WA_ID, whatsapp_name="X"))
+
+    assert await store.get(_WA_ID) is None
+
+
+async def test_conversation_messages_roundtrip_in_timestamp_order(
+    db: _FakeAsyncFirestore,
+) -> None:
+    store = AsyncFirestoreConversationStore(db)  # type: ignore[arg-type]
+    for message_id, minute in (("m2", 2), ("m1", 1), ("m3", 3)):
+        await store.append_message("hash", _message(message_id, minute), tenant_id="t1")
+
+    messages = await store.get_messages("hash", limit=2, tenant_id="t1")
+
+    assert [m.message_id for m in messages] == ["m1", "m2"]
+    assert "conversations/t1_hash/messages/m1" in db.docs
+
+
+async def test_conversation_lead_roundtrip_and_write_errors(db: _FakeAsyncFirestore) -> None:
+    store = AsyncFirestoreConversationStore(db)  # type: ignore[arg-type]
+    await store.upsert_lead(LeadData(phone_hash="hash", name="Ana", total_messages=3))
+
+    lead = await store.get_lead("hash")
+
+    assert lead is not None
+    assert (lead.name, lead.total_messages) == ("Ana", 3)
+    assert await store.get_lead("outro") is None
+
+    db.fail_writes = True
+    with pytest.raises(ConversationStoreError):
+        await store.append_message("hash", _message("m1", 1))
+
+
+async def test_conversation_write_batch_uses_single_commit(db: _FakeAsyncFirestore) -> None:
+    store = AsyncFirestoreConversationStore(db)  # type: ignore[arg-type]
+    pending = [PendingConversationMessage("hash", "t1", _message(f"m{i}", i)) for i in range(3)]
+
+    await store.write_batch(pending, [LeadData(phone_hash="hash", tenant_id="t1", name="Ana")])
+
+    assert db.commits == 1
+    assert [m.message_id for m in await store.get_messages("hash", tenant_id="t1")] == [
+        "m0",
+        "m1",
+        "m2",
+    ]
+    lead = await store.get_lead("hash", tenant_id="t1")
+    assert lead is not None
+    assert lead.name == "Ana"
@@ -111,6 +111,42 @@ class TestMemoryDedupeStore:
 
         assert await store.is_duplicate("retry-key") is False
 
+    @pytest.mark.anyio
+    async def test_claim_many_claims_only_new_keys(self) -> None:
+        """claim_many deve ignorar chaves já processadas ou em processamento."""
+        store = MemoryDedupeStore()
+        await store.mark_processed("done", ttl=60)
+        await store.mark_processing("busy", ttl=30)
+
+        claims = await store.claim_many(["done", "busy", "new-1", "new-2", "new-1"])
+
+        assert list(claims) == ["new-1", "new-2"]
+        assert await store.is_duplicate("new-1") is True
+
+    @pytest.mark.anyio
+    async def test_release_many_requires_claim_owner(self) -> None:
+        """Só o dono do claim libera o lock de processamento."""
+        store = MemoryDedupeStore()
+        claims = await store.claim_many(["key-1"])
+
+        await store.release_many({"key-1": "other-token"})
+        assert await store.is_duplicate("key-1") is True
+
+        await store.release_many(claims)
+        assert await store.is_duplicate("key-1") is False
+
+    @pytest.mark.anyio
+    async def test_complete_many_marks_processed(self) -> None:
+        """complete_many promove claims para processado."""
+        store = MemoryDedupeStore()
+        claims = await store.claim_many(["key-1", "key-2"])
+
+        await store.complete_many(claims, ttl=60)
+        await store.release_many(claims)
+
+        assert await store.is_duplicate("key-1") is True
+        assert await store.is_duplicate("key-2") is True
+
 
 class TestMemoryAuditStore:
     """Testes do MemoryAuditStore."""
@@ -0,0 +1,76 @@
+"""Testes do RedisContactCardStore (layout em hash) com mock."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from app.domain.contact_card import ContactCard
+from app.infra.stores.contact_card_store import RedisContactCardStore
+
+_WA_ID = "5511999999999"
+_HASH_KEY = f"contact_card:h:{_WA_ID}"
+
+
+def _stored_card() -> dict[bytes, bytes]:
+    card = ContactCard(wa_id=_WA_ID, phone=_WA_ID, whatsapp_name="Maria", total_messages=3)
+    return {
+        name.encode(): json.dumps(value).encode()
+        for name, value in card.model_dump(mode="json", exclude_none=True).items()
+    }
+
+
+async def test_new_card_is_written_as_full_hash() -> None:
+    mock_redis = MagicMock()
+    mock_redis.hgetall.return_value = {}
+    mock_redis.get.return_value = None
+    store = RedisContactCardStore(mock_redis)
+
+    await store.get_or_create(_WA_ID, "Maria")
+
+    pipe = mock_redis.pipeline.return_value
+    mapping = pipe.hset.call_args.kwargs["mapping"]
+    assert pipe.hset.call_args.args == (_HASH_KEY,)
+    assert json.loads(mapping["whatsapp_name"]) == "Maria"
+    pipe.sadd.assert_called_once_with("contact_cards:index", _WA_ID)
+    pipe.execute.assert_called_once()
+
+
+async def test_loaded_card_writes_only_changed_fields() -> None:
+    mock_redis = MagicMock()
+    mock_redis.hgetall.return_value = _stored_card()
+    store = RedisContactCardStore(mock_redis)
+    card = await store.get(_WA_ID)
+    assert card is not None
+
+    await store.upsert(card)  # sem alterações: nenhuma escrita
+    mock_redis.pipeline.assert_not_called()
+
+    card.email = "maria@example.com"
+    card.increment("total_messages")
+    await store.upsert(card)
+
+    pipe = mock_redis.pipeline.return_value
+    pipe.hset.assert_called_once_with(
+        _HASH_KEY,
+        mapping={"email": json.dumps("maria@example.com")},
+    )
+    pipe.hincrby.assert_called_once_with(_HASH_KEY, "total_messages", 1)
+    pipe.delete.assert_not_called()
+    pipe.sadd.assert_not_called()
+
+
+async def test_legacy_json_card_is_migrated_to_hash() -> None:
+    mock_redis = MagicMock()
+    mock_redis.hgetall.return_value = {}
+    legacy = ContactCard(wa_id=_WA_ID, phone=_WA_ID, whatsapp_name="Maria")
+    mock_redis.get.return_value = legacy.model_dump_json().encode()
+    store = RedisContactCardStore(mock_redis)
+
+    card = await store.get(_WA_ID)
+
+    assert card is not None
+    assert card.is_persisted
+    pipe = mock_redis.pipeline.return_value
+    pipe.delete.assert_called_once_with(_HASH_KEY, f"contact_card:{_WA_ID}")
+    pipe.execute.assert_called_once()
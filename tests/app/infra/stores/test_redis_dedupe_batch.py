@@ -0,0 +1,88 @@
+"""Testes dos scripts Lua do claim em lote (fakeredis com Lua real)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import fakeredis
+import pytest
+
+from app.infra.stores.redis_dedupe_store import RedisDedupeStore
+
+
+@pytest.fixture
+def async_redis() -> fakeredis.FakeAsyncRedis:
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def store(async_redis: fakeredis.FakeAsyncRedis) -> RedisDedupeStore:
+    return RedisDedupeStore(MagicMock(), async_redis)
+
+
+@pytest.mark.anyio
+async def test_claim_many_claims_only_new_keys(
+    store: RedisDedupeStore,
+    async_redis: fakeredis.FakeAsyncRedis,
+) -> None:
+    await async_redis.set("dedupe:done", "1")
+
+    claims = await store.claim_many(["new", "done", "new"], ttl=30)
+
+    assert list(claims) == ["new"]
+    assert await async_redis.get("dedupe:processing:new") == claims["new"].encode()
+    assert 0 < await async_redis.ttl("dedupe:processing:new") <= 30
+
+
+@pytest.mark.anyio
+async def test_concurrent_claims_have_a_single_winner(store: RedisDedupeStore) -> None:
+    results = await asyncio.gather(*(store.claim_many(["m1", "m2"]) for _ in range(5)))
+
+    winners = [claims for claims in results if claims]
+    assert len(winners) == 1
+    assert set(winners[0]) == {"m1", "m2"}
+
+
+@pytest.mark.anyio
+async def test_complete_marks_processed_and_drops_own_lock(
+    store: RedisDedupeStore,
+    async_redis: fakeredis.FakeAsyncRedis,
+) -> None:
+    claims = await store.claim_many(["m1"])
+
+    await store.complete_many(claims, ttl=3600)
+
+    assert await async_redis.get("dedupe:m1") == b"1"
+    assert await async_redis.exists("dedupe:processing:m1") == 0
+    assert await store.claim_many(["m1"]) == {}
+
+
+@pytest.mark.anyio
+async def test_complete_keeps_lock_taken_over_by_another_token(
+    store: RedisDedupeStore,
+    async_redis: fakeredis.FakeAsyncRedis,
+) -> None:
+    claims = await store.claim_many(["m1"])
+    await async_redis.set("dedupe:processing:m1", "other-token")
+
+    await store.complete_many(claims)
+
+    assert await async_redis.get("dedupe:processing:m1") == b"other-token"
+
+
+@pytest.mark.anyio
+async def test_release_after_failure_allows_reclaim(
+    store: RedisDedupeStore,
+    async_redis: fakeredis.FakeAsyncRedis,
+) -> None:
+    claims = await store.claim_many(["m1"])
+
+    await store.release_many({"m1": "stale-token"})
+    assert await store.claim_many(["m1"]) == {}
+
+    await store.release_many(claims)
+    reclaimed = await store.claim_many(["m1"])
+
+    assert list(reclaimed) == ["m1"]
+    assert await async_redis.exists("dedupe:m1") == 0
@@ -204,3 +204,61 @@ class TestRedisDedupeStore:
 
         assert result is True
         async_redis.set.assert_awaited_once_with("dedupe:msg-10", "1", nx=True, ex=60)
+
+    @pytest.mark.anyio
+    async def test_claim_many_runs_single_script_and_returns_tokens(self) -> None:
+        """claim_many deve reivindicar todas as chaves numa única chamada de script."""
+        async_redis = MagicMock()
+        script = AsyncMock(return_value=[1, 0, 1])
+        async_redis.register_script.return_value = script
+        store = RedisDedupeStore(MagicMock(), async_redis)
+
+        claims = await store.claim_many(["m1", "m2", "m3", "m1"], ttl=45)
+
+        assert list(claims) == ["m1", "m3"]
+        assert claims["m1"] == claims["m3"]
+        script.assert_awaited_once()
+        kwargs = script.await_args.kwargs
+        assert kwargs["keys"] == [
+            "dedupe:m1", "dedupe:processing:m1",
+            "dedupe:m2", "dedupe:processing:m2",
+            "dedupe:m3", "dedupe:processing:m3",
+        ]
+        assert kwargs["args"] == [claims["m1"], 45]
+
+    @pytest.mark.anyio
+    async def test_scripts_are_registered_once(self) -> None:
+        async_redis = MagicMock()
+        async_redis.register_script.return_value = AsyncMock(return_value=[1])
+        store = RedisDedupeStore(MagicMock(), async_redis)
+
+        await store.claim_many(["m1"])
+        await store.claim_many(["m2"])
+
+        async_redis.register_script.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_complete_and_release_pass_claim_tokens(self) -> None:
+        async_redis = MagicMock()
+        script = AsyncMock(return_value=1)
+        async_redis.register_script.return_value = script
+        store = RedisDedupeStore(MagicMock(), async_redis)
+        claims = {"m1": "tok-1", "m2": "tok-2"}
+
+        await store.complete_many(claims, ttl=600)
+        assert script.await_args.kwargs["args"] == [600, "tok-1", "tok-2"]
+
+        await store.release_many(claims)
+        assert script.await_args.kwargs == {
+            "keys": ["dedupe:processing:m1", "dedupe:processing:m2"],
+            "args": ["tok-1", "tok-2"],
+        }
+
+    @pytest.mark.anyio
+    async def test_claim_many_wraps_script_errors(self) -> None:
+        async_redis = MagicMock()
+        async_redis.register_script.return_value = AsyncMock(side_effect=Exception("down"))
+        store = RedisDedupeStore(MagicMock(), async_redis)
+
+        with pytest.raises(RedisConnectionError, match="reivindicar dedupe"):
+            await store.claim_many(["m1"])
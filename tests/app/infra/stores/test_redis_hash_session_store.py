@@ -0,0 +1,153 @@
+"""Testes do RedisHashSessionStore (hash + lista limitada, escrita por delta)."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from app.infra.stores.redis_hash_session_store import RedisHashSessionStore
+from app.sessions.models import HistoryRole, Session, SessionContext
+from fsm.states import SessionState
+
+_HASH_KEY = "session:{s1}:h"
+_HISTORY_KEY = "session:{s1}:history"
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self._redis = redis
+        self._calls: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args: self._calls.append((name, args))
+
+    def execute(self) -> list[Any]:
+        return [getattr(self._redis, name)(*args) for name, args in self._calls]
+
+
+class _FakeRedis:
+    """Emula os comandos e o script de escrita sobre dicts em memória."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.plans: list[list[list[Any]]] = []
+
+    def register_script(self, source: str) -> Any:
+        return self._run_script
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def hgetall(self, key: str) -> dict[bytes, bytes]:
+        return {k.encode(): str(v).encode() for k, v in self.data.get(key, {}).items()}
+
+    def lrange(self, key: str, start: int, end: int) -> list[bytes]:
+        return [entry.encode() for entry in self.data.get(key, [])]
+
+    def get(self, key: str) -> bytes | None:
+        value = self.data.get(key)
+        return value.encode() if value is not None else None
+
+    def _run_script(self, keys: list[str], args: list[str]) -> int:
+        current = str(self.data.get(keys[0], {}).get("version", 0))
+        if args[0] != "*" and args[0] != current:
+            return -1
+        plan = json.loads(args[1])
+        self.plans.append(plan)
+        for command, key_index, *params in plan:
+            key = keys[key_index - 1]
+            if command == "HSET":
+                self.data.setdefault(key, {}).update(zip(params[::2], params[1::2], strict=True))
+            elif command == "RPUSH":
+                self.data.setdefault(key, []).extend(params)
+            elif command == "LTRIM":
+                self.data[key] = self.data.get(key, [])[params[0] :]
+            elif command == "SET":
+                self.data[key] = params[0]
+            elif command == "DEL":
+                self.data.pop(key, None)
+        version = int(current) + 1
+        self.data.setdefault(keys[0], {})["version"] = version
+        return version
+
+
+def _session() -> Session:
+    return Session(session_id="s1", sender_id="hash", context=SessionContext(tenant_id="t1"))
+
+
+def _commands(plan: list[list[Any]]) -> list[str]:
+    return [command for command, *_ in plan if command != "EXPIRE"]
+
+
+def test_roundtrip_and_delta_write_sends_only_changes() -> None:
+    redis = _FakeRedis()
+    store = RedisHashSessionStore(redis)  # type: ignore[arg-type]
+    session = _session()
+    for idx in range(3):
+        session.add_to_history(f"msg {idx}", max_history=3)
+    store.save(session)
+
+    loaded = store.load("s1")
+    assert loaded is not None
+    loaded.add_to_history("resposta", role=HistoryRole.ASSISTANT, max_history=3)
+    loaded.transition_to(SessionState.TRIAGE)
+    store.save(loaded)
+
+    delta = redis.plans[-1]
+    hset = next(command for command in delta if command[0] == "HSET")
+    assert set(hset[2::2]) == {"current_state", "turn_count", "updated_at"}
+    assert [command[0] for command in delta if command[0] != "HSET"][:2] == ["RPUSH", "LTRIM"]
+    assert len(next(command for command in delta if command[0] == "RPUSH")) == 3
+    assert [json.loads(entry)["content"] for entry in redis.data[_HISTORY_KEY]] == [
+        "msg 1",
+        "msg 2",
+        "resposta",
+    ]
+    reloaded = store.load("s1")
+    assert reloaded is not None
+    assert reloaded.current_state == SessionState.TRIAGE
+    assert reloaded.history_as_strings == loaded.history_as_strings
+
+
+def test_unchanged_session_only_refreshes_ttl() -> None:
+    redis = _FakeRedis()
+    store = RedisHashSessionStore(redis)  # type: ignore[arg-type]
+    store.save(_session())
+    session = store.load("s1")
+
+    store.save(session)
+
+    assert _commands(redis.plans[-1]) == []
+
+
+def test_concurrent_writer_forces_full_rewrite() -> None:
+    redis = _FakeRedis()
+    writer_a = RedisHashSessionStore(redis)  # type: ignore[arg-type]
+    writer_b = RedisHashSessionStore(redis)  # type: ignore[arg-type]
+    writer_a.save(_session())
+    session_a = writer_a.load("s1")
+    session_b = writer_b.load("s1")
+    assert session_a is not None
+    assert session_b is not None
+
+    session_b.history_summary = "resumo de B"
+    writer_b.save(session_b)
+    session_a.transition_to(SessionState.TRIAGE)
+    writer_a.save(session_a)
+
+    assert "DEL" in _commands(redis.plans[-1])  # reescrita completa, não delta
+    assert redis.data[_HASH_KEY]["version"] == 3
+    assert json.loads(redis.data[_HASH_KEY]["current_state"]) == "TRIAGE"
+
+
+def test_legacy_blob_is_read_and_migrated_on_first_save() -> None:
+    redis = _FakeRedis()
+    redis.data["session:s1"] = json.dumps(_session().to_dict())
+    store = RedisHashSessionStore(redis)  # type: ignore[arg-type]
+
+    session = store.load("s1")
+    assert session is not None
+    store.save(session)
+
+    assert "session:s1" not in redis.data
+    assert json.loads(redis.data[_HASH_KEY]["session_id"]) == "s1"
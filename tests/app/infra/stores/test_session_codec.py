@@ -0,0 +1,94 @@
+"""Testes dos codecs de sessão (JSON legado e envelope binário)."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.infra.stores.redis_session_store import RedisSessionStore
+from app.infra.stores.session_codec import (
+    BinarySessionCodec,
+    JsonSessionCodec,
+    SessionCodecError,
+    create_session_codec,
+)
+from app.sessions.models import HistoryRole, Session, SessionContext
+
+
+def _session(history_len: int = 3) -> Session:
+    session = Session(
+        session_id="codec-1",
+        sender_id="sender-1",
+        context=SessionContext(tenant_id="t1", rules={"max": 3}),
+    )
+    for idx in range(history_len):
+        role = HistoryRole.USER if idx % 2 == 0 else HistoryRole.ASSISTANT
+        session.add_to_history(f"mensagem {idx} " * 10, role=role, max_history=None)
+    return session
+
+
+def test_binary_roundtrip_preserves_session_dict() -> None:
+    data = _session().to_dict()
+    codec = BinarySessionCodec()
+
+    encoded = codec.encode(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == data
+
+
+def test_binary_compresses_above_threshold() -> None:
+    data = _session(history_len=60).to_dict()
+    plain = BinarySessionCodec(compress_threshold_bytes=0).encode(data)
+    compressed = BinarySessionCodec(compress_threshold_bytes=1024).encode(data)
+
+    assert len(compressed) < len(plain) / 2
+    assert BinarySessionCodec().decode(compressed) == data
+
+
+def test_binary_codec_reads_legacy_json() -> None:
+    data = _session().to_dict()
+
+    assert BinarySessionCodec().decode(json.dumps(data).encode()) == data
+    assert JsonSessionCodec().decode(BinarySessionCodec().encode(data)) == data
+
+
+def test_decode_rejects_unknown_schema_version() -> None:
+    encoded = bytearray(BinarySessionCodec().encode({"session_id": "x"}))
+    encoded[4] = 99
+
+    with pytest.raises(SessionCodecError, match="schema_unsupported"):
+        BinarySessionCodec().decode(bytes(encoded))
+
+
+def test_create_session_codec_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError, match="SESSION_CODEC"):
+        create_session_codec("xml")
+
+
+def test_store_writes_with_codec_and_loads_both_formats() -> None:
+    redis = MagicMock()
+    store = RedisSessionStore(redis, codec=BinarySessionCodec())
+    session = _session()
+
+    store.save(session)
+    written = redis.setex.call_args.args[2]
+    redis.get.return_value = written
+    loaded = store.load("codec-1")
+    redis.get.return_value = json.dumps(session.to_dict()).encode()
+    legacy = store.load("codec-1")
+
+    assert written.startswith(b"\x00SES")
+    assert loaded is not None
+    assert legacy is not None
+    assert loaded.history == legacy.history == session.history
+
+
+def test_store_returns_none_for_corrupted_payload() -> None:
+    redis = MagicMock()
+    redis.get.return_value = b"\x00SES\x01\x01\x02garbage"
+    store = RedisSessionStore(redis, codec=BinarySessionCodec())
+
+    assert store.load("codec-1") is None
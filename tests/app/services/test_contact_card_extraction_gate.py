@@ -0,0 +1,76 @@
+"""Testes do pré-gate do extrator de ContactCard."""
+
+from __future__ import annotations
+
+import pytest
+
+import app.services.contact_card_extraction_gate as gate_module
+from ai.models.contact_card_extraction import ContactCardExtractionResult, ContactCardPatch
+from app.services.contact_card_extraction_gate import (
+    ContactCardExtractionGate,
+    predict_extractable,
+)
+
+_OPEN_QUESTION = "Legal! Me conta um pouco mais sobre o seu negócio."
+_CRM_QUESTION = "Vocês já usam algum CRM hoje?"
+
+
+@pytest.mark.parametrize(
+    ("text", "assistant", "expected"),
+    [
+        ("👍", _OPEN_QUESTION, (False, "no_content")),
+        ("Bom dia!!", _OPEN_QUESTION, (False, "small_talk")),
+        ("kkkkk", _OPEN_QUESTION, (False, "small_talk")),
+        ("obrigado 🙏", _CRM_QUESTION, (False, "small_talk")),
+        ("ok", _OPEN_QUESTION, (False, "confirmation")),
+        ("sim", _CRM_QUESTION, (True, "answers_pending_question")),
+        ("uns 300 por dia", _OPEN_QUESTION, (True, "data_pattern")),
+        ("joao@empresa.com.br", _OPEN_QUESTION, (True, "data_pattern")),
+        ("Sou dono de uma clínica odontológica", _OPEN_QUESTION, (True, "default")),
+    ],
+)
+def test_predict_extractable(text: str, assistant: str, expected: tuple[bool, str]) -> None:
+    assert predict_extractable(text, assistant) == expected
+
+
+@pytest.fixture
+def counters(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    recorded: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        gate_module,
+        "record_counter",
+        lambda component, op, **kw: recorded.append((op, kw["metadata"]["reason"])),
+    )
+    return recorded
+
+
+def test_gate_skips_and_counts(counters: list[tuple[str, str]]) -> None:
+    gate = ContactCardExtractionGate(shadow_sample_rate=0.0)
+
+    assert gate.evaluate("oi", _OPEN_QUESTION).run is False
+    assert gate.evaluate("tenho 5 atendentes", _OPEN_QUESTION).run is True
+    assert counters == [("skipped", "small_talk"), ("passed", "data_pattern")]
+
+
+def test_disabled_gate_always_runs(counters: list[tuple[str, str]]) -> None:
+    decision = ContactCardExtractionGate(enabled=False).evaluate("oi", _OPEN_QUESTION)
+
+    assert decision.run is True
+    assert counters == []
+
+
+async def test_shadow_sample_counts_miss_when_patch_is_found(
+    counters: list[tuple[str, str]],
+) -> None:
+    gate = ContactCardExtractionGate(shadow_sample_rate=0.5, rng=lambda: 0.1)
+    decision = gate.evaluate("ok", _OPEN_QUESTION)
+
+    async def _extract() -> ContactCardExtractionResult:
+        return ContactCardExtractionResult(updates=ContactCardPatch(requested_human=True))
+
+    result = await gate.observe_shadow(_extract(), decision)
+
+    assert decision.run is True
+    assert decision.shadow is True
+    assert result.has_updates
+    assert counters == [("shadow_checked", "confirmation"), ("shadow_miss", "confirmation")]
@@ -79,3 +79,28 @@ def test_apply_patch_merges_lists_with_limits_and_promotes_true_flags_only() ->
     assert "mod_13" not in card.modules_needed
     assert card.requested_human is True
     assert card.showed_objection is True
+
+
+def test_apply_patch_marks_only_changed_fields_dirty() -> None:
+    card = _new_contact_card()
+    card.mark_persisted()
+
+    apply_contact_card_patch(card, ContactCardPatch(email="ana@empresa.com"))
+    changes = card.pending_changes()
+
+    assert "email" in changes.values
+    assert "full_name" not in changes.values
+    assert "whatsapp_name" not in changes.values
+
+
+def test_increment_is_tracked_until_absolute_assignment() -> None:
+    card = _new_contact_card()
+    card.mark_persisted()
+
+    card.increment("total_messages", by=2)
+    assert card.pending_changes().increments == {"total_messages": 2}
+
+    card.total_messages = 10
+    changes = card.pending_changes()
+    assert changes.increments == {}
+    assert changes.values == {"total_messages": 10}
@@ -0,0 +1,87 @@
+"""Testes das lanes de execução ordenada por conversa."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.conversation_lanes import (
+    ConversationLaneFullError,
+    ConversationLaneScheduler,
+)
+
+
+async def test_same_key_runs_in_arrival_order_without_overlap() -> None:
+    scheduler = ConversationLaneScheduler()
+    events: list[str] = []
+
+    async def work(name: str) -> str:
+        events.append(f"start:{name}")
+        await asyncio.sleep(0.01)
+        events.append(f"end:{name}")
+        return name
+
+    results = await asyncio.gather(
+        *(scheduler.run("sender-a", lambda n=n: work(n)) for n in ("m1", "m2", "m3"))
+    )
+
+    assert results == ["m1", "m2", "m3"]
+    assert events == [
+        "start:m1", "end:m1", "start:m2", "end:m2", "start:m3", "end:m3",
+    ]
+    assert scheduler.active_lanes == 0
+
+
+async def test_different_keys_run_in_parallel() -> None:
+    scheduler = ConversationLaneScheduler()
+    both_started = asyncio.Event()
+    started: set[str] = set()
+
+    async def work(key: str) -> None:
+        started.add(key)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+
+    await asyncio.gather(
+        scheduler.run("sender-a", lambda: work("a")),
+        scheduler.run("sender-b", lambda: work("b")),
+    )
+
+    assert started == {"a", "b"}
+
+
+async def test_lane_rejects_work_beyond_max_depth() -> None:
+    scheduler = ConversationLaneScheduler(max_depth=2)
+    gate = asyncio.Event()
+
+    async def blocked() -> None:
+        await gate.wait()
+
+    first = asyncio.create_task(scheduler.run("sender-a", blocked))
+    second = asyncio.create_task(scheduler.run("sender-a", blocked))
+    await asyncio.sleep(0)
+
+    assert scheduler.depth("sender-a") == 2
+    with pytest.raises(ConversationLaneFullError):
+        await scheduler.run("sender-a", blocked)
+
+    gate.set()
+    await asyncio.gather(first, second)
+    assert scheduler.depth("sender-a") == 0
+
+
+async def test_failure_releases_lane_for_next_message() -> None:
+    scheduler = ConversationLaneScheduler()
+
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    async def ok() -> str:
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        await scheduler.run("sender-a", boom)
+
+    assert await scheduler.run("sender-a", ok) == "ok"
@@ -0,0 +1,66 @@
+"""Testes da agregação de rajadas por remetente."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.message_burst_coalescer import MessageBurstCoalescer
+
+
+async def test_items_within_window_join_leader_burst() -> None:
+    coalescer = MessageBurstCoalescer(window_seconds=0.05, max_wait_seconds=1.0)
+
+    leader = asyncio.create_task(coalescer.join("sender-a", "m1"))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(coalescer.join("sender-a", "m2"))
+    await asyncio.sleep(0.01)
+    other = asyncio.create_task(coalescer.join("sender-b", "x1"))
+
+    burst = await leader
+    assert burst is not None
+    assert burst.items == ["m1", "m2"]
+    assert await follower is None
+    other_burst = await other
+    assert other_burst is not None
+    assert other_burst.items == ["x1"]
+    assert coalescer.open_bursts == 0
+
+
+async def test_follower_returns_once_absorbed_without_waiting_leader() -> None:
+    coalescer = MessageBurstCoalescer(window_seconds=5.0, max_wait_seconds=5.0)
+
+    leader = asyncio.create_task(coalescer.join("sender-a", "m1"))
+    await asyncio.sleep(0)
+
+    assert await asyncio.wait_for(coalescer.join("sender-a", "m2"), timeout=0.1) is None
+    assert not leader.done()
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert coalescer.open_bursts == 0
+
+
+async def test_burst_closes_at_max_items_without_waiting_window() -> None:
+    coalescer = MessageBurstCoalescer(window_seconds=5.0, max_wait_seconds=5.0, max_items=2)
+
+    leader = asyncio.create_task(coalescer.join("sender-a", "m1"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(coalescer.join("sender-a", "m2"))
+
+    burst = await asyncio.wait_for(leader, timeout=1.0)
+    assert burst is not None
+    assert burst.items == ["m1", "m2"]
+    assert await follower is None
+
+
+async def test_item_after_burst_closed_opens_new_burst() -> None:
+    coalescer = MessageBurstCoalescer(window_seconds=0.01, max_wait_seconds=0.05)
+
+    first = await coalescer.join("sender-a", "m1")
+    second = await coalescer.join("sender-a", "m2")
+
+    assert first is not None
+    assert second is not None
+    assert second.items == ["m2"]
@@ -0,0 +1,150 @@
+"""Testes do retry atrasado de envios outbound (sender + worker)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from api.connectors.whatsapp.http_base import HttpClientConfig
+from api.connectors.whatsapp.http_client import WhatsAppHttpClient
+from app.bootstrap import whatsapp_adapters
+from app.bootstrap.whatsapp_adapters import GraphApiOutboundSender
+from app.infra.queues import MemoryOutboundRetryQueue
+from app.protocols.models import OutboundMessageRequest, OutboundMessageResponse
+from app.services.outbound_retry import (
+    RETRY_SCHEDULED_ERROR_CODE,
+    RetryingOutboundSender,
+    retry_delay_seconds,
+)
+from app.services.outbound_retry_worker import OutboundRetryWorker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ScriptedSender:
+    def __init__(self, *codes: str | None) -> None:
+        self._codes = list(codes)
+        self.calls: list[str] = []
+
+    async def send(
+        self, request: OutboundMessageRequest, payload: dict[str, Any]
+    ) -> OutboundMessageResponse:
+        self.calls.append(request.idempotency_key or "")
+        code = self._codes.pop(0)
+        return OutboundMessageResponse(success=code is None, error_code=code, message_id="wamid")
+
+
+def _request(key: str | None = "corr:msg:response") -> OutboundMessageRequest:
+    return OutboundMessageRequest(to="+5511999999999", text="oi", idempotency_key=key)
+
+
+def test_retry_delay_grows_with_jitter_and_cap() -> None:
+    assert retry_delay_seconds(1, 2.0, 60.0, rng=lambda: 0.0) == 1.0
+    assert retry_delay_seconds(3, 2.0, 60.0, rng=lambda: 1.0) == 8.0
+    assert retry_delay_seconds(10, 2.0, 60.0, rng=lambda: 1.0) == 60.0
+
+
+async def test_transient_failure_is_scheduled_instead_of_retried_inline() -> None:
+    clock, queue, started = _Clock(), MemoryOutboundRetryQueue(), []
+    sender = RetryingOutboundSender(
+        _ScriptedSender("WHATSAPP_API_TRANSIENT"),
+        queue,
+        on_scheduled=lambda: started.append(True),
+        clock=clock,
+    )
+
+    response = await sender.send(_request(), {"to": "5511999999999"})
+
+    assert response.success is False
+    assert response.error_code == RETRY_SCHEDULED_ERROR_CODE
+    assert queue.pending_count() == 1
+    assert started == [True]
+
+
+@pytest.mark.parametrize(
+    ("code", "key"),
+    [("WHATSAPP_API_ERROR", "corr:msg:response"), ("WHATSAPP_API_TRANSIENT", None)],
+)
+async def test_permanent_or_keyless_failure_is_not_scheduled(code: str, key: str | None) -> None:
+    queue = MemoryOutboundRetryQueue()
+    sender = RetryingOutboundSender(_ScriptedSender(code), queue)
+
+    response = await sender.send(_request(key), {})
+
+    assert response.error_code == code
+    assert queue.pending_count() == 0
+
+
+async def test_worker_reschedules_then_delivers_with_same_key() -> None:
+    clock, queue = _Clock(), MemoryOutboundRetryQueue()
+    delivery = _ScriptedSender("WHATSAPP_API_TRANSIENT", "WHATSAPP_CIRCUIT_OPEN", None)
+    await RetryingOutboundSender(delivery, queue, clock=clock).send(_request(), {})
+    worker = OutboundRetryWorker(delivery, queue, clock=clock)
+
+    clock.now += 2
+    assert await worker.run_once() == 1  # falha de novo: reagenda
+    assert queue.pending_count() == 1
+    clock.now += 4
+    assert await worker.run_once() == 1
+
+    assert queue.pending_count() == 0
+    assert delivery.calls == ["corr:msg:response"] * 3
+
+
+async def test_worker_gives_up_after_deadline() -> None:
+    clock, queue = _Clock(), MemoryOutboundRetryQueue()
+    delivery = _ScriptedSender("WHATSAPP_API_TRANSIENT", "WHATSAPP_API_TRANSIENT")
+    await RetryingOutboundSender(delivery, queue, max_age_seconds=3, clock=clock).send(
+        _request(), {}
+    )
+    worker = OutboundRetryWorker(delivery, queue, clock=clock)
+
+    clock.now += 2
+    await worker.run_once()
+
+    assert queue.pending_count() == 0
+    assert len(delivery.calls) == 2
+
+
+async def test_graph_5xx_returns_fast_and_worker_delivers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    statuses = [503, 200]
+
+    def graph(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json={"messages": [{"id": "wamid.1"}]})
+
+    monkeypatch.setattr(
+        whatsapp_adapters,
+        "get_whatsapp_settings",
+        lambda: SimpleNamespace(
+            phone_number_id="123",
+            api_version="v24.0",
+            api_base_url="https://graph.example",
+            access_token="token",
+        ),
+    )
+    clock, queue = _Clock(), MemoryOutboundRetryQueue()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(graph)) as pooled:
+        # Sem retry inline: o 503 volta na hora como falha transitória
+        http_client = WhatsAppHttpClient(config=HttpClientConfig(max_retries=0), client=pooled)
+        delivery = GraphApiOutboundSender(http_client)
+        first = await RetryingOutboundSender(delivery, queue, clock=clock).send(
+            _request(), {"to": "5511999999999"}
+        )
+        clock.now += 5
+        await OutboundRetryWorker(delivery, queue, clock=clock).run_once()
+
+    assert first.error_code == RETRY_SCHEDULED_ERROR_CODE
+    assert first.error_message == "WHATSAPP_API_TRANSIENT"
+    assert statuses == []
+    assert queue.pending_count() == 0
@@ -0,0 +1,139 @@
+"""Testes do agendador outbound (token bucket + prioridade)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from api.connectors.whatsapp.http_base import HttpClientConfig
+from api.connectors.whatsapp.http_client import WhatsAppHttpClient
+from app.bootstrap import whatsapp_adapters
+from app.bootstrap.whatsapp_adapters import GraphApiOutboundSender
+from app.protocols.models import OutboundMessageRequest, OutboundMessageResponse
+from app.services.outbound_scheduler import (
+    PRIORITY_BULK,
+    PRIORITY_CONVERSATIONAL,
+    ThrottledOutboundSender,
+    TokenBucket,
+    outbound_priority,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        # Deixa os envios já despachados chegarem ao "servidor" antes de avançar
+        for _ in range(20):
+            await asyncio.sleep(0)
+        self.now += seconds
+
+
+class _RecordingSender:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send(
+        self, request: OutboundMessageRequest, payload: dict[str, Any]
+    ) -> OutboundMessageResponse:
+        self.sent.append(request.idempotency_key or "")
+        return OutboundMessageResponse(success=True, message_id=request.idempotency_key)
+
+
+def _text(key: str) -> OutboundMessageRequest:
+    return OutboundMessageRequest(to="+5511999999999", text="oi", idempotency_key=key)
+
+
+def _template(key: str) -> OutboundMessageRequest:
+    return OutboundMessageRequest(
+        to="+5511999999999",
+        message_type="template",
+        template_name="agendamento_reuniao",
+        category="MARKETING",
+        idempotency_key=key,
+    )
+
+
+def test_token_bucket_refills_at_rate() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(rate_per_second=2, burst=2, clock=clock)
+
+    assert bucket.take(5) == 2
+    assert bucket.take(1) == 0
+    assert bucket.seconds_until_available() == pytest.approx(0.5)
+
+    clock.now = 1.0
+    assert bucket.take(5) == 2
+
+
+def test_priority_separates_conversation_from_templates() -> None:
+    assert outbound_priority(_text("a")) == PRIORITY_CONVERSATIONAL
+    assert outbound_priority(_template("b")) == PRIORITY_BULK
+
+
+async def test_conversational_reply_jumps_ahead_of_queued_templates() -> None:
+    clock = _Clock()
+    sender = _RecordingSender()
+    throttled = ThrottledOutboundSender(
+        sender, rate_per_second=10, burst=1, clock=clock, sleep=clock.sleep
+    )
+
+    results = await asyncio.gather(
+        throttled.send(_template("t1"), {}),
+        throttled.send(_template("t2"), {}),
+        throttled.send(_text("c1"), {}),
+    )
+
+    assert sender.sent == ["c1", "t1", "t2"]
+    assert [r.message_id for r in results] == ["t1", "t2", "c1"]
+    assert clock.now == pytest.approx(0.2)
+
+
+async def test_steady_rate_against_fake_graph_server_without_429(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = _Clock()
+    per_second: dict[int, int] = {}
+    limit = 3
+
+    def graph(request: httpx.Request) -> httpx.Response:
+        second = int(clock.now + 1e-3)
+        per_second[second] = per_second.get(second, 0) + 1
+        if per_second[second] > limit:
+            return httpx.Response(429, json={"error": {"code": 130429}})
+        return httpx.Response(200, json={"messages": [{"id": f"wamid.{sum(per_second.values())}"}]})
+
+    monkeypatch.setattr(
+        whatsapp_adapters,
+        "get_whatsapp_settings",
+        lambda: SimpleNamespace(
+            phone_number_id="123",
+            api_version="v24.0",
+            api_base_url="https://graph.example",
+            access_token="token",
+        ),
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(graph)) as pooled:
+        http_client = WhatsAppHttpClient(config=HttpClientConfig(max_retries=0), client=pooled)
+        throttled = ThrottledOutboundSender(
+            GraphApiOutboundSender(http_client),
+            rate_per_second=limit,
+            burst=1,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        results = await asyncio.gather(
+            *(throttled.send(_text(f"m{i}"), {"to": "5511999999999"}) for i in range(9))
+        )
+
+    assert all(r.success for r in results)
+    assert max(per_second.values()) <= limit
+    assert throttled.queued() == 0
@@ -0,0 +1,97 @@
+"""Testes do pool de consumidores da fila de trabalho."""
+
+from __future__ import annotations
+
+import asyncio
+
+from app.infra.queues import MemoryWorkQueue
+from app.services.work_queue_consumer import WorkQueueConsumerPool
+
+
+async def _wait_for(predicate, timeout: float = 1.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("timeout")
+        await asyncio.sleep(0.005)
+
+
+async def test_pool_processes_items_concurrently_and_acks() -> None:
+    queue = MemoryWorkQueue(block_seconds=0.01)
+    running = 0
+    peak = 0
+    done: list[int] = []
+
+    async def handler(payload: dict) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        done.append(payload["n"])
+
+    for n in range(6):
+        await queue.enqueue({"n": n})
+    pool = WorkQueueConsumerPool(queue, handler, consumers=3)
+    pool.start()
+    await _wait_for(lambda: len(done) == 6)
+    await pool.stop(timeout_seconds=1.0)
+
+    assert sorted(done) == list(range(6))
+    assert peak == 3
+    assert queue.pending_count() == 0
+
+
+async def test_pool_retries_failed_items_until_dead_letter() -> None:
+    queue = MemoryWorkQueue(max_attempts=3, block_seconds=0.01)
+    calls = 0
+
+    async def handler(payload: dict) -> None:
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("boom")
+
+    await queue.enqueue({"n": 1})
+    pool = WorkQueueConsumerPool(queue, handler, consumers=1)
+    pool.start()
+    await _wait_for(lambda: bool(queue.dead_letters))
+    await pool.stop(timeout_seconds=1.0)
+
+    assert calls == 3
+    assert queue.dead_letters[0][1] == "RuntimeError"
+
+
+async def test_stop_leaves_unacked_item_in_queue() -> None:
+    queue = MemoryWorkQueue(block_seconds=0.01)
+    started = asyncio.Event()
+
+    async def handler(payload: dict) -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    await queue.enqueue({"n": 1})
+    pool = WorkQueueConsumerPool(queue, handler, consumers=1)
+    pool.start()
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+    await pool.stop(timeout_seconds=0.01)
+
+    assert not pool.running
+    assert queue.pending_count() == 1
+
+
+async def test_slow_handler_renews_lease_and_is_not_redelivered() -> None:
+    queue = MemoryWorkQueue(visibility_timeout_seconds=0.05, block_seconds=0.01)
+    calls = 0
+
+    async def handler(payload: dict) -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.2)
+
+    await queue.enqueue({"n": 1})
+    pool = WorkQueueConsumerPool(queue, handler, consumers=2, heartbeat_seconds=0.01)
+    pool.start()
+    await _wait_for(lambda: queue.pending_count() == 0)
+    await pool.stop(timeout_seconds=1.0)
+
+    assert calls == 1
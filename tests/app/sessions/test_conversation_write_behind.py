@@ -0,0 +1,93 @@
+"""Testes do write-behind das escritas permanentes de conversa."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.protocols.conversation_store import ConversationMessage, LeadData
+from app.sessions.conversation_write_behind import ConversationWriteBehind
+
+
+def _messages(count: int) -> list[ConversationMessage]:
+    return [
+        ConversationMessage(
+            message_id=f"m{idx}",
+            role="user",
+            content=f"msg {idx}",
+            timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        for idx in range(count)
+    ]
+
+
+@pytest.fixture
+def store() -> AsyncMock:
+    return AsyncMock()
+
+
+def _batch_sizes(store: AsyncMock) -> list[int]:
+    return [len(c.args[0]) + len(c.args[1]) for c in store.write_batch.await_args_list]
+
+
+async def test_full_batch_flushes_without_waiting_for_timer(store: AsyncMock) -> None:
+    write_behind = ConversationWriteBehind(store, batch_size=3, flush_interval_seconds=60.0)
+
+    await write_behind.enqueue_messages("hash", _messages(3), tenant_id="t1")
+    await asyncio.sleep(0)
+
+    assert _batch_sizes(store) == [3]
+    assert write_behind.depth == 0
+
+
+async def test_partial_batch_flushes_after_interval(store: AsyncMock) -> None:
+    write_behind = ConversationWriteBehind(store, batch_size=10, flush_interval_seconds=0.01)
+
+    await write_behind.enqueue_messages("hash", _messages(2), tenant_id="t1")
+    assert store.write_batch.await_count == 0
+    await asyncio.sleep(0.05)
+
+    assert _batch_sizes(store) == [2]
+
+
+async def test_lead_upserts_collapse_to_latest_version(store: AsyncMock) -> None:
+    write_behind = ConversationWriteBehind(store, flush_interval_seconds=60.0)
+
+    await write_behind.enqueue_lead(LeadData(phone_hash="hash", name="Ana"))
+    await write_behind.enqueue_lead(LeadData(phone_hash="hash", name="Ana Souza"))
+    await write_behind.flush()
+
+    _, leads = store.write_batch.await_args.args
+    assert [lead.name for lead in leads] == ["Ana Souza"]
+
+
+async def test_full_buffer_applies_backpressure(store: AsyncMock) -> None:
+    write_behind = ConversationWriteBehind(
+        store,
+        batch_size=2,
+        flush_interval_seconds=60.0,
+        max_pending=2,
+    )
+    write_behind._after_enqueue = lambda: None  # type: ignore[method-assign]
+
+    await write_behind.enqueue_messages("hash", _messages(3), tenant_id="t1")
+
+    # O terceiro enqueue aguardou o flush das duas primeiras escritas
+    assert _batch_sizes(store) == [2]
+    assert write_behind.depth == 1
+
+
+async def test_failed_flush_is_dropped_and_drain_empties_buffer(store: AsyncMock) -> None:
+    store.write_batch.side_effect = [RuntimeError("unavailable"), None]
+    write_behind = ConversationWriteBehind(store, flush_interval_seconds=60.0)
+
+    await write_behind.enqueue_messages("hash", _messages(1), tenant_id="t1")
+    await write_behind.flush()
+    await write_behind.enqueue_messages("hash", _messages(2), tenant_id="t1")
+    await write_behind.drain(timeout_seconds=1.0)
+
+    assert _batch_sizes(store) == [1, 2]
+    assert write_behind.depth == 0
@@ -0,0 +1,59 @@
+"""Testes da compactação de histórico (janela quente + resumo)."""
+
+from __future__ import annotations
+
+from app.sessions.history_compaction import HistoryCompactor, roll_summary
+from app.sessions.models import HistoryEntry, HistoryRole, Session
+
+
+def _session(count: int) -> Session:
+    session = Session(session_id="s1", sender_id="h1")
+    for idx in range(count):
+        role = HistoryRole.USER if idx % 2 == 0 else HistoryRole.ASSISTANT
+        session.add_to_history(f"mensagem {idx}", role=role, max_history=None)
+    return session
+
+
+def test_compact_is_noop_within_window() -> None:
+    session = _session(3)
+
+    assert HistoryCompactor(hot_window=3).compact(session) == []
+    assert len(session.history) == 3
+    assert session.history_summary == ""
+
+
+def test_compact_is_incremental_across_saves() -> None:
+    compactor = HistoryCompactor(hot_window=2)
+    session = _session(3)
+
+    first = compactor.compact(session)
+    session.add_to_history("mensagem 3", role=HistoryRole.ASSISTANT, max_history=None)
+    second = compactor.compact(session)
+
+    assert [entry.content for entry in first] == ["mensagem 0"]
+    assert [entry.content for entry in second] == ["mensagem 1"]
+    assert session.history_summary == "U: mensagem 0 | O: mensagem 1"
+    assert [entry.content for entry in session.history] == ["mensagem 2", "mensagem 3"]
+
+
+def test_summary_is_bounded_and_keeps_most_recent_text() -> None:
+    entries = [
+        HistoryEntry(role=HistoryRole.USER, content=f"assunto {idx} " * 20)
+        for idx in range(10)
+    ]
+
+    summary = roll_summary("", entries, max_chars=200)
+
+    assert len(summary) <= 200
+    assert summary.startswith("...")
+    assert "assunto 9" in summary
+
+
+def test_session_roundtrip_preserves_summary() -> None:
+    session = _session(5)
+    HistoryCompactor(hot_window=2).compact(session)
+
+    restored = Session.from_dict(session.to_dict())
+
+    assert restored.history_summary == session.history_summary
+    assert Session.from_dict({"session_id": "s", "sender_id": "h"}).history_summary == ""
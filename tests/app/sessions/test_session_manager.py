@@ -15,6 +15,8 @@ from unittest.mock import AsyncMock
 import pytest
 
 from app.protocols.conversation_store import ConversationMessage, LeadData
+from app.sessions.conversation_write_behind import ConversationWriteBehind
+from app.sessions.history_compaction import HistoryCompactor
 from app.sessions.manager import SessionManager
 from app.sessions.models import HistoryRole
 
@@ -44,6 +46,12 @@ def mock_conversation_store() -> AsyncMock:
     return store
 
 
+@pytest.fixture
+def write_behind(mock_conversation_store: AsyncMock) -> ConversationWriteBehind:
+    """Write-behind do dual-write (flush manual nos testes)."""
+    return ConversationWriteBehind(mock_conversation_store, flush_interval_seconds=60.0)
+
+
 @pytest.fixture
 def manager(mock_session_store: AsyncMock) -> SessionManager:
     """SessionManager sem ConversationStore."""
@@ -54,11 +62,13 @@ def manager(mock_session_store: AsyncMock) -> SessionManager:
 def manager_with_firestore(
     mock_session_store: AsyncMock,
     mock_conversation_store: AsyncMock,
+    write_behind: ConversationWriteBehind,
 ) -> SessionManager:
     """SessionManager com ConversationStore."""
     return SessionManager(
         store=mock_session_store,
         conversation_store=mock_conversation_store,
+        write_behind=write_behind,
     )
 
 
@@ -145,18 +155,18 @@ class TestDualWrite:
             role=HistoryRole.USER,
         )
 
-        # Redis deve ser chamado
+        # Redis recebe a entidade: o store serializa uma única vez
         mock_session_store.save_async.assert_called_once()
+        assert mock_session_store.save_async.call_args.args[0] is session
 
     @pytest.mark.asyncio
-    async def test_add_message_fires_firestore_task(
+    async def test_add_message_enqueues_firestore_write(
         self,
         manager_with_firestore: SessionManager,
         mock_conversation_store: AsyncMock,
+        write_behind: ConversationWriteBehind,
     ) -> None:
-        """add_message dispara task para Firestore (fire-and-forget)."""
-        import asyncio
-
+        """add_message enfileira a escrita no write-behind do Firestore."""
         session = await manager_with_firestore.resolve_or_create(
             sender_id="5511999998888",
             tenant_id="tenant-123",
@@ -169,13 +179,14 @@ class TestDualWrite:
             detected_intent="PRICING_INQUIRY",
         )
 
-        # Aguarda tasks pendentes
-        await asyncio.sleep(0.1)
+        assert write_behind.depth == 1
+        await write_behind.flush()
 
-        # Firestore deve ser chamado
-        mock_conversation_store.append_message.assert_called_once()
-        call_kwargs = mock_conversation_store.append_message.call_args
-        assert call_kwargs.kwargs["tenant_id"] == "tenant-123"
+        # Firestore recebe um único lote
+        mock_conversation_store.write_batch.assert_awaited_once()
+        messages, leads = mock_conversation_store.write_batch.call_args.args
+        assert [m.tenant_id for m in messages] == ["tenant-123"]
+        assert leads == []
 
     @pytest.mark.asyncio
     async def test_add_message_without_firestore_works(
@@ -264,6 +275,8 @@ class TestFirestoreRecovery:
         assert len(session.history) == 2
         assert session.history[0].role == HistoryRole.USER
         assert session.history[1].role == HistoryRole.ASSISTANT
+        # Histórico recuperado já está no store: não é reenviado no próximo save
+        assert session.history_persisted_at == session.history[-1].timestamp
 
     @pytest.mark.asyncio
     async def test_recovery_handles_firestore_error(
@@ -308,9 +321,9 @@ class TestUpdateContactCard:
         manager_with_firestore: SessionManager,
         mock_session_store: AsyncMock,
         mock_conversation_store: AsyncMock,
+        write_behind: ConversationWriteBehind,
     ) -> None:
         """Atualiza contato e persiste no Firestore."""
-        import asyncio
 
         session = await manager_with_firestore.resolve_or_create(
             sender_id="5511999998888",
@@ -325,13 +338,13 @@ class TestUpdateContactCard:
             primary_interest="sob_medida",
         )
 
-        # Aguarda tasks pendentes
-        await asyncio.sleep(0.1)
+        await write_behind.flush()
 
         assert session.contact_card is not None
         assert session.contact_card.full_name == "Maria"
         assert session.contact_card.email == "maria@example.com"
-        mock_conversation_store.upsert_lead.assert_called_once()
+        _, leads = mock_conversation_store.write_batch.call_args.args
+        assert [lead.email for lead in leads] == ["maria@example.com"]
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -354,3 +367,79 @@ class TestCloseSession:
         await manager.close(session, reason="completed")
 
         mock_session_store.delete_async.assert_called_once()
+
+
+class TestHistoryCompaction:
+    """Testes da compactação de histórico no save."""
+
+    @pytest.mark.asyncio
+    async def test_save_keeps_hot_window_and_moves_overflow_to_firestore(
+        self,
+        mock_session_store: AsyncMock,
+        mock_conversation_store: AsyncMock,
+        write_behind: ConversationWriteBehind,
+    ) -> None:
+        """Entradas além da janela saem da sessão, viram resumo e vão ao Firestore."""
+        manager = SessionManager(
+            store=mock_session_store,
+            conversation_store=mock_conversation_store,
+            history_compactor=HistoryCompactor(hot_window=4),
+            write_behind=write_behind,
+        )
+        session = await manager.resolve_or_create(sender_id="5511999998888")
+        for idx in range(6):
+            session.add_to_history(f"msg {idx}", max_history=None)
+
+        await manager.save(session)
+        await write_behind.flush()
+
+        assert [entry.content for entry in session.history] == [
+            "msg 2", "msg 3", "msg 4", "msg 5",
+        ]
+        assert session.history_summary == "U: msg 0 | U: msg 1"
+        saved = mock_session_store.save_async.call_args.args[0].to_dict()
+        assert len(saved["history"]) == 4
+        assert saved["history_summary"] == session.history_summary
+        messages, _ = mock_conversation_store.write_batch.call_args.args
+        assert [m.message.content for m in messages] == [f"msg {idx}" for idx in range(6)]
+
+    @pytest.mark.asyncio
+    async def test_save_persists_each_turn_once(
+        self,
+        mock_session_store: AsyncMock,
+        mock_conversation_store: AsyncMock,
+        write_behind: ConversationWriteBehind,
+    ) -> None:
+        """Turnos da janela quente vão ao store no save, sem reenvio depois."""
+        manager = SessionManager(
+            store=mock_session_store,
+            conversation_store=mock_conversation_store,
+            history_compactor=HistoryCompactor(hot_window=4),
+            write_behind=write_behind,
+        )
+        session = await manager.resolve_or_create(sender_id="5511999998888")
+        await manager.add_message(session, "primeira", HistoryRole.USER)
+        await manager.add_message(session, "segunda", HistoryRole.ASSISTANT)
+        await manager.save(session)
+        await write_behind.flush()
+
+        messages, _ = mock_conversation_store.write_batch.call_args.args
+        assert [m.message.content for m in messages] == ["primeira", "segunda"]
+        saved = mock_session_store.save_async.call_args.args[0].to_dict()
+        assert saved["history_persisted_at"] == session.history[-1].timestamp.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_without_conversation_store(
+        self,
+        manager: SessionManager,
+    ) -> None:
+        """Sem store a janela quente ainda limita a sessão (excedente vira resumo)."""
+        session = await manager.resolve_or_create(sender_id="5511999998888")
+        for idx in range(30):
+            session.add_to_history(f"msg {idx}", max_history=None)
+
+        await manager.save(session)
+
+        assert len(session.history) == 20
+        assert session.history[0].content == "msg 10"
+        assert session.history_summary.startswith("U: msg 0 | U: msg 1")
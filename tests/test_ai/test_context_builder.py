@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from ai.prompts import context_builder
+from ai.prompts.context_blocks import merge_context_texts
 
 
 def test_normalize_tenant_intent_aliases() -> None:
@@ -68,3 +69,39 @@ def test_build_contexts_real_assets_include_required_contexts() -> None:
 
     lowered_user = result["institutional_context"].lower()
     assert "contato@pyloto.com.br" in lowered_user
+
+
+def test_build_contexts_is_memoized_and_returns_copies() -> None:
+    context_builder.clear_context_builder_cache()
+    first = context_builder.build_contexts(tenant_intent="automacao")
+    first["system_context"] = "mutado"
+
+    second = context_builder.build_contexts(tenant_intent="automacao_atendimento")
+
+    assert second["system_context"] != "mutado"
+    assert context_builder._assemble_contexts.cache_info().hits == 1
+
+
+def test_merge_context_texts_dedupes_normalized_blocks() -> None:
+    merged = merge_context_texts(["A\n\nB  x", "b X\n\n  \n\nC", ""])
+
+    assert merged == "A\n\nB  x\n\nC"
+
+
+def test_build_contexts_warm_path_skips_merge(monkeypatch) -> None:
+    """Chamadas repetidas reutilizam a montagem memoizada (sem split/normalize)."""
+    merges: list[int] = []
+
+    def counting_merge(texts, *args, **kwargs):
+        merges.append(1)
+        return merge_context_texts(texts, *args, **kwargs)
+
+    monkeypatch.setattr(context_builder, "merge_context_texts", counting_merge)
+    context_builder.clear_context_builder_cache()
+
+    for _ in range(50):
+        context_builder.build_contexts(tenant_intent="automacao")
+
+    info = context_builder._assemble_contexts.cache_info()
+    assert (info.misses, info.hits) == (1, 49)
+    assert len(merges) == 4  # só a montagem fria
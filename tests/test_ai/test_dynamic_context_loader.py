@@ -2,8 +2,23 @@
 
 from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from ai.prompts import context_trigger_index
+from ai.prompts.context_trigger_index import (
+    clear_trigger_index_cache,
+    get_trigger_index,
+    normalize_text,
+)
 from ai.prompts.dynamic_context_loader import resolve_dynamic_contexts
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
 
 def test_dynamic_loader_returns_empty_without_intent() -> None:
     result = resolve_dynamic_contexts(tenant_intent=None, user_message="preço")
@@ -41,3 +56,48 @@ def test_dynamic_loader_injects_tech_stack_for_sob_medida() -> None:
     )
     joined = "\n".join(result.contexts_for_prompt).lower()
     assert "stack" in joined or "tecnologia" in joined
+
+
+def _write_context(directory: Path, name: str, trigger: str, persist: bool = False) -> Path:
+    path = directory / name
+    path.write_text(
+        f"metadata:\n  persist: {str(persist).lower()}\n  injection_trigger:\n{trigger}",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_trigger_index_matches_overlapping_and_all_keywords(tmp_path: Path) -> None:
+    _write_context(tmp_path, "a_ads.yaml", "    any_keywords: [google]\n")
+    _write_context(tmp_path, "b_combo.yaml", "    all_keywords: [google ads, Orçamento]\n")
+    _write_context(tmp_path, "core.yaml", "    any_keywords: [google]\n")
+    clear_trigger_index_cache()
+
+    index = get_trigger_index(tmp_path)
+
+    assert index is not None
+    hits = index.match(normalize_text("Quanto de orcamento pro Google Ads?"), 0.0)
+    assert [entry.file_name for entry in hits] == ["a_ads.yaml", "b_combo.yaml"]
+    assert [e.file_name for e in index.match("so google", 0.0)] == ["a_ads.yaml"]
+
+
+def test_trigger_index_is_cached_until_files_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _write_context(tmp_path, "seo.yaml", "    any_keywords: [seo]\n")
+    monkeypatch.setattr(context_trigger_index, "REVALIDATE_SECONDS", 0.0)
+    clear_trigger_index_cache()
+    first = get_trigger_index(tmp_path)
+
+    with patch.object(context_trigger_index.yaml, "safe_load") as safe_load:
+        assert get_trigger_index(tmp_path) is first
+    safe_load.assert_not_called()
+
+    _write_context(tmp_path, "seo.yaml", "    any_keywords: [ranquear]\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    refreshed = get_trigger_index(tmp_path)
+
+    assert refreshed is not first
+    assert refreshed is not None
+    assert refreshed.match("quero ranquear", 0.0)[0].file_name == "seo.yaml"
@@ -0,0 +1,67 @@
+"""Testes do transporte OpenAI compartilhado."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.infra.ai import openai_transport
+from app.infra.ai.contact_card_extractor_client import ContactCardExtractorClient
+from app.infra.ai.otto_client import OttoClient
+from app.infra.ai.whisper_client import WhisperClient
+from config.settings.ai.openai import OpenAISettings
+
+_SETTINGS = OpenAISettings(api_key="sk-test", http_max_connections=7)
+
+
+@pytest.fixture(autouse=True)
+async def _fresh_transport(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(openai_transport, "get_openai_settings", lambda: _SETTINGS)
+    monkeypatch.setattr(openai_transport, "_counter", openai_transport._ConnectionCounter())
+    await openai_transport.close_shared_openai_client()
+    yield
+    await openai_transport.close_shared_openai_client()
+
+
+async def test_ai_clients_share_one_http_pool() -> None:
+    otto = OttoClient(settings=_SETTINGS)
+    extractor = ContactCardExtractorClient(settings=_SETTINGS)
+    whisper = WhisperClient(settings=_SETTINGS)
+
+    shared = openai_transport.get_shared_openai_client()
+    pools = {id(c._client._client) for c in (otto, extractor, whisper)}
+
+    assert pools == {id(shared._client)}
+    assert otto._client.timeout == otto._timeout_seconds
+    assert extractor._client.timeout == extractor._timeout_seconds
+
+
+async def test_connection_stats_count_new_and_reused_connections() -> None:
+    counter = openai_transport._counter
+    for _ in range(3):
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        await counter.on_request(request)
+        trace = request.extensions["trace"]
+        await trace("connection.send_request_headers.started", {})
+    await trace(openai_transport._NEW_CONNECTION_EVENT, {})
+
+    stats = openai_transport.get_openai_connection_stats()
+
+    assert stats.as_dict() == {
+        "requests": 3,
+        "new_connections": 1,
+        "reused": 2,
+        "reuse_ratio": round(2 / 3, 4),
+    }
+
+
+async def test_warmup_is_best_effort(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = openai_transport.init_shared_openai_client(_SETTINGS)
+    monkeypatch.setattr(client.models, "list", AsyncMock(side_effect=httpx.ConnectError("down")))
+
+    assert await openai_transport.warmup_shared_openai_client(timeout_seconds=0.1) is False
+
+    monkeypatch.setattr(client.models, "list", AsyncMock(return_value=[]))
+    assert await openai_transport.warmup_shared_openai_client(timeout_seconds=0.1) is True
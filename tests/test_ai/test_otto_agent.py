@@ -69,3 +69,9 @@ def test_conversation_history_uses_last_20_messages() -> None:
 def test_conversation_history_normalizes_assistant_label_to_otto() -> None:
     text = _conversation_history_text(["assistente: tudo certo"])
     assert text == "Otto: tudo certo"
+
+
+def test_conversation_history_prepends_rolling_summary() -> None:
+    text = _conversation_history_text(["Usuario: oi"], summary="U: quero um site")
+
+    assert text.splitlines() == ["Resumo anterior: U: quero um site", "Usuario: oi"]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -58,3 +59,27 @@ def test_response_format_enforces_state_and_message_type_enums() -> None:
 
     assert "TRIAGE" in props["next_state"]["enum"]
     assert props["message_type"]["enum"] == ["text", "interactive_button", "interactive_list"]
+
+
+@pytest.mark.asyncio
+async def test_decide_records_token_usage_with_cached_tokens() -> None:
+    fake_openai = _build_fake_openai(
+        '{"next_state": "TRIAGE", "response_text": "Oi", "message_type": "text", '
+        '"confidence": 0.9, "requires_human": false}'
+    )
+    response = fake_openai.chat.completions.create.return_value
+    response.usage = SimpleNamespace(
+        prompt_tokens=1800,
+        completion_tokens=60,
+        total_tokens=1860,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1536),
+    )
+    client = OttoClient(client=fake_openai, model="gpt-4o", timeout_seconds=10)
+
+    with patch("app.infra.ai.openai_usage.record_token_usage") as record:
+        await client.decide(system_prompt="s", user_prompt="u")
+
+    record.assert_called_once()
+    assert record.call_args.args == ("otto_client", "decide")
+    assert record.call_args.kwargs["prompt_tokens"] == 1800
+    assert record.call_args.kwargs["cached_tokens"] == 1536
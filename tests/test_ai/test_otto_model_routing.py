@@ -0,0 +1,129 @@
+"""Testes do roteamento adaptativo de modelo do Otto."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from ai.core.otto_client import OttoClientProtocol
+from ai.models.otto import OttoDecision, OttoRequest
+from ai.rules.otto_model_routing import ModelRoutingPolicy, RoutingFeatures, route_model_tier
+from ai.services.otto_agent import OttoAgentService
+from ai.services.otto_model_router import OttoModelRouter
+from ai.services.prompt_micro_agents import MicroAgentResult
+
+_POLICY = ModelRoutingPolicy()
+
+
+def _features(**overrides: object) -> RoutingFeatures:
+    values: dict[str, object] = {
+        "session_state": "COLLECTING_INFO",
+        "message_chars": 3,
+        "user_asked_question": False,
+        "micro_agents_fired": False,
+        "pending_question": "email",
+        "contact_missing_fields": 4,
+    }
+    values.update(overrides)
+    return RoutingFeatures(**values)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("overrides", "expected"),
+    [
+        ({}, ("fast", "answer_to_pending_question")),
+        ({"pending_question": None}, ("fast", "short_turn")),
+        ({"session_state": "GENERATING_RESPONSE"}, ("full", "state")),
+        ({"micro_agents_fired": True}, ("full", "micro_agents")),
+        ({"message_chars": 200}, ("full", "long_message")),
+        ({"user_asked_question": True}, ("full", "user_question")),
+        ({"contact_missing_fields": 0}, ("full", "card_complete")),
+    ],
+)
+def test_route_model_tier(overrides: dict[str, object], expected: tuple[str, str]) -> None:
+    assert route_model_tier(_features(**overrides), _POLICY) == expected
+
+
+def _decision(confidence: float) -> OttoDecision:
+    return OttoDecision(
+        next_state="COLLECTING_INFO",
+        response_text="Perfeito, anotado!",
+        message_type="text",
+        confidence=confidence,
+    )
+
+
+def _client(result: object) -> AsyncMock:
+    client = AsyncMock(spec=OttoClientProtocol)
+    if isinstance(result, Exception):
+        client.decide.side_effect = result
+    else:
+        client.decide.return_value = result
+    return client
+
+
+def _request(message: str = "ok") -> OttoRequest:
+    return OttoRequest(
+        user_message=message,
+        session_state="COLLECTING_INFO",
+        correlation_id="corr-route",
+        pending_question="email",
+        contact_missing_fields=3,
+    )
+
+
+async def _route(router: OttoModelRouter, message: str = "ok") -> OttoDecision | None:
+    return await router.decide(
+        request=_request(message),
+        micro_result=MicroAgentResult.empty(),
+        system_prompt="s",
+        user_prompt="u",
+    )
+
+
+async def test_confident_fast_decision_skips_full_model() -> None:
+    fast, full = _client(_decision(0.9)), _client(_decision(0.95))
+    router = OttoModelRouter(full_client=full, fast_client=fast)
+
+    decision = await _route(router)
+
+    assert decision is not None
+    assert decision.confidence == 0.9
+    full.decide.assert_not_awaited()
+
+
+@pytest.mark.parametrize("fast_result", [_decision(0.3), None, RuntimeError("boom")])
+async def test_fast_model_escalates_to_full(fast_result: object) -> None:
+    fast, full = _client(fast_result), _client(_decision(0.95))
+    router = OttoModelRouter(full_client=full, fast_client=fast)
+
+    decision = await _route(router)
+
+    assert decision is not None
+    assert decision.confidence == 0.95
+    fast.decide.assert_awaited_once()
+    full.decide.assert_awaited_once()
+
+
+async def test_complex_turn_goes_straight_to_full_model() -> None:
+    fast, full = _client(_decision(0.9)), _client(_decision(0.95))
+    router = OttoModelRouter(full_client=full, fast_client=fast)
+
+    await _route(router, message="Quanto custa a integração com o meu ERP?")
+
+    fast.decide.assert_not_awaited()
+    full.decide.assert_awaited_once()
+
+
+async def test_otto_agent_uses_router_when_configured() -> None:
+    fast, full = _client(_decision(0.9)), _client(_decision(0.95))
+    service = OttoAgentService(
+        full,
+        router=OttoModelRouter(full_client=full, fast_client=fast),
+    )
+
+    decision = await service.decide(_request())
+
+    assert decision.confidence == 0.9
+    full.decide.assert_not_awaited()
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from ai.prompts.otto_prompt import OTTO_SYSTEM_PROMPT, format_otto_prompt
+from ai.prompts.otto_prompt import (
+    OTTO_SYSTEM_PROMPT,
+    PromptComponents,
+    build_full_prompt,
+    format_otto_prompt,
+)
 
 
 def test_system_prompt_requires_json() -> None:
@@ -72,3 +77,43 @@ def test_format_otto_prompt_mentions_operational_instruction() -> None:
 
     assert "Instrucao operacional" in result
     assert "ContactCard + Historico" in result
+
+
+def _cache_prefix_prompt(user_message: str, card: str) -> PromptComponents:
+    return build_full_prompt(
+        contact_card_summary=card,
+        conversation_history="Usuario: Oi",
+        session_state="TRIAGE",
+        valid_transitions=["COLLECTING_INFO"],
+        user_message=user_message,
+        tenant_intent="trafego",
+        intent_confidence=0.6,
+        prompt_layout="cache_prefix",
+    )
+
+
+def test_cache_prefix_layout_keeps_system_byte_identical_across_turns() -> None:
+    first = _cache_prefix_prompt("Oi, tudo bem?", "Nome: Joao")
+    second = _cache_prefix_prompt("Quero melhorar SEO e ranquear no Google", "Nome: Ana")
+
+    assert first.system_prompt == second.system_prompt
+    assert first.system_prompt.startswith(OTTO_SYSTEM_PROMPT)
+    assert "## Contexto Pyloto" in first.system_prompt
+    assert "## Contexto Pyloto" not in second.user_prompt
+    assert "Nome: Ana" in second.user_prompt
+    assert "SEO (quando perguntado)" in second.user_prompt
+    assert "SEO (quando perguntado)" not in first.user_prompt
+
+
+def test_legacy_layout_keeps_static_context_in_user_prompt() -> None:
+    result = build_full_prompt(
+        contact_card_summary="Nome: Joao",
+        conversation_history="Usuario: Oi",
+        session_state="TRIAGE",
+        valid_transitions=["COLLECTING_INFO"],
+        user_message="Oi",
+        tenant_intent="trafego",
+    )
+
+    assert result.system_prompt == OTTO_SYSTEM_PROMPT
+    assert "## Contexto Pyloto" in result.user_prompt
@@ -0,0 +1,159 @@
+"""Testes do hedging de requisições OpenAI."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infra.ai.openai_transport import hedged_create
+from app.infra.ai.otto_client import OttoClient
+from app.infra.ai.request_hedging import HedgeBudget, LatencyWindow, RequestHedger
+from config.settings.ai.hedging import OpenAIHedgeSettings
+
+_VALID_DECISION = (
+    '{"next_state": "TRIAGE", "response_text": "Oi", "message_type": "text", '
+    '"confidence": 0.9, "requires_human": false}'
+)
+
+
+def _hedger(*, budget_ratio: float = 1.0, samples: int = 5) -> RequestHedger:
+    settings = OpenAIHedgeSettings(
+        enabled=True,
+        quantile=0.9,
+        budget_ratio=budget_ratio,
+        min_samples=5,
+        window_size=50,
+        min_delay_seconds=0.0,
+    )
+    hedger = RequestHedger(settings)
+    for _ in range(samples):
+        hedger._window.observe("gpt-4o", 0.01)
+    return hedger
+
+
+class _Calls:
+    """Primeira chamada lenta (cauda), demais rápidas."""
+
+    def __init__(self, slow_seconds: float = 5.0) -> None:
+        self.started = 0
+        self.cancelled = 0
+        self._slow_seconds = slow_seconds
+
+    async def __call__(self) -> str:
+        self.started += 1
+        attempt = self.started
+        try:
+            await asyncio.sleep(self._slow_seconds if attempt == 1 else 0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"resp-{attempt}"
+
+
+def test_latency_window_waits_for_min_samples() -> None:
+    window = LatencyWindow(size=10, min_samples=3)
+    window.observe("m", 1.0)
+    window.observe("m", 3.0)
+    assert window.quantile("m", 0.5) is None
+
+    window.observe("m", 2.0)
+    assert window.quantile("m", 0.5) == 2.0
+    assert window.quantile("m", 0.99) == 3.0
+
+
+def test_budget_caps_hedges_to_ratio_of_requests() -> None:
+    budget = HedgeBudget(0.05)
+    granted = 0
+    for _ in range(200):
+        budget.on_request()
+        granted += budget.try_acquire()
+    assert granted == 10
+
+
+async def test_slow_primary_is_hedged_and_cancelled() -> None:
+    calls = _Calls()
+
+    result = await _hedger().run("gpt-4o", calls)
+
+    assert result == "resp-2"
+    assert calls.started == 2
+    await asyncio.sleep(0)
+    assert calls.cancelled == 1
+
+
+async def test_no_hedge_without_latency_history() -> None:
+    calls = _Calls(slow_seconds=0.05)
+
+    result = await _hedger(samples=0).run("gpt-4o", calls)
+
+    assert result == "resp-1"
+    assert calls.started == 1
+
+
+async def test_no_hedge_when_budget_is_exhausted() -> None:
+    calls = _Calls(slow_seconds=0.05)
+
+    result = await _hedger(budget_ratio=0.0).run("gpt-4o", calls)
+
+    assert result == "resp-1"
+    assert calls.started == 1
+
+
+async def test_failed_primary_falls_back_to_hedge() -> None:
+    attempts = 0
+
+    async def _call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            await asyncio.sleep(0.05)
+            raise TimeoutError("slow and failed")
+        await asyncio.sleep(0.1)
+        return "hedge"
+
+    assert await _hedger().run("gpt-4o", _call) == "hedge"
+
+
+async def test_both_failures_propagate_first_error() -> None:
+    async def _call() -> str:
+        await asyncio.sleep(0.02)
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        await _hedger().run("gpt-4o", _call)
+
+
+async def test_otto_client_routes_completions_through_hedger() -> None:
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=_VALID_DECISION))]
+    calls = 0
+
+    async def _create(**kwargs: object) -> object:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)
+        return response
+
+    fake_openai = MagicMock()
+    fake_openai.chat.completions.create = _create
+    client = OttoClient(client=fake_openai, model="gpt-4o", hedger=_hedger())
+
+    decision = await asyncio.wait_for(client.decide(system_prompt="s", user_prompt="u"), 1)
+
+    assert decision is not None
+    assert calls == 2
+
+
+async def test_hedged_create_calls_openai_directly_without_hedger() -> None:
+    fake_openai = MagicMock()
+    fake_openai.chat.completions.create = AsyncMock(return_value="ok")
+
+    result = await hedged_create(fake_openai, None, model="gpt-4o-mini", temperature=0.0)
+
+    assert result == "ok"
+    fake_openai.chat.completions.create.assert_awaited_once_with(
+        model="gpt-4o-mini", temperature=0.0
+    )
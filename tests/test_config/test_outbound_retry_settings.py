@@ -0,0 +1,34 @@
+"""Testes do carregamento de OutboundRetrySettings."""
+
+from __future__ import annotations
+
+import pytest
+
+from config.settings.infra.outbound_retry import _load_outbound_retry_from_env
+
+
+def test_default_backend_is_inline_without_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OUTBOUND_RETRY_BACKEND", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    assert _load_outbound_retry_from_env().backend == "inline"
+
+
+def test_default_backend_is_redis_when_configured(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("OUTBOUND_RETRY_BACKEND", raising=False)
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+
+    assert _load_outbound_retry_from_env().backend == "redis"
+
+
+def test_explicit_memory_backend_is_kept(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OUTBOUND_RETRY_BACKEND", "Memory")
+
+    assert _load_outbound_retry_from_env().backend == "memory"
+
+
+def test_unknown_backend_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OUTBOUND_RETRY_BACKEND", "rabbit")
+
+    with pytest.raises(ValueError, match="OUTBOUND_RETRY_BACKEND"):
+        _load_outbound_retry_from_env()
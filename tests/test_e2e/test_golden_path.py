@@ -160,6 +160,7 @@ async def test_full_conversation_saas_interest() -> None:
     assert contact_card is not None
     assert contact_card.primary_interest == "saas"
     assert contact_card.email == "lead@empresa.com"
+    assert contact_card.total_messages == 2
 
     assert len(outbound_sender.requests) == 2
     assert len(outbound_sender.payloads) == 2
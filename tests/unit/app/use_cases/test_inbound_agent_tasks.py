@@ -0,0 +1,88 @@
+"""Testes da execução dos agentes com prazo próprio (Otto nunca é refeito)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+import app.use_cases.whatsapp._inbound_agent_tasks as agent_tasks
+from app.use_cases.whatsapp._inbound_agent_tasks import await_optional_agent, start_agent_task
+
+
+@pytest.fixture
+def metrics(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    recorded: dict[str, list] = {"latency": [], "counter": []}
+    monkeypatch.setattr(
+        agent_tasks,
+        "record_latency",
+        lambda component, op, ms, correlation_id=None: recorded["latency"].append(op),
+    )
+    monkeypatch.setattr(
+        agent_tasks,
+        "record_counter",
+        lambda component, op, **_: recorded["counter"].append(op),
+    )
+    return recorded
+
+
+async def test_slow_extractor_is_cancelled_at_its_deadline(metrics: dict[str, list]) -> None:
+    cancelled = asyncio.Event()
+
+    async def _slow() -> dict[str, str]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return {"email": "x@x.com"}
+
+    task = start_agent_task("contact_card_extract", _slow(), "corr")
+    result = await await_optional_agent(
+        task,
+        operation="contact_card_extract",
+        deadline=time.monotonic() + 0.01,
+        correlation_id="corr",
+    )
+    await asyncio.sleep(0)
+
+    assert result is None
+    assert cancelled.is_set()
+    assert metrics["counter"] == ["contact_card_extract_timeout"]
+    assert metrics["latency"] == ["contact_card_extract"]
+
+
+async def test_extractor_error_yields_none(metrics: dict[str, list]) -> None:
+    async def _boom() -> None:
+        raise ValueError("bad json")
+
+    task = start_agent_task("contact_card_extract", _boom(), "corr")
+    result = await await_optional_agent(
+        task,
+        operation="contact_card_extract",
+        deadline=time.monotonic() + 1,
+        correlation_id="corr",
+    )
+
+    assert result is None
+    assert metrics["counter"] == ["contact_card_extract_error"]
+
+
+async def test_finished_extractor_result_is_used_even_after_deadline(
+    metrics: dict[str, list],
+) -> None:
+    async def _fast() -> dict[str, str]:
+        return {"email": "lead@empresa.com"}
+
+    task = start_agent_task("contact_card_extract", _fast(), "corr")
+    await asyncio.sleep(0)
+    result = await await_optional_agent(
+        task,
+        operation="contact_card_extract",
+        deadline=time.monotonic() - 1,
+        correlation_id="corr",
+    )
+
+    assert result == {"email": "lead@empresa.com"}
+    assert metrics["counter"] == []
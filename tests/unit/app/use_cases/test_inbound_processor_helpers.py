@@ -13,6 +13,8 @@ import app.use_cases.whatsapp._inbound_processor_context as inbound_processor_co
 import app.use_cases.whatsapp._inbound_processor_mixin as inbound_processor_mixin
 from ai.models.contact_card_extraction import ContactCardExtractionResult, ContactCardPatch
 from ai.models.otto import OttoDecision
+from app.domain.contact_card import ContactCard
+from app.protocols.dedupe import AsyncDedupeProtocol
 from app.protocols.models import NormalizedMessage
 from app.services.otto_repetition_guard import GuardResult
 from app.sessions.models import Session, SessionContext
@@ -40,7 +42,7 @@ class _SessionManagerStub:
         return None
 
 
-class _DedupeSpy:
+class _DedupeSpy(AsyncDedupeProtocol):
     def __init__(self, *, duplicate: bool = False) -> None:
         self.duplicate = duplicate
         self.calls: list[str] = []
@@ -498,7 +500,7 @@ async def test_run_agents_returns_extraction_when_parallel_succeeds(
 
 
 @pytest.mark.asyncio
-async def test_run_agents_fallbacks_to_otto_when_parallel_times_out(
+async def test_run_agents_keeps_otto_decision_when_extractor_times_out(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     class _OttoWithCount(_OttoStub):
@@ -524,8 +526,7 @@ async def test_run_agents_fallbacks_to_otto_when_parallel_times_out(
         "_build_extraction_task",
         lambda **_: _slow_extraction(),
     )
-    monkeypatch.setattr(inbound_processor_context, "_AGENTS_PARALLEL_TIMEOUT_SECONDS", 0.001)
-    monkeypatch.setattr(inbound_processor_mixin, "_AGENTS_PARALLEL_TIMEOUT_SECONDS", 0.001)
+    monkeypatch.setattr(inbound_processor_context, "_EXTRACTOR_DEADLINE_SECONDS", 0.001)
 
     otto_request, decision, extraction = await processor._run_agents(
         session=_build_session(),
@@ -540,4 +541,27 @@ async def test_run_agents_fallbacks_to_otto_when_parallel_times_out(
     assert otto_request.user_message == "oi"
     assert decision.response_text == "fallback"
     assert extraction is None
-    assert otto.calls == 2
+    assert otto.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_contact_card_writes_turn_counter_only_when_pending() -> None:
+    store = MagicMock(upsert=AsyncMock())
+    processor = _build_processor(_DedupeSpy())
+    processor._contact_card_store = store
+    card = ContactCard(
+        wa_id="5544988887777",
+        phone="5544988887777",
+        whatsapp_name="Ana",
+        total_messages=3,
+    )
+    card.mark_persisted()
+
+    await processor._flush_contact_card(card)
+    store.upsert.assert_not_awaited()
+
+    card.increment("total_messages")
+    await processor._flush_contact_card(card)
+
+    store.upsert.assert_awaited_once_with(card)
+    assert card.pending_changes().increments == {"total_messages": 1}
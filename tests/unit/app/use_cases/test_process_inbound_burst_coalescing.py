@@ -0,0 +1,191 @@
+"""Testes da agregação de rajadas no processamento inbound."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ai.models.otto import OttoDecision
+from app.protocols.dedupe import AsyncDedupeProtocol
+from app.protocols.models import NormalizedMessage
+from app.services.message_burst_coalescer import MessageBurstCoalescer
+from app.sessions.models import Session, SessionContext
+from app.use_cases.whatsapp.process_inbound_canonical import ProcessInboundCanonicalUseCase
+from fsm.states import SessionState
+
+
+class _BurstNormalizer:
+    def normalize(self, payload: dict[str, object]) -> list[NormalizedMessage]:
+        return [
+            NormalizedMessage(
+                message_id=f"mid-{idx}",
+                from_number="+554499999999",
+                message_type="text",
+                text=text,
+            )
+            for idx, text in enumerate(("oi", "tudo bem?", "quero saber do SaaS"), start=1)
+        ]
+
+
+class _SessionManager:
+    def __init__(self) -> None:
+        self.session = Session(
+            session_id="session-1",
+            sender_id="hash-1",
+            current_state=SessionState.INITIAL,
+            context=SessionContext(tenant_id="tenant", vertente="geral"),
+            history=[],
+            turn_count=0,
+        )
+
+    async def resolve_or_create(
+        self,
+        *,
+        sender_id: str,
+        tenant_id: str,
+        whatsapp_name: str | None = None,
+    ) -> Session:
+        return self.session
+
+    async def save(self, session: Session) -> None:
+        return None
+
+    async def close(self, session: Session, reason: str) -> None:
+        return None
+
+
+class _Dedupe(AsyncDedupeProtocol):
+    def __init__(self, duplicates: set[str] | None = None) -> None:
+        self.duplicates = duplicates or set()
+        self.processing: list[str] = []
+        self.processed: list[str] = []
+        self.unmarked: list[str] = []
+
+    async def is_duplicate(self, message_id: str, ttl: int = 3600) -> bool:
+        return message_id in self.duplicates
+
+    async def mark_processing(self, message_id: str, ttl: int = 30) -> None:
+        self.processing.append(message_id)
+
+    async def mark_processed(self, message_id: str, ttl: int = 3600) -> None:
+        self.processed.append(message_id)
+
+    async def unmark_processing(self, message_id: str) -> None:
+        self.unmarked.append(message_id)
+
+
+class _Sender:
+    def __init__(self) -> None:
+        self.sent = 0
+
+    async def send(self, request, payload):
+        self.sent += 1
+        return type("Resp", (), {"success": True})()
+
+
+class _Otto:
+    def __init__(self, *, fail: bool = False) -> None:
+        self.requests: list = []
+        self._fail = fail
+
+    async def decide(self, request):
+        self.requests.append(request)
+        if self._fail:
+            raise RuntimeError("otto_down")
+        return OttoDecision(
+            next_state="TRIAGE",
+            response_text="resposta",
+            message_type="text",
+            confidence=0.9,
+            requires_human=False,
+        )
+
+
+def _usecase(dedupe: _Dedupe, otto: _Otto, sender: _Sender) -> ProcessInboundCanonicalUseCase:
+    return ProcessInboundCanonicalUseCase(
+        normalizer=_BurstNormalizer(),
+        session_manager=_SessionManager(),
+        dedupe=dedupe,
+        otto_agent=otto,
+        outbound_sender=sender,
+        burst_coalescer=MessageBurstCoalescer(window_seconds=0.05, max_wait_seconds=0.5),
+    )
+
+
+@pytest.mark.asyncio
+async def test_burst_produces_single_decision_and_reply() -> None:
+    dedupe, otto, sender = _Dedupe(), _Otto(), _Sender()
+
+    result = await _usecase(dedupe, otto, sender).execute(
+        payload={"entry": []}, correlation_id="corr-1", tenant_id="tenant"
+    )
+
+    assert len(otto.requests) == 1
+    assert otto.requests[0].user_message == "oi\ntudo bem?\nquero saber do SaaS"
+    assert sender.sent == 1
+    assert (result.processed, result.skipped, result.sent) == (1, 2, 1)
+    assert dedupe.processed == ["mid-1", "mid-2", "mid-3"]
+
+
+@pytest.mark.asyncio
+async def test_burst_skips_already_processed_message_ids() -> None:
+    dedupe, otto, sender = _Dedupe(duplicates={"mid-2"}), _Otto(), _Sender()
+
+    await _usecase(dedupe, otto, sender).execute(
+        payload={"entry": []}, correlation_id="corr-2", tenant_id="tenant"
+    )
+
+    assert otto.requests[0].user_message == "oi\nquero saber do SaaS"
+    assert dedupe.processing == ["mid-1", "mid-3"]
+    assert dedupe.processed == ["mid-1", "mid-3"]
+
+
+@pytest.mark.asyncio
+async def test_burst_failure_unmarks_every_merged_message() -> None:
+    dedupe, otto, sender = _Dedupe(), _Otto(fail=True), _Sender()
+
+    with pytest.raises(RuntimeError, match="otto_down"):
+        await _usecase(dedupe, otto, sender).execute(
+            payload={"entry": []}, correlation_id="corr-3", tenant_id="tenant"
+        )
+
+    assert dedupe.processed == []
+    assert dedupe.unmarked == ["mid-1", "mid-2", "mid-3"]
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_sibling_messages_of_the_payload() -> None:
+    class _TwoSendersNormalizer:
+        def normalize(self, payload: dict[str, object]) -> list[NormalizedMessage]:
+            return [
+                NormalizedMessage(
+                    message_id="mid-a", from_number="+5511", message_type="text", text="a"
+                ),
+                NormalizedMessage(
+                    message_id="mid-b", from_number="+5522", message_type="text", text="b"
+                ),
+            ]
+
+    class _Processor:
+        def __init__(self) -> None:
+            self.cancelled = False
+
+        async def process(self, msg, correlation_id, tenant_id):
+            if msg.message_id == "mid-a":
+                raise RuntimeError("otto_down")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+    usecase = _usecase(_Dedupe(), _Otto(), _Sender())
+    usecase._normalizer = _TwoSendersNormalizer()
+    processor = _Processor()
+    usecase._processor = processor
+
+    with pytest.raises(RuntimeError, match="otto_down"):
+        await usecase.execute(payload={"entry": []}, correlation_id="corr-4", tenant_id="t")
+
+    assert processor.cancelled
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.protocols.dedupe import AsyncDedupeProtocol
 from app.protocols.models import NormalizedMessage
 from app.use_cases.whatsapp.process_inbound_canonical import ProcessInboundCanonicalUseCase
 
@@ -35,7 +36,7 @@ class _NoopSessionManager:
         return None
 
 
-class _NoopDedupe:
+class _NoopDedupe(AsyncDedupeProtocol):
     async def is_duplicate(self, message_id: str, ttl: int = 3600) -> bool:
         return False
 
@@ -0,0 +1,131 @@
+"""Testes do diário de decisões: reentrega retoma sem novo LLM nem resposta dupla."""
+
+from __future__ import annotations
+
+import pytest
+
+from ai.models.otto import OttoDecision
+from app.infra.stores import MemoryDecisionJournal
+from app.infra.stores.memory_stores import MemoryDedupeStore
+from app.protocols.models import NormalizedMessage
+from app.sessions.models import Session, SessionContext
+from app.use_cases.whatsapp.process_inbound_canonical import ProcessInboundCanonicalUseCase
+from fsm.states import SessionState
+
+
+class _Normalizer:
+    def normalize(self, payload: dict[str, object]) -> list[NormalizedMessage]:
+        return [
+            NormalizedMessage(
+                message_id="mid-journal",
+                from_number="+554499999999",
+                message_type="text",
+                text="quero automatizar meu atendimento",
+            )
+        ]
+
+
+class _FlakySessionManager:
+    """Falha no save das primeiras `failures` chamadas (ex.: Redis fora)."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.saved: list[Session] = []
+
+    async def resolve_or_create(
+        self,
+        *,
+        sender_id: str,
+        tenant_id: str,
+        whatsapp_name: str | None = None,
+    ) -> Session:
+        return Session(
+            session_id="session-1",
+            sender_id="hash-1",
+            current_state=SessionState.INITIAL,
+            context=SessionContext(tenant_id="tenant", vertente="geral"),
+            history=[],
+            turn_count=0,
+        )
+
+    async def save(self, session: Session) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("redis_down")
+        self.saved.append(session)
+
+    async def close(self, session: Session, reason: str) -> None:
+        return None
+
+
+class _CountingOtto:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def decide(self, request: object) -> OttoDecision:
+        self.calls += 1
+        return OttoDecision(
+            next_state="TRIAGE",
+            response_text="Posso te ajudar com isso!",
+            message_type="text",
+            confidence=0.9,
+            requires_human=False,
+        )
+
+
+class _CountingSender:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def send(self, request: object, payload: object) -> object:
+        self.calls += 1
+        return type("Resp", (), {"success": True})()
+
+
+def _use_case(
+    session_manager: _FlakySessionManager,
+    otto: _CountingOtto,
+    sender: _CountingSender,
+    journal: MemoryDecisionJournal | None,
+) -> ProcessInboundCanonicalUseCase:
+    return ProcessInboundCanonicalUseCase(
+        normalizer=_Normalizer(),
+        session_manager=session_manager,
+        dedupe=MemoryDedupeStore(),
+        otto_agent=otto,
+        outbound_sender=sender,
+        decision_journal=journal,
+    )
+
+
+@pytest.mark.asyncio
+async def test_redelivery_after_session_save_failure_resumes_from_journal() -> None:
+    sessions, otto, sender = _FlakySessionManager(failures=1), _CountingOtto(), _CountingSender()
+    journal = MemoryDecisionJournal()
+    use_case = _use_case(sessions, otto, sender, journal)
+
+    with pytest.raises(ConnectionError):
+        await use_case.execute(payload={"entry": []}, correlation_id="c-1", tenant_id="tenant")
+    result = await use_case.execute(payload={"entry": []}, correlation_id="c-2", tenant_id="tenant")
+
+    assert otto.calls == 1
+    assert sender.calls == 1
+    assert result.sent == 1
+    [saved] = sessions.saved
+    assert saved.history[-1].content == "Posso te ajudar com isso!"
+    entry = await journal.get("mid-journal")
+    assert entry is not None
+    assert entry.sent is True
+
+
+@pytest.mark.asyncio
+async def test_without_journal_redelivery_reruns_llm_and_replies_again() -> None:
+    sessions, otto, sender = _FlakySessionManager(failures=1), _CountingOtto(), _CountingSender()
+    use_case = _use_case(sessions, otto, sender, journal=None)
+
+    with pytest.raises(ConnectionError):
+        await use_case.execute(payload={"entry": []}, correlation_id="c-1", tenant_id="tenant")
+    await use_case.execute(payload={"entry": []}, correlation_id="c-2", tenant_id="tenant")
+
+    assert otto.calls == 2
+    assert sender.calls == 2
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from ai.models.otto import OttoDecision
+from app.protocols.dedupe import AsyncDedupeProtocol
 from app.protocols.models import NormalizedMessage
 from app.sessions.models import Session, SessionContext
 from app.use_cases.whatsapp.process_inbound_canonical import ProcessInboundCanonicalUseCase
@@ -50,7 +51,7 @@ class _SessionManager:
         return None
 
 
-class _DedupeTracker:
+class _DedupeTracker(AsyncDedupeProtocol):
     def __init__(self) -> None:
         self.calls: list[str] = []
 
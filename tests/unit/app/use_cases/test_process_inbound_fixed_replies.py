@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from ai.models.otto import OttoDecision
+from app.protocols.dedupe import AsyncDedupeProtocol
 from app.protocols.models import NormalizedMessage
 from app.sessions.models import HistoryRole, Session, SessionContext
 from app.use_cases.whatsapp.process_inbound_canonical import ProcessInboundCanonicalUseCase
@@ -66,7 +67,7 @@ class DummyNormalizer:
         ]
 
 
-class DummyDedupe:
+class DummyDedupe(AsyncDedupeProtocol):
     async def is_duplicate(self, message_id: str) -> bool:
         return False
 
@@ -1,6 +1,7 @@
 import pytest
 
 from ai.models.otto import OttoDecision
+from app.protocols.dedupe import AsyncDedupeProtocol
 from app.protocols.models import NormalizedMessage
 from app.sessions.models import Session, SessionContext
 from app.use_cases.whatsapp.process_inbound_canonical import ProcessInboundCanonicalUseCase
@@ -62,7 +63,7 @@ class DummyNormalizer:
         ]
 
 
-class DummyDedupe:
+class DummyDedupe(AsyncDedupeProtocol):
     async def is_duplicate(self, message_id: str) -> bool:
         return False
 